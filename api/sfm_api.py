@@ -42,11 +42,34 @@ from core.sfm_service import (
     CreatePolicyRequest,
     CreateResourceRequest,
     CreateRelationshipRequest,
+    BulkPathRequest,
+    BatchPolicyImpactRequest,
+    FailureSimulationRequest,
+    ImpactUncertaintyRequest,
+    OutputUncertaintyRequest,
+    WeightSensitivityRequest,
+    TemporalProjectionRequest,
+    FlowEfficiencyMatrixRequest,
+    DemandShockRequest,
     NodeResponse,
     RelationshipResponse,
     GraphStatistics,
     CentralityAnalysis,
     PolicyImpactAnalysis,
+    BatchPolicyImpactAnalysis,
+    ImpactPropagationAnalysis,
+    FailureSimulationBatch,
+    RobustnessCurveAnalysis,
+    ReachabilityResult,
+    FlowEfficiencyMatrixAnalysis,
+    DemandShockAnalysis,
+    SectorMultiplierAnalysis,
+    DeliveryMatrixView,
+    ComponentDeliveries,
+    CeremonialBalanceAnalysis,
+    UncertaintyAnalysis,
+    WeightSensitivityAnalysis,
+    TemporalProjectionAnalysis,
     create_sfm_service,
     get_sfm_service,
     reset_sfm_service,
@@ -239,6 +262,9 @@ async def get_quick_analysis(service: SFMService = Depends(get_sfm_service_depen
 async def analyze_centrality(
     centrality_type: str = Query("betweenness", description="Type of centrality analysis"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of nodes to return"),
+    sample_size: Optional[int] = Query(
+        None, ge=1, description="Pivot count for approximate betweenness (default: automatic)"
+    ),
     service: SFMService = Depends(get_sfm_service_dependency)
 ):
     """
@@ -249,8 +275,12 @@ async def analyze_centrality(
     - closeness: Identifies nodes with shortest paths to all others
     - degree: Identifies nodes with most connections
     - eigenvector: Identifies nodes connected to important nodes
+
+    Betweenness is approximated by k-pivot sampling when sample_size is given or the
+    graph exceeds the configured size threshold; the response then reports the
+    sample size and estimated error.
     """
-    return service.analyze_centrality(centrality_type, limit)
+    return service.analyze_centrality(centrality_type, limit, sample_size=sample_size)
 
 @app.get("/analytics/policy-impact/{policy_id}", response_model=PolicyImpactAnalysis, tags=["Analytics"])
 async def analyze_policy_impact(
@@ -268,19 +298,259 @@ async def analyze_policy_impact(
     """
     return service.analyze_policy_impact(policy_id, impact_radius)
 
+@app.post("/analytics/policy-impact/batch", response_model=BatchPolicyImpactAnalysis,
+          tags=["Analytics"])
+async def analyze_policy_impacts(
+    request: BatchPolicyImpactRequest,
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Analyze the impact of many policies in one request.
+    
+    Omitting policy_ids analyzes every policy in the graph. Returns:
+    - Per-policy affected entities and impact-area density
+    - Pairs of policies whose impact areas overlap, largest overlap first
+    - Requested policy IDs that were not found
+    """
+    return service.analyze_policy_impacts(
+        request.policy_ids, request.impact_radius, min_shared=request.min_shared
+    )
+
+@app.get("/analytics/impact-propagation", response_model=ImpactPropagationAnalysis,
+         tags=["Analytics"])
+async def propagate_impact(
+    seed_ids: List[str] = Query(..., description="UUIDs of the nodes the impact starts from"),
+    top_k: int = Query(20, ge=1, le=1000, description="Number of ranked nodes to return"),
+    damping: Optional[float] = Query(
+        None, ge=0.0, lt=1.0, description="Probability of following a relationship vs. restarting"
+    ),
+    include_seeds: bool = Query(False, description="Include the seed nodes in the ranking"),
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Rank nodes by weighted influence from one or more seed nodes.
+    
+    Uses random walk with restart (personalized PageRank) over relationship
+    weight scaled by certainty. Unlike the hop-radius policy impact, results
+    are ranked by how strongly each node is reached.
+    """
+    return service.propagate_impact(
+        seed_ids, top_k, damping=damping, include_seeds=include_seeds
+    )
+
+@app.post("/analytics/failure-simulation/batch", response_model=FailureSimulationBatch,
+          tags=["Analytics"])
+async def simulate_node_failures(
+    request: FailureSimulationRequest,
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Simulate many node-failure scenarios against the current graph.
+    
+    Each failure set is evaluated independently. Returns, per scenario:
+    - Change in weakly connected components and largest component size
+    - Nodes left without outgoing connections
+    - Nodes that fail in turn (cascade mode)
+    """
+    return service.simulate_node_failures(request.failure_sets, request.failure_mode)
+
+@app.get("/analytics/robustness-curve", response_model=RobustnessCurveAnalysis,
+         tags=["Analytics"])
+async def get_robustness_curve(
+    strategy: str = Query(
+        "degree", description="Removal order: 'degree', 'betweenness' or 'random'"
+    ),
+    trials: int = Query(10, ge=1, le=1000, description="Random removal orders averaged"),
+    seed: Optional[int] = Query(None, description="Seed for random removal orders"),
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Largest connected component size as nodes are removed one by one.
+    
+    Returns the largest-component fraction after every removal, the
+    robustness index (mean fraction over the curve) and the share of nodes
+    removed before the largest component halves.
+    """
+    return service.get_robustness_curve(strategy, trials, seed)
+
+@app.post("/analytics/flow-efficiency/matrix", response_model=FlowEfficiencyMatrixAnalysis,
+          tags=["Analytics"])
+async def calculate_flow_efficiency_matrix(
+    request: FlowEfficiencyMatrixRequest,
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Flow efficiency (inverse path length) between sets of nodes.
+    
+    Path lengths are estimated from precomputed distances to a few landmark
+    nodes, so matrices over thousands of nodes need no per-pair path search.
+    Set `exact` to resolve every pair exactly.
+    """
+    return service.calculate_flow_efficiency_matrix(
+        request.source_ids, request.target_ids, request.exact, request.landmark_strategy
+    )
+
+@app.post("/analytics/input-output/demand-shocks", response_model=DemandShockAnalysis,
+          tags=["Analytics"])
+async def analyze_demand_shocks(
+    request: DemandShockRequest,
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Gross output change of every process for final-demand shocks.
+    
+    Processes are the sectors of a Leontief input-output model assembled
+    from Flow nodes; every shock in the request is answered by one solve.
+    """
+    return service.analyze_demand_shocks(request.shocks)
+
+@app.get("/analytics/input-output/multipliers", response_model=SectorMultiplierAnalysis,
+         tags=["Analytics"])
+async def get_sector_multipliers(
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Output multipliers and forward linkages of every process.
+    """
+    return service.get_sector_multipliers()
+
+@app.post("/analytics/uncertainty/impact", response_model=UncertaintyAnalysis,
+          tags=["Analytics"])
+async def propagate_impact_uncertainty(
+    request: ImpactUncertaintyRequest,
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Monte Carlo percentile bands on weighted influence from seed nodes.
+    
+    Relationship presence is sampled from certainty and weights from
+    variability; all draws are ranked together in batched matrix form.
+    """
+    return service.propagate_impact_uncertainty(
+        request.seed_ids, request.draws, request.seed, request.top_k
+    )
+
+@app.post("/analytics/uncertainty/input-output", response_model=UncertaintyAnalysis,
+          tags=["Analytics"])
+async def analyze_output_uncertainty(
+    request: OutputUncertaintyRequest,
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Monte Carlo percentile bands on every process's gross output.
+    """
+    return service.analyze_output_uncertainty(
+        request.final_demand, request.draws, request.seed, request.flow_variability
+    )
+
+@app.post("/analytics/sensitivity/weights", response_model=WeightSensitivityAnalysis,
+          tags=["Analytics"])
+async def analyze_weight_sensitivity(
+    request: WeightSensitivityRequest,
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Rank relationships by how strongly their weights steer impact from seed nodes.
+    
+    One-at-a-time, Morris or Sobol perturbations of the weights are all
+    evaluated against one factorization of the propagation system.
+    """
+    return service.analyze_weight_sensitivity(
+        request.seed_ids, request.target_ids, request.relationship_ids, request.method,
+        request.perturbation, request.samples, request.seed, request.top_k
+    )
+
+@app.post("/analytics/temporal-dynamics/projection", response_model=TemporalProjectionAnalysis,
+          tags=["Analytics"])
+async def project_temporal_dynamics(
+    request: TemporalProjectionRequest,
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Forward projection of every flow, indicator and relationship with temporal dynamics.
+    
+    All dynamic entities advance together in vectorized steps grouped by
+    function type.
+    """
+    return service.project_temporal_dynamics(
+        request.steps, request.dt, request.start, request.entity_ids, request.seed
+    )
+
+@app.get("/analytics/delivery-matrix", response_model=DeliveryMatrixView, tags=["Analytics"])
+async def get_delivery_matrix(
+    row_type: Optional[str] = Query(None, description="Delivering node type, e.g. Institution"),
+    column_type: Optional[str] = Query(None, description="Receiving node type, e.g. Actor"),
+    relationship_kind: Optional[str] = Query(None, description="Single relationship kind"),
+    dense: bool = Query(False, description="Also return the block as a dense matrix"),
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Block of the social fabric delivery matrix between two node types.
+    
+    Served from a sparse matrix kept in sync with the graph, so a block
+    costs time proportional to its non-empty cells.
+    """
+    return service.get_delivery_matrix(row_type, column_type, relationship_kind, dense)
+
+@app.get("/analytics/delivery-matrix/nodes/{node_id}", response_model=ComponentDeliveries,
+         tags=["Analytics"])
+async def get_component_deliveries(
+    node_id: str,
+    relationship_kind: Optional[str] = Query(None, description="Single relationship kind"),
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    What a component delivers to and receives from every other component.
+    """
+    return service.get_component_deliveries(node_id, relationship_kind)
+
+@app.get("/analytics/ceremonial-balance", response_model=CeremonialBalanceAnalysis,
+         tags=["Analytics"])
+async def analyze_ceremonial_balance(
+    group_by: str = Query("layer", description="Grouping: node, community or layer"),
+    top_k: Optional[int] = Query(None, ge=1, description="Most ceremonial groups to return"),
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Ceremonial versus instrumental balance of the graph and its groups.
+    
+    Kept in sync with graph mutations, so a refresh costs only the aggregation.
+    """
+    return service.analyze_ceremonial_balance(group_by, top_k)
+
+@app.get("/analytics/reachability", response_model=ReachabilityResult, tags=["Analytics"])
+async def check_reachability(
+    source_id: str = Query(..., description="UUID of the source node"),
+    target_id: str = Query(..., description="UUID of the target node"),
+    relationship_kinds: Optional[List[str]] = Query(None, description="Filter by relationship kinds"),
+    service: SFMService = Depends(get_sfm_service_dependency)
+):
+    """
+    Check whether any chain of relationships leads from one node to another.
+    
+    Answered from a cached reachability index rather than a path search, so
+    repeated "can X influence Y" queries stay cheap on large graphs.
+    """
+    return service.can_reach(source_id, target_id, relationship_kinds)
+
 @app.get("/analytics/shortest-path", tags=["Analytics"])
 async def find_shortest_path(
     source_id: str = Query(..., description="UUID of the source node"),
     target_id: str = Query(..., description="UUID of the target node"),
     relationship_kinds: Optional[List[str]] = Query(None, description="Filter by relationship kinds"),
+    cost: Optional[str] = Query(
+        None, description="Edge cost for a weighted search: 'weight' or 'certainty'"
+    ),
     service: SFMService = Depends(get_sfm_service_dependency)
 ) -> Dict[str, Any]:
     """
     Find the shortest path between two nodes.
     
     Returns the path as a list of node IDs, or null if no path exists.
+    Without a cost the path with the fewest hops is returned; with a cost the
+    path minimizing total relationship weight (or maximizing joint certainty).
     """
-    path = service.find_shortest_path(source_id, target_id, relationship_kinds)
+    path = service.find_shortest_path(source_id, target_id, relationship_kinds, cost=cost)
     return {
         "source_id": source_id,
         "target_id": target_id,
@@ -289,6 +559,29 @@ async def find_shortest_path(
         "timestamp": datetime.now().isoformat()
     }
 
+@app.post("/analytics/shortest-paths", tags=["Analytics"])
+async def find_shortest_paths_bulk(
+    request: BulkPathRequest,
+    service: SFMService = Depends(get_sfm_service_dependency)
+) -> Dict[str, Any]:
+    """
+    Find shortest paths for many source/target pairs in one request.
+    
+    Pairs are grouped by source so each distinct source is searched only once.
+    Paths are returned in request order; a path is null if none exists.
+    """
+    results = service.find_shortest_paths_bulk(
+        [(pair.source_id, pair.target_id) for pair in request.pairs],
+        request.relationship_kinds,
+        cost=request.cost,
+    )
+    return {
+        "paths": results,
+        "path_count": len(results),
+        "distinct_sources": len({pair.source_id for pair in request.pairs}),
+        "timestamp": datetime.now().isoformat()
+    }
+
 # ═══ ACTOR ENDPOINTS ═══
 
 @app.post("/actors", response_model=NodeResponse, status_code=status.HTTP_201_CREATED, tags=["Actors"])
@@ -325,17 +618,35 @@ async def get_actor_neighbors(
     actor_id: str = Path(..., description="UUID of the actor"),
     relationship_kinds: Optional[List[str]] = Query(None, description="Filter by relationship kinds"),
     distance: int = Query(1, ge=1, le=5, description="Distance/hops to search"),
+    include_distances: bool = Query(False, description="Include the hop distance of each neighbor"),
+    include_paths: bool = Query(False, description="Include the relationship path to each neighbor"),
     service: SFMService = Depends(get_sfm_service_dependency)
 ) -> Dict[str, Any]:
     """Get neighboring nodes for a specific actor."""
-    neighbors = service.get_node_neighbors(actor_id, relationship_kinds, distance)
-    return {
+    if not (include_distances or include_paths):
+        neighbors = service.get_node_neighbors(actor_id, relationship_kinds, distance)
+        return {
+            "actor_id": actor_id,
+            "neighbors": neighbors,
+            "neighbor_count": len(neighbors),
+            "distance": distance,
+            "relationship_kinds": relationship_kinds
+        }
+
+    neighborhood = service.get_node_neighborhood(
+        actor_id, relationship_kinds, distance, include_paths=include_paths
+    )
+    response = {
         "actor_id": actor_id,
-        "neighbors": neighbors,
-        "neighbor_count": len(neighbors),
+        "neighbors": list(neighborhood),
+        "neighbor_count": len(neighborhood),
         "distance": distance,
-        "relationship_kinds": relationship_kinds
+        "relationship_kinds": relationship_kinds,
+        "distances": {node_id: entry["distance"] for node_id, entry in neighborhood.items()},
     }
+    if include_paths:
+        response["paths"] = {node_id: entry["path"] for node_id, entry in neighborhood.items()}
+    return response
 
 # ═══ INSTITUTION ENDPOINTS ═══
 
@@ -563,7 +874,21 @@ async def get_configuration(service: SFMService = Depends(get_sfm_service_depend
         "enable_logging": config.enable_logging,
         "log_level": config.log_level,
         "max_graph_size": config.max_graph_size,
-        "query_timeout": config.query_timeout
+        "query_timeout": config.query_timeout,
+        "approximate_centrality_threshold": config.approximate_centrality_threshold,
+        "betweenness_sample_size": config.betweenness_sample_size,
+        "centrality_sampling_seed": config.centrality_sampling_seed,
+        "centrality_workers": config.centrality_workers,
+        "parallel_centrality_min_nodes": config.parallel_centrality_min_nodes,
+        "cycle_check_max_length": config.cycle_check_max_length,
+        "cycle_check_max_cycles": config.cycle_check_max_cycles,
+        "cycle_check_time_limit": config.cycle_check_time_limit,
+        "impact_propagation_damping": config.impact_propagation_damping,
+        "failure_simulation_workers": config.failure_simulation_workers,
+        "distance_oracle_landmarks": config.distance_oracle_landmarks,
+        "uncertainty_max_draws": config.uncertainty_max_draws,
+        "uncertainty_workers": config.uncertainty_workers,
+        "dynamics_max_values": config.dynamics_max_values
     }
 
 # ═══ METADATA & DOCUMENTATION ═══
@@ -0,0 +1,165 @@
+"""
+Centrality memoization for SFM query engines.
+
+Whole-graph centrality measures (betweenness in particular) dominate the cost
+of most analytical queries. This module provides a small store that keeps each
+measure for the current graph version so that every analysis running against
+the same graph state shares a single computation.
+
+Features:
+- Results keyed by (graph version, centrality type, parameters)
+- Automatic invalidation when the graph version moves
+- Hit/miss statistics for monitoring
+- Error bounds for pivot-sampled (approximate) betweenness
+"""
+
+import math
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import uuid
+
+import logging
+logger = logging.getLogger(__name__)
+
+CentralityScores = Dict[uuid.UUID, float]
+
+SUPPORTED_CENTRALITY_TYPES = ("betweenness", "closeness", "degree", "eigenvector")
+
+# Approximate betweenness defaults
+DEFAULT_APPROXIMATION_THRESHOLD = 5000  # Node count above which sampling is used
+DEFAULT_BETWEENNESS_SAMPLE_SIZE = 1000  # Number of pivot sources
+DEFAULT_SAMPLING_SEED = 42
+DEFAULT_ERROR_CONFIDENCE = 0.95
+
+
+@dataclass
+class BetweennessEstimate:
+    """Betweenness scores together with how they were obtained."""
+    scores: CentralityScores
+    sample_size: int
+    node_count: int
+    exact: bool
+    estimated_error: float = 0.0
+    confidence: float = DEFAULT_ERROR_CONFIDENCE
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the estimate metadata (without scores) to a dictionary."""
+        return {
+            "sample_size": self.sample_size,
+            "node_count": self.node_count,
+            "exact": self.exact,
+            "estimated_error": self.estimated_error,
+            "confidence": self.confidence,
+        }
+
+
+def betweenness_error_bound(node_count: int, sample_size: int,
+                            confidence: float = DEFAULT_ERROR_CONFIDENCE) -> float:
+    """Estimate the absolute error of pivot-sampled normalized betweenness.
+
+    Each sampled pivot contributes an independent term in [0, n/(n-1)] to a
+    node's normalized score, so by Hoeffding's inequality the estimate for any
+    single node is within the returned value of the exact score with the given
+    confidence.
+
+    Args:
+        node_count: Number of nodes in the graph
+        sample_size: Number of pivot sources used
+        confidence: Desired confidence level in (0, 1)
+
+    Returns:
+        Error bound, or 0.0 when every node was used as a pivot
+    """
+    if node_count <= 2 or sample_size >= node_count:
+        return 0.0
+    if sample_size <= 0:
+        return 1.0
+    value_range = node_count / (node_count - 1)
+    return value_range * math.sqrt(math.log(2 / (1 - confidence)) / (2 * sample_size))
+
+
+@dataclass
+class CentralityStoreStats:
+    """Statistics for centrality store usage."""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+        }
+
+
+class CentralityStore:
+    """Memoizes whole-graph centrality results per graph version.
+
+    Only results for a single graph version are retained: as soon as a lookup
+    arrives for a newer version, everything computed for the old one is dropped.
+    """
+
+    def __init__(self):
+        self._version: Optional[int] = None
+        self._results: Dict[Tuple[str, Tuple[Tuple[str, Hashable], ...]], Any] = {}
+        self._lock = threading.RLock()
+        self._stats = CentralityStoreStats()
+
+    @staticmethod
+    def _make_key(centrality_type: str, params: Optional[Dict[str, Hashable]]
+                  ) -> Tuple[str, Tuple[Tuple[str, Hashable], ...]]:
+        """Build a hashable key from a centrality type and its parameters."""
+        return centrality_type, tuple(sorted((params or {}).items()))
+
+    def get_or_compute(self, version: int, centrality_type: str,
+                       compute: Callable[[], Any],
+                       params: Optional[Dict[str, Hashable]] = None) -> Any:
+        """Return the stored result for this version, computing it on a miss.
+
+        Args:
+            version: Graph version the result must correspond to
+            centrality_type: Name of the centrality measure
+            compute: Zero-argument callable producing the result on a miss
+            params: Parameters that distinguish otherwise identical measures
+
+        Returns:
+            The stored or freshly computed result
+        """
+        key = self._make_key(centrality_type, params)
+        with self._lock:
+            if version != self._version:
+                if self._results:
+                    self._stats.invalidations += 1
+                self._results.clear()
+                self._version = version
+
+            if key in self._results:
+                self._stats.hits += 1
+                return self._results[key]
+
+            self._stats.misses += 1
+            result = compute()
+            self._results[key] = result
+            logger.debug("Computed %s centrality for graph version %s", centrality_type, version)
+            return result
+
+    def invalidate(self) -> None:
+        """Drop all stored results."""
+        with self._lock:
+            if self._results:
+                self._stats.invalidations += 1
+            self._results.clear()
+            self._version = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            stats = self._stats.to_dict()
+            stats["version"] = self._version
+            stats["entries"] = len(self._results)
+            return stats
@@ -0,0 +1,353 @@
+"""
+Ceremonial versus instrumental balance of an SFM graph.
+
+Hayden's dichotomy asks how much of a system's activity preserves status
+and tradition (ceremonial) rather than solving problems (instrumental).
+Every RelationshipKind carries a `ceremonial_tendency` in [0, 1]; behavioral
+nodes and flows carry scores of their own. A CeremonialBalance turns them
+into ceremonial and instrumental mass:
+
+- A relationship contributes mass |weight| (1 when unset) x certainty,
+  split by the tendency of its kind; tendencies are looked up for all
+  relationships with one gather from a per-kind array
+- A node's balance sums the relationships touching it plus, with weight
+  `node_evidence_weight`, its own tendency: the mean rigidity, tradition
+  strength and resistance of a CeremonialBehavior, one minus the mean
+  efficiency, adaptability and innovation of an InstrumentalBehavior, the
+  ceremonial share of a Flow's components
+- Communities and institution layers aggregate their nodes' masses with one
+  bincount
+
+Node sums are updated in place from graph mutation events; a missed
+mutation falls back to a full vectorized rebuild on the next query.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+import math
+import uuid
+
+import numpy as np
+
+from core.sfm_enums import InstitutionLayer, RelationshipKind
+from core.sfm_models import (
+    CeremonialBehavior,
+    Flow,
+    InstrumentalBehavior,
+    Node,
+    Relationship,
+    SFMGraph,
+)
+
+DEFAULT_NODE_EVIDENCE_WEIGHT = 1.0  # Weight of a node's own score against one relationship
+
+KIND_CODES: Dict[RelationshipKind, int] = {kind: i for i, kind in enumerate(RelationshipKind)}
+CEREMONIAL_TENDENCY = np.array([kind.ceremonial_tendency for kind in RelationshipKind])
+LAYERS: List[InstitutionLayer] = list(InstitutionLayer)
+LAYER_CODES: Dict[InstitutionLayer, int] = {layer: i for i, layer in enumerate(LAYERS)}
+
+# (source index, target index, ceremonial mass, mass) of one relationship
+EdgeMass = Tuple[int, int, float, float]
+
+
+def relationship_mass(weight: Optional[float], certainty: Optional[float]) -> float:
+    """Evidence carried by one relationship: |weight| (1 when unset) scaled by certainty."""
+    value = abs(weight or 1.0)
+    return value * min(max(certainty if certainty is not None else 1.0, 0.0), 1.0)
+
+
+def node_tendency(node: Node) -> float:
+    """Ceremonial tendency a node reports about itself, NaN if it reports none."""
+    if isinstance(node, CeremonialBehavior):
+        scores = [node.rigidity_level, node.tradition_strength, node.resistance_to_change]
+        ceremonial = True
+    elif isinstance(node, InstrumentalBehavior):
+        scores = [node.efficiency_measure, node.adaptability_score, node.innovation_potential]
+        ceremonial = False
+    elif isinstance(node, Flow):
+        parts = (node.ceremonial_component, node.instrumental_component)
+        if None in parts or parts[0] + parts[1] <= 0:
+            return math.nan
+        return min(max(parts[0] / (parts[0] + parts[1]), 0.0), 1.0)
+    else:
+        return math.nan
+    known = [score for score in scores if score is not None]
+    if not known:
+        return math.nan
+    mean = min(max(sum(known) / len(known), 0.0), 1.0)
+    return mean if ceremonial else 1.0 - mean
+
+
+@dataclass
+class BalanceScore:
+    """Ceremonial and instrumental mass of a node, group or graph."""
+
+    ceremonial: float
+    instrumental: float
+
+    @property
+    def total(self) -> float:
+        """Combined mass."""
+        return self.ceremonial + self.instrumental
+
+    @property
+    def score(self) -> float:
+        """Ceremonial share of the mass, 0.5 (neutral) without any evidence."""
+        return self.ceremonial / self.total if self.total > 0 else 0.5
+
+    def to_dict(self) -> Dict[str, float]:
+        """Masses and score as a plain dictionary."""
+        return {"ceremonial": self.ceremonial, "instrumental": self.instrumental,
+                "score": self.score}
+
+
+class CeremonialBalance:
+    """Incrementally maintained ceremonial/instrumental masses of a graph.
+
+    Node arrays are indexed in graph order; removed nodes keep a zeroed slot
+    until the next full rebuild. Relationship endpoints that are not loaded
+    nodes (e.g. evicted with remove_node_from_memory) get a slot of their
+    own, as components do in DeliveryMatrix.
+    """
+
+    def __init__(self, graph: SFMGraph,
+                 node_evidence_weight: float = DEFAULT_NODE_EVIDENCE_WEIGHT):
+        if node_evidence_weight < 0:
+            raise ValueError(f"node_evidence_weight must be non-negative, "
+                             f"got {node_evidence_weight}")
+        self.graph = graph
+        self.node_evidence_weight = node_evidence_weight
+        self.node_ids: List[uuid.UUID] = []
+        self.node_index: Dict[uuid.UUID, int] = {}
+        self._size = 0
+        self._incident_ceremonial: np.ndarray = np.zeros(0)
+        self._incident_mass: np.ndarray = np.zeros(0)
+        self._own_tendency: np.ndarray = np.zeros(0)
+        self._layer: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._live: np.ndarray = np.zeros(0, dtype=bool)
+        self._edges: Dict[uuid.UUID, EdgeMass] = {}
+        self._edge_ceremonial = 0.0
+        self._edge_mass = 0.0
+        self._synced_version: Optional[int] = None
+        graph.add_mutation_listener(self._on_graph_mutation)
+
+    # ─── SYNC ───
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the masses missed a graph change."""
+        return self._synced_version != self.graph.graph_version
+
+    def sync(self) -> None:
+        """Rebuild every mass if the incremental updates missed a change."""
+        if self.is_stale:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Recompute all masses from the graph in vectorized form."""
+        nodes = list(self.graph)
+        self.node_ids = [node.id for node in nodes]
+        self.node_index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        relationships = list(self.graph.relationships.values())
+        for rel in relationships:
+            for endpoint in (rel.source_id, rel.target_id):
+                if endpoint not in self.node_index:
+                    self.node_index[endpoint] = len(self.node_ids)
+                    self.node_ids.append(endpoint)
+
+        n = self._size = len(self.node_ids)
+        self._own_tendency = np.full(n, math.nan)
+        self._own_tendency[:len(nodes)] = np.fromiter(
+            (node_tendency(node) for node in nodes), dtype=np.float64, count=len(nodes))
+        self._layer = np.full(n, -1, dtype=np.int64)
+        self._layer[:len(nodes)] = np.fromiter(
+            (_layer_code(node) for node in nodes), dtype=np.int64, count=len(nodes))
+        self._live = np.ones(n, dtype=bool)
+
+        m = len(relationships)
+        sources = np.fromiter((self.node_index[rel.source_id] for rel in relationships),
+                              dtype=np.int64, count=m)
+        targets = np.fromiter((self.node_index[rel.target_id] for rel in relationships),
+                              dtype=np.int64, count=m)
+        kinds = np.fromiter((KIND_CODES[rel.kind] for rel in relationships),
+                            dtype=np.int64, count=m)
+        mass = np.fromiter((relationship_mass(rel.weight, rel.certainty)
+                            for rel in relationships), dtype=np.float64, count=m)
+        ceremonial = mass * CEREMONIAL_TENDENCY[kinds]
+
+        self._incident_ceremonial = (np.bincount(sources, ceremonial, minlength=n)
+                                     + np.bincount(targets, ceremonial, minlength=n))
+        self._incident_mass = (np.bincount(sources, mass, minlength=n)
+                               + np.bincount(targets, mass, minlength=n))
+        self._edges = {
+            rel.id: edge for rel, edge in zip(relationships, zip(
+                sources.tolist(), targets.tolist(), ceremonial.tolist(), mass.tolist()))
+        }
+        self._edge_ceremonial = float(ceremonial.sum())
+        self._edge_mass = float(mass.sum())
+        self._synced_version = self.graph.graph_version
+
+    def _on_graph_mutation(self, event: str, version: int, **context) -> None:
+        """Apply a single graph mutation to the masses."""
+        if self._synced_version is None or version != self._synced_version + 1:
+            return  # Not built yet, or a change was missed: rebuild on next query
+        if event == "node_added":
+            self._add_node(context["node"])
+        elif event == "node_removed":
+            index = self.node_index.get(context["node_id"])
+            if index is not None:  # Its relationships were removed first
+                self._live[index] = False
+                self._own_tendency[index] = math.nan
+                self._layer[index] = -1
+        elif event == "relationship_added":
+            self._add_relationship(context["relationship"])
+        elif event == "relationship_removed":
+            self._remove_relationship(context["relationship"].id)
+        else:
+            return  # graph_cleared: rebuild (and compact) on next query
+        self._synced_version = version
+
+    def _slot(self, node_id: uuid.UUID) -> int:
+        """Array index of a node, appending a live slot if it is new."""
+        index = self.node_index.get(node_id)
+        if index is None:
+            if self._size == self._live.size:
+                capacity = max(2 * self._live.size, 16)
+                self._incident_ceremonial = _grown(self._incident_ceremonial, capacity, 0.0)
+                self._incident_mass = _grown(self._incident_mass, capacity, 0.0)
+                self._own_tendency = _grown(self._own_tendency, capacity, math.nan)
+                self._layer = _grown(self._layer, capacity, -1)
+                self._live = _grown(self._live, capacity, False)
+            index = self._size
+            self._size += 1
+            self.node_index[node_id] = index
+            self.node_ids.append(node_id)
+        self._live[index] = True
+        return index
+
+    def _add_node(self, node: Node) -> None:
+        """Record a node's own tendency and layer, growing the arrays geometrically."""
+        index = self._slot(node.id)
+        self._own_tendency[index] = node_tendency(node)
+        self._layer[index] = _layer_code(node)
+
+    def _add_relationship(self, relationship: Relationship) -> None:
+        """Add one relationship's mass to its endpoints."""
+        mass = relationship_mass(relationship.weight, relationship.certainty)
+        edge = (self._slot(relationship.source_id), self._slot(relationship.target_id),
+                mass * relationship.kind.ceremonial_tendency, mass)
+        self._edges[relationship.id] = edge
+        self._apply(edge, 1.0)
+
+    def _remove_relationship(self, relationship_id: uuid.UUID) -> None:
+        """Remove the mass one relationship contributed when it was added."""
+        edge = self._edges.pop(relationship_id, None)
+        if edge is not None:
+            self._apply(edge, -1.0)
+
+    def _apply(self, edge: EdgeMass, sign: float) -> None:
+        """Add (sign 1) or subtract (sign -1) one relationship's mass."""
+        source, target, ceremonial, mass = edge
+        for index in (source, target):
+            self._incident_ceremonial[index] += sign * ceremonial
+            self._incident_mass[index] += sign * mass
+        self._edge_ceremonial += sign * ceremonial
+        self._edge_mass += sign * mass
+
+    # ─── QUERIES ───
+
+    def _node_masses(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Ceremonial and total mass of every node slot, own evidence included."""
+        own = self._own_tendency[:self._size]
+        has_own = ~np.isnan(own)
+        own_weight = np.where(has_own, self.node_evidence_weight, 0.0)
+        own_ceremonial = own_weight * np.where(has_own, own, 0.0)
+        ceremonial = self._incident_ceremonial[:self._size] + own_ceremonial
+        mass = self._incident_mass[:self._size] + own_weight
+        live = self._live[:self._size]
+        return np.where(live, ceremonial, 0.0), np.where(live, mass, 0.0)
+
+    def graph_balance(self) -> BalanceScore:
+        """Balance of the whole graph; each relationship counts once."""
+        self.sync()
+        own = self._own_tendency[:self._size]
+        has_own = ~np.isnan(own) & self._live[:self._size]
+        ceremonial = self._edge_ceremonial + self.node_evidence_weight * float(own[has_own].sum())
+        mass = self._edge_mass + self.node_evidence_weight * int(has_own.sum())
+        return BalanceScore(ceremonial, max(mass - ceremonial, 0.0))
+
+    def node_balance(self, node_id: uuid.UUID) -> Optional[BalanceScore]:
+        """Balance of one node's relationships and own score, None for unknown nodes."""
+        self.sync()
+        index = self.node_index.get(node_id)
+        if index is None or not self._live[index]:
+            return None
+        ceremonial, mass = self._node_masses()
+        return BalanceScore(float(ceremonial[index]), float(mass[index] - ceremonial[index]))
+
+    def node_balances(self) -> Dict[uuid.UUID, BalanceScore]:
+        """Balance of every node with any evidence."""
+        self.sync()
+        ceremonial, mass = self._node_masses()
+        present = np.flatnonzero(mass > 0)
+        return {
+            self.node_ids[i]: BalanceScore(c, max(total - c, 0.0))
+            for i, c, total in zip(present.tolist(), ceremonial[present].tolist(),
+                                   mass[present].tolist())
+        }
+
+    def node_scores(self) -> Dict[uuid.UUID, float]:
+        """Ceremonial share of every node with any evidence."""
+        self.sync()
+        ceremonial, mass = self._node_masses()
+        present = np.flatnonzero(mass > 0)
+        scores = ceremonial[present] / mass[present]
+        return {self.node_ids[i]: score for i, score in zip(present.tolist(), scores.tolist())}
+
+    def group_balance(self, labels: Mapping[uuid.UUID, Hashable]) -> Dict[Hashable, BalanceScore]:
+        """Balance of node groups, e.g. communities; unlabeled nodes are left out.
+
+        Relationships inside a group count at both endpoints, so a group's
+        score weighs its internal relationships as much as its members do.
+        """
+        self.sync()
+        groups: Dict[Hashable, int] = {}
+        codes = np.full(self._size, -1, dtype=np.int64)
+        for node_id, label in labels.items():
+            index = self.node_index.get(node_id)
+            if index is not None:
+                codes[index] = groups.setdefault(label, len(groups))
+        return self._aggregate(codes, list(groups))
+
+    def layer_balance(self) -> Dict[InstitutionLayer, BalanceScore]:
+        """Balance of the institutions in each of Hayden's institution layers."""
+        self.sync()
+        return {
+            layer: balance for layer, balance
+            in self._aggregate(self._layer[:self._size], LAYERS).items()
+            if balance.total > 0
+        }
+
+    def _aggregate(self, codes: np.ndarray, groups: List[Any]) -> Dict[Any, BalanceScore]:
+        """Sum node masses per group code (-1 for none)."""
+        ceremonial, mass = self._node_masses()
+        member = codes >= 0
+        group_ceremonial = np.bincount(codes[member], ceremonial[member], minlength=len(groups))
+        group_mass = np.bincount(codes[member], mass[member], minlength=len(groups))
+        return {
+            group: BalanceScore(c, max(total - c, 0.0))
+            for group, c, total in zip(groups, group_ceremonial.tolist(), group_mass.tolist())
+        }
+
+
+def _layer_code(node: Node) -> int:
+    """Institution layer of a node as an index into LAYERS, -1 for none."""
+    layer = getattr(node, "layer", None)
+    return LAYER_CODES.get(layer, -1) if isinstance(layer, InstitutionLayer) else -1
+
+
+def _grown(array: np.ndarray, capacity: int, fill: Any) -> np.ndarray:
+    """Copy of an array extended to `capacity` with `fill`."""
+    grown = np.full(capacity, fill, dtype=array.dtype)
+    grown[:array.size] = array
+    return grown
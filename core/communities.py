@@ -0,0 +1,231 @@
+"""
+Incremental community detection for SFM query engines.
+
+Running Louvain from scratch after every edit makes community views lag
+behind analysts who change a few relationships at a time. A
+CommunityTracker keeps the last partition together with the graph version
+it belongs to, records which nodes the graph mutations touched since, and
+brings the partition up to date by re-optimizing only the communities that
+contain those nodes, starting from their previous assignment.
+
+Features:
+- Partition cached per graph version; unchanged graphs are never re-clustered
+- Warm-started Louvain local moving restricted to the affected communities,
+  using modularity gains over the whole graph
+- Affected communities split into connected pieces after moving
+- Stable community labels: untouched communities keep their label across
+  versions, so assignments can be stored (e.g. NetworkMetrics.community_assignment)
+- Full Louvain run on first use, after missed mutations, or when too much of
+  the graph changed
+"""
+
+from types import MappingProxyType
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+DEFAULT_MAX_LOCAL_PASSES = 20
+# Above this share of nodes in affected communities, a full run is cheaper
+DEFAULT_FULL_RECOMPUTE_FRACTION = 0.5
+
+
+def undirected_weights(nx_graph: nx.Graph, nodelist: List[Hashable]) -> sparse.csr_matrix:
+    """Symmetric edge-weight matrix of the undirected view of `nx_graph`.
+
+    Parallel edges and both directions add up and a self-loop counts twice
+    towards its node's degree, as in NetworkX's Louvain on `to_undirected()`.
+    """
+    directed = sparse.csr_matrix(nx.to_scipy_sparse_array(
+        nx_graph, nodelist=nodelist, weight="weight", dtype=np.float64, format="csr"
+    ))
+    return sparse.csr_matrix(directed + directed.T)
+
+
+class CommunityTracker:
+    """Louvain partition of one graph, kept current across graph versions.
+
+    The owning engine reports every applied mutation through
+    `record_change(version, node_ids)`. `partition(nx_graph, version)` then
+    returns the cached partition, updates it incrementally when every
+    version since the cached one was recorded, or recomputes it in full.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        max_local_passes: int = DEFAULT_MAX_LOCAL_PASSES,
+        full_recompute_fraction: float = DEFAULT_FULL_RECOMPUTE_FRACTION,
+    ):
+        self.seed = seed
+        self.max_local_passes = max_local_passes
+        self.full_recompute_fraction = full_recompute_fraction
+        self.version: Optional[int] = None
+        # "cached", "incremental" or "full": how the last partition was obtained
+        self.last_update: Optional[str] = None
+        self._labels: Dict[Hashable, int] = {}
+        self._next_label = 0
+        self._changed: Set[Hashable] = set()
+        self._recorded_version: Optional[int] = None
+
+    # ─── CHANGE TRACKING ───
+
+    def record_change(self, version: int, node_ids: Iterable[Hashable]) -> None:
+        """Note the nodes touched by the mutation that produced `version`."""
+        if self._recorded_version is None or version != self._recorded_version + 1:
+            self.invalidate()
+            return
+        self._changed.update(node_ids)
+        self._recorded_version = version
+
+    def invalidate(self) -> None:
+        """Forget the partition; the next request runs Louvain in full."""
+        self.version = None
+        self._recorded_version = None
+        self._changed.clear()
+
+    # ─── PARTITION ───
+
+    def partition(self, nx_graph: nx.Graph, version: int) -> Mapping[Hashable, int]:
+        """Community label of every node of `nx_graph` at graph `version`.
+
+        The result is a read-only view of the tracker's labels, which the
+        next update warm-starts from; copy it to get a mutable dict.
+        """
+        if self.version == version:
+            self.last_update = "cached"
+        elif self.version is not None and self._recorded_version == version:
+            self._update(nx_graph)
+        else:
+            self._recompute(nx_graph)
+        self.version = version
+        self._recorded_version = version
+        self._changed.clear()
+        return MappingProxyType(self._labels)
+
+    def communities(self, nx_graph: nx.Graph, version: int) -> Dict[int, List[Hashable]]:
+        """Members of every community, keyed by community label."""
+        communities: Dict[int, List[Hashable]] = {}
+        for node, label in self.partition(nx_graph, version).items():
+            communities.setdefault(label, []).append(node)
+        return communities
+
+    def _recompute(self, nx_graph: nx.Graph) -> None:
+        """Run Louvain from scratch and number the communities from zero."""
+        self.last_update = "full"
+        self._labels = {}
+        if nx_graph.number_of_nodes() == 0:
+            self._next_label = 0
+            return
+        communities = nx.algorithms.community.louvain_communities(
+            nx_graph.to_undirected(), seed=self.seed
+        )
+        for label, members in enumerate(communities):
+            for node in members:
+                self._labels[node] = label
+        self._next_label = len(communities)
+
+    def _update(self, nx_graph: nx.Graph) -> None:
+        """Re-optimize the communities that contain changed nodes."""
+        nodes = list(nx_graph.nodes())
+        node_count = len(nodes)
+        previous = self._labels
+        affected_labels = {previous[node] for node in self._changed if node in previous}
+        affected_nodes = [
+            node for node in nodes
+            if node in self._changed or previous.get(node) in affected_labels
+        ]
+        if len(affected_nodes) > self.full_recompute_fraction * node_count:
+            self._recompute(nx_graph)
+            return
+        self.last_update = "incremental"
+
+        # Warm start: previous labels, new nodes in singleton communities
+        labels = np.empty(node_count, dtype=np.int64)
+        for i, node in enumerate(nodes):
+            label = previous.get(node)
+            if label is None:
+                label = self._next_label
+                self._next_label += 1
+            labels[i] = label
+
+        weights = undirected_weights(nx_graph, nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+        movable = np.array([index[node] for node in affected_nodes], dtype=np.int64)
+        self._local_moving(weights, labels, movable)
+        self._split_disconnected(weights, labels, movable)
+        self._labels = dict(zip(nodes, labels.tolist()))
+
+    def _local_moving(
+        self, weights: sparse.csr_matrix, labels: np.ndarray, movable: np.ndarray
+    ) -> None:
+        """Louvain phase one, moving only the `movable` nodes.
+
+        Each node joins the neighboring community with the largest modularity
+        gain k_i,C - k_i * tot_C / 2m until a pass moves nothing.
+        """
+        degrees = np.asarray(weights.sum(axis=1)).ravel()
+        total_weight = degrees.sum()
+        if total_weight == 0 or movable.size == 0:
+            return
+        totals: Dict[int, float] = {}
+        for label, degree in zip(labels.tolist(), degrees.tolist()):
+            totals[label] = totals.get(label, 0.0) + degree
+        indptr, indices, data = weights.indptr, weights.indices, weights.data
+
+        for _ in range(self.max_local_passes):
+            moved = False
+            for node in movable.tolist():
+                current = int(labels[node])
+                degree = degrees[node]
+                links: Dict[int, float] = {}
+                for neighbor, weight in zip(indices[indptr[node]:indptr[node + 1]].tolist(),
+                                            data[indptr[node]:indptr[node + 1]].tolist()):
+                    if neighbor != node:
+                        label = int(labels[neighbor])
+                        links[label] = links.get(label, 0.0) + weight
+
+                totals[current] -= degree
+                best = current
+                best_gain = links.get(current, 0.0) - totals[current] * degree / total_weight
+                for label, link in links.items():
+                    gain = link - totals[label] * degree / total_weight
+                    if gain > best_gain:
+                        best, best_gain = label, gain
+                totals[best] += degree
+                if best != current:
+                    labels[node] = best
+                    moved = True
+            if not moved:
+                break
+
+    def _split_disconnected(
+        self, weights: sparse.csr_matrix, labels: np.ndarray, movable: np.ndarray
+    ) -> None:
+        """Give every connected piece of a re-optimized community its own label.
+
+        The largest piece keeps the community's label; the others get fresh
+        labels.
+        """
+        touched = np.unique(labels[movable])
+        members = np.flatnonzero(np.isin(labels, touched))
+        if members.size == 0:
+            return
+        # Only keep edges inside a community
+        sub = sparse.coo_matrix(weights[members][:, members])
+        same = labels[members][sub.row] == labels[members][sub.col]
+        inner = sparse.csr_matrix(
+            (sub.data[same], (sub.row[same], sub.col[same])), shape=sub.shape
+        )
+        _, pieces = csgraph.connected_components(inner, directed=False)
+
+        for label in touched.tolist():
+            in_label = labels[members] == label
+            piece_ids, sizes = np.unique(pieces[in_label], return_counts=True)
+            if piece_ids.size <= 1:
+                continue
+            for piece in piece_ids[np.argsort(-sizes, kind="stable")][1:].tolist():
+                labels[members[in_label & (pieces == piece)]] = self._next_label
+                self._next_label += 1
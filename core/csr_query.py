@@ -0,0 +1,830 @@
+"""
+Compressed sparse row (CSR) query engine for Social Fabric Matrix analysis.
+
+The NetworkX engine keeps a Python dict per edge plus a reference to the full
+Relationship dataclass. This backend stores the graph as flat NumPy arrays
+instead: dense int32 node indices, float64 edge weights and uint8
+RelationshipKind codes, i.e. 13 bytes per edge. Traversals (BFS, shortest
+path, ego graphs) and spectral measures (eigenvector centrality, PageRank) run
+as vectorized NumPy code over those arrays; redundant-path counting uses
+SciPy sparse products over the same arrays.
+
+Analyses that have no array formulation here (cycles, communities, scenario
+and temporal comparisons, failure simulations, ...) are delegated to a
+NetworkXSFMQueryEngine that is only built the first time one of them is used.
+"""
+
+import logging
+import uuid
+from array import array
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from core.centrality import SUPPORTED_CENTRALITY_TYPES, CentralityStore
+from core.cycles import (
+    DEFAULT_CYCLE_TIME_LIMIT,
+    DEFAULT_MAX_CYCLE_LENGTH,
+    DEFAULT_MAX_CYCLES,
+    CycleList,
+)
+from core.distance_oracle import (
+    DEFAULT_LANDMARKS, LandmarkDistanceOracle, bidirectional_hop_distance
+)
+from core.parallel_centrality import CompactGraph, ParallelCentralityExecutor
+from core.path_counting import flow_inefficiency_report
+from core.percolation import DEFAULT_RANDOM_TRIALS, RobustnessCurve
+from core.policy_batch import batch_policy_impact
+from core.reachability import ReachabilityIndex
+from core.scenario_overlay import ScenarioOverlay
+from core.sfm_enums import FlowNature, RelationshipKind, ResourceType
+from core.sfm_models import Actor, Institution, Resource, SFMGraph
+from core.sfm_query import (
+    FlowAnalysis,
+    NetworkXSFMQueryEngine,
+    NodeMetrics,
+    NodePair,
+    PathHeuristic,
+    SFMQueryEngine,
+    TraversalResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# Public API
+__all__ = [
+    'RELATIONSHIP_KIND_CODES',
+    'CSRSFMQueryEngine',
+]
+
+# Stable uint8 code per RelationshipKind (enum declaration order)
+RELATIONSHIP_KIND_CODES: Dict[RelationshipKind, int] = {
+    kind: code for code, kind in enumerate(RelationshipKind)
+}
+UNKNOWN_KIND_CODE = 255
+assert len(RELATIONSHIP_KIND_CODES) < UNKNOWN_KIND_CODE, "RelationshipKind no longer fits in uint8"
+
+CSR_CENTRALITY_TYPES = SUPPORTED_CENTRALITY_TYPES + ("pagerank",)
+
+
+def _to_int_array(values: np.ndarray) -> array:
+    """Convert an integer NumPy array into the stdlib array used by CompactGraph."""
+    return array("q", values.astype(np.int64).tobytes())
+
+
+def _kind_code(kind: Any) -> int:
+    """Map a relationship kind (enum or enum name) to its uint8 code."""
+    if isinstance(kind, str):
+        kind = RelationshipKind.__members__.get(kind.upper(), kind)
+    return RELATIONSHIP_KIND_CODES.get(kind, UNKNOWN_KIND_CODE)
+
+
+class CSRSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public-methods
+    """NumPy CSR-backed implementation of the SFM query engine.
+
+    The arrays are rebuilt lazily whenever the graph version moves, so the
+    engine never serves results for a graph state it has not indexed.
+    """
+
+    def __init__(
+        self,
+        graph: SFMGraph,
+        centrality_workers: Optional[int] = 1,
+        max_iter: int = 1000,
+        tol: float = 1.0e-6,
+    ):
+        super().__init__(graph)
+        self.max_iter = max_iter
+        self.tol = tol
+        self.centrality_executor = ParallelCentralityExecutor(centrality_workers)
+        self._centrality_store = CentralityStore()
+        self._networkx_engine: Optional[NetworkXSFMQueryEngine] = None
+        # Reachability indexes per relationship-kind set, dropped when the arrays are rebuilt
+        self._reachability_indexes: Dict[Optional[FrozenSet[Any]], ReachabilityIndex] = {}
+        # Landmark distance oracles per (landmarks, strategy), dropped with the arrays
+        self._distance_oracles: Dict[Tuple[int, str], LandmarkDistanceOracle] = {}
+        # Forward and transposed adjacency for single-pair hop distances, dropped with the arrays
+        self._hop_adjacency: Optional[Tuple[sparse.csr_matrix, sparse.csr_matrix]] = None
+        self._built_version = -1
+        self._build_arrays()
+
+    # ─── ARRAY CONSTRUCTION ───
+
+    def _build_arrays(self) -> None:
+        """Convert the SFMGraph into CSR arrays."""
+        node_ids: List[uuid.UUID] = []
+        nodes: List[Any] = []
+        node_index: Dict[uuid.UUID, int] = {}
+        for node in self.graph:
+            node_index[node.id] = len(node_ids)
+            node_ids.append(node.id)
+            nodes.append(node)
+
+        relationships = list(self.graph.relationships.values())
+        edge_count = len(relationships)
+        sources = np.empty(edge_count, dtype=np.int32)
+        targets = np.empty(edge_count, dtype=np.int32)
+        weights = np.empty(edge_count, dtype=np.float64)
+        kinds = np.empty(edge_count, dtype=np.uint8)
+        for i, rel in enumerate(relationships):
+            # Endpoints that are not loaded as nodes still take part in traversals,
+            # exactly as NetworkX adds bare nodes for dangling edges
+            for endpoint in (rel.source_id, rel.target_id):
+                if endpoint not in node_index:
+                    node_index[endpoint] = len(node_ids)
+                    node_ids.append(endpoint)
+                    nodes.append(None)
+            sources[i] = node_index[rel.source_id]
+            targets[i] = node_index[rel.target_id]
+            weights[i] = rel.weight or 1.0
+            kinds[i] = _kind_code(rel.kind)
+
+        # Stable sort keeps relationship insertion order within each row
+        order = np.argsort(sources, kind="stable")
+        node_count = len(node_ids)
+        self.indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=node_count), out=self.indptr[1:])
+        self.indices = targets[order]
+        self.weights = weights[order]
+        self.kinds = kinds[order]
+
+        self.node_ids = node_ids
+        self.node_index = node_index
+        self._nodes = nodes
+        self._reachability_indexes.clear()
+        self._distance_oracles.clear()
+        self._hop_adjacency = None
+        self._built_version = self.graph.graph_version
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes indexed by the engine."""
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of relationships indexed by the engine."""
+        return int(self.indices.shape[0])
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the graph changed since the arrays were built."""
+        return self._built_version != self.graph.graph_version
+
+    def sync(self) -> None:
+        """Rebuild the CSR arrays if the graph has changed."""
+        if self.is_stale:
+            self._build_arrays()
+
+    def get_memory_usage(self) -> Dict[str, Any]:
+        """Report the memory held by the CSR arrays."""
+        edge_bytes = self.indices.nbytes + self.weights.nbytes + self.kinds.nbytes
+        return {
+            "nodes": self.node_count,
+            "edges": self.edge_count,
+            "edge_array_bytes": edge_bytes,
+            "indptr_bytes": self.indptr.nbytes,
+            "bytes_per_edge": edge_bytes / self.edge_count if self.edge_count else 0.0,
+        }
+
+    # ─── VECTORIZED PRIMITIVES ───
+
+    def _adjacency_matrix(self) -> sparse.csr_matrix:
+        """Edge-multiplicity adjacency matrix over the current arrays."""
+        self.sync()
+        # Copy: sum_duplicates sorts indices in place, which must not touch the engine arrays
+        adjacency = sparse.csr_matrix(
+            (np.ones(self.edge_count, dtype=np.int64), self.indices, self.indptr),
+            shape=(self.node_count, self.node_count), copy=True,
+        )
+        adjacency.sum_duplicates()
+        return adjacency
+
+    def _source_array(self) -> np.ndarray:
+        """Expand indptr into the source index of every edge."""
+        return np.repeat(
+            np.arange(self.node_count, dtype=np.int32), np.diff(self.indptr)
+        )
+
+    def _kind_mask(
+        self, relationship_kinds: Optional[Sequence[RelationshipKind]]
+    ) -> Optional[np.ndarray]:
+        """Lookup table of allowed kind codes, or None when unfiltered."""
+        if not relationship_kinds:
+            return None
+        allowed = np.zeros(256, dtype=bool)
+        for kind in relationship_kinds:
+            allowed[_kind_code(kind)] = True
+        return allowed
+
+    def _out_edges(
+        self, frontier: np.ndarray, allowed_kinds: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions and source nodes of all out-edges of the frontier nodes."""
+        starts = self.indptr[frontier]
+        counts = self.indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        # Offsets of each frontier node's slice within the gathered edge list
+        row_offsets = np.cumsum(counts) - counts
+        positions = np.repeat(starts - row_offsets, counts) + np.arange(total)
+        edge_sources = np.repeat(frontier, counts)
+        if allowed_kinds is not None:
+            keep = allowed_kinds[self.kinds[positions]]
+            positions = positions[keep]
+            edge_sources = edge_sources[keep]
+        return positions, edge_sources
+
+    def bfs(
+        self,
+        source: int,
+        max_depth: Optional[int] = None,
+        allowed_kinds: Optional[np.ndarray] = None,
+        target: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Level-synchronous BFS over out-edges.
+
+        Args:
+            source: Start node index
+            max_depth: Stop after this many levels (None = unbounded)
+            allowed_kinds: Kind-code lookup table restricting traversed edges
+            target: Stop as soon as this node index is reached
+
+        Returns:
+            (distance, parent) int32 arrays; unreached nodes have distance -1
+        """
+        distance = np.full(self.node_count, -1, dtype=np.int32)
+        parent = np.full(self.node_count, -1, dtype=np.int32)
+        distance[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        depth = 0
+        while frontier.size and (max_depth is None or depth < max_depth):
+            if target is not None and distance[target] >= 0:
+                break
+            positions, edge_sources = self._out_edges(frontier, allowed_kinds)
+            reached = self.indices[positions]
+            unseen = distance[reached] < 0
+            reached, edge_sources = reached[unseen], edge_sources[unseen]
+            # First edge to reach a node wins, matching BFS discovery order
+            reached, first = np.unique(reached, return_index=True)
+            depth += 1
+            distance[reached] = depth
+            parent[reached] = edge_sources[first]
+            frontier = reached.astype(np.int64)
+        return distance, parent
+
+    def _dedup_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Edge positions with parallel edges collapsed (first occurrence kept)."""
+        sources = self._source_array().astype(np.int64)
+        keys = sources * max(1, self.node_count) + self.indices
+        _, first = np.unique(keys, return_index=True)
+        keep = np.sort(first)
+        return sources[keep], self.indices[keep].astype(np.int64)
+
+    def _compact_graph(self, node_subset: Optional[np.ndarray] = None) -> CompactGraph:
+        """Build the CompactGraph used by the betweenness/closeness kernels."""
+        sources, targets = self._dedup_edges()
+        node_ids = self.node_ids
+        if node_subset is not None:
+            remap = np.full(self.node_count, -1, dtype=np.int64)
+            remap[node_subset] = np.arange(node_subset.size)
+            inside = (remap[sources] >= 0) & (remap[targets] >= 0)
+            sources, targets = remap[sources[inside]], remap[targets[inside]]
+            node_ids = [self.node_ids[i] for i in node_subset.tolist()]
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(node_ids)), out=indptr[1:])
+        order = np.argsort(sources, kind="stable")
+        return CompactGraph(
+            node_ids=list(node_ids),
+            indptr=_to_int_array(indptr),
+            indices=_to_int_array(targets[order]),
+        )
+
+    # ─── CENTRALITY ───
+
+    def _degree_centrality(self) -> np.ndarray:
+        """Total (in + out) degree normalized by n - 1, counting parallel edges."""
+        if self.node_count <= 1:
+            return np.ones(self.node_count)
+        degree = np.diff(self.indptr) + np.bincount(self.indices, minlength=self.node_count)
+        return degree / (self.node_count - 1)
+
+    def _eigenvector_centrality(self) -> np.ndarray:
+        """Left eigenvector centrality by power iteration on (A + I)."""
+        if self.node_count == 0:
+            return np.zeros(0)
+        sources, targets = self._dedup_edges()
+        x = np.full(self.node_count, 1.0 / self.node_count)
+        for _ in range(self.max_iter):
+            x_last = x
+            x = x_last + np.bincount(targets, weights=x_last[sources], minlength=self.node_count)
+            norm = np.sqrt(np.dot(x, x)) or 1.0
+            x = x / norm
+            if np.abs(x - x_last).sum() < self.node_count * self.tol:
+                return x
+        logger.warning("Eigenvector centrality did not converge, using degree centrality")
+        return self._degree_centrality()
+
+    def get_pagerank(self, alpha: float = 0.85) -> Dict[uuid.UUID, float]:
+        """Weighted PageRank with uniform teleport and dangling redistribution."""
+        return self._get_centrality("pagerank", params={"alpha": alpha})
+
+    def _pagerank(self, alpha: float) -> np.ndarray:
+        """Power-iteration PageRank over the weighted CSR arrays."""
+        n = self.node_count
+        if n == 0:
+            return np.zeros(0)
+        sources = self._source_array()
+        out_weight = np.bincount(sources, weights=self.weights, minlength=n)
+        dangling = out_weight == 0
+        edge_share = self.weights / np.where(dangling, 1.0, out_weight)[sources]
+        x = np.full(n, 1.0 / n)
+        for _ in range(self.max_iter):
+            x_last = x
+            x = alpha * np.bincount(self.indices, weights=x_last[sources] * edge_share, minlength=n)
+            x += (alpha * x_last[dangling].sum() + (1.0 - alpha)) / n
+            if np.abs(x - x_last).sum() < n * self.tol:
+                return x
+        logger.warning("PageRank did not converge after %d iterations", self.max_iter)
+        return x
+
+    def _compute_centrality(self, centrality_type: str, **params) -> Dict[uuid.UUID, float]:
+        """Compute a whole-graph centrality measure from the arrays."""
+        if centrality_type in ("betweenness", "closeness"):
+            return self.centrality_executor.compute(
+                self._compact_graph(), [centrality_type]
+            )[centrality_type]
+        if centrality_type == "degree":
+            scores = self._degree_centrality()
+        elif centrality_type == "eigenvector":
+            scores = self._eigenvector_centrality()
+        else:
+            scores = self._pagerank(params["alpha"])
+        return dict(zip(self.node_ids, scores.tolist()))
+
+    def _get_centrality(
+        self, centrality_type: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[uuid.UUID, float]:
+        """Get a whole-graph centrality measure, computed at most once per graph version."""
+        if centrality_type not in CSR_CENTRALITY_TYPES:
+            raise ValueError(f"Unsupported centrality type: {centrality_type}")
+        if centrality_type == "pagerank" and not params:
+            params = {"alpha": 0.85}
+        self.sync()
+        return self._centrality_store.get_or_compute(
+            self._built_version,
+            centrality_type,
+            lambda: self._compute_centrality(centrality_type, **(params or {})),
+            params,
+        )
+
+    def get_all_centralities(
+        self, types: Optional[List[str]] = None, sample_size: Optional[int] = None
+    ) -> Dict[str, Dict[uuid.UUID, float]]:
+        """Get whole-graph scores for several centrality measures in one call.
+
+        Betweenness is always exact on this backend; sample_size is ignored.
+        """
+        types = list(types) if types else list(SUPPORTED_CENTRALITY_TYPES)
+        return {centrality_type: self._get_centrality(centrality_type) for centrality_type in types}
+
+    def get_node_centrality(
+        self,
+        node_id: uuid.UUID,
+        centrality_type: str = "betweenness",
+        sample_size: Optional[int] = None,
+    ) -> float:
+        """Calculate centrality measures for a node."""
+        return self._get_centrality(centrality_type).get(node_id, 0.0)
+
+    def get_most_central_nodes(
+        self,
+        node_type: Optional[type] = None,
+        centrality_type: str = "betweenness",
+        limit: int = 10,
+        sample_size: Optional[int] = None,
+    ) -> List[Tuple[uuid.UUID, float]]:
+        """Get the most central nodes by type."""
+        centrality = self._get_centrality(centrality_type)
+        scores = np.array([centrality[node_id] for node_id in self.node_ids])
+        if node_type:
+            eligible = np.array([isinstance(node, node_type) for node in self._nodes], dtype=bool)
+        else:
+            eligible = np.ones(self.node_count, dtype=bool)
+        candidates = np.flatnonzero(eligible)
+        # Stable descending sort keeps ties in node order, like sorted(..., reverse=True)
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")][:limit]
+        return [(self.node_ids[i], float(scores[i])) for i in ranked]
+
+    # ─── TRAVERSAL ───
+
+    def get_ego_nodes(
+        self,
+        node_id: uuid.UUID,
+        radius: int = 1,
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+    ) -> List[uuid.UUID]:
+        """Get the node and everything reachable from it within radius hops."""
+        self.sync()
+        source = self.node_index.get(node_id)
+        if source is None:
+            return []
+        distance, _ = self.bfs(source, radius, self._kind_mask(relationship_kinds))
+        return [self.node_ids[i] for i in np.flatnonzero(distance >= 0).tolist()]
+
+    def get_node_neighbors(
+        self,
+        node_id: uuid.UUID,
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+        distance: int = 1,
+    ) -> List[uuid.UUID]:
+        """Get neighboring nodes within specified distance."""
+        self.sync()
+        source = self.node_index.get(node_id)
+        if source is None:
+            return []
+        allowed = self._kind_mask(relationship_kinds)
+        if distance == 1:
+            # Direct successors, including the node itself for self-loops
+            positions, _ = self._out_edges(np.array([source], dtype=np.int64), allowed)
+            return [self.node_ids[i] for i in np.unique(self.indices[positions]).tolist()]
+
+        hops, _ = self.bfs(source, distance, allowed)
+        return [self.node_ids[i] for i in np.flatnonzero(hops > 0).tolist()]
+
+    def traverse(
+        self,
+        node_id: uuid.UUID,
+        max_depth: int = 1,
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+        include_paths: bool = False,
+    ) -> TraversalResult:
+        """Breadth-first traversal from a node, bounded by depth."""
+        if include_paths:
+            # Relationship IDs are not part of the CSR arrays
+            return self.networkx_engine.traverse(
+                node_id, max_depth, relationship_kinds, include_paths
+            )
+
+        self.sync()
+        result = TraversalResult(source_id=node_id, max_depth=max_depth)
+        source = self.node_index.get(node_id)
+        if source is None:
+            return result
+        hops, _ = self.bfs(source, max_depth, self._kind_mask(relationship_kinds))
+        reached = np.flatnonzero(hops > 0)
+        reached = reached[np.argsort(hops[reached], kind="stable")]
+        result.distances = {self.node_ids[i]: int(hops[i]) for i in reached.tolist()}
+        return result
+
+    def reachability_index(
+        self, relationship_kinds: Optional[List[RelationshipKind]] = None
+    ) -> ReachabilityIndex:
+        """Reachability index over the CSR arrays, built once per graph version and kind set."""
+        self.sync()
+        allowed = self._kind_mask(relationship_kinds)
+
+        kinds = frozenset(relationship_kinds) if relationship_kinds else None
+        index = self._reachability_indexes.get(kinds)
+        if index is None:
+            mask = np.ones(self.edge_count, dtype=bool) if allowed is None else allowed[self.kinds]
+            adjacency = sparse.csr_matrix(
+                (mask, self.indices, self.indptr),
+                shape=(self.node_count, self.node_count), copy=True,
+            )
+            adjacency.eliminate_zeros()
+            index = ReachabilityIndex(adjacency, self.node_ids)
+            self._reachability_indexes[kinds] = index
+        return index
+
+    def can_reach(
+        self,
+        source_id: uuid.UUID,
+        target_id: uuid.UUID,
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+    ) -> bool:
+        """True if any directed path leads from source to target."""
+        return self.reachability_index(relationship_kinds).can_reach(source_id, target_id)
+
+    def find_shortest_path(
+        self,
+        source_id: uuid.UUID,
+        target_id: uuid.UUID,
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+        cost: Optional[str] = None,
+        heuristic: Optional[PathHeuristic] = None,
+    ) -> Optional[List[uuid.UUID]]:
+        """Find shortest path between two nodes."""
+        if cost or heuristic:
+            # Certainty is not part of the CSR arrays; weighted search runs on NetworkX
+            return self.networkx_engine.find_shortest_path(
+                source_id, target_id, relationship_kinds, cost, heuristic
+            )
+
+        self.sync()
+        source = self.node_index.get(source_id)
+        target = self.node_index.get(target_id)
+        if source is None or target is None:
+            return None
+        if source == target:
+            return [source_id]
+
+        distance, parent = self.bfs(
+            source, allowed_kinds=self._kind_mask(relationship_kinds), target=target
+        )
+        if distance[target] < 0:
+            return None
+        path = [target]
+        while path[-1] != source:
+            path.append(int(parent[path[-1]]))
+        return [self.node_ids[i] for i in reversed(path)]
+
+    def find_shortest_paths_bulk(
+        self,
+        pairs: List[NodePair],
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+        cost: Optional[str] = None,
+    ) -> Dict[NodePair, Optional[List[uuid.UUID]]]:
+        """Find shortest paths for many pairs with one BFS per distinct source."""
+        if cost:
+            return self.networkx_engine.find_shortest_paths_bulk(pairs, relationship_kinds, cost)
+
+        self.sync()
+        allowed = self._kind_mask(relationship_kinds)
+        targets_by_source: Dict[uuid.UUID, List[uuid.UUID]] = {}
+        for source_id, target_id in pairs:
+            targets_by_source.setdefault(source_id, []).append(target_id)
+
+        results: Dict[NodePair, Optional[List[uuid.UUID]]] = {}
+        for source_id, target_ids in targets_by_source.items():
+            source = self.node_index.get(source_id)
+            if source is None:
+                results.update({(source_id, target_id): None for target_id in target_ids})
+                continue
+            distance, parent = self.bfs(source, allowed_kinds=allowed)
+            for target_id in target_ids:
+                target = self.node_index.get(target_id)
+                if target is None or distance[target] < 0:
+                    results[(source_id, target_id)] = None
+                    continue
+                path = [target]
+                while path[-1] != source:
+                    path.append(int(parent[path[-1]]))
+                results[(source_id, target_id)] = [self.node_ids[i] for i in reversed(path)]
+        return results
+
+    def get_relationship_strength(
+        self, source_id: uuid.UUID, target_id: uuid.UUID
+    ) -> float:
+        """Calculate aggregate relationship strength between nodes."""
+        self.sync()
+        source = self.node_index.get(source_id)
+        target = self.node_index.get(target_id)
+        if source is None or target is None:
+            return 0.0
+        row = slice(self.indptr[source], self.indptr[source + 1])
+        matching = self.weights[row][self.indices[row] == target]
+        return float(matching.mean()) if matching.size else 0.0
+
+    def calculate_flow_efficiency(
+        self, source_id: uuid.UUID, target_id: uuid.UUID
+    ) -> float:
+        """Inverse hop distance by a bidirectional BFS over the CSR arrays."""
+        self.sync()
+        source = self.node_index.get(source_id)
+        target = self.node_index.get(target_id)
+        if source is None or target is None:
+            return 0.0
+        if self._hop_adjacency is None:
+            adjacency = self._adjacency_matrix()
+            self._hop_adjacency = (adjacency, adjacency.T.tocsr())
+        distance = bidirectional_hop_distance(*self._hop_adjacency, source, target)
+        return 1.0 / distance if 0 < distance < np.inf else 0.0
+
+    def distance_oracle(
+        self, landmarks: int = DEFAULT_LANDMARKS, strategy: str = "degree"
+    ) -> LandmarkDistanceOracle:
+        """Landmark distance oracle over the CSR arrays, built once per graph version."""
+        self.sync()
+        oracle = self._distance_oracles.get((landmarks, strategy))
+        if oracle is None:
+            scores = self._get_centrality("betweenness") if strategy == "betweenness" else None
+            oracle = LandmarkDistanceOracle.build(
+                self._adjacency_matrix(), self.node_ids, landmarks, strategy, scores
+            )
+            self._distance_oracles[(landmarks, strategy)] = oracle
+        return oracle
+
+    # ─── STRUCTURAL ANALYSIS ───
+
+    def get_network_density(self) -> float:
+        """Calculate overall network density."""
+        self.sync()
+        n = self.node_count
+        if n <= 1:
+            return 0.0
+        return self.edge_count / (n * (n - 1))
+
+    def _top_betweenness(self, fraction_divisor: int) -> List[uuid.UUID]:
+        """Nodes whose betweenness reaches the top 1/fraction_divisor score."""
+        self.sync()
+        if self.node_count <= 1:
+            return []
+        centrality = self._get_centrality("betweenness")
+        scores = np.array(list(centrality.values()))
+        threshold = np.sort(scores)[-max(1, scores.size // fraction_divisor)]
+        return [node_id for node_id, score in centrality.items() if score >= threshold]
+
+    def identify_bottlenecks(
+        self, flow_type: FlowNature, sample_size: Optional[int] = None
+    ) -> List[uuid.UUID]:
+        """Identify bottleneck nodes in flow networks."""
+        return self._top_betweenness(10)  # Top 10%
+
+    def get_structural_holes(self, sample_size: Optional[int] = None) -> List[uuid.UUID]:
+        """Identify nodes that bridge structural holes."""
+        return self._top_betweenness(20)  # Top 5%
+
+    # ─── POLICY ANALYSIS ───
+
+    def analyze_policy_impact(
+        self, policy_id: uuid.UUID, impact_radius: int = 3
+    ) -> Dict[str, Any]:
+        """Analyze the network impact of a policy intervention."""
+        self.sync()
+        source = self.node_index.get(policy_id)
+        if source is None:
+            return {"error": "Policy node not found in graph"}
+
+        distance, _ = self.bfs(source, impact_radius)
+        ego = np.flatnonzero(distance >= 0)
+
+        # Density and policy betweenness of the induced ego subgraph
+        inside = np.zeros(self.node_count, dtype=bool)
+        inside[ego] = True
+        edge_sources = self._source_array()
+        ego_edges = int((inside[edge_sources] & inside[self.indices]).sum())
+        density = ego_edges / (ego.size * (ego.size - 1)) if ego.size > 1 else 0.0
+        ego_betweenness = self.centrality_executor.compute(
+            self._compact_graph(ego), ["betweenness"]
+        )["betweenness"]
+
+        impact_analysis: Dict[str, Any] = {
+            "total_affected_nodes": int(ego.size) - 1,  # Exclude policy node itself
+            "affected_actors": [],
+            "affected_institutions": [],
+            "affected_resources": [],
+            "network_metrics": {
+                "density": density,
+                "centrality": ego_betweenness.get(policy_id, 0.0),
+            },
+        }
+        for i in ego.tolist():
+            if i == source:
+                continue
+            node = self._nodes[i]
+            if isinstance(node, Actor):
+                impact_analysis["affected_actors"].append(self.node_ids[i])
+            elif isinstance(node, Institution):
+                impact_analysis["affected_institutions"].append(self.node_ids[i])
+            elif isinstance(node, Resource):
+                impact_analysis["affected_resources"].append(self.node_ids[i])
+        return impact_analysis
+
+    def analyze_policy_impacts(
+        self,
+        policy_ids: Optional[List[uuid.UUID]] = None,
+        impact_radius: int = 3,
+        min_shared: int = 1,
+    ) -> Dict[str, Any]:
+        """Analyze the impact of many policies at once."""
+        if policy_ids is None:
+            policy_ids = list(self.graph.policies)
+        return batch_policy_impact(
+            self._adjacency_matrix(), self.node_ids, self._nodes, policy_ids,
+            impact_radius=impact_radius, min_shared=min_shared,
+        )
+
+    def identify_policy_targets(self, policy_id: uuid.UUID) -> List[uuid.UUID]:
+        """Identify nodes directly and indirectly affected by a policy."""
+        # Direct and indirect targets are the nodes a 2-hop traversal reaches
+        return self.traverse(policy_id, 2).node_ids
+
+    # ─── DELEGATED ANALYSES ───
+
+    @property
+    def networkx_engine(self) -> NetworkXSFMQueryEngine:
+        """NetworkX engine used for analyses without an array implementation."""
+        if self._networkx_engine is None:
+            self._networkx_engine = NetworkXSFMQueryEngine(self.graph)
+        self._networkx_engine.sync()
+        return self._networkx_engine
+
+    def find_cycles(
+        self,
+        max_length: int = DEFAULT_MAX_CYCLE_LENGTH,
+        max_cycles: Optional[int] = DEFAULT_MAX_CYCLES,
+        time_limit: Optional[float] = DEFAULT_CYCLE_TIME_LIMIT,
+    ) -> CycleList:
+        """Find cycles in the graph (feedback loops), with truncation status."""
+        return self.networkx_engine.find_cycles(max_length, max_cycles, time_limit)
+
+    def trace_resource_flows(
+        self,
+        resource_type: ResourceType,
+        source_actors: Optional[List[uuid.UUID]] = None,
+    ) -> FlowAnalysis:
+        """Trace flows of specific resource types through the network."""
+        return self.networkx_engine.trace_resource_flows(resource_type, source_actors)
+
+    def compare_scenario_overlays(
+        self, overlays: List[ScenarioOverlay], include_centrality: bool = False
+    ) -> Dict[str, Any]:
+        """Compare policy scenarios expressed as overlays on this engine's graph."""
+        return self.networkx_engine.compare_scenario_overlays(overlays, include_centrality)
+
+    def detect_overlay_changes(
+        self, overlay: ScenarioOverlay, include_centrality: bool = False
+    ) -> Dict[str, Any]:
+        """Detect structural changes a scenario overlay makes to this engine's graph."""
+        return self.networkx_engine.detect_overlay_changes(overlay, include_centrality)
+
+    def compare_policy_scenarios(
+        self, scenario_graphs: List[SFMGraph]
+    ) -> Dict[str, Any]:
+        """Compare multiple policy scenarios."""
+        return self.networkx_engine.compare_policy_scenarios(scenario_graphs)
+
+    def identify_communities(
+        self, algorithm: str = "louvain"
+    ) -> Dict[int, List[uuid.UUID]]:
+        """Identify communities/clusters in the network."""
+        return self.networkx_engine.identify_communities(algorithm)
+
+    def get_community_assignment(self, node_id: uuid.UUID) -> Optional[str]:
+        """Community label of a node from the NetworkX engine's community tracker."""
+        return self.networkx_engine.get_community_assignment(node_id)
+
+    def comprehensive_node_analysis(self, node_id: uuid.UUID) -> NodeMetrics:
+        """Comprehensive analysis of a single node."""
+        return self.networkx_engine.comprehensive_node_analysis(node_id)
+
+    def system_vulnerability_analysis(self) -> Dict[str, Any]:
+        """Analyze system-wide vulnerabilities and resilience."""
+        return self.networkx_engine.system_vulnerability_analysis()
+
+    def analyze_temporal_changes(
+        self, time_slice_graphs: List[Tuple[datetime, SFMGraph]]
+    ) -> Dict[str, Any]:
+        """Analyze changes across multiple time slices of the graph."""
+        return self.networkx_engine.analyze_temporal_changes(time_slice_graphs)
+
+    def detect_structural_changes(
+        self, reference_graph: SFMGraph, comparison_graph: SFMGraph
+    ) -> Dict[str, Any]:
+        """Detect structural changes between two graph states."""
+        return self.networkx_engine.detect_structural_changes(reference_graph, comparison_graph)
+
+    def assess_network_vulnerabilities(self, sample_size: Optional[int] = None) -> Dict[str, Any]:
+        """Comprehensive vulnerability assessment of the network."""
+        return self.networkx_engine.assess_network_vulnerabilities(sample_size)
+
+    def simulate_node_failure_impact(
+        self, node_ids: List[uuid.UUID], failure_mode: str = "cascade"
+    ) -> Dict[str, Any]:
+        """Simulate the impact of node failures on the network."""
+        return self.networkx_engine.simulate_node_failure_impact(node_ids, failure_mode)
+
+    def simulate_node_failures(
+        self,
+        failure_sets: List[List[uuid.UUID]],
+        failure_mode: str = "cascade",
+        max_workers: Optional[int] = 1,
+    ) -> List[Dict[str, Any]]:
+        """Simulate many independent failure scenarios against the same graph."""
+        return self.networkx_engine.simulate_node_failures(
+            failure_sets, failure_mode, max_workers
+        )
+
+    def get_robustness_curve(
+        self,
+        strategy: str = "degree",
+        trials: int = DEFAULT_RANDOM_TRIALS,
+        seed: Optional[int] = None,
+    ) -> RobustnessCurve:
+        """Largest-component fraction as nodes are removed by a targeted or random attack."""
+        return self.networkx_engine.get_robustness_curve(strategy, trials, seed)
+
+    def analyze_flow_patterns(
+        self, flow_type: FlowNature, time_window: Optional[Tuple[datetime, datetime]] = None
+    ) -> Dict[str, Any]:
+        """Analyze patterns in specific types of flows."""
+        return self.networkx_engine.analyze_flow_patterns(flow_type, time_window)
+
+    def identify_flow_inefficiencies(self, top_k: int = 10) -> Dict[str, Any]:
+        """Identify inefficiencies in flow patterns."""
+        return flow_inefficiency_report(self._adjacency_matrix(), self.node_ids, top_k)
@@ -0,0 +1,155 @@
+"""
+Bounded cycle enumeration for SFM graphs.
+
+Social Fabric Matrix models are built around dense feedback structures, so the
+number of simple cycles grows exponentially with graph size. Enumerating all of
+them (and filtering afterwards) does not finish on regional models. This module
+enumerates cycles lazily under hard limits instead.
+
+Features:
+- Graph condensed to its strongly connected components first; nodes outside
+  any cycle-carrying component are never searched
+- Depth-first search rooted at each cycle's lowest-ranked node, with the
+  cycle length bound applied as a depth limit during the search
+- Caps on the number of cycles returned and on wall-clock time. The time
+  limit is checked on every expansion of the search, so it holds even while
+  no cycle is being found
+- Truncation status reported so callers can tell a partial result from a
+  complete one, also on the collected `CycleList`
+"""
+
+import logging
+import time
+from typing import Any, Hashable, Iterable, Iterator, List, Optional, Set
+
+import networkx as nx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CYCLE_LENGTH = 10
+DEFAULT_MAX_CYCLES = 1000
+DEFAULT_CYCLE_TIME_LIMIT = 10.0  # Seconds
+
+
+def cyclic_nodes(graph: nx.DiGraph) -> Set[Hashable]:
+    """Nodes that lie on at least one cycle.
+
+    These are the members of strongly connected components with more than one
+    node, plus nodes with a self-loop.
+    """
+    nodes: Set[Hashable] = set()
+    for component in nx.strongly_connected_components(graph):
+        if len(component) > 1:
+            nodes.update(component)
+        else:
+            node = next(iter(component))
+            if graph.has_edge(node, node):
+                nodes.add(node)
+    return nodes
+
+
+class CycleList(list):
+    """Cycles collected from a bounded search, with its truncation status."""
+
+    def __init__(
+        self,
+        cycles: Iterable[List[Any]] = (),
+        truncated: bool = False,
+        truncation_reason: Optional[str] = None,
+    ):
+        super().__init__(cycles)
+        self.truncated = truncated
+        self.truncation_reason = truncation_reason
+
+
+class BoundedCycleSearch:
+    """Lazy, capped enumeration of simple cycles.
+
+    Iterating the search yields cycles (lists of nodes) one at a time. Once the
+    iteration stops, `truncated` tells whether a cap cut it short and
+    `truncation_reason` names the cap ("max_cycles" or "time_limit").
+
+    Each cycle is produced once, from its lowest-ranked node (in graph
+    iteration order): the search from a node only extends paths through
+    higher-ranked nodes of the same strongly connected component. The time
+    limit is checked on every expansion of the search, not only when a cycle
+    is found.
+    """
+
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        max_length: Optional[int] = DEFAULT_MAX_CYCLE_LENGTH,
+        max_cycles: Optional[int] = DEFAULT_MAX_CYCLES,
+        time_limit: Optional[float] = DEFAULT_CYCLE_TIME_LIMIT,
+        min_length: int = 1,
+    ):
+        if max_length is not None and max_length < 1:
+            raise ValueError(f"max_length must be positive, got {max_length}")
+        self.graph = graph
+        self.max_length = max_length
+        self.max_cycles = max_cycles
+        self.time_limit = time_limit
+        self.min_length = min_length
+        self.cycles_found = 0
+        self.truncated = False
+        self.truncation_reason: Optional[str] = None
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        for cycle in self._simple_cycles():
+            if len(cycle) < self.min_length:
+                continue
+            self.cycles_found += 1
+            yield cycle
+            if self.max_cycles is not None and self.cycles_found >= self.max_cycles:
+                self._truncate("max_cycles")
+                return
+
+    def _simple_cycles(self) -> Iterator[List[Any]]:
+        """Depth-bounded DFS for simple cycles that stops at the deadline."""
+        deadline = time.monotonic() + self.time_limit if self.time_limit is not None else None
+        graph = self.graph
+        rank = {node: i for i, node in enumerate(graph)}
+
+        for component in nx.strongly_connected_components(graph):
+            if len(component) == 1:
+                (node,) = component
+                if graph.has_edge(node, node):
+                    yield [node]
+                continue
+
+            # Rank of each member, also used as the membership test
+            members = {node: rank[node] for node in component}
+            for start in sorted(component, key=members.__getitem__):
+                start_rank = members[start]
+                path = [start]
+                on_path = {start}
+                successors = [iter(graph.successors(start))]
+                while successors:
+                    if deadline is not None and time.monotonic() > deadline:
+                        self._truncate("time_limit")
+                        return
+                    for nxt in successors[-1]:
+                        if nxt == start:
+                            yield list(path)
+                        elif (members.get(nxt, -1) > start_rank and nxt not in on_path
+                              and (self.max_length is None or len(path) < self.max_length)):
+                            path.append(nxt)
+                            on_path.add(nxt)
+                            successors.append(iter(graph.successors(nxt)))
+                            break
+                    else:
+                        successors.pop()
+                        on_path.discard(path.pop())
+
+    def collect(self) -> CycleList:
+        """Run the search to completion and return its cycles and truncation status."""
+        cycles = list(self)
+        return CycleList(cycles, self.truncated, self.truncation_reason)
+
+    def _truncate(self, reason: str) -> None:
+        """Record that a cap stopped the enumeration."""
+        self.truncated = True
+        self.truncation_reason = reason
+        logger.warning("Cycle enumeration stopped after %d cycles (%s reached)",
+                       self.cycles_found, reason)
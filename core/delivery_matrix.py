@@ -0,0 +1,285 @@
+"""
+Social Fabric Matrix delivery-matrix view of an SFM graph.
+
+Hayden's social fabric matrix reads a system as component x component
+deliveries: what does each component deliver to every other one? On the
+graph, each such question is a scan over `SFMGraph.relationships`. A
+DeliveryMatrix keeps the answer materialized: one sparse component x
+component matrix of relationship weights per RelationshipKind plus one
+aggregated across kinds.
+
+Features:
+- Cells (summed weight and relationship count per source, target and kind)
+  updated in place from graph mutation events; a missed mutation falls back
+  to a full rebuild on the next query
+- Cells indexed by row and by column, so row, column and cell queries cost
+  O(cells in the slice) and never materialize a matrix
+- CSR matrices for matrix and block (e.g. Institutions x Actors) queries,
+  built lazily per kind and only after that kind changed
+- Dense NumPy export for small matrices
+"""
+
+from typing import Dict, List, Optional, Set, Tuple, Type
+import uuid
+
+import numpy as np
+from scipy import sparse
+
+from core.sfm_enums import RelationshipKind
+from core.sfm_models import Node, Relationship, SFMGraph
+
+DEFAULT_DENSE_COMPONENT_LIMIT = 2000  # Largest matrix side exported densely
+
+# A cell: summed weight and number of relationships behind it
+Cell = List[float]
+# Cells of one kind by outer index then inner index (row -> column or column -> row)
+CellIndex = Dict[int, Dict[int, Cell]]
+# None stands for the aggregate over all kinds
+KindKey = Optional[RelationshipKind]
+
+
+class DeliveryMatrix:
+    """Component x component delivery matrices of an SFMGraph.
+
+    Components are the graph's nodes. Matrix indices are assigned in graph
+    order and stay stable across incremental updates; removed components
+    keep an empty row and column until the next full rebuild.
+    """
+
+    def __init__(self, graph: SFMGraph):
+        self.graph = graph
+        self.component_ids: List[uuid.UUID] = []
+        self.component_index: Dict[uuid.UUID, int] = {}
+        # Indices of components removed from the graph since the last rebuild
+        self._removed: Set[int] = set()
+        # The same cell objects, reachable by source row and by target column
+        self._row_cells: Dict[KindKey, CellIndex] = {}
+        self._column_cells: Dict[KindKey, CellIndex] = {}
+        self._rows: Dict[KindKey, sparse.csr_matrix] = {}
+        self._type_indices: Dict[type, np.ndarray] = {}
+        self._live: Optional[np.ndarray] = None
+        self._synced_version: Optional[int] = None
+        graph.add_mutation_listener(self._on_graph_mutation)
+
+    # ─── SYNC ───
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the cells missed a graph change."""
+        return self._synced_version != self.graph.graph_version
+
+    def sync(self) -> None:
+        """Rebuild every cell if the incremental updates missed a change."""
+        if self.is_stale:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Recompute all cells from the graph, compacting component indices."""
+        self.component_ids = []
+        self.component_index = {}
+        self._removed = set()
+        self._row_cells = {None: {}}
+        self._column_cells = {None: {}}
+        for node in self.graph:
+            self._add_component(node.id)
+        for relationship in self.graph.relationships.values():
+            self._apply(relationship, 1)
+        self._invalidate()
+        self._synced_version = self.graph.graph_version
+
+    def _on_graph_mutation(self, event: str, version: int, **context) -> None:
+        """Apply a single graph mutation to the cells."""
+        if self._synced_version is None or version != self._synced_version + 1:
+            return  # Not built yet, or a change was missed: rebuild on next query
+        if event == "node_added":
+            self._removed.discard(self._add_component(context["node"].id))
+            self._type_indices.clear()
+            self._live = None
+        elif event == "node_removed":
+            index = self.component_index.get(context["node_id"])
+            if index is not None:
+                self._removed.add(index)
+            self._type_indices.clear()
+            self._live = None
+        elif event == "relationship_added":
+            self._apply(context["relationship"], 1)
+        elif event == "relationship_removed":
+            self._apply(context["relationship"], -1)
+        else:
+            return  # graph_cleared: rebuild (and compact) on next query
+        self._synced_version = version
+
+    def _add_component(self, node_id: uuid.UUID) -> int:
+        """Matrix index of a component, assigning the next one if it is new."""
+        index = self.component_index.get(node_id)
+        if index is None:
+            index = len(self.component_ids)
+            self.component_index[node_id] = index
+            self.component_ids.append(node_id)
+            self._live = None
+        return index
+
+    def _apply(self, relationship: Relationship, sign: int) -> None:
+        """Add (sign 1) or remove (sign -1) one relationship's weight."""
+        source = self._add_component(relationship.source_id)
+        target = self._add_component(relationship.target_id)
+        weight = relationship.weight or 0.0
+        for kind in (relationship.kind, None):
+            row = self._row_cells.setdefault(kind, {}).setdefault(source, {})
+            cell = row.get(target)
+            if cell is None:
+                cell = row[target] = [0.0, 0]
+                self._column_cells.setdefault(kind, {}).setdefault(target, {})[source] = cell
+            cell[0] += sign * weight
+            cell[1] += sign
+            if cell[1] <= 0:
+                self._drop_cell(kind, source, target)
+            self._rows.pop(kind, None)
+
+    def _drop_cell(self, kind: KindKey, source: int, target: int) -> None:
+        """Remove an emptied cell from both indexes, pruning empty rows and columns."""
+        for cells, outer, inner in ((self._row_cells[kind], source, target),
+                                    (self._column_cells[kind], target, source)):
+            line = cells[outer]
+            del line[inner]
+            if not line:
+                del cells[outer]
+
+    def _invalidate(self) -> None:
+        """Drop every materialized matrix and index array."""
+        self._rows.clear()
+        self._type_indices.clear()
+        self._live = None
+
+    # ─── MATRICES ───
+
+    @property
+    def size(self) -> int:
+        """Side of the matrices (component slots, removed ones included)."""
+        self.sync()
+        return len(self.component_ids)
+
+    def matrix(self, kind: KindKey = None) -> sparse.csr_matrix:
+        """Summed relationship weight per source row and target column.
+
+        `kind` selects one RelationshipKind; None aggregates all kinds.
+        Cells with relationships of weight 0 are stored as explicit zeros.
+        """
+        self.sync()
+        rows = self._rows.get(kind)
+        if rows is None or rows.shape[0] != len(self.component_ids):
+            n = len(self.component_ids)
+            sources, targets, weights = [], [], []
+            for source, row in self._row_cells.get(kind, {}).items():
+                for target, cell in row.items():
+                    sources.append(source)
+                    targets.append(target)
+                    weights.append(cell[0])
+            rows = sparse.csr_matrix(
+                (np.asarray(weights, dtype=np.float64),
+                 (np.asarray(sources, dtype=np.int64), np.asarray(targets, dtype=np.int64))),
+                shape=(n, n),
+            )
+            rows.sort_indices()
+            self._rows[kind] = rows
+        return rows
+
+    def kinds(self) -> List[RelationshipKind]:
+        """Relationship kinds with at least one delivery."""
+        self.sync()
+        return [kind for kind, cells in self._row_cells.items() if kind is not None and cells]
+
+    # ─── QUERIES ───
+
+    def __contains__(self, node_id: uuid.UUID) -> bool:
+        self.sync()
+        index = self.component_index.get(node_id)
+        return index is not None and index not in self._removed
+
+    def cell(self, source_id: uuid.UUID, target_id: uuid.UUID, kind: KindKey = None) -> float:
+        """Weight the source delivers to the target (0 if nothing)."""
+        self.sync()
+        source, target = self.component_index.get(source_id), self.component_index.get(target_id)
+        if source is None or target is None:
+            return 0.0
+        cell = self._row_cells.get(kind, {}).get(source, {}).get(target)
+        return cell[0] if cell is not None else 0.0
+
+    def row(self, source_id: uuid.UUID, kind: KindKey = None) -> Dict[uuid.UUID, float]:
+        """Everything a component delivers, by receiving component."""
+        self.sync()
+        return self._line(self._row_cells, self.component_index.get(source_id), kind)
+
+    def column(self, target_id: uuid.UUID, kind: KindKey = None) -> Dict[uuid.UUID, float]:
+        """Everything a component receives, by delivering component."""
+        self.sync()
+        return self._line(self._column_cells, self.component_index.get(target_id), kind)
+
+    def _line(self, cells: Dict[KindKey, CellIndex], index: Optional[int],
+              kind: KindKey) -> Dict[uuid.UUID, float]:
+        """One row or column of cells, keyed by the other side's component ID."""
+        if index is None:
+            return {}
+        line = cells.get(kind, {}).get(index, {})
+        return {self.component_ids[other]: float(line[other][0]) for other in sorted(line)}
+
+    def component_indices(self, node_type: Type[Node]) -> np.ndarray:
+        """Matrix indices of live components that are instances of `node_type`."""
+        self.sync()
+        indices = self._type_indices.get(node_type)
+        if indices is None:
+            indices = np.array([
+                index for index, node_id in enumerate(self.component_ids)
+                if index not in self._removed
+                and isinstance(self.graph.get_node_by_id(node_id), node_type)
+            ], dtype=np.int64)
+            self._type_indices[node_type] = indices
+        return indices
+
+    def block(
+        self,
+        row_type: Optional[Type[Node]] = None,
+        column_type: Optional[Type[Node]] = None,
+        kind: KindKey = None,
+    ) -> Tuple[List[uuid.UUID], List[uuid.UUID], sparse.csr_matrix]:
+        """Deliveries from components of one type to components of another.
+
+        Returns the row component IDs, the column component IDs and the
+        sparse block between them; a type of None selects every live
+        component.
+        """
+        self.sync()
+        rows = self._live_indices() if row_type is None else self.component_indices(row_type)
+        columns = (self._live_indices() if column_type is None
+                   else self.component_indices(column_type))
+        block = sparse.csr_matrix(self.matrix(kind)[rows][:, columns])
+        return ([self.component_ids[i] for i in rows.tolist()],
+                [self.component_ids[j] for j in columns.tolist()],
+                block)
+
+    def to_dense(
+        self,
+        row_type: Optional[Type[Node]] = None,
+        column_type: Optional[Type[Node]] = None,
+        kind: KindKey = None,
+        max_components: int = DEFAULT_DENSE_COMPONENT_LIMIT,
+    ) -> Tuple[List[uuid.UUID], List[uuid.UUID], np.ndarray]:
+        """Dense NumPy export of `block(row_type, column_type, kind)`.
+
+        Raises ValueError if either side has more than `max_components`
+        components.
+        """
+        row_ids, column_ids, block = self.block(row_type, column_type, kind)
+        if max(len(row_ids), len(column_ids)) > max_components:
+            raise ValueError(
+                f"Delivery matrix of {len(row_ids)} x {len(column_ids)} components exceeds "
+                f"the dense limit ({max_components}); use block() instead"
+            )
+        return row_ids, column_ids, block.toarray()
+
+    def _live_indices(self) -> np.ndarray:
+        """Matrix indices of every live component, cached until one is added or removed."""
+        if self._live is None:
+            self._live = np.array([index for index in range(len(self.component_ids))
+                                   if index not in self._removed], dtype=np.int64)
+        return self._live
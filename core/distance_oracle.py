@@ -0,0 +1,309 @@
+"""
+Landmark distance oracle for SFM graphs.
+
+Flow efficiency and other distance-based scores only need the hop distance
+between two nodes, not the path. Running a shortest path search per pair
+makes all-pairs efficiency matrices over thousands of nodes impractical.
+A LandmarkDistanceOracle runs one breadth-first search from and one to each
+of k landmark nodes up front and bounds any distance in O(k) with the
+triangle inequality:
+
+    max_L max(d(L,t) - d(L,s), d(s,L) - d(t,L)) <= d(s,t) <= min_L d(s,L) + d(L,t)
+
+Features:
+- Landmarks chosen by degree or by (precomputed) betweenness centrality
+- Distances from and to every landmark kept in dense NumPy arrays
+- Upper bound as the distance estimate; pairs whose bounds meet are exact
+- Optional exact fallback: a bidirectional BFS for a single undecided pair,
+  one BFS per source that still has undecided pairs for matrices
+- Bounds for whole distance matrices vectorized over sources and targets
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+DEFAULT_LANDMARKS = 16
+LANDMARK_STRATEGIES = ("degree", "betweenness")
+
+
+def select_landmarks(
+    adjacency: sparse.csr_matrix,
+    count: int,
+    strategy: str = "degree",
+    scores: Optional[Sequence[float]] = None,
+) -> np.ndarray:
+    """Indices of the `count` best-connected nodes.
+
+    "degree" ranks nodes by their number of distinct in- and out-neighbors,
+    "betweenness" by `scores` (one value per node index). Ties keep node
+    order.
+    """
+    if strategy == "degree":
+        adjacency = sparse.csr_matrix(adjacency, dtype=bool)
+        ranking = np.diff(adjacency.indptr) + np.bincount(
+            adjacency.indices, minlength=adjacency.shape[0]
+        )
+    elif strategy == "betweenness":
+        if scores is None:
+            raise ValueError("Betweenness landmarks require centrality scores")
+        ranking = np.asarray(scores, dtype=np.float64)
+    else:
+        raise ValueError(f"Unsupported landmark strategy: {strategy}")
+    return np.argsort(-ranking, kind="stable")[:max(count, 0)]
+
+
+def bidirectional_hop_distance(
+    successors: sparse.csr_matrix,
+    predecessors: sparse.csr_matrix,
+    source: int,
+    target: int,
+) -> float:
+    """Exact directed hop distance between two node indices, `inf` if unreachable.
+
+    Breadth-first search from both ends, one whole level of the smaller
+    frontier at a time; stops at the level where the searches meet instead
+    of visiting every node reachable from the source. `predecessors` is the
+    transpose of `successors`.
+    """
+    if source == target:
+        return 0.0
+    forward: Dict[int, int] = {source: 0}
+    backward: Dict[int, int] = {target: 0}
+    forward_frontier, backward_frontier = [source], [target]
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = _expand_level(
+                successors, forward_frontier, forward, backward
+            )
+        else:
+            backward_frontier, meeting = _expand_level(
+                predecessors, backward_frontier, backward, forward
+            )
+        if meeting < np.inf:
+            return meeting
+    return np.inf
+
+
+def _expand_level(
+    adjacency: sparse.csr_matrix,
+    frontier: List[int],
+    seen: Dict[int, int],
+    other: Dict[int, int],
+) -> Tuple[List[int], float]:
+    """Advance one BFS side by a full level.
+
+    Returns the next frontier and the shortest source-target distance through
+    a node the other side has reached (`inf` if the sides did not meet).
+    """
+    meeting = np.inf
+    next_frontier = []
+    for node in frontier:
+        depth = seen[node] + 1
+        for neighbor in adjacency.indices[adjacency.indptr[node]:adjacency.indptr[node + 1]]:
+            neighbor = int(neighbor)
+            if neighbor in other:
+                meeting = min(meeting, depth + other[neighbor])
+            if neighbor not in seen:
+                seen[neighbor] = depth
+                next_frontier.append(neighbor)
+    return next_frontier, float(meeting)
+
+
+@dataclass
+class EfficiencyMatrix:
+    """Flow efficiency (inverse hop distance) between sets of nodes.
+
+    `efficiency[i, j]` belongs to (source_ids[i], target_ids[j]); unreachable
+    pairs and a node paired with itself score 0, as in
+    `calculate_flow_efficiency`.
+    """
+
+    source_ids: List[Hashable]
+    target_ids: List[Hashable]
+    efficiency: np.ndarray
+    exact: bool
+
+    @property
+    def average(self) -> float:
+        """Mean efficiency over pairs of distinct nodes."""
+        codes: Dict[Hashable, int] = {}
+        sources = np.array([codes.setdefault(n, len(codes)) for n in self.source_ids], dtype=int)
+        targets = np.array([codes.setdefault(n, len(codes)) for n in self.target_ids], dtype=int)
+        distinct = sources[:, None] != targets[None, :]
+        return float(self.efficiency[distinct].mean()) if distinct.any() else 0.0
+
+
+class LandmarkDistanceOracle:
+    """Hop-distance bounds from BFS distances to and from landmark nodes.
+
+    Built once from a directed adjacency matrix; rebuild it (or let the
+    owning engine rebuild it lazily) when the graph changes. Distances are
+    directed and `inf` for unreachable pairs.
+    """
+
+    def __init__(
+        self,
+        adjacency: sparse.spmatrix,
+        node_ids: Sequence[Hashable],
+        landmarks: Union[Sequence[int], np.ndarray],
+    ):
+        self.node_ids = list(node_ids)
+        self.node_index: Dict[Hashable, int] = {
+            node_id: i for i, node_id in enumerate(self.node_ids)
+        }
+        self._adjacency = sparse.csr_matrix(adjacency, dtype=bool)
+        self._reverse = self._adjacency.T.tocsr()
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        if self.landmarks.size:
+            # Row k: d(landmark_k, v) and d(v, landmark_k) for every node v
+            self._from_landmarks = csgraph.shortest_path(
+                self._adjacency, directed=True, unweighted=True, indices=self.landmarks
+            ).reshape(self.landmarks.size, -1)
+            self._to_landmarks = csgraph.shortest_path(
+                self._reverse, directed=True, unweighted=True, indices=self.landmarks,
+            ).reshape(self.landmarks.size, -1)
+        else:
+            self._from_landmarks = np.zeros((0, len(self.node_ids)))
+            self._to_landmarks = np.zeros((0, len(self.node_ids)))
+
+    @classmethod
+    def build(
+        cls,
+        adjacency: sparse.spmatrix,
+        node_ids: Sequence[Hashable],
+        landmarks: int = DEFAULT_LANDMARKS,
+        strategy: str = "degree",
+        scores: Optional[Mapping[Any, float]] = None,
+    ) -> "LandmarkDistanceOracle":
+        """Select landmarks by `strategy` and build the oracle.
+
+        `scores` maps node ID to centrality and is required for
+        "betweenness".
+        """
+        index_scores = None
+        if scores is not None:
+            index_scores = [scores.get(node_id, 0.0) for node_id in node_ids]
+        chosen = select_landmarks(
+            sparse.csr_matrix(adjacency), landmarks, strategy, index_scores
+        )
+        return cls(adjacency, node_ids, chosen)
+
+    # ─── QUERIES ───
+
+    def __contains__(self, node_id: Hashable) -> bool:
+        return node_id in self.node_index
+
+    def bounds(self, source: Hashable, target: Hashable) -> Tuple[float, float]:
+        """Lower and upper bound on the hop distance from source to target."""
+        source_index, target_index = self.node_index.get(source), self.node_index.get(target)
+        if source_index is None or target_index is None:
+            return np.inf, np.inf
+        lower, upper = self._bounds(np.array([source_index]), np.array([target_index]))
+        assert lower is not None
+        return float(lower[0, 0]), float(upper[0, 0])
+
+    def distance(self, source: Hashable, target: Hashable, exact: bool = False) -> float:
+        """Hop distance from source to target, `inf` if unreachable.
+
+        Without `exact`, the landmark upper bound is returned, which is exact
+        whenever the bounds meet. With `exact`, undecided pairs fall back to
+        a bidirectional BFS between the two nodes.
+        """
+        lower, upper = self.bounds(source, target)
+        if lower == upper or not exact:
+            return upper
+        return bidirectional_hop_distance(
+            self._adjacency, self._reverse, self.node_index[source], self.node_index[target]
+        )
+
+    def distance_matrix(
+        self,
+        sources: Optional[Sequence[Hashable]] = None,
+        targets: Optional[Sequence[Hashable]] = None,
+        exact: bool = False,
+    ) -> np.ndarray:
+        """Hop distances between every source and target (all nodes by default).
+
+        Unknown node IDs are unreachable. Rows follow `sources` and columns
+        `targets`.
+        """
+        source_index = self._indices(sources)
+        target_index = self._indices(targets)
+        distances = np.full((source_index.size, target_index.size), np.inf)
+        known_rows = np.flatnonzero(source_index >= 0)
+        known_cols = np.flatnonzero(target_index >= 0)
+        if known_rows.size == 0 or known_cols.size == 0:
+            return distances
+
+        lower, upper = self._bounds(
+            source_index[known_rows], target_index[known_cols], with_lower=exact
+        )
+        if lower is not None:
+            undecided = np.flatnonzero((lower < upper).any(axis=1))
+            if undecided.size:
+                rows = self._exact_rows(source_index[known_rows[undecided]])
+                upper[undecided] = rows[:, target_index[known_cols]]
+        distances[np.ix_(known_rows, known_cols)] = upper
+        return distances
+
+    def efficiency_matrix(
+        self,
+        sources: Optional[Sequence[Hashable]] = None,
+        targets: Optional[Sequence[Hashable]] = None,
+        exact: bool = False,
+    ) -> EfficiencyMatrix:
+        """Inverse hop distance between every source and target."""
+        source_ids = self.node_ids if sources is None else list(sources)
+        target_ids = self.node_ids if targets is None else list(targets)
+        distances = self.distance_matrix(source_ids, target_ids, exact)
+        efficiency = np.zeros_like(distances)
+        reachable = np.isfinite(distances) & (distances > 0)
+        efficiency[reachable] = 1.0 / distances[reachable]
+        return EfficiencyMatrix(source_ids, target_ids, efficiency, exact)
+
+    # ─── BOUNDS ───
+
+    def _indices(self, node_ids: Optional[Sequence[Hashable]]) -> np.ndarray:
+        """Matrix indices of node IDs, -1 for unknown IDs."""
+        if node_ids is None:
+            return np.arange(len(self.node_ids), dtype=np.int64)
+        return np.array([self.node_index.get(node_id, -1) for node_id in node_ids],
+                        dtype=np.int64)
+
+    def _bounds(self, sources: np.ndarray, targets: np.ndarray, with_lower: bool = True
+                ) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        """Lower and upper bound matrices, accumulated one landmark at a time.
+
+        The lower bound is only needed to tell exact estimates apart and is
+        skipped (None) without `with_lower`.
+        """
+        shape = (sources.size, targets.size)
+        upper = np.full(shape, np.inf)
+        lower = np.zeros(shape) if with_lower else None
+        with np.errstate(invalid="ignore"):
+            for from_landmark, to_landmark in zip(self._from_landmarks, self._to_landmarks):
+                np.minimum(upper, to_landmark[sources, None] + from_landmark[None, targets],
+                           out=upper)
+                if lower is not None:
+                    # inf - inf is NaN (no information); fmax skips it
+                    np.fmax(lower, from_landmark[None, targets] - from_landmark[sources, None],
+                            out=lower)
+                    np.fmax(lower, to_landmark[sources, None] - to_landmark[None, targets],
+                            out=lower)
+
+        # A node is at distance 0 from itself and at least 1 from any other
+        same = sources[:, None] == targets[None, :]
+        upper[same] = 0.0
+        if lower is not None:
+            lower = np.where(same, 0.0, np.maximum(lower, 1.0))
+        return lower, upper
+
+    def _exact_rows(self, sources: np.ndarray) -> np.ndarray:
+        """Exact hop distances from each source to every node (one BFS each)."""
+        return csgraph.shortest_path(
+            self._adjacency, directed=True, unweighted=True, indices=sources
+        ).reshape(sources.size, -1)
@@ -0,0 +1,323 @@
+"""
+Batch node-failure simulation for SFM graphs.
+
+`simulate_node_failure_impact` copies the whole NetworkX graph per failure
+scenario, recounts weakly connected components from scratch and runs the
+cascade rule through `neighbors()` lists. Resilience studies evaluate
+thousands of failure sets against the same graph, so this module builds an
+immutable array model of the graph once and evaluates every scenario against
+it.
+
+Features:
+- Base weak components computed once; a scenario only relabels the
+  components that contain a failed node
+- Out-degree arrays for the isolation and cascade rules, decremented per
+  removed node instead of recounting neighbors
+- Cascade visits only candidate nodes, in graph order, through a heap
+- Scenarios fanned out over a process pool, the model shipped to each worker
+  once through the pool initializer
+- Results identical to `simulate_node_failure_impact`
+"""
+
+import heapq
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+logger = logging.getLogger(__name__)
+
+# A node cascades when it keeps fewer than this share of its original out-neighbors
+CASCADE_DEGREE_FRACTION = 0.3
+DEFAULT_SCENARIO_CHUNK_SIZE = 64
+DEFAULT_PARALLEL_MIN_SCENARIOS = 256  # Below this, process start-up outweighs the gain
+
+FAILURE_MODES = ("cascade", "complete")
+
+
+@dataclass(frozen=True)
+class FailureModel:
+    """Immutable array view of a graph for failure simulation.
+
+    Node indices follow the NetworkX node order, which fixes the order the
+    cascade rule visits nodes in. Parallel relationships collapse into one
+    adjacency entry, matching `neighbors()` on the multigraph.
+    """
+
+    node_ids: List[Hashable]
+    successors: sparse.csr_matrix  # Row i marks the distinct out-neighbors of node i
+    undirected: sparse.csr_matrix  # Symmetric adjacency for weak connectivity
+    out_degrees: np.ndarray
+    component_labels: np.ndarray
+    component_sizes: np.ndarray
+    component_members: List[np.ndarray]
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the graph."""
+        return len(self.node_ids)
+
+    @property
+    def largest_component_size(self) -> int:
+        """Size of the largest weakly connected component."""
+        return int(self.component_sizes.max()) if self.component_sizes.size else 0
+
+    @classmethod
+    def from_networkx(cls, nx_graph: nx.Graph) -> "FailureModel":
+        """Build the model from a (multi)directed NetworkX graph."""
+        node_ids = list(nx_graph.nodes())
+        if not node_ids:
+            # NetworkX refuses to build a matrix for an empty graph
+            return cls.from_adjacency(sparse.csr_matrix((0, 0), dtype=np.int64), node_ids)
+        adjacency = sparse.csr_matrix(nx.to_scipy_sparse_array(
+            nx_graph, nodelist=node_ids, weight=None, dtype=np.int64, format="csr"
+        ))
+        return cls.from_adjacency(adjacency, node_ids)
+
+    @classmethod
+    def from_adjacency(cls, adjacency: sparse.spmatrix, node_ids: Sequence[Hashable]
+                       ) -> "FailureModel":
+        """Build the model from an adjacency matrix ordered like `node_ids`."""
+        successors = sparse.csr_matrix(adjacency, dtype=bool)
+        successors.sum_duplicates()
+        successors.eliminate_zeros()
+        successors.sort_indices()
+        undirected = sparse.csr_matrix(successors + successors.T, dtype=bool)
+
+        component_count, labels = csgraph.connected_components(undirected, directed=False)
+        sizes = np.bincount(labels, minlength=component_count)
+        order = np.argsort(labels, kind="stable")
+        members = np.split(order, np.cumsum(sizes)[:-1]) if component_count else []
+        return cls(
+            node_ids=list(node_ids),
+            successors=successors,
+            undirected=undirected,
+            out_degrees=np.diff(successors.indptr).astype(np.int64),
+            component_labels=labels,
+            component_sizes=sizes,
+            component_members=members,
+        )
+
+    def predecessors(self) -> sparse.csr_matrix:
+        """Row i marks the distinct in-neighbors of node i."""
+        return sparse.csr_matrix(self.successors.T)
+
+
+def simulate_failure(
+    model: FailureModel,
+    failed: Sequence[int],
+    failure_mode: str = "cascade",
+    predecessors: Optional[sparse.csr_matrix] = None,
+) -> Dict[str, Any]:
+    """Impact of removing the nodes at indices `failed` from the model graph.
+
+    Returns the fields of `simulate_node_failure_impact` with node indices in
+    place of node IDs (see `format_failure_result`). `predecessors` may be
+    passed in to avoid transposing the model once per scenario.
+    """
+    if failure_mode not in FAILURE_MODES:
+        raise ValueError(f"Unsupported failure mode: {failure_mode}")
+    if predecessors is None:
+        predecessors = model.predecessors()
+
+    alive = np.ones(model.node_count, dtype=bool)
+    failed_indices = np.unique(np.asarray(failed, dtype=np.int64))
+    alive[failed_indices] = False
+
+    # Out-degree among survivors: drop one per failed successor
+    degrees = model.out_degrees.copy()
+    for index in failed_indices.tolist():
+        np.subtract.at(degrees, _row(predecessors, index), 1)
+
+    result: Dict[str, Any] = {
+        "connectivity_impact": _connectivity_impact(model, failed_indices, alive),
+        "isolated_nodes": np.flatnonzero(alive & (degrees == 0)).tolist(),
+        "cascading_failures": [],
+    }
+    if failure_mode == "cascade":
+        result["cascading_failures"] = _cascade(model, predecessors, alive, degrees)
+    return result
+
+
+def _row(matrix: sparse.csr_matrix, index: int) -> np.ndarray:
+    """Column indices of one CSR row."""
+    return matrix.indices[matrix.indptr[index]:matrix.indptr[index + 1]]
+
+
+def _connectivity_impact(
+    model: FailureModel, failed: np.ndarray, alive: np.ndarray
+) -> Dict[str, Any]:
+    """Component changes, recomputing only the components that lost a node."""
+    original_components = int(model.component_sizes.size)
+    original_largest = model.largest_component_size
+
+    touched = np.unique(model.component_labels[failed])
+    untouched_sizes = np.delete(model.component_sizes, touched)
+    new_components = int(untouched_sizes.size)
+    new_largest = int(untouched_sizes.max()) if untouched_sizes.size else 0
+
+    if touched.size:
+        survivors = np.concatenate([model.component_members[c] for c in touched.tolist()])
+        survivors = survivors[alive[survivors]]
+        if survivors.size:
+            subgraph = model.undirected[survivors][:, survivors]
+            piece_count, labels = csgraph.connected_components(subgraph, directed=False)
+            new_components += int(piece_count)
+            new_largest = max(new_largest, int(np.bincount(labels).max()))
+
+    return {
+        "original_components": original_components,
+        "new_components": new_components,
+        "component_increase": new_components - original_components,
+        "largest_component_size_change": new_largest - original_largest,
+        "connectivity_loss_percentage": (
+            (original_largest - new_largest) / original_largest * 100
+            if original_largest > 0 else 0
+        ),
+    }
+
+
+def _cascade(
+    model: FailureModel,
+    predecessors: sparse.csr_matrix,
+    alive: np.ndarray,
+    degrees: np.ndarray,
+) -> List[int]:
+    """Single pass of the cascade rule over surviving nodes in graph order.
+
+    A node visited in the pass fails if it kept fewer than
+    CASCADE_DEGREE_FRACTION of its original out-neighbors, counting nodes
+    that failed earlier in the pass. Degrees only decrease, so only nodes
+    that are below the threshold, or drop below it after an earlier failure,
+    need visiting.
+    """
+    thresholds = model.out_degrees * CASCADE_DEGREE_FRACTION
+    queued = alive & (degrees < thresholds)
+    heap = np.flatnonzero(queued).tolist()  # Sorted, so already a heap
+
+    cascaded = []
+    while heap:
+        index = heapq.heappop(heap)
+        alive[index] = False
+        cascaded.append(index)
+        for predecessor in _row(predecessors, index).tolist():
+            if not alive[predecessor]:
+                continue
+            degrees[predecessor] -= 1
+            # Nodes before this one were already visited in the pass
+            if (predecessor > index and not queued[predecessor]
+                    and degrees[predecessor] < thresholds[predecessor]):
+                queued[predecessor] = True
+                heapq.heappush(heap, predecessor)
+    return cascaded
+
+
+def format_failure_result(
+    model: FailureModel,
+    failed_ids: Sequence[Hashable],
+    failure_mode: str,
+    result: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Turn an index-based result into the `simulate_node_failure_impact` layout."""
+    return {
+        "failed_nodes": [str(node_id) for node_id in failed_ids],
+        "failure_mode": failure_mode,
+        "connectivity_impact": result["connectivity_impact"],
+        "isolated_nodes": [str(model.node_ids[i]) for i in result["isolated_nodes"]],
+        "affected_components": 0,
+        "cascading_failures": [str(model.node_ids[i]) for i in result["cascading_failures"]],
+    }
+
+
+# Worker-process state, populated once per worker by the pool initializer
+_WORKER_MODEL: Optional[FailureModel] = None
+_WORKER_PREDECESSORS: Optional[sparse.csr_matrix] = None
+
+
+def _init_worker(model: FailureModel) -> None:
+    """Pool initializer: keep the shipped model for every scenario of the run."""
+    global _WORKER_MODEL, _WORKER_PREDECESSORS  # pylint: disable=global-statement
+    _WORKER_MODEL = model
+    _WORKER_PREDECESSORS = model.predecessors()
+
+
+def _worker_task(scenarios: List[List[int]], failure_mode: str) -> List[Dict[str, Any]]:
+    """Run one chunk of scenarios inside a worker process."""
+    assert _WORKER_MODEL is not None
+    return [
+        simulate_failure(_WORKER_MODEL, failed, failure_mode, _WORKER_PREDECESSORS)
+        for failed in scenarios
+    ]
+
+
+class FailureSimulator:
+    """Evaluates many failure scenarios against one shared FailureModel.
+
+    Scenarios are split into fixed-size chunks; with more than one worker
+    and at least `parallel_min_scenarios` scenarios the chunks run in a
+    process pool, otherwise in process. Results come back in scenario order
+    either way.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_SCENARIO_CHUNK_SIZE,
+        parallel_min_scenarios: int = DEFAULT_PARALLEL_MIN_SCENARIOS,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.chunk_size = chunk_size
+        self.parallel_min_scenarios = parallel_min_scenarios
+
+    def run(
+        self,
+        model: FailureModel,
+        failure_sets: Sequence[Sequence[Hashable]],
+        failure_mode: str = "cascade",
+    ) -> List[Dict[str, Any]]:
+        """Simulate every failure set, returning `simulate_node_failure_impact` results.
+
+        Node IDs that are not in the model graph are listed as failed but
+        otherwise ignored.
+        """
+        if failure_mode not in FAILURE_MODES:
+            raise ValueError(f"Unsupported failure mode: {failure_mode}")
+        position = {node_id: i for i, node_id in enumerate(model.node_ids)}
+        scenarios = [
+            [position[node_id] for node_id in failed_ids if node_id in position]
+            for failed_ids in failure_sets
+        ]
+        chunks = [
+            scenarios[start:start + self.chunk_size]
+            for start in range(0, len(scenarios), self.chunk_size)
+        ]
+
+        if (self.max_workers <= 1 or len(chunks) <= 1
+                or len(scenarios) < self.parallel_min_scenarios):
+            predecessors = model.predecessors()
+            results = [
+                simulate_failure(model, failed, failure_mode, predecessors)
+                for failed in scenarios
+            ]
+        else:
+            workers = min(self.max_workers, len(chunks))
+            logger.debug("Simulating %d failure scenarios with %d workers",
+                         len(scenarios), workers)
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(model,)
+            ) as pool:
+                futures = [pool.submit(_worker_task, chunk, failure_mode) for chunk in chunks]
+                results = [result for future in futures for result in future.result()]
+
+        return [
+            format_failure_result(model, failed_ids, failure_mode, result)
+            for failed_ids, result in zip(failure_sets, results)
+        ]
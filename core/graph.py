@@ -10,6 +10,7 @@ from __future__ import annotations
 import uuid
 import logging
 import sys
+import weakref
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Iterator, Callable, Set
 from datetime import datetime
@@ -36,6 +37,9 @@ from core.performance_metrics import get_metrics_collector, timed_operation
 # Set up logger for lazy loading operations
 logger = logging.getLogger(__name__)
 
+# Called as listener(event, version, **context) after each graph mutation
+MutationListener = Callable[..., None]
+
 
 class NodeTypeRegistry:
     """Registry pattern for mapping node types to their collections in SFMGraph."""
@@ -93,6 +97,58 @@ class NodeTypeRegistry:
             yield collection
 
 
+class RelationshipStore(Dict[uuid.UUID, Relationship]):
+    """Relationship dict that counts writes, so direct edits are detectable.
+
+    SFMGraph keeps adjacency indexes beside this dict. Code that writes to the
+    dict directly instead of going through add_relationship/remove_relationship
+    bypasses them; comparing `mutation_count` with the count the indexes were
+    built at catches any such write, including a delete followed by an add
+    that leaves the size unchanged.
+    """
+
+    mutation_count = 0
+
+    def _mutated(self) -> None:
+        self.mutation_count += 1
+
+    def __setitem__(self, key: uuid.UUID, value: Relationship) -> None:
+        super().__setitem__(key, value)
+        self._mutated()
+
+    def __delitem__(self, key: uuid.UUID) -> None:
+        super().__delitem__(key)
+        self._mutated()
+
+    def __ior__(self, other):  # type: ignore[override, misc]
+        result = super().__ior__(other)
+        self._mutated()
+        return result
+
+    def pop(self, key, *default):  # type: ignore[override]
+        result = super().pop(key, *default)
+        self._mutated()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._mutated()
+        return result
+
+    def setdefault(self, key, default=None):  # type: ignore[override]
+        result = super().setdefault(key, default)
+        self._mutated()
+        return result
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+        super().update(*args, **kwargs)
+        self._mutated()
+
+    def clear(self) -> None:
+        super().clear()
+        self._mutated()
+
+
 @dataclass
 class NetworkMetrics(Node):
     """Captures network analysis metrics for nodes or subgraphs."""
@@ -117,7 +173,7 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
     resources: Dict[uuid.UUID, Resource] = field(default_factory=lambda: {})
     processes: Dict[uuid.UUID, Process] = field(default_factory=lambda: {})
     flows: Dict[uuid.UUID, Flow] = field(default_factory=lambda: {})
-    relationships: Dict[uuid.UUID, Relationship] = field(default_factory=lambda: {})
+    relationships: Dict[uuid.UUID, Relationship] = field(default_factory=RelationshipStore)
     # Optional specialized components
     belief_systems: Dict[uuid.UUID, BeliefSystem] = field(default_factory=lambda: {})
     technology_systems: Dict[uuid.UUID, TechnologySystem] = field(default_factory=lambda: {})
@@ -164,6 +220,20 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
     )
     _relationship_cache_max_size: int = field(default=1000, init=False)
 
+    # Performance optimization: Live adjacency indexes (node id -> relationship ids)
+    # so neighbor lookups cost O(degree) instead of a scan over all relationships
+    _out_index: Dict[uuid.UUID, Set[uuid.UUID]] = field(default_factory=lambda: {}, init=False)
+    _in_index: Dict[uuid.UUID, Set[uuid.UUID]] = field(default_factory=lambda: {}, init=False)
+    # relationships.mutation_count the indexes are in sync with
+    _indexed_relationship_mutations: int = field(default=0, init=False)
+
+    # Mutation tracking: monotonically increasing version plus weakly held listeners
+    # so derived structures (e.g. query engine mirrors) can apply deltas or detect staleness
+    _graph_version: int = field(default=0, init=False)
+    _mutation_listeners: List[Callable[[], Optional[MutationListener]]] = field(
+        default_factory=lambda: [], init=False
+    )
+
     # Performance optimization: Optional lazy loading support
     _lazy_loading_enabled: bool = field(default=False, init=False)
     _node_loader: Optional[Callable[[uuid.UUID], Optional[Node]]] = field(default=None, init=False)
@@ -186,12 +256,15 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
         
         if self._enable_advanced_caching:
             self._setup_cache_invalidation_rules()
+
+        # Index any relationships supplied through the constructor
+        self._rebuild_adjacency_index()
     
     def __getstate__(self):
         """Custom pickle serialization to handle non-serializable objects."""
         state = self.__dict__.copy()
         # Remove non-serializable objects before pickling
-        non_serializable = ['_memory_monitor', '_query_cache']
+        non_serializable = ['_memory_monitor', '_query_cache', '_mutation_listeners']
         for key in non_serializable:
             if key in state:
                 del state[key]
@@ -200,6 +273,10 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
     def __setstate__(self, state):
         """Custom pickle deserialization to restore non-serializable objects."""
         self.__dict__.update(state)
+        # Listeners belong to the original instance and are never carried over
+        self._mutation_listeners = []
+        self._graph_version = state.get('_graph_version', 0)
+
         # Restore non-serializable objects after unpickling
         if getattr(self, '_enable_memory_management', True):
             self._memory_monitor = MemoryMonitor(
@@ -211,6 +288,12 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
         if getattr(self, '_enable_advanced_caching', True):
             self._query_cache = QueryCache()
             self._setup_cache_invalidation_rules()
+
+        # Graphs pickled before the adjacency indexes existed need them rebuilt
+        if '_out_index' not in state:
+            self._out_index = {}
+            self._in_index = {}
+            self._rebuild_adjacency_index()
     
     def _setup_cache_invalidation_rules(self):
         """Set up cache invalidation rules for different events."""
@@ -228,17 +311,62 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
             ['get_node_relationships:{node_id}:*', 'get_nodes_by_type:*', 'count_nodes:*']
         )
         
-        # Relationship-related invalidations
+        # Relationship-related invalidations (node relationship lookups are served
+        # from the adjacency index and only need their endpoint entries refreshed)
         self._query_cache.register_invalidation_rule(
             'relationship_added',
-            ['get_node_relationships:*', 'find_paths:*', 'analyze_network:*']
+            ['find_paths:*', 'analyze_network:*']
         )
         
         self._query_cache.register_invalidation_rule(
             'relationship_removed', 
-            ['get_node_relationships:*', 'find_paths:*', 'analyze_network:*']
+            ['find_paths:*', 'analyze_network:*']
         )
 
+    @property
+    def graph_version(self) -> int:
+        """Monotonic counter bumped on every structural change to the graph."""
+        self._ensure_adjacency_index()
+        return self._graph_version
+
+    def add_mutation_listener(self, listener: MutationListener) -> None:
+        """Subscribe to graph mutations.
+
+        The listener is called as ``listener(event, version, **context)`` after each
+        change, where event is one of 'node_added', 'node_removed',
+        'relationship_added', 'relationship_removed' or 'graph_cleared'. Bound
+        methods are held weakly so subscribers do not keep themselves alive.
+        """
+        ref: Callable[[], Optional[MutationListener]]
+        if hasattr(listener, '__self__'):
+            ref = weakref.WeakMethod(listener)
+        else:
+            def strong_ref() -> Optional[MutationListener]:
+                return listener
+            ref = strong_ref
+        self._mutation_listeners.append(ref)
+
+    def remove_mutation_listener(self, listener: MutationListener) -> None:
+        """Unsubscribe a listener previously passed to add_mutation_listener."""
+        self._mutation_listeners = [
+            ref for ref in self._mutation_listeners if ref() not in (None, listener)
+        ]
+
+    def _notify_mutation(self, event: str, **context) -> None:
+        """Bump the graph version and notify live mutation listeners."""
+        self._graph_version += 1
+        live_refs = []
+        for ref in self._mutation_listeners:
+            listener = ref()
+            if listener is None:
+                continue
+            live_refs.append(ref)
+            try:
+                listener(event, self._graph_version, **context)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Graph mutation listener failed on %s: %s", event, e)
+        self._mutation_listeners = live_refs
+
     @timed_operation("add_node")
     def add_node(self, node: Node) -> Node:
         """Add a node to the appropriate collection based on its type."""
@@ -261,6 +389,7 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
         if self._enable_advanced_caching and hasattr(self, '_query_cache') and self._query_cache:
             self._query_cache.invalidate_on_event('node_added', node_id=node.id)
 
+        self._notify_mutation('node_added', node=node)
         return node
 
     @timed_operation("add_relationship")
@@ -280,11 +409,22 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
                 relationship.kind, source_type, target_type
             )
 
+        # Replacing an existing relationship must drop its old index entries first
+        self._ensure_adjacency_index()
+        previous = self.relationships.get(relationship.id)
+        if previous is not None:
+            self._unindex_relationship(previous)
+            self._notify_mutation('relationship_removed', relationship=previous)
+
         # Store the relationship
         self.relationships[relationship.id] = relationship
 
-        # Performance optimization: Clear relationship cache when relationships change
-        self._clear_relationship_cache()
+        # Performance optimization: Update adjacency index in place and only drop
+        # the cached lookups for the endpoints that actually changed
+        self._index_relationship(relationship)
+        self._mark_adjacency_index_synced()
+        self._relationship_cache.pop(relationship.source_id, None)
+        self._relationship_cache.pop(relationship.target_id, None)
 
         # Cache invalidation
         if self._enable_advanced_caching and hasattr(self, '_query_cache') and self._query_cache:
@@ -292,8 +432,64 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
                                                source_id=relationship.source_id,
                                                target_id=relationship.target_id)
 
+        self._notify_mutation('relationship_added', relationship=relationship)
         return relationship
 
+    @timed_operation("remove_relationship")
+    def remove_relationship(self, relationship_id: uuid.UUID) -> bool:
+        """Remove a relationship from the graph.
+
+        Returns:
+            True if the relationship existed and was removed, False otherwise
+        """
+        self._ensure_adjacency_index()
+        relationship = self.relationships.pop(relationship_id, None)
+        self._mark_adjacency_index_synced()
+        if relationship is None:
+            return False
+
+        self._unindex_relationship(relationship)
+
+        if self._enable_advanced_caching and hasattr(self, '_query_cache') and self._query_cache:
+            self._query_cache.invalidate_on_event('relationship_removed',
+                                               source_id=relationship.source_id,
+                                               target_id=relationship.target_id)
+
+        self._notify_mutation('relationship_removed', relationship=relationship)
+        return True
+
+    @timed_operation("remove_node")
+    def remove_node(self, node_id: uuid.UUID) -> bool:
+        """Remove a node and every relationship touching it from the graph.
+
+        Unlike remove_node_from_memory, this is a structural change: the node's
+        relationships are dropped as well.
+
+        Returns:
+            True if the node existed and was removed, False otherwise
+        """
+        node = self._node_index.get(node_id)
+        if node is None:
+            return False
+
+        self._ensure_adjacency_index()
+        incident_ids = self._out_index.get(node_id, set()) | self._in_index.get(node_id, set())
+        for rel_id in incident_ids:
+            self.remove_relationship(rel_id)
+
+        collection = getattr(self, self._node_registry.get_collection_name(node))
+        collection.pop(node_id, None)
+        del self._node_index[node_id]
+        self._relationship_cache.pop(node_id, None)
+        if self._memory_monitor:
+            self._memory_monitor.access_tracker.remove_node(node_id)
+
+        if self._enable_advanced_caching and hasattr(self, '_query_cache') and self._query_cache:
+            self._query_cache.invalidate_on_event('node_removed', node_id=node_id)
+
+        self._notify_mutation('node_removed', node_id=node_id)
+        return True
+
     def _find_node_by_id(self, node_id: uuid.UUID) -> Optional[Node]:
         """Find a node by its ID using central index for O(1) lookup."""
         if self._lazy_loading_enabled:
@@ -327,38 +523,93 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
             collection.clear()
         self.relationships.clear()
 
-        # Performance optimization: Clear index and cache
+        # Performance optimization: Clear indexes and cache
         self._node_index.clear()
+        self._out_index.clear()
+        self._in_index.clear()
+        self._mark_adjacency_index_synced()
         self._relationship_cache.clear()
 
+        self._notify_mutation('graph_cleared')
+
     def _clear_relationship_cache(self) -> None:
         """Clear the relationship cache when relationships change."""
         self._relationship_cache.clear()
 
+    def _index_relationship(self, relationship: Relationship) -> None:
+        """Add a relationship to the outgoing and incoming adjacency indexes."""
+        self._out_index.setdefault(relationship.source_id, set()).add(relationship.id)
+        self._in_index.setdefault(relationship.target_id, set()).add(relationship.id)
+
+    def _unindex_relationship(self, relationship: Relationship) -> None:
+        """Remove a relationship from the adjacency indexes, pruning empty entries."""
+        for index, node_id in (
+            (self._out_index, relationship.source_id),
+            (self._in_index, relationship.target_id),
+        ):
+            rel_ids = index.get(node_id)
+            if rel_ids is not None:
+                rel_ids.discard(relationship.id)
+                if not rel_ids:
+                    del index[node_id]
+        self._relationship_cache.pop(relationship.source_id, None)
+        self._relationship_cache.pop(relationship.target_id, None)
+
+    def _rebuild_adjacency_index(self) -> None:
+        """Rebuild the adjacency indexes from the relationships collection."""
+        if not isinstance(self.relationships, RelationshipStore):
+            self.relationships = RelationshipStore(self.relationships)
+        self._out_index.clear()
+        self._in_index.clear()
+        for relationship in self.relationships.values():
+            self._index_relationship(relationship)
+        self._mark_adjacency_index_synced()
+        self._relationship_cache.clear()
+
+    def _mark_adjacency_index_synced(self) -> None:
+        """Record that the indexes reflect every write made to relationships so far."""
+        self._indexed_relationship_mutations = getattr(self.relationships, 'mutation_count', 0)
+
+    def _ensure_adjacency_index(self) -> None:
+        """Re-sync the indexes if relationships were written to the dict directly.
+
+        A replaced collection (a plain dict assigned to `relationships`) or any
+        write to the store since the last indexed one triggers a rebuild.
+        """
+        if (not isinstance(self.relationships, RelationshipStore)
+                or self.relationships.mutation_count != self._indexed_relationship_mutations):
+            self._rebuild_adjacency_index()
+            # Listeners never saw these writes, so only the version moves;
+            # subscribers compare versions and fall back to a full resync.
+            self._graph_version += 1
+
+    def get_out_relationships(self, node_id: uuid.UUID) -> List[Relationship]:
+        """Get relationships whose source is the given node in O(out-degree)."""
+        self._ensure_adjacency_index()
+        return [self.relationships[rel_id] for rel_id in self._out_index.get(node_id, ())]
+
+    def get_in_relationships(self, node_id: uuid.UUID) -> List[Relationship]:
+        """Get relationships whose target is the given node in O(in-degree)."""
+        self._ensure_adjacency_index()
+        return [self.relationships[rel_id] for rel_id in self._in_index.get(node_id, ())]
+
     @timed_operation("get_node_relationships")
     def get_node_relationships(self, node_id: uuid.UUID) -> List[Relationship]:
-        """Get all relationships for a node with caching for performance."""
-        # Try advanced cache first
-        if (self._enable_advanced_caching and 
-            hasattr(self, '_query_cache') and self._query_cache):
-            cached_result = self._query_cache.get_cached_result("get_node_relationships", node_id)
-            if cached_result is not None:
-                return cached_result
+        """Get all relationships for a node in O(degree) using the adjacency index."""
+        self._ensure_adjacency_index()
 
         # Check basic cache
         if node_id in self._relationship_cache:
-            relationships = self._relationship_cache[node_id]
-            # Cache in advanced cache too
-            if (self._enable_advanced_caching and 
-                hasattr(self, '_query_cache') and self._query_cache):
-                self._query_cache.cache_result("get_node_relationships", relationships, node_id=node_id)
-            return relationships
-
-        # Compute relationships for this node
-        relationships = []
-        for relationship in self.relationships.values():
-            if node_id in (relationship.source_id, relationship.target_id):
-                relationships.append(relationship)
+            return self._relationship_cache[node_id]
+
+        # Compute relationships for this node from the adjacency indexes
+        out_ids = self._out_index.get(node_id, set())
+        relationships = [self.relationships[rel_id] for rel_id in out_ids]
+        relationships.extend(
+            self.relationships[rel_id]
+            for rel_id in self._in_index.get(node_id, ())
+            if rel_id not in out_ids  # Self-loops are already counted once
+        )
 
         # Cache result with simple size management
         if len(self._relationship_cache) >= self._relationship_cache_max_size:
@@ -367,12 +618,6 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
             del self._relationship_cache[oldest_key]
 
         self._relationship_cache[node_id] = relationships
-        
-        # Cache in advanced cache
-        if (self._enable_advanced_caching and 
-            hasattr(self, '_query_cache') and self._query_cache):
-            self._query_cache.cache_result("get_node_relationships", relationships, ttl=1800, node_id=node_id)
-        
         return relationships
 
     def enable_lazy_loading(self, node_loader: Callable[[uuid.UUID], Optional[Node]]) -> None:
@@ -430,7 +675,8 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
             del collection[node_id]
             del self._node_index[node_id]
             
-            # Clear related caches
+            # Clear related caches. The node's relationships stay in the graph (and
+            # in the adjacency indexes) so they are still found once it is reloaded.
             self._relationship_cache.pop(node_id, None)
             if (self._enable_advanced_caching and 
                 hasattr(self, '_query_cache') and self._query_cache):
@@ -494,6 +740,7 @@ class SFMGraph(EvictableGraph):  # pylint: disable=too-many-instance-attributes
             "total_nodes": len(self._node_index),
             "total_relationships": len(self.relationships),
             "relationship_cache_size": len(self._relationship_cache),
+            "adjacency_index_size": len(self._out_index) + len(self._in_index),
             "memory_management_enabled": self._enable_memory_management
         }
         
@@ -0,0 +1,245 @@
+"""
+Leontief input-output analysis over the Flow and Process nodes of an SFM graph.
+
+The social fabric matrix is a delivery matrix: processes deliver flows to
+one another. This module assembles those deliveries into a Leontief
+input-output model, with Process nodes as sectors, and answers demand
+questions with linear solves instead of tracing flows path by path.
+
+Flow accounting:
+- A flow with a source and a target process is an intermediate delivery;
+  one with only a source process is final demand for that sector's output,
+  one with only a target process a primary input (imports, labor, ...)
+- `quantity` is the amount delivered; with a `loss_factor` the source has to
+  ship quantity / (1 - loss_factor) for it to arrive
+- Gross output of a sector is everything it ships, intermediate and final
+- Technical coefficient a_ij = shipments from i to j per unit of j's gross
+  output; a flow with a `transformation_coefficient` states its input per
+  unit of the target's output directly (grossed up for losses)
+
+Features:
+- Sparse technical-coefficient matrix, rebuilt only when the graph version
+  changes
+- Dense LU factorization of I - A, reused for every solve, up to
+  `dense_limit` sectors; sparse GMRES above that
+- Many final-demand shocks solved together as columns of one right-hand side
+- Output multipliers and forward linkages of every sector from one solve
+  each (with the transposed and the plain system), without forming the
+  Leontief inverse
+"""
+
+import logging
+import uuid
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import linalg, sparse
+from scipy.sparse import linalg as sparse_linalg
+
+from core.sfm_models import Flow, SFMGraph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DENSE_SECTOR_LIMIT = 1000  # Above this many sectors, solve iteratively
+DEFAULT_SOLVER_TOL = 1e-10  # Relative residual at which GMRES stops
+DEFAULT_SOLVER_MAX_ITER = 1000
+
+
+def shipped_quantity(flow: Flow) -> float:
+    """Amount the source ships for the flow's quantity to arrive."""
+    loss = flow.loss_factor or 0.0
+    if not 0.0 <= loss < 1.0:
+        raise ValueError(f"Flow {flow.id} has loss_factor {loss}; expected [0, 1)")
+    return (flow.quantity or 0.0) / (1.0 - loss)
+
+
+class InputOutputModel:
+    """Leontief input-output model of an SFMGraph's processes.
+
+    Sectors are the graph's Process nodes in insertion order. Flows that
+    reference process IDs outside the graph treat that end as outside the
+    economy. The model follows the graph version.
+    """
+
+    def __init__(
+        self,
+        graph: SFMGraph,
+        dense_limit: int = DEFAULT_DENSE_SECTOR_LIMIT,
+        tol: float = DEFAULT_SOLVER_TOL,
+        max_iter: int = DEFAULT_SOLVER_MAX_ITER,
+    ):
+        self.graph = graph
+        self.dense_limit = dense_limit
+        self.tol = tol
+        self.max_iter = max_iter
+        self.sector_ids: List[uuid.UUID] = []
+        self.sector_index: Dict[uuid.UUID, int] = {}
+        self.technical_coefficients = sparse.csr_matrix((0, 0))
+        self.gross_output = np.zeros(0)
+        self.final_demand = np.zeros(0)
+        self.primary_inputs = np.zeros(0)
+        self._system = sparse.csr_matrix((0, 0))  # I - A
+        self._lu: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._built_version: Optional[int] = None
+
+    # ─── MODEL ───
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the graph changed since the model was built."""
+        return self._built_version != self.graph.graph_version
+
+    def sync(self) -> None:
+        """Rebuild the model if the graph has changed."""
+        if self.is_stale:
+            self._build()
+
+    @property
+    def sector_count(self) -> int:
+        """Number of sectors (Process nodes)."""
+        self.sync()
+        return len(self.sector_ids)
+
+    def _flows(self) -> List[Flow]:
+        """Flow and ValueFlow nodes of the graph."""
+        return list(self.graph.flows.values()) + list(self.graph.value_flows.values())
+
+    def _build(self) -> None:
+        """Assemble the technical-coefficient matrix for the current graph."""
+        sector_ids = list(self.graph.processes)
+        sector_index = {sector_id: i for i, sector_id in enumerate(sector_ids)}
+        n = len(sector_ids)
+
+        shipped_rows, shipped_cols, shipped = [], [], []
+        fixed_rows, fixed_cols, fixed = [], [], []
+        gross_output = np.zeros(n)
+        final_demand = np.zeros(n)
+        primary_inputs = np.zeros(n)
+        for flow in self._flows():
+            source = sector_index.get(flow.source_process_id)
+            target = sector_index.get(flow.target_process_id)
+            amount = shipped_quantity(flow)
+            if source is not None:
+                gross_output[source] += amount
+                if target is None:
+                    final_demand[source] += amount
+            if target is None:
+                continue
+            if source is None:
+                primary_inputs[target] += amount
+            elif flow.transformation_coefficient is not None:
+                fixed_rows.append(source)
+                fixed_cols.append(target)
+                fixed.append(flow.transformation_coefficient / (1.0 - (flow.loss_factor or 0.0)))
+            else:
+                shipped_rows.append(source)
+                shipped_cols.append(target)
+                shipped.append(amount)
+
+        # Shipments per unit of the buying sector's gross output
+        deliveries = sparse.csr_matrix((shipped, (shipped_rows, shipped_cols)), shape=(n, n))
+        scale = np.divide(1.0, gross_output, out=np.zeros(n), where=gross_output > 0)
+        coefficients = sparse.csr_matrix(deliveries @ sparse.diags(scale)) + sparse.csr_matrix(
+            (fixed, (fixed_rows, fixed_cols)), shape=(n, n)
+        )
+        coefficients.eliminate_zeros()
+
+        self.sector_ids = sector_ids
+        self.sector_index = sector_index
+        self.technical_coefficients = sparse.csr_matrix(coefficients)
+        self.gross_output = gross_output
+        self.final_demand = final_demand
+        self.primary_inputs = primary_inputs
+        self._system = sparse.csr_matrix(sparse.identity(n, format="csr") - coefficients)
+        self._lu = None
+        self._built_version = self.graph.graph_version
+
+    # ─── SOLVES ───
+
+    def solve(self, rhs: np.ndarray, transpose: bool = False) -> np.ndarray:
+        """Solve (I - A) x = rhs, or (I - A)^T x = rhs, for one or many columns."""
+        self.sync()
+        n = len(self.sector_ids)
+        if n == 0:
+            return np.zeros_like(rhs, dtype=np.float64)
+        if n <= self.dense_limit:
+            if self._lu is None:
+                lu, pivots = linalg.lu_factor(self._system.toarray(), check_finite=False)
+                if np.any(np.diag(lu) == 0):
+                    raise ValueError("I - A is singular; the input-output system has no solution")
+                self._lu = (lu, pivots)
+            return linalg.lu_solve(self._lu, rhs, trans=1 if transpose else 0)
+
+        system = sparse.csr_matrix(self._system.T) if transpose else self._system
+        columns = np.asarray(rhs, dtype=np.float64).reshape(n, -1)
+        solution = np.empty_like(columns)
+        for k in range(columns.shape[1]):
+            # The first Neumann series term (x = rhs) is a good starting point
+            solution[:, k], info = sparse_linalg.gmres(
+                system, columns[:, k], x0=columns[:, k], rtol=self.tol, maxiter=self.max_iter
+            )
+            if info != 0:
+                raise ValueError(
+                    f"GMRES did not converge for the input-output system (info {info})"
+                )
+        return solution.reshape(np.shape(rhs))
+
+    def leontief_inverse(self) -> np.ndarray:
+        """Dense Leontief inverse L = (I - A)^-1, for up to `dense_limit` sectors."""
+        self.sync()
+        if len(self.sector_ids) > self.dense_limit:
+            raise ValueError(
+                f"Leontief inverse of {len(self.sector_ids)} sectors exceeds the dense limit "
+                f"({self.dense_limit}); use solve() or multipliers()"
+            )
+        return self.solve(np.identity(len(self.sector_ids)))
+
+    def total_output(self, final_demand: Optional[Mapping[uuid.UUID, float]] = None
+                     ) -> Dict[uuid.UUID, float]:
+        """Gross output every sector needs to meet `final_demand` (observed by default)."""
+        self.sync()
+        demand = self.final_demand if final_demand is None else self._demand_vector(final_demand)
+        return dict(zip(self.sector_ids, self.solve(demand).tolist()))
+
+    def demand_shocks(
+        self, shocks: Sequence[Mapping[uuid.UUID, float]]
+    ) -> List[Dict[uuid.UUID, float]]:
+        """Change in gross output per sector for each final-demand shock, in one solve.
+
+        A shock maps sector IDs to the change in their final demand; IDs
+        that are not sectors of the model are ignored.
+        """
+        self.sync()
+        n = len(self.sector_ids)
+        demand = np.zeros((n, len(shocks)))
+        for column, shock in enumerate(shocks):
+            demand[:, column] = self._demand_vector(shock)
+        changes = self.solve(demand)
+        return [dict(zip(self.sector_ids, changes[:, column].tolist()))
+                for column in range(len(shocks))]
+
+    def multipliers(self) -> Dict[uuid.UUID, Dict[str, float]]:
+        """Output multiplier and forward linkage of every sector.
+
+        The output multiplier of sector j (column sum of L) is the gross
+        output the whole economy produces per unit of final demand for j.
+        The forward linkage of sector i (row sum of L) is the output i
+        produces when final demand for every sector rises by one unit.
+        """
+        self.sync()
+        ones = np.ones(len(self.sector_ids))
+        output = self.solve(ones, transpose=True)
+        forward = self.solve(ones)
+        return {
+            sector_id: {"output_multiplier": float(output[i]), "forward_linkage": float(forward[i])}
+            for i, sector_id in enumerate(self.sector_ids)
+        }
+
+    def _demand_vector(self, demand: Mapping[uuid.UUID, float]) -> np.ndarray:
+        """Final demand by sector index; unknown sector IDs are ignored."""
+        vector = np.zeros(len(self.sector_ids))
+        for sector_id, amount in demand.items():
+            index = self.sector_index.get(sector_id)
+            if index is not None:
+                vector[index] += amount
+        return vector
@@ -0,0 +1,273 @@
+"""
+Process-pool parallel centrality computation for SFM query engines.
+
+Exact betweenness and closeness centrality are sums (or independent values)
+over single-source shortest path searches, so the source nodes can be split
+across worker processes. The graph is shipped to each worker once, through the
+pool initializer, as a compact integer CSR edge array instead of a pickled
+NetworkX graph full of node and relationship dataclasses.
+
+Features:
+- Compact CSR representation built from the NetworkX mirror
+- Brandes betweenness and closeness kernels that reproduce NetworkX's
+  arithmetic step for step
+- Per-source betweenness dependencies added up in NetworkX's source order, so
+  results are bit-identical to nx.betweenness_centrality for any number of
+  workers or chunk size
+- In-process fallback when only one worker is requested
+"""
+
+import logging
+import os
+import uuid
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import networkx as nx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARALLEL_MIN_NODES = 2000  # Below this, process start-up outweighs the gain
+DEFAULT_SOURCE_CHUNK_SIZE = 64
+
+SUPPORTED_PARALLEL_MEASURES = ("betweenness", "closeness")
+
+# Dependencies of the nodes reached from one source: (node indices, values)
+SourceDependencies = Tuple[array, array]
+
+
+@dataclass(frozen=True)
+class CompactGraph:
+    """Directed graph as integer CSR arrays, cheap to pickle to worker processes.
+
+    Parallel edges collapse into a single adjacency entry and neighbor order
+    follows the NetworkX adjacency order, so searches visit nodes exactly as
+    the NetworkX algorithms do.
+    """
+
+    node_ids: List[uuid.UUID]
+    indptr: array
+    indices: array
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the graph."""
+        return len(self.node_ids)
+
+    @classmethod
+    def from_networkx(cls, nx_graph: nx.Graph) -> "CompactGraph":
+        """Build the CSR arrays from a (multi)directed NetworkX graph."""
+        node_ids = list(nx_graph.nodes())
+        position = {node_id: i for i, node_id in enumerate(node_ids)}
+        indptr = array("q", [0])
+        indices = array("q")
+        for node_id in node_ids:
+            indices.extend(position[neighbor] for neighbor in nx_graph[node_id])
+            indptr.append(len(indices))
+        return cls(node_ids=node_ids, indptr=indptr, indices=indices)
+
+
+def _build_adjacency(indptr: Sequence[int], indices: Sequence[int]) -> List[List[int]]:
+    """Expand CSR arrays into per-node neighbor lists."""
+    return [list(indices[indptr[i]:indptr[i + 1]]) for i in range(len(indptr) - 1)]
+
+
+def _reverse_adjacency(adjacency: List[List[int]]) -> List[List[int]]:
+    """Build incoming-neighbor lists in the order NetworkX's reverse() produces."""
+    reverse: List[List[int]] = [[] for _ in adjacency]
+    for source, neighbors in enumerate(adjacency):
+        for target in neighbors:
+            reverse[target].append(source)
+    return reverse
+
+
+def _betweenness_dependencies(
+    adjacency: List[List[int]], sources: Sequence[int]
+) -> List[SourceDependencies]:
+    """Un-normalized Brandes dependencies of each source in a chunk, kept separate.
+
+    Summing them per chunk would change the order of floating-point additions
+    relative to NetworkX, so the caller adds them up source by source.
+    """
+    node_count = len(adjacency)
+    contributions = []
+    for source in sources:
+        # Single-source shortest paths (BFS)
+        stack: List[int] = []
+        predecessors: List[List[int]] = [[] for _ in range(node_count)]
+        sigma = [0.0] * node_count
+        distance = [-1] * node_count
+        sigma[source] = 1.0
+        distance[source] = 0
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            stack.append(v)
+            dist_v = distance[v]
+            sigma_v = sigma[v]
+            for w in adjacency[v]:
+                if distance[w] < 0:
+                    queue.append(w)
+                    distance[w] = dist_v + 1
+                if distance[w] == dist_v + 1:
+                    sigma[w] += sigma_v
+                    predecessors[w].append(v)
+
+        # Dependency accumulation
+        delta = [0.0] * node_count
+        nodes, values = array("q"), array("d")
+        while stack:
+            w = stack.pop()
+            coeff = (1 + delta[w]) / sigma[w]
+            for v in predecessors[w]:
+                delta[v] += sigma[v] * coeff
+            if w != source:
+                nodes.append(w)
+                values.append(delta[w])
+        contributions.append((nodes, values))
+    return contributions
+
+
+def _closeness_values(reverse_adjacency: List[List[int]], sources: Sequence[int]) -> List[float]:
+    """Wasserman-Faust improved closeness (incoming distances) for a chunk of nodes."""
+    node_count = len(reverse_adjacency)
+    values = []
+    for source in sources:
+        distance = {source: 0}
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            for w in reverse_adjacency[v]:
+                if w not in distance:
+                    distance[w] = distance[v] + 1
+                    queue.append(w)
+        total = sum(distance.values())
+        closeness = 0.0
+        if total > 0.0 and node_count > 1:
+            reachable = len(distance) - 1.0
+            closeness = reachable / total
+            closeness *= reachable / (node_count - 1)
+        values.append(closeness)
+    return values
+
+
+# Worker-process state, populated once per worker by the pool initializer
+_WORKER_ADJACENCY: List[List[int]] = []
+_WORKER_REVERSE_ADJACENCY: List[List[int]] = []
+
+
+def _init_worker(indptr: array, indices: array) -> None:
+    """Pool initializer: unpack the shipped CSR arrays once per worker."""
+    global _WORKER_ADJACENCY, _WORKER_REVERSE_ADJACENCY  # pylint: disable=global-statement
+    _WORKER_ADJACENCY = _build_adjacency(indptr, indices)
+    _WORKER_REVERSE_ADJACENCY = _reverse_adjacency(_WORKER_ADJACENCY)
+
+
+def _worker_task(measure: str, sources: List[int]) -> list:
+    """Run one chunk of a measure inside a worker process."""
+    if measure == "betweenness":
+        return _betweenness_dependencies(_WORKER_ADJACENCY, sources)
+    return _closeness_values(_WORKER_REVERSE_ADJACENCY, sources)
+
+
+class ParallelCentralityExecutor:
+    """Computes exact betweenness and closeness across a process pool.
+
+    Sources are split into fixed-size chunks; betweenness dependencies come
+    back per source and are added in source order, as NetworkX adds them, and
+    closeness values are independent per node. Both therefore match
+    nx.betweenness_centrality and nx.closeness_centrality exactly, for any
+    number of workers (including the in-process path used when max_workers
+    is 1) and any chunk size.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_SOURCE_CHUNK_SIZE):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.chunk_size = chunk_size
+
+    def compute(self, compact_graph: CompactGraph,
+                measures: Sequence[str] = SUPPORTED_PARALLEL_MEASURES
+                ) -> Dict[str, Dict[uuid.UUID, float]]:
+        """Compute the requested measures, shipping the graph to workers once.
+
+        Args:
+            compact_graph: Graph in CSR form
+            measures: Any of 'betweenness' and 'closeness'
+
+        Returns:
+            Mapping of measure name to node id -> normalized score
+        """
+        for measure in measures:
+            if measure not in SUPPORTED_PARALLEL_MEASURES:
+                raise ValueError(f"Unsupported parallel centrality measure: {measure}")
+
+        node_count = compact_graph.node_count
+        chunks = [
+            list(range(start, min(start + self.chunk_size, node_count)))
+            for start in range(0, node_count, self.chunk_size)
+        ]
+
+        # Per measure, one result per chunk: source dependencies or closeness values
+        partials: Dict[str, List[Any]]
+        if self.max_workers <= 1 or len(chunks) <= 1:
+            adjacency = _build_adjacency(compact_graph.indptr, compact_graph.indices)
+            reverse_adjacency = _reverse_adjacency(adjacency)
+            partials = {
+                measure: [
+                    _betweenness_dependencies(adjacency, chunk) if measure == "betweenness"
+                    else _closeness_values(reverse_adjacency, chunk)
+                    for chunk in chunks
+                ]
+                for measure in measures
+            }
+        else:
+            workers = min(self.max_workers, len(chunks))
+            logger.debug("Computing %s over %d nodes with %d workers",
+                         ", ".join(measures), node_count, workers)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(compact_graph.indptr, compact_graph.indices),
+            ) as pool:
+                futures = {
+                    measure: [pool.submit(_worker_task, measure, chunk) for chunk in chunks]
+                    for measure in measures
+                }
+                partials = {
+                    measure: [future.result() for future in measure_futures]
+                    for measure, measure_futures in futures.items()
+                }
+
+        results: Dict[str, Dict[uuid.UUID, float]] = {}
+        if "betweenness" in partials:
+            results["betweenness"] = self._reduce_betweenness(
+                compact_graph, partials["betweenness"]
+            )
+        if "closeness" in partials:
+            values = [value for chunk_values in partials["closeness"] for value in chunk_values]
+            results["closeness"] = dict(zip(compact_graph.node_ids, values))
+        return results
+
+    @staticmethod
+    def _reduce_betweenness(compact_graph: CompactGraph,
+                            partials: List[List[SourceDependencies]]
+                            ) -> Dict[uuid.UUID, float]:
+        """Add dependencies source by source and apply NetworkX's directed normalization."""
+        node_count = compact_graph.node_count
+        totals = [0.0] * node_count
+        # Chunks and the sources inside them are in node order, like NetworkX's loop
+        for chunk in partials:
+            for nodes, values in chunk:
+                for i, value in zip(nodes, values):
+                    totals[i] += value
+
+        if node_count > 2:
+            scale = 1 / ((node_count - 1) * (node_count - 2))
+            totals = [value * scale for value in totals]
+        return dict(zip(compact_graph.node_ids, totals))
@@ -0,0 +1,161 @@
+"""
+Sparse matrix path counting for SFM flow analysis.
+
+Redundant-path detection used to enumerate `nx.all_simple_paths(cutoff=3)` for
+every ordered node pair, which is O(N^2) Python calls before any path is even
+found. Path counts of bounded length fall out of powers of the adjacency
+matrix instead: (A^k)[s, t] is the number of length-k walks from s to t. This
+module evaluates those powers with SciPy sparse products, one block of source
+rows at a time, and keeps only the top pairs in a heap.
+
+Features:
+- Exact simple path counts for lengths up to 3 (walk counts corrected for
+  revisited endpoints), walk counts beyond that
+- Parallel relationships counted as distinct paths, as NetworkX does for
+  multigraphs
+- Row-blocked evaluation so at most `block_size` rows of A^k are held at once
+- Distinct in/out neighbor counts read straight off the sparse structure
+"""
+
+import heapq
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+MAX_EXACT_PATH_LENGTH = 3
+DEFAULT_BLOCK_SIZE = 512
+IMBALANCE_THRESHOLD = 0.7
+
+# (path count, source index, target index)
+PairCount = Tuple[int, int, int]
+
+
+def adjacency_matrix(graph: nx.MultiDiGraph, nodelist: Sequence[Hashable]) -> sparse.csr_matrix:
+    """Edge-multiplicity adjacency matrix of `graph` in `nodelist` order."""
+    return sparse.csr_matrix(nx.to_scipy_sparse_array(
+        graph, nodelist=nodelist, weight=None, dtype=np.int64, format="csr"
+    ))
+
+
+def top_path_counts(
+    adjacency: sparse.spmatrix,
+    max_length: int = MAX_EXACT_PATH_LENGTH,
+    top_k: int = 10,
+    min_count: int = 2,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> List[PairCount]:
+    """The `top_k` ordered pairs with the most paths of length <= `max_length`.
+
+    Self-loops never lie on a simple path and are dropped. For `max_length`
+    up to 3 the counts equal the number of simple paths (what
+    `nx.all_simple_paths(cutoff=max_length)` would yield); above that they
+    are walk counts, an upper bound. Pairs with fewer than `min_count` paths
+    are ignored. Results are sorted by count, highest first.
+    """
+    if max_length < 1:
+        raise ValueError(f"max_length must be positive, got {max_length}")
+    adjacency = sparse.csr_matrix(adjacency, dtype=np.int64, copy=True)
+    adjacency.setdiag(0)
+    adjacency.eliminate_zeros()
+    transpose = adjacency.T.tocsr()
+    # (A^2)[i, i]: closed 2-walks, needed to correct 3-walks that revisit an endpoint
+    closed_two_walks = np.asarray(adjacency.multiply(transpose).sum(axis=1)).ravel()
+
+    heap: List[PairCount] = []
+    node_count = adjacency.shape[0]
+    for start in range(0, node_count, block_size):
+        stop = min(start + block_size, node_count)
+        block = adjacency[start:stop]
+        counts = block.copy()
+        power = block
+        for length in range(2, max_length + 1):
+            power = power @ adjacency
+            counts = counts + power
+            if length == 3:
+                counts = counts - _revisiting_three_walks(
+                    block, transpose[start:stop], closed_two_walks, start, stop
+                )
+
+        counts = counts.tocoo()
+        rows = counts.row + start
+        keep = (counts.data >= min_count) & (rows != counts.col)
+        for count, source, target in zip(counts.data[keep], rows[keep], counts.col[keep]):
+            item = (int(count), -int(source), -int(target))
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    return [(count, -source, -target) for count, source, target in sorted(heap, reverse=True)]
+
+
+def _revisiting_three_walks(
+    block: sparse.csr_matrix,
+    transpose_block: sparse.csr_matrix,
+    closed_two_walks: np.ndarray,
+    start: int,
+    stop: int,
+) -> sparse.csr_matrix:
+    """Length-3 walks s -> a -> b -> t (s != t) that are not simple paths.
+
+    With self-loops removed the only repeats are a == t (s -> t -> b -> t) or
+    b == s (s -> a -> s -> t); walks doing both (s -> t -> s -> t) are counted
+    by each term and added back once.
+    """
+    through_target = block.multiply(closed_two_walks[np.newaxis, :])
+    through_source = block.multiply(closed_two_walks[start:stop, np.newaxis])
+    both = block.multiply(block).multiply(transpose_block)
+    return sparse.csr_matrix(through_target + through_source - both)
+
+
+def distinct_degrees(adjacency: sparse.spmatrix) -> Tuple[np.ndarray, np.ndarray]:
+    """Number of distinct predecessors and successors of every node."""
+    adjacency = sparse.csr_matrix(adjacency, copy=True)
+    adjacency.sum_duplicates()
+    adjacency.eliminate_zeros()
+    out_degrees = np.diff(adjacency.indptr)
+    in_degrees = np.bincount(adjacency.indices, minlength=adjacency.shape[1])
+    return in_degrees, out_degrees
+
+
+def flow_inefficiency_report(
+    adjacency: sparse.spmatrix,
+    node_ids: Sequence[Hashable],
+    top_k: int = 10,
+    max_length: int = MAX_EXACT_PATH_LENGTH,
+) -> Dict[str, Any]:
+    """Redundant paths and degree imbalances for `identify_flow_inefficiencies`.
+
+    `adjacency` rows and columns follow `node_ids`. Redundant paths are the
+    `top_k` ordered pairs joined by more than one path of length <=
+    `max_length`; imbalances are nodes with both predecessors and successors
+    whose counts differ by more than IMBALANCE_THRESHOLD of the larger one.
+    """
+    redundant_paths = [
+        {"source": str(node_ids[s]), "target": str(node_ids[t]), "path_count": count}
+        for count, s, t in top_path_counts(adjacency, max_length=max_length, top_k=top_k)
+    ]
+
+    in_degrees, out_degrees = distinct_degrees(adjacency)
+    larger = np.maximum(in_degrees, out_degrees)
+    connected = (in_degrees > 0) & (out_degrees > 0)
+    ratios = np.zeros(len(node_ids))
+    np.divide(np.abs(in_degrees - out_degrees), larger, out=ratios, where=connected)
+    flow_imbalances = [
+        {
+            "node": str(node_ids[i]),
+            "in_degree": int(in_degrees[i]),
+            "out_degree": int(out_degrees[i]),
+            "imbalance_ratio": float(ratios[i]),
+        }
+        for i in np.flatnonzero(connected & (ratios > IMBALANCE_THRESHOLD)).tolist()
+    ]
+
+    return {
+        "redundant_paths": redundant_paths,
+        "flow_imbalances": flow_imbalances,
+        "underutilized_connections": [],
+        "optimization_opportunities": [],
+    }
@@ -0,0 +1,187 @@
+"""
+Percolation robustness curves for SFM graphs.
+
+A robustness curve records the size of the largest weakly connected
+component as nodes are removed one after another. Recomputing components
+after each removal costs O(N * (N + M)) per curve; the Newman-Ziff approach
+runs the removal backwards instead, adding nodes in reverse order and
+merging components with a union-find, so a whole curve costs near-linear
+time.
+
+Features:
+- Targeted attacks in descending degree or betweenness order
+- Random failures averaged over repeated trials
+- Largest-component fraction after every removal and the robustness index R
+  (mean fraction over all removals, Schneider et al. 2011)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+from scipy import sparse
+
+ATTACK_STRATEGIES = ("degree", "betweenness", "random")
+DEFAULT_RANDOM_TRIALS = 10
+
+
+@dataclass
+class RobustnessCurve:
+    """Largest-component fraction after each node removal.
+
+    `fractions[k]` is the share of the original nodes in the largest weakly
+    connected component once k nodes have been removed, so the curve has
+    node_count + 1 points and ends at 0. For random failures the curve is the
+    mean over trials and `std` holds the per-point standard deviation.
+    """
+
+    strategy: str
+    fractions: List[float] = field(default_factory=lambda: [])
+    std: List[float] = field(default_factory=lambda: [])
+    removal_order: List[Hashable] = field(default_factory=lambda: [])
+    trials: int = 1
+
+    @property
+    def robustness(self) -> float:
+        """Mean largest-component fraction over all removals (the R index)."""
+        removals = len(self.fractions) - 1
+        return float(sum(self.fractions[1:])) / removals if removals > 0 else 0.0
+
+    def critical_fraction(self, threshold: float = 0.5) -> float:
+        """Share of nodes removed once the largest component falls to `threshold` x its start."""
+        removals = len(self.fractions) - 1
+        if removals <= 0 or self.fractions[0] == 0:
+            return 0.0
+        for removed, fraction in enumerate(self.fractions):
+            if fraction <= threshold * self.fractions[0]:
+                return removed / removals
+        return 1.0
+
+
+def largest_component_curve(
+    undirected: sparse.csr_matrix, order: Union[Sequence[int], np.ndarray]
+) -> np.ndarray:
+    """Largest component size after removing each prefix of `order`.
+
+    `undirected` is a symmetric adjacency matrix and `order` a permutation
+    of its node indices. Entry k of the result is the largest component size
+    once order[:k] are removed. Nodes are added back in reverse order and
+    joined to present neighbors with a union-find (Newman-Ziff).
+    """
+    node_count = undirected.shape[0]
+    if len(order) != node_count:
+        raise ValueError(f"Removal order covers {len(order)} of {node_count} nodes")
+    indptr = undirected.indptr.tolist()
+    indices = undirected.indices.tolist()
+    parent = list(range(node_count))
+    size = [1] * node_count
+    present = [False] * node_count
+
+    def find(node: int) -> int:
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    sizes = np.zeros(node_count + 1, dtype=np.int64)
+    largest = 0
+    for added, node in enumerate(reversed(order), start=1):
+        present[node] = True
+        root = node
+        for neighbor in indices[indptr[node]:indptr[node + 1]]:
+            if not present[neighbor]:
+                continue
+            other = find(neighbor)
+            if other == root:
+                continue
+            # Union by size
+            if size[root] < size[other]:
+                root, other = other, root
+            parent[other] = root
+            size[root] += size[other]
+        largest = max(largest, size[root])
+        sizes[node_count - added] = largest
+    return sizes
+
+
+def removal_order(
+    undirected: sparse.csr_matrix,
+    strategy: str,
+    scores: Optional[Dict[int, float]] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Node indices in the order an attack removes them.
+
+    "degree" removes nodes by descending number of distinct neighbors,
+    "betweenness" by descending `scores` (node index -> centrality), and
+    "random" in a random permutation drawn from `rng`. Ties keep node order.
+    """
+    node_count = undirected.shape[0]
+    if strategy == "degree":
+        degrees = np.diff(undirected.indptr) - (undirected.diagonal() != 0)
+        return np.argsort(-degrees, kind="stable")
+    if strategy == "betweenness":
+        if scores is None:
+            raise ValueError("Betweenness attack requires centrality scores")
+        values = np.array([scores.get(i, 0.0) for i in range(node_count)])
+        return np.argsort(-values, kind="stable")
+    if strategy == "random":
+        return (rng or np.random.default_rng()).permutation(node_count)
+    raise ValueError(f"Unsupported attack strategy: {strategy}")
+
+
+def robustness_curve(
+    undirected: sparse.csr_matrix,
+    node_ids: Sequence[Hashable],
+    strategy: str = "degree",
+    scores: Optional[Mapping[Any, float]] = None,
+    trials: int = DEFAULT_RANDOM_TRIALS,
+    seed: Optional[int] = None,
+) -> RobustnessCurve:
+    """Robustness curve of a graph under one attack strategy.
+
+    Args:
+        undirected: Symmetric adjacency matrix ordered like `node_ids`
+        node_ids: Node ID per matrix index
+        strategy: "degree", "betweenness" or "random"
+        scores: Node ID -> centrality, required for "betweenness"
+        trials: Number of random removal orders averaged ("random" only)
+        seed: Seed for the random removal orders
+
+    Targeted orders are fixed up front from the intact graph (no
+    recalculation after each removal) and are returned as `removal_order`.
+    """
+    if strategy not in ATTACK_STRATEGIES:
+        raise ValueError(f"Unsupported attack strategy: {strategy}")
+    node_count = len(node_ids)
+    if node_count == 0:
+        return RobustnessCurve(strategy=strategy, fractions=[0.0], std=[0.0], trials=0)
+
+    if strategy != "random":
+        index_scores = None
+        if scores is not None:
+            index_scores = {i: scores.get(node_id, 0.0) for i, node_id in enumerate(node_ids)}
+        order = removal_order(undirected, strategy, index_scores)
+        fractions = largest_component_curve(undirected, order) / node_count
+        return RobustnessCurve(
+            strategy=strategy,
+            fractions=fractions.tolist(),
+            std=[0.0] * (node_count + 1),
+            removal_order=[node_ids[i] for i in order.tolist()],
+        )
+
+    if trials < 1:
+        raise ValueError(f"trials must be positive, got {trials}")
+    rng = np.random.default_rng(seed)
+    curves = np.array([
+        largest_component_curve(undirected, removal_order(undirected, "random", rng=rng))
+        for _ in range(trials)
+    ]) / node_count
+    return RobustnessCurve(
+        strategy=strategy,
+        fractions=curves.mean(axis=0).tolist(),
+        std=curves.std(axis=0).tolist(),
+        trials=trials,
+    )
@@ -0,0 +1,270 @@
+"""
+Weighted impact propagation for SFM graphs.
+
+Policy impact analysis treats everything within a hop radius as equally
+affected and ignores how strong or how certain the connecting relationships
+are. This module ranks influence instead, using random walk with restart
+(personalized PageRank): a walker leaves the seed nodes along relationships
+in proportion to weight x certainty and jumps back to the seeds with
+probability 1 - alpha at every step. The stationary distribution scores how
+strongly each node is reached from the seeds.
+
+Features:
+- Sparse column-stochastic transition matrix, rebuilt only when the graph
+  version changes
+- Power iteration with configurable damping, tolerance and iteration cap
+- Many seed sets solved together as columns of one matrix
+- Warm start from the previous solution for the same seeds, carried across
+  graph versions by node ID
+"""
+
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from core.sfm_models import SFMGraph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAMPING = 0.85  # Probability of following a relationship rather than restarting
+DEFAULT_PROPAGATION_TOL = 1e-8  # L1 change per seed set at which iteration stops
+DEFAULT_PROPAGATION_MAX_ITER = 200
+DEFAULT_MAX_WARM_STARTS = 256  # Seed sets whose last solution is kept
+
+# Seed nodes, optionally with restart weights
+Seeds = Union[Sequence[uuid.UUID], Mapping[uuid.UUID, float]]
+SeedKey = FrozenSet[Tuple[uuid.UUID, float]]
+
+
+@dataclass
+class PropagationResult:
+    """Influence scores from one seed set.
+
+    Scores sum to one over all nodes, seeds included.
+    """
+
+    seeds: Dict[uuid.UUID, float]
+    scores: Dict[uuid.UUID, float] = field(default_factory=lambda: {})
+    iterations: int = 0
+    converged: bool = True
+
+    def ranked(
+        self, top_k: Optional[int] = None, include_seeds: bool = False
+    ) -> List[Tuple[uuid.UUID, float]]:
+        """Nodes by descending score, without the seeds unless asked for."""
+        ranking = sorted(
+            (
+                (node_id, score) for node_id, score in self.scores.items()
+                if score > 0 and (include_seeds or node_id not in self.seeds)
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return ranking[:top_k] if top_k is not None else ranking
+
+
+class ImpactPropagator:
+    """Random walk with restart over an SFMGraph.
+
+    The transition matrix follows the graph version. Each solved seed set is
+    remembered (up to `max_warm_starts`) and used as the starting vector the
+    next time the same seeds are propagated, so re-ranking after a small
+    graph edit starts close to the answer.
+    """
+
+    def __init__(
+        self,
+        graph: SFMGraph,
+        alpha: float = DEFAULT_DAMPING,
+        tol: float = DEFAULT_PROPAGATION_TOL,
+        max_iter: int = DEFAULT_PROPAGATION_MAX_ITER,
+        use_certainty: bool = True,
+        max_warm_starts: int = DEFAULT_MAX_WARM_STARTS,
+    ):
+        if not 0.0 <= alpha < 1.0:
+            raise ValueError(f"alpha must be in [0, 1), got {alpha}")
+        self.graph = graph
+        self.alpha = alpha
+        self.tol = tol
+        self.max_iter = max_iter
+        self.use_certainty = use_certainty
+        self.max_warm_starts = max_warm_starts
+        self.node_ids: List[uuid.UUID] = []
+        self.node_index: Dict[uuid.UUID, int] = {}
+        self._transition = sparse.csr_matrix((0, 0))
+        self._dangling = np.zeros(0, dtype=bool)
+        self._built_version: Optional[int] = None
+        # Last solution per seed set, indexed like node_ids at the time it was solved
+        self._warm_starts: "OrderedDict[SeedKey, np.ndarray]" = OrderedDict()
+
+    # ─── TRANSITION MATRIX ───
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the graph changed since the transition matrix was built."""
+        return self._built_version != self.graph.graph_version
+
+    def sync(self) -> None:
+        """Rebuild the transition matrix if the graph has changed."""
+        if self.is_stale:
+            self._build()
+
+    def edge_weight(self, weight: Optional[float], certainty: Optional[float]) -> float:
+        """Walk weight of one relationship: weight scaled by certainty."""
+        value = weight or 1.0
+        if self.use_certainty:
+            value *= min(max(certainty if certainty is not None else 1.0, 0.0), 1.0)
+        return max(value, 0.0)
+
+    def _build(self) -> None:
+        """Build the column-stochastic transition matrix for the current graph."""
+        previous_ids = self.node_ids
+        node_ids = [node.id for node in self.graph]
+        node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+
+        rows, cols, weights = [], [], []
+        for rel in self.graph.relationships.values():
+            for endpoint in (rel.source_id, rel.target_id):
+                if endpoint not in node_index:
+                    node_index[endpoint] = len(node_ids)
+                    node_ids.append(endpoint)
+            rows.append(node_index[rel.target_id])
+            cols.append(node_index[rel.source_id])
+            weights.append(self.edge_weight(rel.weight, rel.certainty))
+
+        n = len(node_ids)
+        # Column j holds node j's outgoing weights; parallel relationships add up
+        matrix = sparse.csc_matrix((weights, (rows, cols)), shape=(n, n), dtype=np.float64)
+        matrix.eliminate_zeros()
+        out_weight = np.asarray(matrix.sum(axis=0)).ravel()
+        self._dangling = out_weight == 0
+        scale = np.divide(1.0, out_weight, out=np.zeros(n), where=~self._dangling)
+        self._transition = sparse.csr_matrix(matrix @ sparse.diags(scale))
+
+        self._remap_warm_starts(previous_ids, node_index, n)
+        self.node_ids = node_ids
+        self.node_index = node_index
+        self._built_version = self.graph.graph_version
+
+    def _remap_warm_starts(
+        self, previous_ids: List[uuid.UUID], node_index: Dict[uuid.UUID, int], n: int
+    ) -> None:
+        """Carry stored solutions over to the new node order by node ID."""
+        if not self._warm_starts:
+            return
+        old_positions, new_positions = [], []
+        for old, node_id in enumerate(previous_ids):
+            new = node_index.get(node_id)
+            if new is not None:
+                old_positions.append(old)
+                new_positions.append(new)
+        for key, vector in self._warm_starts.items():
+            remapped = np.zeros(n)
+            remapped[new_positions] = vector[old_positions]
+            self._warm_starts[key] = remapped
+
+    # ─── PROPAGATION ───
+
+    def propagate(
+        self, seeds: Seeds, warm_start: bool = True, alpha: Optional[float] = None
+    ) -> PropagationResult:
+        """Score every node by random walk with restart from `seeds`."""
+        return self.propagate_batch([seeds], warm_start=warm_start, alpha=alpha)[0]
+
+    def propagate_batch(
+        self,
+        seed_sets: Sequence[Seeds],
+        warm_start: bool = True,
+        alpha: Optional[float] = None,
+    ) -> List[PropagationResult]:
+        """Propagate many seed sets at once, one matrix column per seed set.
+
+        Seeds may be a list of node IDs (equal restart weight) or a mapping of
+        node ID to restart weight. Seeds that are not in the graph are
+        ignored; a seed set with no known seeds gives empty scores. `alpha`
+        overrides the propagator's damping for this call.
+        """
+        alpha = self.alpha if alpha is None else alpha
+        if not 0.0 <= alpha < 1.0:
+            raise ValueError(f"alpha must be in [0, 1), got {alpha}")
+        self.sync()
+        n = len(self.node_ids)
+        normalized = [self._normalize_seeds(seeds) for seeds in seed_sets]
+        keys = [frozenset(seeds.items()) for seeds in normalized]
+
+        restart = np.zeros((n, len(normalized)))
+        for column, seeds in enumerate(normalized):
+            for node_id, share in seeds.items():
+                restart[self.node_index[node_id], column] = share
+        active = restart.sum(axis=0) > 0
+
+        scores = restart.copy()
+        if warm_start:
+            for column, key in enumerate(keys):
+                previous = self._warm_starts.get(key)
+                if previous is not None and active[column] and previous.sum() > 0:
+                    scores[:, column] = previous / previous.sum()
+
+        iterations = np.zeros(len(normalized), dtype=np.int64)
+        pending = active.copy()
+        for _ in range(self.max_iter):
+            if not pending.any():
+                break
+            current = scores[:, pending]
+            # Walk mass stuck on dangling nodes restarts at the seeds
+            stuck = current[self._dangling].sum(axis=0)
+            updated = (
+                alpha * (self._transition @ current)
+                + (1.0 - alpha + alpha * stuck) * restart[:, pending]
+            )
+            change = np.abs(updated - current).sum(axis=0)
+            scores[:, pending] = updated
+            iterations[pending] += 1
+            pending[np.flatnonzero(pending)[change < self.tol]] = False
+
+        if pending.any():
+            logger.warning("Impact propagation did not converge for %d of %d seed sets "
+                           "after %d iterations", int(pending.sum()), len(normalized),
+                           self.max_iter)
+
+        results = []
+        for column, seeds in enumerate(normalized):
+            if not active[column]:
+                results.append(PropagationResult(seeds=seeds))
+                continue
+            vector = scores[:, column]
+            self._remember(keys[column], vector)
+            results.append(PropagationResult(
+                seeds=seeds,
+                scores=dict(zip(self.node_ids, vector.tolist())),
+                iterations=int(iterations[column]),
+                converged=not pending[column],
+            ))
+        return results
+
+    def _normalize_seeds(self, seeds: Seeds) -> Dict[uuid.UUID, float]:
+        """Restart distribution over the seeds present in the graph."""
+        if isinstance(seeds, Mapping):
+            weights = {node_id: float(weight) for node_id, weight in seeds.items()}
+        else:
+            weights = {node_id: 1.0 for node_id in seeds}
+        if any(weight < 0 for weight in weights.values()):
+            raise ValueError("Seed weights must be non-negative")
+        weights = {
+            node_id: weight for node_id, weight in weights.items()
+            if node_id in self.node_index and weight > 0
+        }
+        total = sum(weights.values())
+        return {node_id: weight / total for node_id, weight in weights.items()}
+
+    def _remember(self, key: SeedKey, vector: np.ndarray) -> None:
+        """Keep a solution for warm starts, evicting the least recently used."""
+        self._warm_starts[key] = vector.copy()
+        self._warm_starts.move_to_end(key)
+        while len(self._warm_starts) > self.max_warm_starts:
+            self._warm_starts.popitem(last=False)
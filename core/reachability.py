@@ -0,0 +1,208 @@
+"""
+Reachability index for SFM graphs.
+
+"Can policy X influence actor Y at all?" needs no path, only a yes or no,
+yet answering it with a shortest path search explores a large part of the
+graph per query. A ReachabilityIndex condenses the graph into its strongly
+connected components (a DAG) once and labels every component so that most
+queries are decided by comparing a few integers.
+
+Labels (GRAIL, Yildirim et al. 2010):
+- Topological rank: a component never reaches one earlier in topological order
+- k interval labels from randomized post-order traversals: if the target's
+  interval is not nested in the source's under any traversal, it is unreachable
+- DFS-tree pre/post numbers: nesting in the spanning tree proves reachability
+Queries the labels cannot decide fall back to a DFS over the condensation
+that prunes every component whose intervals rule the target out.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+DEFAULT_INTERVAL_LABELS = 3
+
+
+class ReachabilityIndex:
+    """Reachability labels over the SCC condensation of a directed graph.
+
+    Built once from an adjacency matrix; queries never change it. Rebuild
+    (or let the owning engine rebuild it lazily) when the graph changes.
+    """
+
+    def __init__(
+        self,
+        adjacency: sparse.spmatrix,
+        node_ids: Sequence[Hashable],
+        labels: int = DEFAULT_INTERVAL_LABELS,
+        seed: Optional[int] = 0,
+    ):
+        if labels < 1:
+            raise ValueError(f"labels must be positive, got {labels}")
+        self.node_index: Dict[Hashable, int] = {node_id: i for i, node_id in enumerate(node_ids)}
+        adjacency = sparse.csr_matrix(adjacency, dtype=bool)
+        self.component_count, self.component_of = csgraph.connected_components(
+            adjacency, directed=True, connection="strong"
+        )
+
+        # Condensation DAG without self-loops or duplicate edges
+        coo = adjacency.tocoo()
+        sources, targets = self.component_of[coo.row], self.component_of[coo.col]
+        keep = sources != targets
+        dag = sparse.csr_matrix(
+            (np.ones(int(keep.sum()), dtype=bool), (sources[keep], targets[keep])),
+            shape=(self.component_count, self.component_count),
+        )
+        dag.sum_duplicates()
+        self._children: List[List[int]] = [
+            dag.indices[dag.indptr[c]:dag.indptr[c + 1]].tolist()
+            for c in range(self.component_count)
+        ]
+
+        self._rank = self._topological_rank(dag)
+        rng = np.random.default_rng(seed)
+        self._intervals: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._tree: Tuple[np.ndarray, np.ndarray] = (np.zeros(0), np.zeros(0))
+        for traversal in range(labels):
+            low, post, pre = self._label(rng, shuffle=traversal > 0)
+            self._intervals.append((low, post))
+            if traversal == 0:
+                self._tree = (pre, post)
+
+    # ─── CONSTRUCTION ───
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[Hashable, Hashable]],
+        node_ids: Sequence[Hashable],
+        labels: int = DEFAULT_INTERVAL_LABELS,
+        seed: Optional[int] = 0,
+    ) -> "ReachabilityIndex":
+        """Build the index from (source ID, target ID) pairs over `node_ids`."""
+        position = {node_id: i for i, node_id in enumerate(node_ids)}
+        pairs = np.array(
+            [(position[source], position[target]) for source, target in edges], dtype=np.int64
+        ).reshape(-1, 2)
+        adjacency = sparse.csr_matrix(
+            (np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])),
+            shape=(len(node_ids), len(node_ids)),
+        )
+        return cls(adjacency, node_ids, labels=labels, seed=seed)
+
+    def _topological_rank(self, dag: sparse.csr_matrix) -> np.ndarray:
+        """Position of every component in a topological order (Kahn)."""
+        in_degree = np.bincount(dag.indices, minlength=self.component_count)
+        stack = np.flatnonzero(in_degree == 0).tolist()
+        rank = np.empty(self.component_count, dtype=np.int64)
+        position = 0
+        while stack:
+            component = stack.pop()
+            rank[component] = position
+            position += 1
+            for child in self._children[component]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    stack.append(child)
+        return rank
+
+    def _label(self, rng: np.random.Generator, shuffle: bool
+               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """One randomized DFS over the condensation.
+
+        Returns GRAIL's interval lower bound (smallest post-order number
+        reachable), the post-order number and the pre-order number of every
+        component.
+        """
+        count = self.component_count
+        low = np.empty(count, dtype=np.int64)
+        post = np.full(count, -1, dtype=np.int64)
+        pre = np.full(count, -1, dtype=np.int64)
+        roots = np.argsort(self._rank)
+        if shuffle:
+            roots = rng.permutation(count)
+        next_pre = next_post = 0
+
+        for root in roots.tolist():
+            if pre[root] >= 0:
+                continue
+            pre[root] = next_pre
+            next_pre += 1
+            stack = [(root, self._ordered_children(root, rng, shuffle), 0)]
+            while stack:
+                component, children, position = stack[-1]
+                if position < len(children):
+                    stack[-1] = (component, children, position + 1)
+                    child = children[position]
+                    if pre[child] < 0:
+                        pre[child] = next_pre
+                        next_pre += 1
+                        stack.append((child, self._ordered_children(child, rng, shuffle), 0))
+                    continue
+                stack.pop()
+                post[component] = next_post
+                smallest = next_post
+                for child in children:
+                    smallest = min(smallest, int(low[child]))
+                low[component] = smallest
+                next_post += 1
+        return low, post, pre
+
+    def _ordered_children(self, component: int, rng: np.random.Generator,
+                          shuffle: bool) -> List[int]:
+        """Children of a component, shuffled for randomized traversals."""
+        children = self._children[component]
+        if shuffle and len(children) > 1:
+            children = [children[i] for i in rng.permutation(len(children)).tolist()]
+        return children
+
+    # ─── QUERIES ───
+
+    def __contains__(self, node_id: Hashable) -> bool:
+        return node_id in self.node_index
+
+    def can_reach(self, source: Hashable, target: Hashable) -> bool:
+        """True if a directed path leads from source to target.
+
+        Every node reaches itself; nodes not in the index reach nothing.
+        """
+        source_index = self.node_index.get(source)
+        target_index = self.node_index.get(target)
+        if source_index is None or target_index is None:
+            return False
+        return self.component_reaches(int(self.component_of[source_index]),
+                                      int(self.component_of[target_index]))
+
+    def component_reaches(self, source: int, target: int) -> bool:
+        """Reachability between two components of the condensation."""
+        if source == target:
+            return True
+        if self._excluded(source, target):
+            return False
+        pre, post = self._tree
+        if pre[source] <= pre[target] and post[target] <= post[source]:
+            return True
+
+        # Labels undecided: DFS that skips components ruling the target out
+        visited = {source}
+        stack = [source]
+        while stack:
+            component = stack.pop()
+            for child in self._children[component]:
+                if child == target:
+                    return True
+                if child not in visited and not self._excluded(child, target):
+                    visited.add(child)
+                    stack.append(child)
+        return False
+
+    def _excluded(self, source: int, target: int) -> bool:
+        """True if the labels prove `source` cannot reach `target`."""
+        if self._rank[source] > self._rank[target]:
+            return True
+        for low, post in self._intervals:
+            if not low[source] <= low[target] or not post[target] <= post[source]:
+                return True
+        return False
@@ -0,0 +1,303 @@
+"""
+Copy-on-write scenario overlays for SFM graphs.
+
+Policy variants usually differ from their baseline in a handful of nodes and
+relationships, yet comparing them used to mean a deep copy of the baseline
+SFMGraph per variant plus a full NetworkX rebuild of each copy. A
+ScenarioOverlay records only the differences (added, modified and removed
+nodes and relationships) on top of a shared base graph and resolves reads
+against base + delta lazily.
+
+Features:
+- Writes never touch the base graph; modified entities are replaced in the
+  overlay (copy-on-write via dataclasses.replace)
+- Removing a node removes every relationship touching it, as SFMGraph does
+- Reads (nodes, relationships, adjacency, undirected neighbors) resolved on
+  demand using the base graph's adjacency indexes
+- Delta summaries and counts computed from the delta, not the whole graph
+- materialize() for callers that need a standalone SFMGraph
+"""
+
+from dataclasses import replace
+from typing import Any, Dict, Iterator, List, Optional, Set
+import uuid
+
+from core.sfm_enums import EnumValidator
+from core.sfm_models import Node, Relationship, SFMGraph
+
+
+class ScenarioOverlay:  # pylint: disable=too-many-public-methods
+    """A policy scenario expressed as a delta over a base SFMGraph.
+
+    The base graph is shared, not copied. Entities of the base graph that the
+    overlay does not touch are read straight from it, so later changes to the
+    base show through every overlay built on it.
+    """
+
+    def __init__(self, base: SFMGraph, name: str = "", description: str = ""):
+        self.base = base
+        self.name = name
+        self.description = description
+        # Upserted entities: new ones, and modified copies of base entities
+        self._nodes: Dict[uuid.UUID, Node] = {}
+        self._relationships: Dict[uuid.UUID, Relationship] = {}
+        self._removed_nodes: Set[uuid.UUID] = set()
+        self._removed_relationships: Set[uuid.UUID] = set()
+        # Endpoint indexes over the upserted relationships
+        self._out: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+        self._in: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+
+    # ─── WRITES ───
+
+    def add_node(self, node: Node) -> Node:
+        """Add a node, or replace the base node with the same ID."""
+        self._removed_nodes.discard(node.id)
+        self._nodes[node.id] = node
+        return node
+
+    def update_node(self, node_id: uuid.UUID, **changes: Any) -> Node:
+        """Replace a node by a copy with some fields changed."""
+        node = self.get_node_by_id(node_id)
+        if node is None:
+            raise KeyError(f"Node {node_id} not found in scenario")
+        return self.add_node(replace(node, **changes))
+
+    def remove_node(self, node_id: uuid.UUID) -> bool:
+        """Remove a node and every relationship touching it."""
+        if not self.has_node(node_id):
+            return False
+        incident = self.get_out_relationships(node_id) + self.get_in_relationships(node_id)
+        for relationship in incident:
+            self.remove_relationship(relationship.id)
+        self._nodes.pop(node_id, None)
+        self._removed_nodes.add(node_id)
+        return True
+
+    def add_relationship(self, relationship: Relationship) -> Relationship:
+        """Add a relationship, or replace the base relationship with the same ID."""
+        source = self.get_node_by_id(relationship.source_id)
+        target = self.get_node_by_id(relationship.target_id)
+        if source is not None and target is not None:
+            EnumValidator.validate_relationship_context(
+                relationship.kind, type(source).__name__, type(target).__name__
+            )
+
+        previous = self._relationships.get(relationship.id)
+        if previous is not None:
+            self._out[previous.source_id].discard(previous.id)
+            self._in[previous.target_id].discard(previous.id)
+        self._removed_relationships.discard(relationship.id)
+        self._relationships[relationship.id] = relationship
+        self._out.setdefault(relationship.source_id, set()).add(relationship.id)
+        self._in.setdefault(relationship.target_id, set()).add(relationship.id)
+        return relationship
+
+    def update_relationship(self, relationship_id: uuid.UUID, **changes: Any) -> Relationship:
+        """Replace a relationship by a copy with some fields changed."""
+        relationship = self.get_relationship(relationship_id)
+        if relationship is None:
+            raise KeyError(f"Relationship {relationship_id} not found in scenario")
+        return self.add_relationship(replace(relationship, **changes))
+
+    def remove_relationship(self, relationship_id: uuid.UUID) -> bool:
+        """Remove a relationship."""
+        if self.get_relationship(relationship_id) is None:
+            return False
+        previous = self._relationships.pop(relationship_id, None)
+        if previous is not None:
+            self._out[previous.source_id].discard(relationship_id)
+            self._in[previous.target_id].discard(relationship_id)
+        self._removed_relationships.add(relationship_id)
+        return True
+
+    # ─── READS ───
+
+    def get_node_by_id(self, node_id: uuid.UUID) -> Optional[Node]:
+        """Resolve a node through the overlay."""
+        if node_id in self._removed_nodes:
+            return None
+        node = self._nodes.get(node_id)
+        return node if node is not None else self.base.get_node_by_id(node_id)
+
+    def has_node(self, node_id: uuid.UUID) -> bool:
+        """True if the node exists in this scenario."""
+        return self.get_node_by_id(node_id) is not None
+
+    def __contains__(self, node_id: uuid.UUID) -> bool:
+        return self.has_node(node_id)
+
+    def __iter__(self) -> Iterator[Node]:
+        """Iterate over the scenario's nodes, base nodes first."""
+        for node in self.base:
+            if node.id in self._removed_nodes:
+                continue
+            yield self._nodes.get(node.id, node)
+        for node_id, node in self._nodes.items():
+            if self.base.get_node_by_id(node_id) is None:
+                yield node
+
+    def __len__(self) -> int:
+        """Number of nodes, computed from the delta."""
+        return len(self.base) - len(self.removed_node_ids()) + len(self.added_node_ids())
+
+    def get_relationship(self, relationship_id: uuid.UUID) -> Optional[Relationship]:
+        """Resolve a relationship through the overlay."""
+        if relationship_id in self._removed_relationships:
+            return None
+        relationship = self._relationships.get(relationship_id)
+        if relationship is not None:
+            return relationship
+        return self.base.relationships.get(relationship_id)
+
+    def iter_relationships(self) -> Iterator[Relationship]:
+        """Iterate over the scenario's relationships, base relationships first."""
+        for relationship_id in self.base.relationships:
+            relationship = self.get_relationship(relationship_id)
+            if relationship is not None:
+                yield relationship
+        for relationship_id, relationship in self._relationships.items():
+            if relationship_id not in self.base.relationships:
+                yield relationship
+
+    @property
+    def relationship_count(self) -> int:
+        """Number of relationships, computed from the delta."""
+        return (len(self.base.relationships) - len(self.removed_relationship_ids())
+                + len(self.added_relationship_ids()))
+
+    def get_out_relationships(self, node_id: uuid.UUID) -> List[Relationship]:
+        """Relationships whose source is the given node."""
+        return self._incident(node_id, self.base.get_out_relationships(node_id), self._out,
+                              "source_id")
+
+    def get_in_relationships(self, node_id: uuid.UUID) -> List[Relationship]:
+        """Relationships whose target is the given node."""
+        return self._incident(node_id, self.base.get_in_relationships(node_id), self._in,
+                              "target_id")
+
+    def _incident(
+        self,
+        node_id: uuid.UUID,
+        base_relationships: List[Relationship],
+        overlay_index: Dict[uuid.UUID, Set[uuid.UUID]],
+        endpoint: str,
+    ) -> List[Relationship]:
+        """Merge base and overlay relationships at one endpoint of a node."""
+        relationships = []
+        for base_relationship in base_relationships:
+            relationship = self.get_relationship(base_relationship.id)
+            # A modified relationship may have moved to other endpoints
+            if relationship is not None and getattr(relationship, endpoint) == node_id:
+                relationships.append(relationship)
+        seen = {relationship.id for relationship in relationships}
+        relationships.extend(
+            self._relationships[relationship_id]
+            for relationship_id in overlay_index.get(node_id, ())
+            if relationship_id not in seen
+        )
+        return relationships
+
+    def neighbors(self, node_id: uuid.UUID) -> Set[uuid.UUID]:
+        """Nodes connected to the given node in either direction, itself excluded."""
+        neighbors = {rel.target_id for rel in self.get_out_relationships(node_id)}
+        neighbors.update(rel.source_id for rel in self.get_in_relationships(node_id))
+        neighbors.discard(node_id)
+        return neighbors
+
+    # ─── DELTA ───
+
+    def added_node_ids(self) -> Set[uuid.UUID]:
+        """Nodes that do not exist in the base graph."""
+        return {node_id for node_id in self._nodes if self.base.get_node_by_id(node_id) is None}
+
+    def modified_node_ids(self) -> Set[uuid.UUID]:
+        """Base nodes replaced by the overlay."""
+        return set(self._nodes) - self.added_node_ids()
+
+    def removed_node_ids(self) -> Set[uuid.UUID]:
+        """Base nodes removed by the overlay."""
+        return {node_id for node_id in self._removed_nodes
+                if self.base.get_node_by_id(node_id) is not None}
+
+    def added_relationship_ids(self) -> Set[uuid.UUID]:
+        """Relationships that do not exist in the base graph."""
+        return {rel_id for rel_id in self._relationships if rel_id not in self.base.relationships}
+
+    def modified_relationship_ids(self) -> Set[uuid.UUID]:
+        """Base relationships replaced by the overlay."""
+        return {rel_id for rel_id in self._relationships if rel_id in self.base.relationships}
+
+    def removed_relationship_ids(self) -> Set[uuid.UUID]:
+        """Base relationships removed by the overlay, directly or with a node."""
+        return {rel_id for rel_id in self._removed_relationships
+                if rel_id in self.base.relationships}
+
+    def changed_relationships(self) -> List[Relationship]:
+        """Base and overlay versions of every added, modified or removed relationship."""
+        changed = []
+        for relationship_id in self.removed_relationship_ids() | self.modified_relationship_ids():
+            changed.append(self.base.relationships[relationship_id])
+        for relationship_id in self.added_relationship_ids() | self.modified_relationship_ids():
+            changed.append(self._relationships[relationship_id])
+        return changed
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the overlay changes nothing."""
+        return not (self._nodes or self._relationships
+                    or self._removed_nodes or self._removed_relationships)
+
+    def get_delta_summary(self) -> Dict[str, int]:
+        """Counts of added, modified and removed entities."""
+        return {
+            "nodes_added": len(self.added_node_ids()),
+            "nodes_modified": len(self.modified_node_ids()),
+            "nodes_removed": len(self.removed_node_ids()),
+            "relationships_added": len(self.added_relationship_ids()),
+            "relationships_modified": len(self.modified_relationship_ids()),
+            "relationships_removed": len(self.removed_relationship_ids()),
+        }
+
+    def materialize(self) -> SFMGraph:
+        """Build a standalone SFMGraph for this scenario (a full copy)."""
+        graph = SFMGraph(name=self.name or self.base.name,
+                         description=self.description or self.base.description)
+        for node in self:
+            graph.add_node(node)
+        for relationship in self.iter_relationships():
+            graph.add_relationship(relationship)
+        return graph
+
+
+def local_clustering(overlay: ScenarioOverlay, node_id: uuid.UUID) -> float:
+    """Clustering coefficient of one node in the undirected scenario graph.
+
+    Matches nx.clustering on the simple undirected view (parallel
+    relationships and self-loops ignored).
+    """
+    neighbors = overlay.neighbors(node_id)
+    degree = len(neighbors)
+    if degree < 2:
+        return 0.0
+    links = sum(len(overlay.neighbors(neighbor) & neighbors) for neighbor in neighbors)
+    return links / (degree * (degree - 1))
+
+
+def clustering_affected_nodes(overlay: ScenarioOverlay) -> Set[uuid.UUID]:
+    """Nodes whose clustering coefficient the overlay may have changed.
+
+    A changed relationship (u, v) can only change the clustering of u, v and
+    their common neighbors, so endpoints and their neighbors in the base and
+    in the scenario cover every affected node. Added nodes are included;
+    removed nodes are not.
+    """
+    endpoints: Set[uuid.UUID] = set(overlay.added_node_ids())
+    for relationship in overlay.changed_relationships():
+        endpoints.update((relationship.source_id, relationship.target_id))
+
+    affected = set(endpoints)
+    for node_id in endpoints:
+        affected.update(rel.target_id for rel in overlay.base.get_out_relationships(node_id))
+        affected.update(rel.source_id for rel in overlay.base.get_in_relationships(node_id))
+        affected.update(overlay.neighbors(node_id))
+    return affected - overlay.removed_node_ids()
@@ -5,9 +5,10 @@ Default implementation uses NetworkX for graph analysis.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, cast
+import math
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
@@ -16,11 +17,62 @@ import networkx as nx
 from core.sfm_models import (
     Actor,
     Institution,
+    Policy,
     Resource,
     Relationship,
     SFMGraph,
 )
 from core.sfm_enums import ResourceType, FlowNature, RelationshipKind
+from core.centrality import (
+    BetweennessEstimate,
+    CentralityStore,
+    SUPPORTED_CENTRALITY_TYPES,
+    DEFAULT_APPROXIMATION_THRESHOLD,
+    DEFAULT_BETWEENNESS_SAMPLE_SIZE,
+    DEFAULT_SAMPLING_SEED,
+    betweenness_error_bound,
+)
+from core.cycles import (
+    BoundedCycleSearch,
+    CycleList,
+    DEFAULT_MAX_CYCLE_LENGTH,
+    DEFAULT_MAX_CYCLES,
+    DEFAULT_CYCLE_TIME_LIMIT,
+)
+from core.path_counting import adjacency_matrix, flow_inefficiency_report
+from core.policy_batch import batch_policy_impact
+from core.propagation import ImpactPropagator, PropagationResult, Seeds
+from core.scenario_overlay import ScenarioOverlay, clustering_affected_nodes, local_clustering
+from core.failure_simulation import FailureModel, FailureSimulator
+from core.percolation import DEFAULT_RANDOM_TRIALS, RobustnessCurve, robustness_curve
+from core.communities import CommunityTracker
+from core.reachability import ReachabilityIndex
+from core.distance_oracle import DEFAULT_LANDMARKS, EfficiencyMatrix, LandmarkDistanceOracle
+from core.input_output import InputOutputModel
+from core.delivery_matrix import DeliveryMatrix
+from core.ceremonial_balance import BalanceScore, CeremonialBalance
+from core.uncertainty import DEFAULT_DRAWS, UncertaintyAnalyzer, UncertaintyBands
+from core.sensitivity import (
+    DEFAULT_MORRIS_TRAJECTORIES,
+    DEFAULT_PERTURBATION,
+    DEFAULT_SOBOL_SAMPLES,
+    SensitivityResult,
+    WeightSensitivityModel,
+    morris_screening,
+    one_at_a_time,
+    sobol_indices,
+)
+from core.system_dynamics import (
+    DEFAULT_TIME_STEP,
+    DynamicsProjection,
+    DynamicsStep,
+    SystemDynamicsSimulator,
+)
+from core.parallel_centrality import (
+    CompactGraph,
+    ParallelCentralityExecutor,
+    DEFAULT_PARALLEL_MIN_NODES,
+)
 
 # Public API
 __all__ = [
@@ -28,12 +80,21 @@ __all__ = [
     'QueryResult',
     'NodeMetrics',
     'FlowAnalysis',
+    'TraversalResult',
+    'PATH_COST_TYPES',
     'SFMQueryEngine',
     'NetworkXSFMQueryEngine',
     'SFMQueryFactory',
 ]
 
 
+# Edge costs accepted by weighted shortest path search
+PATH_COST_TYPES = ("weight", "certainty")
+
+PathHeuristic = Callable[[uuid.UUID, uuid.UUID], float]
+NodePair = Tuple[uuid.UUID, uuid.UUID]
+
+
 class AnalysisType(Enum):
     """Types of SFM analysis supported."""
 
@@ -79,17 +140,51 @@ class FlowAnalysis:
     efficiency_metrics: Dict[str, float]
 
 
+@dataclass
+class TraversalResult:
+    """Nodes reached by a bounded traversal from a seed node.
+
+    Distances and paths exclude the seed itself. Paths are the relationship
+    IDs followed from the seed and are only filled when requested.
+    """
+
+    source_id: uuid.UUID
+    max_depth: int
+    distances: Dict[uuid.UUID, int] = field(default_factory=lambda: {})
+    paths: Dict[uuid.UUID, List[uuid.UUID]] = field(default_factory=lambda: {})
+
+    @property
+    def node_ids(self) -> List[uuid.UUID]:
+        """Reached nodes in discovery order."""
+        return list(self.distances)
+
+
 class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
     """Abstract base class for SFM analytical queries."""
 
     def __init__(self, graph: SFMGraph):
         self.graph = graph
+        self._impact_propagator: Optional[ImpactPropagator] = None
+        self._input_output_model: Optional[InputOutputModel] = None
+        self._delivery_matrix: Optional[DeliveryMatrix] = None
+        self._uncertainty_analyzer: Optional[UncertaintyAnalyzer] = None
+        self._dynamics_simulator: Optional[SystemDynamicsSimulator] = None
+        self._ceremonial_balance: Optional[CeremonialBalance] = None
+
+    def sync(self) -> None:
+        """Bring any derived representation up to date with the graph.
+
+        Engines that query the SFMGraph directly have nothing to do here.
+        """
 
     # ─── NODE ANALYSIS ───
 
     @abstractmethod
     def get_node_centrality(
-        self, node_id: uuid.UUID, centrality_type: str = "betweenness"
+        self,
+        node_id: uuid.UUID,
+        centrality_type: str = "betweenness",
+        sample_size: Optional[int] = None,
     ) -> float:
         """Calculate centrality measures for a node."""
 
@@ -99,9 +194,37 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
         node_type: Optional[type] = None,
         centrality_type: str = "betweenness",
         limit: int = 10,
+        sample_size: Optional[int] = None,
     ) -> List[Tuple[uuid.UUID, float]]:
         """Get the most central nodes by type."""
 
+    def get_all_centralities(
+        self, types: Optional[List[str]] = None, sample_size: Optional[int] = None
+    ) -> Dict[str, Dict[uuid.UUID, float]]:
+        """Get whole-graph scores for several centrality measures in one call.
+
+        The default implementation falls back to exact per-node queries and
+        ignores sample_size; backends that compute whole-graph measures should
+        override it.
+        """
+        types = list(types) if types else list(SUPPORTED_CENTRALITY_TYPES)
+        return {
+            centrality_type: {
+                node.id: self.get_node_centrality(node.id, centrality_type)
+                for node in self.graph
+            }
+            for centrality_type in types
+        }
+
+    def get_betweenness_estimate(
+        self, sample_size: Optional[int] = None
+    ) -> BetweennessEstimate:
+        """Get betweenness scores along with the sample size and error estimate."""
+        scores = self.get_all_centralities(["betweenness"])["betweenness"]
+        return BetweennessEstimate(
+            scores=scores, sample_size=len(scores), node_count=len(scores), exact=True
+        )
+
     @abstractmethod
     def get_node_neighbors(
         self,
@@ -111,6 +234,16 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
     ) -> List[uuid.UUID]:
         """Get neighboring nodes within specified distance."""
 
+    @abstractmethod
+    def traverse(
+        self,
+        node_id: uuid.UUID,
+        max_depth: int = 1,
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+        include_paths: bool = False,
+    ) -> TraversalResult:
+        """Breadth-first traversal from a node, bounded by depth."""
+
     # ─── RELATIONSHIP ANALYSIS ───
 
     @abstractmethod
@@ -119,8 +252,47 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
         source_id: uuid.UUID,
         target_id: uuid.UUID,
         relationship_kinds: Optional[List[RelationshipKind]] = None,
+        cost: Optional[str] = None,
+        heuristic: Optional[PathHeuristic] = None,
     ) -> Optional[List[uuid.UUID]]:
-        """Find shortest path between two nodes."""
+        """Find shortest path between two nodes.
+
+        Without a cost the path with the fewest hops is returned. With a cost
+        ('weight' or 'certainty') the path minimizing that edge cost is used,
+        searched with A* when a heuristic is supplied.
+        """
+
+    @abstractmethod
+    def can_reach(
+        self,
+        source_id: uuid.UUID,
+        target_id: uuid.UUID,
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+    ) -> bool:
+        """True if any directed path leads from source to target.
+
+        Answered from a reachability index over the strongly connected
+        component condensation, built lazily once per graph version and
+        relationship kind set, instead of a path search per query.
+        """
+
+    def find_shortest_paths_bulk(
+        self,
+        pairs: List[NodePair],
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+        cost: Optional[str] = None,
+    ) -> Dict[NodePair, Optional[List[uuid.UUID]]]:
+        """Find shortest paths for many (source, target) pairs at once.
+
+        This default answers each pair separately; engines override it to run
+        one single-source search per distinct source.
+        """
+        return {
+            (source_id, target_id): self.find_shortest_path(
+                source_id, target_id, relationship_kinds, cost=cost
+            )
+            for source_id, target_id in pairs
+        }
 
     @abstractmethod
     def get_relationship_strength(
@@ -129,8 +301,18 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
         """Calculate aggregate relationship strength between nodes."""
 
     @abstractmethod
-    def find_cycles(self, max_length: int = 10) -> List[List[uuid.UUID]]:
-        """Find cycles in the graph (feedback loops)."""
+    def find_cycles(
+        self,
+        max_length: int = DEFAULT_MAX_CYCLE_LENGTH,
+        max_cycles: Optional[int] = DEFAULT_MAX_CYCLES,
+        time_limit: Optional[float] = DEFAULT_CYCLE_TIME_LIMIT,
+    ) -> CycleList:
+        """Find cycles in the graph (feedback loops).
+
+        Enumeration is bounded by cycle length, by the number of cycles
+        returned and by wall-clock time. The returned list's
+        `truncated` and `truncation_reason` tell whether a cap cut it short.
+        """
 
     # ─── FLOW ANALYSIS ───
 
@@ -143,7 +325,9 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
         """Trace flows of specific resource types through the network."""
 
     @abstractmethod
-    def identify_bottlenecks(self, flow_type: FlowNature) -> List[uuid.UUID]:
+    def identify_bottlenecks(
+        self, flow_type: FlowNature, sample_size: Optional[int] = None
+    ) -> List[uuid.UUID]:
         """Identify bottleneck nodes in flow networks."""
 
     @abstractmethod
@@ -152,6 +336,109 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
     ) -> float:
         """Calculate efficiency of flows between nodes."""
 
+    @abstractmethod
+    def distance_oracle(
+        self, landmarks: int = DEFAULT_LANDMARKS, strategy: str = "degree"
+    ) -> LandmarkDistanceOracle:
+        """Landmark distance oracle over the graph, built once per graph version.
+
+        Landmarks are the `landmarks` nodes with the highest degree or
+        betweenness (`strategy`).
+        """
+
+    def estimate_distance(
+        self, source_id: uuid.UUID, target_id: uuid.UUID, exact: bool = False
+    ) -> float:
+        """Directed hop distance between two nodes (`inf` if unreachable).
+
+        Estimated from landmark bounds in O(landmarks); with `exact`, pairs
+        the bounds leave open are settled by a breadth-first search.
+        """
+        return self.distance_oracle().distance(source_id, target_id, exact=exact)
+
+    def calculate_flow_efficiency_matrix(
+        self,
+        source_ids: Optional[List[uuid.UUID]] = None,
+        target_ids: Optional[List[uuid.UUID]] = None,
+        exact: bool = False,
+        landmarks: int = DEFAULT_LANDMARKS,
+        strategy: str = "degree",
+    ) -> EfficiencyMatrix:
+        """Flow efficiency between every source and target (all nodes by default).
+
+        The per-pair score of `calculate_flow_efficiency` (inverse hop
+        distance) for whole node sets, from landmark distance estimates
+        instead of a path search per pair. Estimates never understate the
+        distance; `exact` makes every entry exact.
+        """
+        oracle = self.distance_oracle(landmarks, strategy)
+        return oracle.efficiency_matrix(source_ids, target_ids, exact)
+
+    @property
+    def input_output_model(self) -> InputOutputModel:
+        """Leontief input-output model over the graph's processes, created on first use."""
+        if self._input_output_model is None:
+            self._input_output_model = InputOutputModel(self.graph)
+        return self._input_output_model
+
+    def analyze_demand_shocks(
+        self, shocks: List[Dict[uuid.UUID, float]]
+    ) -> List[Dict[uuid.UUID, float]]:
+        """Change in every process's gross output for each final-demand shock.
+
+        Each shock maps Process IDs to a change in final demand. All shocks
+        are answered by one solve of the Leontief system built from the
+        graph's Flow nodes.
+        """
+        return self.input_output_model.demand_shocks(shocks)
+
+    def get_sector_multipliers(self) -> Dict[uuid.UUID, Dict[str, float]]:
+        """Output multiplier and forward linkage of every process."""
+        return self.input_output_model.multipliers()
+
+    @property
+    def delivery_matrix(self) -> DeliveryMatrix:
+        """Social fabric matrix view of the graph's relationships, created on first use."""
+        if self._delivery_matrix is None:
+            self._delivery_matrix = DeliveryMatrix(self.graph)
+        return self._delivery_matrix
+
+    def get_component_deliveries(
+        self, node_id: uuid.UUID, kind: Optional[RelationshipKind] = None
+    ) -> Dict[str, Dict[uuid.UUID, float]]:
+        """What a component delivers and receives, by counterpart.
+
+        Reads the component's row and column of the delivery matrix for one
+        relationship kind (all kinds by default).
+        """
+        return {
+            "delivers_to": self.delivery_matrix.row(node_id, kind),
+            "receives_from": self.delivery_matrix.column(node_id, kind),
+        }
+
+    @property
+    def ceremonial_balance(self) -> CeremonialBalance:
+        """Ceremonial/instrumental masses kept in sync with the graph, created on first use."""
+        if self._ceremonial_balance is None:
+            self._ceremonial_balance = CeremonialBalance(self.graph)
+        return self._ceremonial_balance
+
+    def get_ceremonial_balance(self) -> BalanceScore:
+        """Graph-wide balance of ceremonial versus instrumental relationships and behaviors."""
+        return self.ceremonial_balance.graph_balance()
+
+    def get_grouped_ceremonial_balance(self, group_by: str = "node") -> Dict[Any, BalanceScore]:
+        """Ceremonial/instrumental balance per "node", "community" or institution "layer"."""
+        if group_by == "node":
+            return self.ceremonial_balance.node_balances()
+        if group_by == "community":
+            labels = {node_id: label for label, members in self.identify_communities().items()
+                      for node_id in members}
+            return self.ceremonial_balance.group_balance(labels)
+        if group_by == "layer":
+            return self.ceremonial_balance.layer_balance()
+        raise ValueError(f"Unknown ceremonial balance grouping: {group_by}")
+
     # ─── POLICY ANALYSIS ───
 
     @abstractmethod
@@ -160,6 +447,150 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
     ) -> Dict[str, Any]:
         """Analyze the network impact of a policy intervention."""
 
+    @abstractmethod
+    def analyze_policy_impacts(
+        self,
+        policy_ids: Optional[List[uuid.UUID]] = None,
+        impact_radius: int = 3,
+        min_shared: int = 1,
+    ) -> Dict[str, Any]:
+        """Analyze the impact of many policies (all Policy nodes by default) at once."""
+
+    @property
+    def impact_propagator(self) -> ImpactPropagator:
+        """Random walk with restart over this engine's graph, created on first use."""
+        if self._impact_propagator is None:
+            self._impact_propagator = ImpactPropagator(self.graph)
+        return self._impact_propagator
+
+    def propagate_impact(
+        self, seeds: Seeds, alpha: Optional[float] = None
+    ) -> PropagationResult:
+        """Rank nodes by weighted influence from the seed nodes.
+
+        Scores come from random walk with restart (personalized PageRank) over
+        relationship weight x certainty, warm-started from the last solution
+        for the same seeds.
+        """
+        return self.impact_propagator.propagate(seeds, alpha=alpha)
+
+    def propagate_impact_batch(
+        self, seed_sets: List[Seeds], alpha: Optional[float] = None
+    ) -> List[PropagationResult]:
+        """Rank weighted influence for many seed sets in one solve."""
+        return self.impact_propagator.propagate_batch(seed_sets, alpha=alpha)
+
+    @property
+    def uncertainty_analyzer(self) -> UncertaintyAnalyzer:
+        """Monte Carlo sampler over relationship and flow uncertainty, created on first use."""
+        if self._uncertainty_analyzer is None:
+            self._uncertainty_analyzer = UncertaintyAnalyzer(self.graph)
+        return self._uncertainty_analyzer
+
+    def propagate_impact_uncertainty(
+        self,
+        seeds: Seeds,
+        draws: int = DEFAULT_DRAWS,
+        seed: Optional[int] = None,
+        node_ids: Optional[List[uuid.UUID]] = None,
+        max_workers: Optional[int] = 1,
+    ) -> UncertaintyBands:
+        """Percentile bands of weighted influence from the seed nodes.
+
+        Relationship presence is sampled from certainty and weights from
+        variability; every draw is ranked by random walk with restart, all
+        draws of a chunk in one batched iteration. Chunks fan out over
+        `max_workers` processes (None for one per CPU) for large draw counts.
+        """
+        return self.uncertainty_analyzer.propagate_impact(
+            seeds, draws=draws, seed=seed, node_ids=node_ids, max_workers=max_workers
+        )
+
+    def analyze_output_uncertainty(
+        self,
+        final_demand: Optional[Dict[uuid.UUID, float]] = None,
+        draws: int = DEFAULT_DRAWS,
+        seed: Optional[int] = None,
+        flow_variability: float = 0.0,
+        max_workers: Optional[int] = 1,
+    ) -> UncertaintyBands:
+        """Percentile bands of every process's gross output under flow uncertainty.
+
+        Flow presence is sampled from certainty and quantities from
+        `flow_variability` (relative standard deviation); each draw is one
+        Leontief solve for `final_demand` (observed final demand by default).
+        """
+        return self.uncertainty_analyzer.output_response(
+            final_demand, draws=draws, seed=seed, flow_variability=flow_variability,
+            max_workers=max_workers,
+        )
+
+    def analyze_weight_sensitivity(
+        self,
+        seeds: Seeds,
+        target_ids: Optional[List[uuid.UUID]] = None,
+        relationship_ids: Optional[List[uuid.UUID]] = None,
+        method: str = "oat",
+        perturbation: float = DEFAULT_PERTURBATION,
+        samples: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> SensitivityResult:
+        """Rank relationships by how strongly their weights steer influence to the targets.
+
+        The indicator is the total weighted influence of the seeds on
+        `target_ids` (every non-seed node by default). "oat" scales each
+        weight on its own, "morris" and "sobol" sample joint perturbations
+        (`samples` is the trajectory or base-sample count); all designs are
+        evaluated against one factorization of the propagation system.
+        """
+        model = WeightSensitivityModel(
+            self.impact_propagator, seeds, target_ids=target_ids,
+            relationship_ids=relationship_ids,
+        )
+        if method == "oat":
+            return one_at_a_time(model, perturbation)
+        if method == "morris":
+            return morris_screening(model, perturbation,
+                                    trajectories=samples or DEFAULT_MORRIS_TRAJECTORIES, seed=seed)
+        if method == "sobol":
+            return sobol_indices(model, perturbation,
+                                 samples=samples or DEFAULT_SOBOL_SAMPLES, seed=seed)
+        raise ValueError(f"Unknown sensitivity method: {method}")
+
+    @property
+    def dynamics_simulator(self) -> SystemDynamicsSimulator:
+        """Vectorized simulator of the graph's temporal dynamics, created on first use."""
+        if self._dynamics_simulator is None:
+            self._dynamics_simulator = SystemDynamicsSimulator(self.graph)
+        return self._dynamics_simulator
+
+    def stream_temporal_dynamics(
+        self,
+        steps: int,
+        dt: float = DEFAULT_TIME_STEP,
+        start: Optional[float] = None,
+        seed: Optional[int] = None,
+    ) -> Iterator[DynamicsStep]:
+        """Advance every Flow, Indicator, ChangeProcess and Relationship with dynamics.
+
+        Yields the values of all dynamic entities one step at a time, so
+        long projections never hold more than one step in memory.
+        """
+        return self.dynamics_simulator.stream(steps, dt=dt, start=start, seed=seed)
+
+    def project_temporal_dynamics(
+        self,
+        steps: int,
+        dt: float = DEFAULT_TIME_STEP,
+        start: Optional[float] = None,
+        entity_ids: Optional[List[uuid.UUID]] = None,
+        seed: Optional[int] = None,
+    ) -> DynamicsProjection:
+        """Trajectories of the given entities with temporal dynamics (all by default)."""
+        return self.dynamics_simulator.project(
+            steps, dt=dt, start=start, entity_ids=entity_ids, seed=seed
+        )
+
     @abstractmethod
     def identify_policy_targets(self, policy_id: uuid.UUID) -> List[uuid.UUID]:
         """Identify nodes directly and indirectly affected by a policy."""
@@ -170,6 +601,12 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
     ) -> Dict[str, Any]:
         """Compare multiple policy scenarios."""
 
+    @abstractmethod
+    def compare_scenario_overlays(
+        self, overlays: List[ScenarioOverlay], include_centrality: bool = False
+    ) -> Dict[str, Any]:
+        """Compare policy scenarios expressed as overlays on this engine's graph."""
+
     # ─── STRUCTURAL ANALYSIS ───
 
     @abstractmethod
@@ -183,7 +620,15 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
         """Identify communities/clusters in the network."""
 
     @abstractmethod
-    def get_structural_holes(self) -> List[uuid.UUID]:
+    def get_community_assignment(self, node_id: uuid.UUID) -> Optional[str]:
+        """Community label of a node from the engine's community tracker.
+
+        The label is not read from NetworkMetrics.community_assignment; it is
+        stable across graph versions, so callers may store it there.
+        """
+
+    @abstractmethod
+    def get_structural_holes(self, sample_size: Optional[int] = None) -> List[uuid.UUID]:
         """Identify nodes that bridge structural holes."""
 
     # ─── COMPOSITE QUERIES ───
@@ -212,12 +657,18 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
     ) -> Dict[str, Any]:
         """Detect structural changes between two graph states."""
 
+    @abstractmethod
+    def detect_overlay_changes(
+        self, overlay: ScenarioOverlay, include_centrality: bool = False
+    ) -> Dict[str, Any]:
+        """Detect structural changes a scenario overlay makes to this engine's graph."""
+
     # ═══════════════════════════════════════════════════════════════════════════
     # RISK ASSESSMENT AND VULNERABILITY ANALYSIS
     # ═══════════════════════════════════════════════════════════════════════════
 
     @abstractmethod
-    def assess_network_vulnerabilities(self) -> Dict[str, Any]:
+    def assess_network_vulnerabilities(self, sample_size: Optional[int] = None) -> Dict[str, Any]:
         """Comprehensive vulnerability assessment of the network."""
 
     @abstractmethod
@@ -226,6 +677,24 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
     ) -> Dict[str, Any]:
         """Simulate the impact of node failures on network connectivity."""
 
+    @abstractmethod
+    def simulate_node_failures(
+        self,
+        failure_sets: List[List[uuid.UUID]],
+        failure_mode: str = "cascade",
+        max_workers: Optional[int] = 1,
+    ) -> List[Dict[str, Any]]:
+        """Simulate many independent failure scenarios against the same graph."""
+
+    @abstractmethod
+    def get_robustness_curve(
+        self,
+        strategy: str = "degree",
+        trials: int = DEFAULT_RANDOM_TRIALS,
+        seed: Optional[int] = None,
+    ) -> RobustnessCurve:
+        """Largest-component fraction as nodes are removed by a targeted or random attack."""
+
     # ═══════════════════════════════════════════════════════════════════════════
     # ADVANCED FLOW ANALYSIS
     # ═══════════════════════════════════════════════════════════════════════════
@@ -237,16 +706,57 @@ class SFMQueryEngine(ABC):  # pylint: disable=too-many-public-methods
         """Analyze patterns in resource or value flows."""
 
     @abstractmethod
-    def identify_flow_inefficiencies(self) -> Dict[str, Any]:
+    def identify_flow_inefficiencies(self, top_k: int = 10) -> Dict[str, Any]:
         """Identify inefficiencies in flow patterns."""
 
 
 class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public-methods
     """NetworkX-based implementation of SFM query engine."""
 
-    def __init__(self, graph: SFMGraph):
+    def __init__(
+        self,
+        graph: SFMGraph,
+        approximation_threshold: int = DEFAULT_APPROXIMATION_THRESHOLD,
+        betweenness_sample_size: int = DEFAULT_BETWEENNESS_SAMPLE_SIZE,
+        sampling_seed: Optional[int] = DEFAULT_SAMPLING_SEED,
+        centrality_workers: Optional[int] = 1,
+        parallel_min_nodes: int = DEFAULT_PARALLEL_MIN_NODES,
+    ):
         super().__init__(graph)
+        # Betweenness switches to k-pivot sampling above this many nodes
+        self.approximation_threshold = approximation_threshold
+        self.betweenness_sample_size = betweenness_sample_size
+        self.sampling_seed = sampling_seed
+        # Exact betweenness/closeness fan out over a process pool when the graph
+        # has at least parallel_min_nodes nodes (None workers = one per CPU)
+        self.centrality_executor = ParallelCentralityExecutor(centrality_workers)
+        self.parallel_min_nodes = parallel_min_nodes
+        self._synced_version = graph.graph_version
         self.nx_graph = self._build_networkx_graph()
+        # Whole-graph centrality results, shared by every analysis on this graph version
+        self._centrality_store = CentralityStore()
+        # Kind-filtered views of the mirror, materialized once per graph version
+        self._kind_views: Dict[FrozenSet[Any], nx.MultiDiGraph] = {}
+        self._kind_views_version = self._synced_version
+        # Smallest edge weight of the mirror, rescanned once per graph version
+        self._min_edge_weight = 0.0
+        self._min_edge_weight_version = -1
+        # Array model for failure analysis, rebuilt once per graph version
+        self._failure_model_cache: Optional[FailureModel] = None
+        self._failure_model_version = -1
+        # Per-node clustering of the mirror and its sum, recomputed once per graph version
+        self._clustering_cache: Tuple[Dict[uuid.UUID, float], float] = ({}, 0.0)
+        self._clustering_version = -1
+        # Reachability indexes per relationship-kind set, rebuilt once per graph version
+        self._reachability_indexes: Dict[Optional[FrozenSet[Any]], ReachabilityIndex] = {}
+        self._reachability_version = self._synced_version
+        # Landmark distance oracles per (landmarks, strategy), rebuilt once per graph version
+        self._distance_oracles: Dict[Tuple[int, str], LandmarkDistanceOracle] = {}
+        self._distance_oracles_version = self._synced_version
+        # Louvain partition, updated from the nodes each mutation touches
+        self._community_tracker = CommunityTracker()
+        # Keep the mirror current by applying graph mutations as deltas
+        graph.add_mutation_listener(self._on_graph_mutation)
 
     def _build_networkx_graph(self) -> nx.MultiDiGraph:
         """Convert SFMGraph to NetworkX graph for analysis."""
@@ -255,63 +765,204 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
 
         # Add all nodes
         for node in self.graph:
-            nx_graph.add_node(node.id, data=node, type=type(node).__name__)
+            self._add_nx_node(nx_graph, node)
 
         # Add all relationships as edges
         for rel in self.graph.relationships.values():
-            nx_graph.add_edge(
-                rel.source_id,
-                rel.target_id,
-                key=rel.id,
-                data=rel,
-                kind=rel.kind,
-                weight=rel.weight or 1.0,
-            )
+            self._add_nx_edge(nx_graph, rel)
 
         return nx_graph
 
-    def get_node_centrality(
-        self, node_id: uuid.UUID, centrality_type: str = "betweenness"
-    ) -> float:
-        """Calculate centrality measures for a node."""
+    @staticmethod
+    def _add_nx_node(nx_graph: nx.MultiDiGraph, node) -> None:
+        """Add (or refresh) a node in the NetworkX mirror."""
+        nx_graph.add_node(node.id, data=node, type=type(node).__name__)
+
+    @staticmethod
+    def _add_nx_edge(nx_graph: nx.MultiDiGraph, rel: Relationship) -> None:
+        """Add (or refresh) a relationship edge in the NetworkX mirror."""
+        nx_graph.add_edge(
+            rel.source_id,
+            rel.target_id,
+            key=rel.id,
+            data=rel,
+            kind=rel.kind,
+            weight=rel.weight or 1.0,
+        )
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the graph changed in ways the mirror has not seen."""
+        return self._synced_version != self.graph.graph_version
+
+    def sync(self) -> None:
+        """Rebuild the NetworkX mirror if incremental updates were missed."""
+        if self.is_stale:
+            self._synced_version = self.graph.graph_version
+            self.nx_graph = self._build_networkx_graph()
+
+    def _on_graph_mutation(self, event: str, version: int, **context) -> None:
+        """Apply a single graph mutation to the NetworkX mirror."""
+        if version != self._synced_version + 1:
+            # A change was missed (e.g. a direct write); leave the mirror stale
+            # so the next sync() falls back to a full rebuild.
+            return
+
+        touched: List[uuid.UUID] = []
+        if event == "node_added":
+            self._add_nx_node(self.nx_graph, context["node"])
+            touched = [context["node"].id]
+        elif event == "node_removed":
+            if context["node_id"] in self.nx_graph:
+                self.nx_graph.remove_node(context["node_id"])
+            touched = [context["node_id"]]
+        elif event == "relationship_added":
+            rel = context["relationship"]
+            self._add_nx_edge(self.nx_graph, rel)
+            touched = [rel.source_id, rel.target_id]
+        elif event == "relationship_removed":
+            rel = context["relationship"]
+            if self.nx_graph.has_edge(rel.source_id, rel.target_id, key=rel.id):
+                self.nx_graph.remove_edge(rel.source_id, rel.target_id, key=rel.id)
+            touched = [rel.source_id, rel.target_id]
+        elif event == "graph_cleared":
+            self.nx_graph.clear()
+            self._community_tracker.invalidate()
+        else:
+            return
+
+        self._synced_version = version
+        self._community_tracker.record_change(version, touched)
+
+    def _compute_centrality(self, centrality_type: str) -> Dict[uuid.UUID, float]:
+        """Compute a whole-graph centrality measure on the NetworkX mirror."""
         if centrality_type == "betweenness":
-            centrality = nx.betweenness_centrality(self.nx_graph)
-        elif centrality_type == "closeness":
-            centrality = nx.closeness_centrality(self.nx_graph)
-        elif centrality_type == "degree":
-            centrality = nx.degree_centrality(self.nx_graph)
-        elif centrality_type == "eigenvector":
+            return self.get_betweenness_estimate().scores
+        if centrality_type == "closeness":
+            if self._use_parallel_centrality():
+                return self._compute_parallel_centrality("closeness")
+            return nx.closeness_centrality(self.nx_graph)
+        if centrality_type == "degree":
+            return nx.degree_centrality(self.nx_graph)
+        if centrality_type == "eigenvector":
             try:
-                centrality = nx.eigenvector_centrality(self.nx_graph, max_iter=1000)
+                return nx.eigenvector_centrality(self.nx_graph, max_iter=1000)
             except nx.NetworkXError:
                 # Fallback for convergence issues
-                centrality = nx.degree_centrality(self.nx_graph)
-        else:
+                return nx.degree_centrality(self.nx_graph)
+        raise ValueError(f"Unsupported centrality type: {centrality_type}")
+
+    def _use_parallel_centrality(self) -> bool:
+        """Whether exact centrality should be fanned out over worker processes."""
+        return (
+            self.centrality_executor.max_workers > 1
+            and self.nx_graph.number_of_nodes() >= self.parallel_min_nodes
+        )
+
+    def _compute_parallel_centrality(self, centrality_type: str) -> Dict[uuid.UUID, float]:
+        """Compute exact betweenness or closeness across the process pool."""
+        compact_graph = CompactGraph.from_networkx(self.nx_graph)
+        return self.centrality_executor.compute(compact_graph, [centrality_type])[centrality_type]
+
+    def _get_centrality(
+        self, centrality_type: str, sample_size: Optional[int] = None
+    ) -> Dict[uuid.UUID, float]:
+        """Get a whole-graph centrality measure, computed at most once per graph version."""
+        if centrality_type not in SUPPORTED_CENTRALITY_TYPES:
             raise ValueError(f"Unsupported centrality type: {centrality_type}")
+        if centrality_type == "betweenness":
+            return self.get_betweenness_estimate(sample_size).scores
+        return self._centrality_store.get_or_compute(
+            self._synced_version,
+            centrality_type,
+            lambda: self._compute_centrality(centrality_type),
+        )
+
+    def _resolve_betweenness_sample_size(self, sample_size: Optional[int]) -> Optional[int]:
+        """Decide how many pivots to sample, or None for exact betweenness.
+
+        An explicit sample_size always wins; otherwise sampling kicks in
+        automatically once the graph exceeds the approximation threshold.
+        """
+        node_count = self.nx_graph.number_of_nodes()
+        if sample_size is None:
+            if node_count <= self.approximation_threshold:
+                return None
+            sample_size = self.betweenness_sample_size
+        if sample_size < 1:
+            raise ValueError(f"sample_size must be positive, got {sample_size}")
+        return sample_size if sample_size < node_count else None
+
+    def get_betweenness_estimate(
+        self, sample_size: Optional[int] = None
+    ) -> BetweennessEstimate:
+        """Get betweenness scores along with the sample size and error estimate.
+
+        Args:
+            sample_size: Number of pivot sources to sample. None uses exact
+                betweenness unless the graph exceeds the approximation threshold.
+
+        Returns:
+            BetweennessEstimate with scores and sampling metadata
+        """
+        node_count = self.nx_graph.number_of_nodes()
+        pivots = self._resolve_betweenness_sample_size(sample_size)
+
+        def compute() -> BetweennessEstimate:
+            if pivots is None:
+                if self._use_parallel_centrality():
+                    scores = self._compute_parallel_centrality("betweenness")
+                else:
+                    scores = nx.betweenness_centrality(self.nx_graph)
+                return BetweennessEstimate(
+                    scores=scores,
+                    sample_size=node_count,
+                    node_count=node_count,
+                    exact=True,
+                )
+            return BetweennessEstimate(
+                scores=nx.betweenness_centrality(
+                    self.nx_graph, k=pivots, seed=self.sampling_seed
+                ),
+                sample_size=pivots,
+                node_count=node_count,
+                exact=False,
+                estimated_error=betweenness_error_bound(node_count, pivots),
+            )
+
+        return self._centrality_store.get_or_compute(
+            self._synced_version, "betweenness", compute, {"k": pivots}
+        )
 
-        return centrality.get(node_id, 0.0)
+    def get_all_centralities(
+        self, types: Optional[List[str]] = None, sample_size: Optional[int] = None
+    ) -> Dict[str, Dict[uuid.UUID, float]]:
+        """Get whole-graph scores for several centrality measures in one call."""
+        types = list(types) if types else list(SUPPORTED_CENTRALITY_TYPES)
+        return {
+            centrality_type: self._get_centrality(centrality_type, sample_size)
+            for centrality_type in types
+        }
+
+    def get_node_centrality(
+        self,
+        node_id: uuid.UUID,
+        centrality_type: str = "betweenness",
+        sample_size: Optional[int] = None,
+    ) -> float:
+        """Calculate centrality measures for a node."""
+        return self._get_centrality(centrality_type, sample_size).get(node_id, 0.0)
 
     def get_most_central_nodes(
         self,
         node_type: Optional[type] = None,
         centrality_type: str = "betweenness",
         limit: int = 10,
+        sample_size: Optional[int] = None,
     ) -> List[Tuple[uuid.UUID, float]]:
         """Get the most central nodes by type."""
         # Calculate centrality for all nodes
-        if centrality_type == "betweenness":
-            centrality = nx.betweenness_centrality(self.nx_graph)
-        elif centrality_type == "closeness":
-            centrality = nx.closeness_centrality(self.nx_graph)
-        elif centrality_type == "degree":
-            centrality = nx.degree_centrality(self.nx_graph)
-        elif centrality_type == "eigenvector":
-            try:
-                centrality = nx.eigenvector_centrality(self.nx_graph, max_iter=1000)
-            except nx.NetworkXError:
-                centrality = nx.degree_centrality(self.nx_graph)
-        else:
-            raise ValueError(f"Unsupported centrality type: {centrality_type}")
+        centrality = self._get_centrality(centrality_type, sample_size)
 
         # Filter by node type if specified
         if node_type:
@@ -347,35 +998,6 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
             return list(set(neighbors))
         return list(self.nx_graph.neighbors(node_id))
 
-    def _get_multihop_neighbors_with_filter(
-        self, node_id: uuid.UUID, relationship_kinds: List[RelationshipKind], distance: int
-    ) -> List[uuid.UUID]:
-        """Get multi-hop neighbors with relationship kind filtering."""
-        # Check if node exists in graph
-        if node_id not in self.nx_graph.nodes():
-            return []
-
-        # Create subgraph with only desired relationship types
-        edges_to_keep = []
-        for u, v, key, data in self.nx_graph.edges(keys=True, data=True):
-            if data.get("kind") in relationship_kinds:
-                edges_to_keep.append((u, v, key))
-
-        subgraph = self.nx_graph.edge_subgraph(edges_to_keep)
-        try:
-            neighbors = set()
-            for target in subgraph.nodes():
-                if target != node_id:
-                    try:
-                        path_length = nx.shortest_path_length(subgraph, node_id, target)
-                        if path_length <= distance:
-                            neighbors.add(target)
-                    except (nx.NetworkXNoPath, nx.NodeNotFound):
-                        continue
-            return list(neighbors)
-        except (nx.NetworkXError, nx.NodeNotFound):
-            return []
-
     def _get_multihop_neighbors_all(self, node_id: uuid.UUID, distance: int) -> List[uuid.UUID]:
         """Get multi-hop neighbors for all relationship types."""
         try:
@@ -400,37 +1022,265 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
 
         # Multi-hop neighbors
         if relationship_kinds:
-            return self._get_multihop_neighbors_with_filter(node_id, relationship_kinds, distance)
+            return self.traverse(node_id, distance, relationship_kinds).node_ids
         return self._get_multihop_neighbors_all(node_id, distance)
 
+    def traverse(
+        self,
+        node_id: uuid.UUID,
+        max_depth: int = 1,
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+        include_paths: bool = False,
+    ) -> TraversalResult:
+        """Breadth-first traversal from a node, bounded by depth.
+
+        Only edges leaving the visited frontier are inspected and the kind
+        filter is checked inline, so the cost is proportional to the size of
+        the neighborhood rather than the whole graph.
+
+        Args:
+            node_id: Seed node
+            max_depth: Maximum number of hops to follow
+            relationship_kinds: Only follow relationships of these kinds
+            include_paths: Also record the relationship IDs leading to each node
+
+        Returns:
+            TraversalResult with the hop distance (and optionally path) per node
+        """
+        result = TraversalResult(source_id=node_id, max_depth=max_depth)
+        if node_id not in self.nx_graph:
+            return result
+
+        allowed_kinds = set(relationship_kinds) if relationship_kinds else None
+        successors = self.nx_graph.adj
+        visited = {node_id}
+        frontier = [node_id]
+        for depth in range(1, max_depth + 1):
+            next_frontier = []
+            for current in frontier:
+                for neighbor, edges in successors[current].items():
+                    if neighbor in visited:
+                        continue
+                    for key, data in edges.items():
+                        if allowed_kinds is None or data.get("kind") in allowed_kinds:
+                            visited.add(neighbor)
+                            next_frontier.append(neighbor)
+                            result.distances[neighbor] = depth
+                            if include_paths:
+                                result.paths[neighbor] = result.paths.get(current, []) + [key]
+                            break
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return result
+
+    def get_filtered_view(self, relationship_kinds: List[RelationshipKind]) -> nx.MultiDiGraph:
+        """Read-only view of the mirror restricted to the given relationship kinds.
+
+        The edge set of each view is collected once per graph version and kind
+        set, so repeated filtered queries do not rescan every edge.
+        """
+        if self._kind_views_version != self._synced_version:
+            self._kind_views.clear()
+            self._kind_views_version = self._synced_version
+
+        key = frozenset(relationship_kinds)
+        view = self._kind_views.get(key)
+        if view is None:
+            edges_to_keep = [
+                (u, v, edge_key)
+                for u, v, edge_key, kind in self.nx_graph.edges(keys=True, data="kind")
+                if kind in key
+            ]
+            view = self.nx_graph.edge_subgraph(edges_to_keep)
+            self._kind_views[key] = view
+        return view
+
+    @staticmethod
+    def _edge_cost_function(cost: str) -> Callable[..., Optional[float]]:
+        """Build a NetworkX weight function over parallel edges for a path cost."""
+        if cost == "weight":
+            def weight_cost(_u, _v, edges):
+                return min(attrs.get("weight", 1.0) for attrs in edges.values())
+            return weight_cost
+
+        if cost == "certainty":
+            # Certainties multiply along a path, so the most certain path
+            # minimizes the sum of -log(certainty); zero-certainty edges are skipped
+            def certainty_cost(_u, _v, edges):
+                certainties = [
+                    getattr(attrs.get("data"), "certainty", None) for attrs in edges.values()
+                ]
+                certainty = max(1.0 if value is None else value for value in certainties)
+                if certainty <= 0:
+                    return None
+                return -math.log(min(certainty, 1.0))
+            return certainty_cost
+
+        raise ValueError(f"Unsupported path cost: {cost}")
+
+    def _check_path_costs(self, graph: nx.MultiDiGraph, cost: str) -> None:
+        """Reject negative weight costs, which Dijkstra and A* cannot search."""
+        if cost != "weight":
+            return
+        if self._min_edge_weight_version != self._synced_version:
+            self._min_edge_weight = min(
+                (weight for _, _, weight in self.nx_graph.edges(data="weight", default=1.0)),
+                default=0.0,
+            )
+            self._min_edge_weight_version = self._synced_version
+        if self._min_edge_weight >= 0:
+            return
+        for source_id, target_id, weight in graph.edges(data="weight", default=1.0):
+            if weight < 0:
+                raise ValueError(
+                    f"Relationship {source_id} -> {target_id} has negative weight {weight}; "
+                    "weighted path search requires non-negative weights"
+                )
+
+    def reachability_index(
+        self, relationship_kinds: Optional[List[RelationshipKind]] = None
+    ) -> ReachabilityIndex:
+        """Reachability index of the mirror, built once per graph version and kind set."""
+        self.sync()
+        kinds = frozenset(relationship_kinds) if relationship_kinds else None
+
+        if self._reachability_version != self._synced_version:
+            self._reachability_indexes.clear()
+            self._reachability_version = self._synced_version
+
+        index = self._reachability_indexes.get(kinds)
+        if index is None:
+            edges = (
+                (u, v) for u, v, kind in self.nx_graph.edges(data="kind")
+                if kinds is None or kind in kinds
+            )
+            index = ReachabilityIndex.from_edges(edges, list(self.nx_graph.nodes()))
+            self._reachability_indexes[kinds] = index
+        return index
+
+    def can_reach(
+        self,
+        source_id: uuid.UUID,
+        target_id: uuid.UUID,
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+    ) -> bool:
+        """True if any directed path leads from source to target."""
+        return self.reachability_index(relationship_kinds).can_reach(source_id, target_id)
+
     def find_shortest_path(
         self,
         source_id: uuid.UUID,
         target_id: uuid.UUID,
         relationship_kinds: Optional[List[RelationshipKind]] = None,
+        cost: Optional[str] = None,
+        heuristic: Optional[PathHeuristic] = None,
     ) -> Optional[List[uuid.UUID]]:
-        """Find shortest path between two nodes."""
+        """Find shortest path between two nodes.
+
+        Unweighted searches run bidirectional BFS; weighted searches run
+        bidirectional Dijkstra, or A* when a heuristic is supplied.
+
+        Raises:
+            ValueError: If a weight-cost search meets a negative relationship weight
+        """
+        weight = self._edge_cost_function(cost or "weight") if cost or heuristic else None
         try:
             # Check if both nodes exist in graph
             if source_id not in self.nx_graph.nodes() or target_id not in self.nx_graph.nodes():
                 return None
 
-            if relationship_kinds:
-                # Create subgraph with only desired relationship types
-                edges_to_keep = []
-                for u, v, key, data in self.nx_graph.edges(keys=True, data=True):
-                    if data.get("kind") in relationship_kinds:
-                        edges_to_keep.append((u, v, key))
-
-                subgraph = self.nx_graph.edge_subgraph(edges_to_keep)
-                path = nx.shortest_path(subgraph, source_id, target_id)
-                return path if isinstance(path, list) else None
-
-            path = nx.shortest_path(self.nx_graph, source_id, target_id)
+            graph = (
+                self.get_filtered_view(relationship_kinds) if relationship_kinds else self.nx_graph
+            )
+            if weight is None:
+                path = nx.shortest_path(graph, source_id, target_id)
+            elif heuristic is not None:
+                self._check_path_costs(graph, cost or "weight")
+                path = nx.astar_path(
+                    graph, source_id, target_id, heuristic=heuristic, weight=weight
+                )
+            else:
+                self._check_path_costs(graph, cost or "weight")
+                _, path = nx.bidirectional_dijkstra(graph, source_id, target_id, weight=weight)
             return path if isinstance(path, list) else None
         except (nx.NetworkXNoPath, nx.NodeNotFound):
             return None
 
+    def find_shortest_paths_bulk(
+        self,
+        pairs: List[NodePair],
+        relationship_kinds: Optional[List[RelationshipKind]] = None,
+        cost: Optional[str] = None,
+    ) -> Dict[NodePair, Optional[List[uuid.UUID]]]:
+        """Find shortest paths for many (source, target) pairs at once.
+
+        Pairs are grouped by source and each distinct source is searched once:
+        BFS that stops when all of its targets are reached, or single-source
+        Dijkstra when a cost is given.
+
+        Args:
+            pairs: (source_id, target_id) pairs
+            relationship_kinds: Only follow relationships of these kinds
+            cost: Optional edge cost ('weight' or 'certainty')
+
+        Returns:
+            Mapping of each pair to its path, or None if there is no path
+
+        Raises:
+            ValueError: If a weight-cost search meets a negative relationship weight
+        """
+        weight = self._edge_cost_function(cost) if cost else None
+        graph = (
+            self.get_filtered_view(relationship_kinds) if relationship_kinds else self.nx_graph
+        )
+        if cost:
+            self._check_path_costs(graph, cost)
+
+        targets_by_source: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+        for source_id, target_id in pairs:
+            targets_by_source.setdefault(source_id, set()).add(target_id)
+
+        results: Dict[NodePair, Optional[List[uuid.UUID]]] = {}
+        for source_id, targets in targets_by_source.items():
+            paths: Dict[uuid.UUID, List[uuid.UUID]] = {}
+            if source_id in graph:
+                if weight is None:
+                    paths = self._bfs_paths(graph, source_id, targets)
+                else:
+                    _, paths = nx.single_source_dijkstra(graph, source_id, weight=weight)
+            for target_id in targets:
+                results[(source_id, target_id)] = paths.get(target_id)
+        return results
+
+    @staticmethod
+    def _bfs_paths(
+        graph: nx.MultiDiGraph, source_id: uuid.UUID, targets: Set[uuid.UUID]
+    ) -> Dict[uuid.UUID, List[uuid.UUID]]:
+        """Unweighted paths from a source, stopping once every target is reached."""
+        parents: Dict[uuid.UUID, Optional[uuid.UUID]] = {source_id: None}
+        remaining = set(targets)
+        remaining.discard(source_id)
+        frontier = [source_id]
+        while frontier and remaining:
+            next_frontier = []
+            for current in frontier:
+                for neighbor in graph.adj[current]:
+                    if neighbor not in parents:
+                        parents[neighbor] = current
+                        next_frontier.append(neighbor)
+                        remaining.discard(neighbor)
+            frontier = next_frontier
+
+        paths = {}
+        for target_id in targets:
+            if target_id in parents:
+                path = [target_id]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                paths[target_id] = path[::-1]
+        return paths
+
     def get_relationship_strength(
         self, source_id: uuid.UUID, target_id: uuid.UUID
     ) -> float:
@@ -448,17 +1298,31 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
 
         return total_weight / edge_count if edge_count > 0 else 0.0
 
-    def find_cycles(self, max_length: int = 10) -> List[List[uuid.UUID]]:
-        """Find cycles in the graph (feedback loops)."""
+    def iter_cycles(
+        self,
+        max_length: int = DEFAULT_MAX_CYCLE_LENGTH,
+        max_cycles: Optional[int] = DEFAULT_MAX_CYCLES,
+        time_limit: Optional[float] = DEFAULT_CYCLE_TIME_LIMIT,
+    ) -> BoundedCycleSearch:
+        """Lazily enumerate feedback loops of at most max_length nodes.
+
+        Only strongly connected components that can carry a cycle are searched,
+        and enumeration stops at max_cycles cycles or once time_limit seconds
+        have passed.
+        """
+        return BoundedCycleSearch(self.nx_graph, max_length, max_cycles, time_limit)
+
+    def find_cycles(
+        self,
+        max_length: int = DEFAULT_MAX_CYCLE_LENGTH,
+        max_cycles: Optional[int] = DEFAULT_MAX_CYCLES,
+        time_limit: Optional[float] = DEFAULT_CYCLE_TIME_LIMIT,
+    ) -> CycleList:
+        """Find cycles in the graph (feedback loops), with truncation status."""
         try:
-            cycles = []
-            # Find simple cycles up to max_length
-            for cycle in nx.simple_cycles(self.nx_graph):
-                if len(cycle) <= max_length:
-                    cycles.append(cycle)
-            return cycles
+            return self.iter_cycles(max_length, max_cycles, time_limit).collect()
         except nx.NetworkXError:
-            return []
+            return CycleList()
 
     def trace_resource_flows(
         self,
@@ -502,14 +1366,16 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
             efficiency_metrics={},
         )
 
-    def identify_bottlenecks(self, flow_type: FlowNature) -> List[uuid.UUID]:
+    def identify_bottlenecks(
+        self, flow_type: FlowNature, sample_size: Optional[int] = None
+    ) -> List[uuid.UUID]:
         """Identify bottleneck nodes in flow networks."""
         # Handle empty or single-node graphs
         if self.nx_graph.number_of_nodes() <= 1:
             return []
 
         # Use betweenness centrality as a proxy for bottlenecks
-        centrality = nx.betweenness_centrality(self.nx_graph)
+        centrality = self._get_centrality("betweenness", sample_size)
 
         # Handle case where no centrality values exist
         if not centrality:
@@ -526,29 +1392,39 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
     def calculate_flow_efficiency(
         self, source_id: uuid.UUID, target_id: uuid.UUID
     ) -> float:
-        """Calculate efficiency of flows between nodes."""
+        """Calculate efficiency of flows between nodes.
+
+        Inverse hop distance, 0.0 for a node paired with itself or an
+        unreachable pair. A single pair is answered by a bidirectional BFS on
+        the mirror, without building a distance oracle.
+        """
         try:
-            path = self.find_shortest_path(source_id, target_id)
-            
-            # Handle cases where no path exists or path is too short
-            if not path or len(path) <= 1:
-                return 0.0
-                
-            shortest_path_length = len(path) - 1
-            
-            # Double-check for zero or negative path length
-            if shortest_path_length <= 0:
-                return 0.0
-
-            # Simple efficiency metric: inverse of path length
-            # Explicit ZeroDivisionError protection for Python 3.8 compatibility
-            try:
-                return 1.0 / shortest_path_length
-            except ZeroDivisionError:
-                return 0.0
-                
-        except (nx.NetworkXError, TypeError):
+            distance = len(nx.bidirectional_shortest_path(self.nx_graph, source_id, target_id)) - 1
+        except (nx.NetworkXNoPath, nx.NodeNotFound):
             return 0.0
+        return 1.0 / distance if distance > 0 else 0.0
+
+    def distance_oracle(
+        self, landmarks: int = DEFAULT_LANDMARKS, strategy: str = "degree"
+    ) -> LandmarkDistanceOracle:
+        """Landmark distance oracle over the mirror, built once per graph version."""
+        self.sync()
+        if self._distance_oracles_version != self._synced_version:
+            self._distance_oracles.clear()
+            self._distance_oracles_version = self._synced_version
+
+        oracle = self._distance_oracles.get((landmarks, strategy))
+        if oracle is None:
+            scores = self._get_centrality("betweenness") if strategy == "betweenness" else None
+            node_ids = list(self.nx_graph)
+            adjacency = nx.to_scipy_sparse_array(
+                self.nx_graph, nodelist=node_ids, weight=None, format="csr"
+            )
+            oracle = LandmarkDistanceOracle.build(
+                adjacency, node_ids, landmarks, strategy, scores
+            )
+            self._distance_oracles[(landmarks, strategy)] = oracle
+        return oracle
 
     def analyze_policy_impact(
         self, policy_id: uuid.UUID, impact_radius: int = 3
@@ -595,19 +1471,42 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
         except nx.NetworkXError:
             return {"error": "Policy node not found or network error"}
 
+    def analyze_policy_impacts(
+        self,
+        policy_ids: Optional[List[uuid.UUID]] = None,
+        impact_radius: int = 3,
+        min_shared: int = 1,
+    ) -> Dict[str, Any]:
+        """Analyze the impact of many policies at once.
+
+        All requested policies are expanded together by one multi-source
+        bounded BFS over a sparse adjacency matrix (see core.policy_batch)
+        instead of an ego graph per policy. Per-policy results carry the same
+        fields as analyze_policy_impact, except that the ego-graph betweenness
+        is not computed.
+
+        Args:
+            policy_ids: Policies to analyze (None = every Policy node)
+            impact_radius: Number of hops considered affected
+            min_shared: Smallest number of shared affected nodes reported as overlap
+
+        Returns:
+            Dict with "impacts" (policy ID -> impact), "overlaps" (policy pairs
+            with shared affected nodes, largest first) and "missing" IDs
+        """
+        if policy_ids is None:
+            policy_ids = list(self.graph.policies)
+        node_ids = list(self.nx_graph.nodes())
+        nodes = [self.nx_graph.nodes[node_id].get("data") for node_id in node_ids]
+        return batch_policy_impact(
+            adjacency_matrix(self.nx_graph, node_ids), node_ids, nodes, policy_ids,
+            impact_radius=impact_radius, min_shared=min_shared,
+        )
+
     def identify_policy_targets(self, policy_id: uuid.UUID) -> List[uuid.UUID]:
         """Identify nodes directly and indirectly affected by a policy."""
-        targets = []
-
-        # Direct targets (immediate neighbors)
-        direct_targets = self.get_node_neighbors(policy_id, distance=1)
-        targets.extend(direct_targets)
-
-        # Indirect targets (2-hop neighbors)
-        indirect_targets = self.get_node_neighbors(policy_id, distance=2)
-        targets.extend([t for t in indirect_targets if t not in direct_targets])
-
-        return list(set(targets))
+        # Direct and indirect targets are the nodes a 2-hop traversal reaches
+        return self.traverse(policy_id, 2).node_ids
 
     def compare_policy_scenarios(
         self, scenario_graphs: List[SFMGraph]
@@ -665,6 +1564,214 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
 
         return comparison
 
+    def compare_scenario_overlays(
+        self, overlays: List[ScenarioOverlay], include_centrality: bool = False
+    ) -> Dict[str, Any]:
+        """Compare policy scenarios expressed as overlays on this engine's graph.
+
+        Scenario 0 is the baseline graph itself and scenario i the i-th overlay,
+        so the result has the same layout as compare_policy_scenarios. Counts,
+        density, node similarity, policy counts and key differences come from
+        the overlay deltas; average clustering is updated from the cached
+        baseline values by recomputing only the nodes near a change.
+        Betweenness needs every overlay materialized and is only compared when
+        include_centrality is set.
+        """
+        for overlay in overlays:
+            self._check_overlay_base(overlay)
+
+        base_nodes = len(self.graph)
+        base_relationships = len(self.graph.relationships)
+        node_counts = [base_nodes] + [len(overlay) for overlay in overlays]
+        relationship_counts = [base_relationships] + [
+            overlay.relationship_count for overlay in overlays
+        ]
+
+        comparison: Dict[str, Any] = {
+            "scenario_count": len(overlays) + 1,
+            "scenario_names": ["baseline"] + [
+                overlay.name or f"scenario_{i}" for i, overlay in enumerate(overlays, 1)
+            ],
+            "basic_metrics": {
+                "node_counts": node_counts,
+                "relationship_counts": relationship_counts,
+                "density_scores": [
+                    self._density(n, m) for n, m in zip(node_counts, relationship_counts)
+                ],
+            },
+            "structural_comparison": {
+                "centrality_differences": [],
+                "clustering_differences": [
+                    {"scenario": i, "clustering_coefficient": clustering}
+                    for i, clustering in enumerate(
+                        [self._baseline_average_clustering()]
+                        + [self._overlay_average_clustering(overlay) for overlay in overlays]
+                    )
+                ],
+                "connectivity_differences": [],
+            },
+            "policy_impact_analysis": {
+                "policy_nodes_per_scenario": [
+                    {"scenario": i, "policy_count": count}
+                    for i, count in enumerate(
+                        [len(self.graph.policies)]
+                        + [self._overlay_policy_count(overlay) for overlay in overlays]
+                    )
+                ],
+                "impact_radius_comparison": [],
+                "policy_target_overlap": [],
+            },
+            "similarity_matrix": self._overlay_similarity_matrix(overlays, base_nodes),
+            "key_differences": [],
+        }
+
+        for i, overlay in enumerate(overlays, 1):
+            delta = overlay.get_delta_summary()
+            changed = (delta["nodes_added"] + delta["nodes_removed"]
+                       + delta["relationships_added"] + delta["relationships_removed"])
+            comparison["key_differences"].append({
+                "comparison": f"scenario_0_vs_scenario_{i}",
+                "nodes_added": delta["nodes_added"],
+                "nodes_removed": delta["nodes_removed"],
+                "nodes_modified": delta["nodes_modified"],
+                "edges_added": delta["relationships_added"],
+                "edges_removed": delta["relationships_removed"],
+                "edges_modified": delta["relationships_modified"],
+                "structural_change_magnitude": changed / max(1, base_nodes + base_relationships),
+            })
+
+        if include_centrality:
+            base_centrality = self._get_centrality("betweenness")
+            for i, overlay in enumerate(overlays, 1):
+                comparison["structural_comparison"]["centrality_differences"].append({
+                    "scenario_pair": f"0_vs_{i}",
+                    "avg_centrality_difference": self._average_centrality_difference(
+                        base_centrality, self._overlay_betweenness(overlay)
+                    ),
+                })
+
+        return comparison
+
+    def detect_overlay_changes(
+        self, overlay: ScenarioOverlay, include_centrality: bool = False
+    ) -> Dict[str, Any]:
+        """Detect structural changes a scenario overlay makes to this engine's graph.
+
+        Same result layout as detect_structural_changes, computed from the
+        overlay delta. Centrality shifts need the overlay materialized and are
+        only computed when include_centrality is set.
+        """
+        self._check_overlay_base(overlay)
+        base_nodes, base_relationships = len(self.graph), len(self.graph.relationships)
+        nodes, relationships = len(overlay), overlay.relationship_count
+
+        changes: Dict[str, Any] = {
+            "density_change": (self._density(nodes, relationships)
+                               - self._density(base_nodes, base_relationships)),
+            "node_count_change": nodes - base_nodes,
+            "edge_count_change": relationships - base_relationships,
+            "centrality_shifts": {},
+            "new_communities": [],
+            "disbanded_communities": [],
+            "delta": overlay.get_delta_summary(),
+        }
+
+        if include_centrality:
+            base_centrality = self._get_centrality("betweenness")
+            overlay_centrality = self._overlay_betweenness(overlay)
+            for node in set(base_centrality) & set(overlay_centrality):
+                shift = overlay_centrality[node] - base_centrality[node]
+                if abs(shift) > 0.1:  # Significant shift threshold
+                    changes["centrality_shifts"][str(node)] = shift
+
+        return changes
+
+    def _check_overlay_base(self, overlay: ScenarioOverlay) -> None:
+        """Overlays can only be compared against the graph they were built on."""
+        if overlay.base is not self.graph:
+            raise ValueError("Scenario overlay is not based on this engine's graph")
+
+    @staticmethod
+    def _density(node_count: int, relationship_count: int) -> float:
+        """Directed density, as nx.density computes it for the mirror."""
+        if node_count <= 1:
+            return 0.0
+        return relationship_count / (node_count * (node_count - 1))
+
+    def _baseline_clustering(self) -> Tuple[Dict[uuid.UUID, float], float]:
+        """Per-node clustering of the baseline and its sum, cached per graph version."""
+        self.sync()
+        if self._clustering_version != self._synced_version:
+            clustering = nx.clustering(nx.Graph(self.nx_graph.to_undirected()))
+            self._clustering_cache = (clustering, math.fsum(clustering.values()))
+            self._clustering_version = self._synced_version
+        return self._clustering_cache
+
+    def _baseline_average_clustering(self) -> float:
+        """Average clustering of the baseline graph."""
+        clustering, total = self._baseline_clustering()
+        return total / len(clustering) if clustering else 0.0
+
+    def _overlay_average_clustering(self, overlay: ScenarioOverlay) -> float:
+        """Average clustering of a scenario from the baseline values plus local updates."""
+        clustering, total = self._baseline_clustering()
+        affected = clustering_affected_nodes(overlay)
+        stale = {node for node in affected | overlay.removed_node_ids() if node in clustering}
+        total -= math.fsum(clustering[node] for node in stale)
+        total += math.fsum(local_clustering(overlay, node) for node in affected)
+        count = len(clustering) - len(stale) + len(affected)
+        return total / count if count else 0.0
+
+    def _overlay_policy_count(self, overlay: ScenarioOverlay) -> int:
+        """Number of Policy nodes in a scenario, from the baseline count and the delta."""
+        count = len(self.graph.policies)
+        for node_id in overlay.added_node_ids() | overlay.modified_node_ids():
+            count += isinstance(overlay.get_node_by_id(node_id), Policy)
+        for node_id in overlay.removed_node_ids() | overlay.modified_node_ids():
+            count -= isinstance(self.graph.get_node_by_id(node_id), Policy)
+        return count
+
+    @staticmethod
+    def _overlay_similarity_matrix(
+        overlays: List[ScenarioOverlay], base_nodes: int
+    ) -> List[List[float]]:
+        """Jaccard similarity of scenario node sets, from removed and added IDs only."""
+        removed: List[Set[uuid.UUID]] = [set()]
+        removed.extend(overlay.removed_node_ids() for overlay in overlays)
+        added: List[Set[uuid.UUID]] = [set()]
+        added.extend(overlay.added_node_ids() for overlay in overlays)
+        sizes = [base_nodes - len(r) + len(a) for r, a in zip(removed, added)]
+        n_scenarios = len(sizes)
+
+        matrix = [[1.0] * n_scenarios for _ in range(n_scenarios)]
+        for i in range(n_scenarios):
+            for j in range(i + 1, n_scenarios):
+                if sizes[i] == 0 and sizes[j] == 0:
+                    similarity = 1.0
+                elif sizes[i] == 0 or sizes[j] == 0:
+                    similarity = 0.0
+                else:
+                    intersection = (base_nodes - len(removed[i] | removed[j])
+                                    + len(added[i] & added[j]))
+                    union = base_nodes - len(removed[i] & removed[j]) + len(added[i] | added[j])
+                    similarity = intersection / union if union > 0 else 0.0
+                matrix[i][j] = matrix[j][i] = similarity
+        return matrix
+
+    def _overlay_betweenness(self, overlay: ScenarioOverlay) -> Dict[uuid.UUID, float]:
+        """Betweenness of a materialized scenario (a full rebuild)."""
+        return nx.betweenness_centrality(self._build_networkx_from_graph(overlay.materialize()))
+
+    @staticmethod
+    def _average_centrality_difference(
+        base: Dict[uuid.UUID, float], other: Dict[uuid.UUID, float]
+    ) -> float:
+        """Mean absolute centrality change over the nodes both scenarios share."""
+        common = set(base) & set(other)
+        if not common:
+            return 0.0
+        return sum(abs(other[node] - base[node]) for node in common) / len(common)
+
     def get_network_density(self) -> float:
         """Calculate overall network density."""
         return nx.density(self.nx_graph)
@@ -677,29 +1784,24 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
             return {}
 
         try:
+            if algorithm.lower() not in ("label_propagation", "greedy_modularity"):
+                # Louvain (also the default for unknown algorithms), kept current
+                # incrementally across graph versions
+                return self._louvain_communities()
+
             # Convert to undirected graph for community detection
             undirected_graph = self.nx_graph.to_undirected()
 
-            if algorithm.lower() == "louvain":
-                # Use Louvain algorithm for community detection
-                communities = nx.algorithms.community.louvain_communities(
-                    undirected_graph
-                )
-            elif algorithm.lower() == "label_propagation":
+            if algorithm.lower() == "label_propagation":
                 # Use label propagation algorithm
                 communities = nx.algorithms.community.label_propagation_communities(
                     undirected_graph
                 )
-            elif algorithm.lower() == "greedy_modularity":
+            else:
                 # Use greedy modularity maximization
                 communities = nx.algorithms.community.greedy_modularity_communities(
                     undirected_graph
                 )
-            else:
-                # Default to Louvain if unknown algorithm specified
-                communities = nx.algorithms.community.louvain_communities(
-                    undirected_graph
-                )
 
             # Convert to the expected format: Dict[int, List[uuid.UUID]]
             community_dict = {}
@@ -712,14 +1814,37 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
             # Fallback to single community containing all nodes
             return {0: list(self.nx_graph.nodes())}
 
-    def get_structural_holes(self) -> List[uuid.UUID]:
+    def _louvain_communities(self) -> Dict[int, List[uuid.UUID]]:
+        """Louvain communities for the current graph version.
+
+        The partition is cached per graph version. After mutations only the
+        communities touching changed nodes are re-optimized, warm-started
+        from their previous assignment (see core.communities), and
+        untouched communities keep their labels.
+        """
+        self.sync()
+        # The mirror is keyed by node UUIDs, so every member is one
+        communities = self._community_tracker.communities(self.nx_graph, self._synced_version)
+        return cast(Dict[int, List[uuid.UUID]], communities)
+
+    def get_community_assignment(self, node_id: uuid.UUID) -> Optional[str]:
+        """Louvain community label of a node from the incremental community tracker.
+
+        The label is not read from NetworkMetrics.community_assignment; it is
+        stable across graph versions, so callers may store it there.
+        """
+        self.sync()
+        label = self._community_tracker.partition(self.nx_graph, self._synced_version).get(node_id)
+        return None if label is None else str(label)
+
+    def get_structural_holes(self, sample_size: Optional[int] = None) -> List[uuid.UUID]:
         """Identify nodes that bridge structural holes."""
         # Handle empty or single-node graphs
         if self.nx_graph.number_of_nodes() <= 1:
             return []
 
         # Use betweenness centrality as a proxy for structural holes
-        centrality = nx.betweenness_centrality(self.nx_graph)
+        centrality = self._get_centrality("betweenness", sample_size)
 
         # Handle case where no centrality values exist
         if not centrality:
@@ -856,7 +1981,7 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
 
         return changes
 
-    def assess_network_vulnerabilities(self) -> Dict[str, Any]:
+    def assess_network_vulnerabilities(self, sample_size: Optional[int] = None) -> Dict[str, Any]:
         """Comprehensive vulnerability assessment of the network."""
         vulnerabilities: Dict[str, Any] = {
             "critical_nodes": [],
@@ -868,7 +1993,10 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
         }
 
         # Identify critical nodes (high betweenness centrality)
-        centrality = nx.betweenness_centrality(self.nx_graph)
+        centrality = self._get_centrality("betweenness", sample_size)
+        vulnerabilities["betweenness_sampling"] = (
+            self.get_betweenness_estimate(sample_size).to_dict()
+        )
         critical_threshold = sorted(centrality.values())[-max(1, len(centrality) // 20)]
         vulnerabilities["critical_nodes"] = [
             {"node_id": str(node_id), "centrality": score}
@@ -983,6 +2111,49 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
 
         return impact_results
 
+    def simulate_node_failures(
+        self,
+        failure_sets: List[List[uuid.UUID]],
+        failure_mode: str = "cascade",
+        max_workers: Optional[int] = 1,
+    ) -> List[Dict[str, Any]]:
+        """Simulate many independent failure scenarios against the same graph.
+
+        Each result matches simulate_node_failure_impact for that failure set,
+        but no graph is copied: every scenario is evaluated against an array
+        model of the graph built once per graph version (see
+        core.failure_simulation). Scenarios fan out over `max_workers`
+        processes when there are enough of them (None = one per CPU).
+        """
+        return FailureSimulator(max_workers).run(self._failure_model(), failure_sets, failure_mode)
+
+    def _failure_model(self) -> FailureModel:
+        """Array model of the graph for failure analysis, cached per graph version."""
+        self.sync()
+        if self._failure_model_version != self._synced_version:
+            self._failure_model_cache = FailureModel.from_networkx(self.nx_graph)
+            self._failure_model_version = self._synced_version
+        return self._failure_model_cache
+
+    def get_robustness_curve(
+        self,
+        strategy: str = "degree",
+        trials: int = DEFAULT_RANDOM_TRIALS,
+        seed: Optional[int] = None,
+    ) -> RobustnessCurve:
+        """Largest-component fraction as nodes are removed by a targeted or random attack.
+
+        Nodes are removed by descending degree, by descending betweenness
+        (the engine's cached, possibly sampled, scores) or in random order
+        averaged over `trials` runs. Each curve is computed in near-linear
+        time by Newman-Ziff percolation (see core.percolation).
+        """
+        model = self._failure_model()
+        scores = self._get_centrality("betweenness") if strategy == "betweenness" else None
+        return robustness_curve(
+            model.undirected, model.node_ids, strategy, scores=scores, trials=trials, seed=seed
+        )
+
     def _get_relevant_flows(self, flow_type: FlowNature) -> List[Tuple[Any, Any, Dict[str, Any]]]:
         """Get flows of the specified type."""
         relevant_flows = []
@@ -1043,52 +2214,12 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
 
         return flow_analysis
 
-    def identify_flow_inefficiencies(self) -> Dict[str, Any]:
+    def identify_flow_inefficiencies(self, top_k: int = 10) -> Dict[str, Any]:
         """Identify inefficiencies in flow patterns."""
-        inefficiencies: Dict[str, Any] = {
-            "redundant_paths": [],
-            "flow_imbalances": [],
-            "underutilized_connections": [],
-            "optimization_opportunities": []
-        }
-
-        # Find redundant paths (multiple paths with similar flows)
-        node_pairs_with_multiple_paths = []
-        for source in self.nx_graph.nodes():
-            for target in self.nx_graph.nodes():
-                if source != target:
-                    try:
-                        paths = list(nx.all_simple_paths(
-                            self.nx_graph, source, target, cutoff=3
-                        ))
-                        if len(paths) > 1:
-                            node_pairs_with_multiple_paths.append(
-                                (source, target, len(paths))
-                            )
-                    except nx.NetworkXNoPath:
-                        continue
-
-        inefficiencies["redundant_paths"] = [
-            {"source": str(s), "target": str(t), "path_count": count}
-            for s, t, count in node_pairs_with_multiple_paths[:10]  # Top 10
-        ]
-
-        # Identify flow imbalances (nodes with very high in-degree vs out-degree)
-        for node in self.nx_graph.nodes():
-            in_degree = len(list(self.nx_graph.predecessors(node)))
-            out_degree = len(list(self.nx_graph.successors(node)))
-
-            if in_degree > 0 and out_degree > 0:
-                imbalance_ratio = abs(in_degree - out_degree) / max(in_degree, out_degree)
-                if imbalance_ratio > 0.7:  # High imbalance threshold
-                    inefficiencies["flow_imbalances"].append({
-                        "node": str(node),
-                        "in_degree": in_degree,
-                        "out_degree": out_degree,
-                        "imbalance_ratio": imbalance_ratio
-                    })
-
-        return inefficiencies
+        # Path counts come from sparse adjacency powers rather than per-pair path
+        # enumeration; see core.path_counting
+        node_ids = list(self.nx_graph.nodes())
+        return flow_inefficiency_report(adjacency_matrix(self.nx_graph, node_ids), node_ids, top_k)
 
     def _build_networkx_from_graph(self, sfm_graph: SFMGraph) -> nx.MultiDiGraph:
         """Helper method to build NetworkX graph from SFMGraph."""
@@ -1164,9 +2295,6 @@ class NetworkXSFMQueryEngine(SFMQueryEngine):  # pylint: disable=too-many-public
             "policy_target_overlap": []
         }
 
-        # Import Policy here to avoid circular import
-        from core.sfm_models import Policy
-
         for i, graph in enumerate(scenario_graphs):
             # Count policy nodes in each scenario
             policy_count = sum(1 for node in graph if isinstance(node, Policy))
@@ -1249,5 +2377,9 @@ class SFMQueryFactory:
         """Create a query engine for the specified backend."""
         if backend.lower() == "networkx":
             return NetworkXSFMQueryEngine(graph)
+        if backend.lower() == "csr":
+            # Imported here: core.csr_query builds on this module
+            from core.csr_query import CSRSFMQueryEngine  # pylint: disable=import-outside-toplevel
+            return CSRSFMQueryEngine(graph)
 
         raise ValueError(f"Unsupported backend: {backend}")
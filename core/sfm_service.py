@@ -52,7 +52,10 @@ from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union, Tuple, Type, TypeVar
+from functools import partial
+from typing import (
+    Dict, List, Optional, Any, Union, Tuple, Type, TypeVar, Callable, Mapping, Sequence
+)
 
 # Third-party imports
 import networkx as nx
@@ -69,8 +72,27 @@ from core.sfm_models import (
     Policy,
     SFMGraph,
 )
-from core.sfm_enums import ResourceType, RelationshipKind
-from core.sfm_query import SFMQueryEngine, NetworkXSFMQueryEngine
+from core.sfm_enums import InstitutionLayer, ResourceType, RelationshipKind
+from core.sfm_query import SFMQueryEngine, NetworkXSFMQueryEngine, PATH_COST_TYPES
+from core.centrality import (
+    DEFAULT_APPROXIMATION_THRESHOLD,
+    DEFAULT_BETWEENNESS_SAMPLE_SIZE,
+    DEFAULT_SAMPLING_SEED,
+)
+from core.parallel_centrality import DEFAULT_PARALLEL_MIN_NODES
+from core.cycles import (
+    BoundedCycleSearch,
+    DEFAULT_MAX_CYCLE_LENGTH,
+    DEFAULT_MAX_CYCLES,
+    DEFAULT_CYCLE_TIME_LIMIT,
+)
+from core.propagation import DEFAULT_DAMPING
+from core.failure_simulation import FAILURE_MODES
+from core.percolation import ATTACK_STRATEGIES, DEFAULT_RANDOM_TRIALS
+from core.distance_oracle import DEFAULT_LANDMARKS, LANDMARK_STRATEGIES
+from core.uncertainty import DEFAULT_DRAWS, UncertaintyBands
+from core.sensitivity import DEFAULT_PERTURBATION, SENSITIVITY_METHODS
+from core.system_dynamics import DEFAULT_TIME_STEP
 from core.security_validators import (
     validate_and_sanitize_node_data,
     SecurityValidationError,
@@ -103,6 +125,8 @@ DEFAULT_GRAPH_SIZE_LIMIT = 10000
 DEFAULT_QUERY_TIMEOUT = 30
 TOP_NODES_LIMIT = 10
 DEFAULT_DISTANCE = 1
+DEFAULT_MAX_UNCERTAINTY_DRAWS = 100000
+DEFAULT_MAX_DYNAMICS_VALUES = 1000000  # Steps x entities in one projection response
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -117,11 +141,38 @@ __all__ = [
     'CreatePolicyRequest',
     'CreateResourceRequest',
     'CreateRelationshipRequest',
+    'PathQuery',
+    'BulkPathRequest',
+    'BatchPolicyImpactRequest',
+    'FailureSimulationRequest',
+    'FlowEfficiencyMatrixRequest',
+    'DemandShockRequest',
+    'ImpactUncertaintyRequest',
+    'OutputUncertaintyRequest',
+    'WeightSensitivityRequest',
+    'TemporalProjectionRequest',
     'NodeResponse',
     'RelationshipResponse',
     'GraphStatistics',
     'CentralityAnalysis',
+    'PathResult',
     'PolicyImpactAnalysis',
+    'PolicyOverlap',
+    'BatchPolicyImpactAnalysis',
+    'ImpactPropagationAnalysis',
+    'FailureScenarioResult',
+    'FailureSimulationBatch',
+    'RobustnessCurveAnalysis',
+    'ReachabilityResult',
+    'FlowEfficiencyMatrixAnalysis',
+    'DemandShockAnalysis',
+    'SectorMultiplierAnalysis',
+    'DeliveryMatrixView',
+    'ComponentDeliveries',
+    'CeremonialBalanceAnalysis',
+    'UncertaintyAnalysis',
+    'WeightSensitivityAnalysis',
+    'TemporalProjectionAnalysis',
     'ServiceStatus',
     'ServiceHealth',
     'SFMServiceConfig',
@@ -193,6 +244,102 @@ class CreateRelationshipRequest:
     meta: Optional[Dict[str, str]] = None
 
 
+@dataclass
+class PathQuery:
+    """A single source/target pair in a bulk path request."""
+
+    source_id: str  # String UUID for API
+    target_id: str  # String UUID for API
+
+
+@dataclass
+class BulkPathRequest:
+    """Request model for bulk shortest path queries."""
+
+    pairs: List[PathQuery]
+    relationship_kinds: Optional[List[str]] = None
+    cost: Optional[str] = None
+
+
+@dataclass
+class BatchPolicyImpactRequest:
+    """Request model for analyzing many policies at once."""
+
+    policy_ids: Optional[List[str]] = None  # None = every policy in the graph
+    impact_radius: int = 3
+    min_shared: int = 1
+
+
+@dataclass
+class FailureSimulationRequest:
+    """Request model for simulating many node-failure scenarios."""
+
+    failure_sets: List[List[str]]
+    failure_mode: str = "cascade"  # "cascade" or "complete"
+
+
+@dataclass
+class FlowEfficiencyMatrixRequest:
+    """Request model for flow efficiency between sets of nodes."""
+
+    source_ids: Optional[List[str]] = None  # All nodes when omitted
+    target_ids: Optional[List[str]] = None
+    exact: bool = False
+    landmark_strategy: str = "degree"  # "degree" or "betweenness"
+
+
+@dataclass
+class DemandShockRequest:
+    """Request model for final-demand shocks to the input-output model."""
+
+    shocks: List[Dict[str, float]]  # Process ID -> change in final demand, per scenario
+
+
+@dataclass
+class ImpactUncertaintyRequest:
+    """Request model for Monte Carlo bands on impact propagation."""
+
+    seed_ids: List[str]
+    draws: int = DEFAULT_DRAWS
+    seed: Optional[int] = None  # Random seed, for reproducible bands
+    top_k: int = 20
+
+
+@dataclass
+class OutputUncertaintyRequest:
+    """Request model for Monte Carlo bands on input-output gross output."""
+
+    final_demand: Optional[Dict[str, float]] = None  # Observed final demand when omitted
+    draws: int = DEFAULT_DRAWS
+    seed: Optional[int] = None
+    flow_variability: float = 0.0  # Relative standard deviation of flow quantities
+
+
+@dataclass
+class WeightSensitivityRequest:
+    """Request model for sensitivity of impact to relationship weights."""
+
+    seed_ids: List[str]
+    target_ids: Optional[List[str]] = None  # Every non-seed node when omitted
+    relationship_ids: Optional[List[str]] = None  # Every relationship when omitted
+    method: str = "oat"  # "oat", "morris" or "sobol"
+    perturbation: float = DEFAULT_PERTURBATION  # Relative change of a weight
+    samples: Optional[int] = None  # Morris trajectories or Sobol base samples
+    seed: Optional[int] = None
+    top_k: int = 20
+
+
+@dataclass
+class TemporalProjectionRequest:
+    """Request model for a forward projection of temporal dynamics."""
+
+    steps: int
+    dt: float = DEFAULT_TIME_STEP
+    start: Optional[float] = None  # Earliest dynamics start when omitted
+    entity_ids: Optional[List[str]] = None  # Every entity with dynamics when omitted
+    seed: Optional[int] = None  # Random seed for RANDOM dynamics
+
+
 @dataclass
 class NodeResponse:
     """Response model for node entities."""
@@ -235,6 +382,19 @@ class CentralityAnalysis:
     most_central_nodes: List[Tuple[str, float]]
     analysis_type: str
     timestamp: str
+    approximate: bool = False
+    sample_size: Optional[int] = None
+    estimated_error: Optional[float] = None
+
+
+@dataclass
+class PathResult:
+    """Response model for one path in a bulk path query."""
+
+    source_id: str
+    target_id: str
+    path: Optional[List[str]]
+    path_length: int
 
 
 @dataclass
@@ -250,6 +410,186 @@ class PolicyImpactAnalysis:
     impact_radius: int
 
 
+@dataclass
+class PolicyOverlap:
+    """Response model for the shared impact area of two policies."""
+
+    policy_a: str
+    policy_b: str
+    shared_nodes: int
+    jaccard: float
+
+
+@dataclass
+class BatchPolicyImpactAnalysis:
+    """Response model for batch policy impact analysis."""
+
+    impacts: List[PolicyImpactAnalysis]
+    overlaps: List[PolicyOverlap]
+    missing_policies: List[str]
+    impact_radius: int
+    timestamp: str
+
+
+@dataclass
+class ImpactPropagationAnalysis:
+    """Response model for weighted impact propagation from seed nodes."""
+
+    seed_ids: List[str]
+    ranked_nodes: List[Tuple[str, float]]
+    damping: float
+    iterations: int
+    converged: bool
+    timestamp: str
+
+
+@dataclass
+class FailureScenarioResult:
+    """Response model for the impact of one node-failure scenario."""
+
+    failed_nodes: List[str]
+    connectivity_impact: Dict[str, Any]
+    isolated_nodes: List[str]
+    cascading_failures: List[str]
+
+
+@dataclass
+class FailureSimulationBatch:
+    """Response model for batch node-failure simulation."""
+
+    scenarios: List[FailureScenarioResult]
+    failure_mode: str
+    timestamp: str
+
+
+@dataclass
+class RobustnessCurveAnalysis:
+    """Response model for a percolation robustness curve."""
+
+    strategy: str
+    fractions: List[float]  # Largest-component fraction after k removals
+    std: List[float]
+    robustness: float
+    critical_fraction: float
+    removal_order: List[str]
+    trials: int
+    timestamp: str
+
+
+@dataclass
+class ReachabilityResult:
+    """Response model for a reachability query."""
+
+    source_id: str
+    target_id: str
+    reachable: bool
+    relationship_kinds: Optional[List[str]]
+    timestamp: str
+
+
+@dataclass
+class FlowEfficiencyMatrixAnalysis:
+    """Response model for flow efficiency between sets of nodes."""
+
+    source_ids: List[str]
+    target_ids: List[str]
+    efficiencies: List[List[float]]  # Row per source, column per target
+    average_efficiency: float
+    exact: bool
+    landmarks: int
+    timestamp: str
+
+
+@dataclass
+class DemandShockAnalysis:
+    """Response model for final-demand shocks to the input-output model."""
+
+    scenarios: List[Dict[str, float]]  # Process ID -> change in gross output
+    total_output_changes: List[float]
+    sectors: int
+    timestamp: str
+
+
+@dataclass
+class SectorMultiplierAnalysis:
+    """Response model for input-output multipliers of every process."""
+
+    multipliers: Dict[str, Dict[str, float]]  # Process ID -> output multiplier, forward linkage
+    sectors: int
+    timestamp: str
+
+
+@dataclass
+class DeliveryMatrixView:
+    """Response model for a block of the social fabric delivery matrix."""
+
+    row_type: Optional[str]
+    column_type: Optional[str]
+    relationship_kind: Optional[str]  # None: all kinds aggregated
+    row_ids: List[str]
+    column_ids: List[str]
+    deliveries: List[Dict[str, Any]]  # source_id, target_id, weight per non-empty cell
+    total_weight: float
+    timestamp: str
+    dense: Optional[List[List[float]]] = None  # Row per row_id, column per column_id
+
+
+@dataclass
+class ComponentDeliveries:
+    """Response model for one component's row and column of the delivery matrix."""
+
+    node_id: str
+    relationship_kind: Optional[str]
+    delivers_to: Dict[str, float]  # Target ID -> weight
+    receives_from: Dict[str, float]  # Source ID -> weight
+    timestamp: str
+
+
+@dataclass
+class CeremonialBalanceAnalysis:
+    """Response model for the ceremonial/instrumental balance of the graph."""
+
+    group_by: str  # "node", "community" or "layer"
+    overall: Dict[str, float]  # Ceremonial and instrumental mass and ceremonial score
+    groups: Dict[str, Dict[str, float]]  # Group -> the same, most ceremonial first
+    timestamp: str
+
+
+@dataclass
+class UncertaintyAnalysis:
+    """Response model for Monte Carlo percentile bands."""
+
+    analysis: str  # "impact_propagation" or "input_output"
+    draws: int
+    percentiles: List[float]
+    bands: Dict[str, Dict[str, float]]  # Node ID -> mean, std and "p5", "p50", ...
+    timestamp: str
+
+
+@dataclass
+class WeightSensitivityAnalysis:
+    """Response model for relationship weight sensitivity."""
+
+    method: str
+    baseline: float  # Influence of the seeds on the targets at the recorded weights
+    ranking_index: str
+    ranked_relationships: List[Tuple[str, float]]  # Relationship ID -> ranking index
+    indices: Dict[str, Dict[str, float]]  # Relationship ID -> every index
+    evaluations: int
+    timestamp: str
+
+
+@dataclass
+class TemporalProjectionAnalysis:
+    """Response model for projected temporal dynamics."""
+
+    steps: int
+    times: List[float]
+    trajectories: Dict[str, List[float]]  # Entity ID -> value per step
+    function_types: Dict[str, str]  # Entity ID -> temporal function type
+    timestamp: str
+
+
 class ServiceStatus(Enum):
     """Service operational status."""
 
@@ -286,6 +626,29 @@ class SFMServiceConfig:
     log_level: str = "INFO"
     max_graph_size: int = DEFAULT_GRAPH_SIZE_LIMIT
     query_timeout: int = DEFAULT_QUERY_TIMEOUT
+    # Betweenness switches to k-pivot sampling above this many nodes
+    approximate_centrality_threshold: int = DEFAULT_APPROXIMATION_THRESHOLD
+    betweenness_sample_size: int = DEFAULT_BETWEENNESS_SAMPLE_SIZE
+    centrality_sampling_seed: Optional[int] = DEFAULT_SAMPLING_SEED
+    # Worker processes for exact betweenness/closeness (None = one per CPU); opt-in
+    centrality_workers: Optional[int] = 1
+    parallel_centrality_min_nodes: int = DEFAULT_PARALLEL_MIN_NODES
+    # Limits for the circular dependency check in integrity validation
+    cycle_check_max_length: int = DEFAULT_MAX_CYCLE_LENGTH
+    cycle_check_max_cycles: int = DEFAULT_MAX_CYCLES
+    cycle_check_time_limit: float = DEFAULT_CYCLE_TIME_LIMIT
+    # Probability of following a relationship (vs. restarting) in impact propagation
+    impact_propagation_damping: float = DEFAULT_DAMPING
+    # Worker processes for batch failure simulation (None = one per CPU); opt-in
+    failure_simulation_workers: Optional[int] = 1
+    # Landmarks per distance oracle behind flow efficiency matrices
+    distance_oracle_landmarks: int = DEFAULT_LANDMARKS
+    # Monte Carlo uncertainty: largest draw count per request and worker
+    # processes for large draw counts (None = one per CPU); opt-in
+    uncertainty_max_draws: int = DEFAULT_MAX_UNCERTAINTY_DRAWS
+    uncertainty_workers: Optional[int] = 1
+    # Largest steps x entities a temporal dynamics projection may return
+    dynamics_max_values: int = DEFAULT_MAX_DYNAMICS_VALUES
 
 
 class SFMServiceError(Exception):
@@ -378,11 +741,20 @@ class SFMService:
 
     @property
     def query_engine(self) -> SFMQueryEngine:
-        """Get the query engine, creating it if necessary."""
-        if self._query_engine is None or self._cache_dirty:
-            graph = self.get_graph()
-            self._query_engine = NetworkXSFMQueryEngine(graph)
-            self._cache_dirty = False
+        """Get the query engine, creating it only when the graph is reloaded."""
+        graph = self.get_graph()
+        if self._query_engine is None or self._query_engine.graph is not graph:
+            self._query_engine = NetworkXSFMQueryEngine(
+                graph,
+                approximation_threshold=self.config.approximate_centrality_threshold,
+                betweenness_sample_size=self.config.betweenness_sample_size,
+                sampling_seed=self.config.centrality_sampling_seed,
+                centrality_workers=self.config.centrality_workers,
+                parallel_min_nodes=self.config.parallel_centrality_min_nodes,
+            )
+        else:
+            # The engine tracks graph mutations itself; this only rebuilds if it missed some
+            self._query_engine.sync()
         return self._query_engine
 
     def get_graph(self) -> SFMGraph:
@@ -399,6 +771,22 @@ class SFMService:
         self._last_operation = operation or "unknown"
         logger.debug("Cache marked dirty after operation: %s", self._last_operation)
 
+    def _apply_graph_delta(self, operation: str, apply: Callable[[SFMGraph], Any]):
+        """Apply a repository change to the cached graph instead of reloading it.
+
+        Falls back to marking the cache dirty when there is no loaded graph to
+        update or the delta cannot be applied.
+        """
+        if self.config.auto_sync and self._graph_cache is not None and not self._cache_dirty:
+            try:
+                apply(self._graph_cache)
+                self._last_operation = operation
+                logger.debug("Applied graph delta for operation: %s", operation)
+                return
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Failed to apply graph delta for %s, reloading: %s", operation, e)
+        self._mark_dirty(operation)
+
     def _validate_graph_size(self):
         """Validate that the graph hasn't exceeded size limits."""
         if self.config.max_graph_size > 0:
@@ -563,7 +951,7 @@ class SFMService:
                     rollback_function=lambda data: self._rollback_create_actor(data["actor_id"])
                 )
             
-            self._mark_dirty("create_actor")
+            self._apply_graph_delta("create_actor", lambda graph: graph.add_node(result))
             self._validate_graph_size()
 
             logger.info("Created actor: %s (%s)", result.label, result.id)
@@ -623,7 +1011,7 @@ class SFMService:
                     rollback_function=lambda data: self._rollback_create_institution(data["institution_id"])
                 )
             
-            self._mark_dirty("create_institution")
+            self._apply_graph_delta("create_institution", lambda graph: graph.add_node(result))
 
             logger.info("Created institution: %s (%s)", result.label, result.id)
             return self._node_to_response(result)
@@ -685,7 +1073,7 @@ class SFMService:
                     rollback_function=lambda data: self._rollback_create_policy(data["policy_id"])
                 )
             
-            self._mark_dirty("create_policy")
+            self._apply_graph_delta("create_policy", lambda graph: graph.add_node(result))
 
             logger.info("Created policy: %s (%s)", result.label, result.id)
             return self._node_to_response(result)
@@ -746,7 +1134,7 @@ class SFMService:
                     rollback_function=lambda data: self._rollback_create_resource(data["resource_id"])
                 )
             
-            self._mark_dirty("create_resource")
+            self._apply_graph_delta("create_resource", lambda graph: graph.add_node(result))
 
             logger.info("Created resource: %s (%s)", result.label, result.id)
             return self._node_to_response(result)
@@ -824,7 +1212,9 @@ class SFMService:
                             rollback_function=lambda data: self._rollback_create_relationship(data["relationship_id"])
                         )
                     
-                    self._mark_dirty("create_relationship")
+                    self._apply_graph_delta(
+                        "create_relationship", lambda graph: graph.add_relationship(result)
+                    )
 
                     logger.info(
                         "Created relationship: %s --%s--> %s",
@@ -959,16 +1349,7 @@ class SFMService:
             else:
                 node_uuid = node_id
 
-            # Convert string relationship kinds to enum values if provided
-            relationship_kind_enums = None
-            if relationship_kinds:
-                relationship_kind_enums = []
-                for kind_str in relationship_kinds:
-                    try:
-                        kind_enum = self._convert_to_relationship_kind(kind_str)
-                        relationship_kind_enums.append(kind_enum)
-                    except ValidationError:
-                        logger.warning("Unknown relationship kind: %s", kind_str)
+            relationship_kind_enums = self._convert_relationship_kind_filter(relationship_kinds)
 
             # Use the query engine to find neighbors
             engine = self.query_engine
@@ -987,6 +1368,64 @@ class SFMService:
                 f"Failed to get node neighbors: {str(e)}", "GET_NODE_NEIGHBORS_FAILED"
             ) from e
 
+    def get_node_neighborhood(
+        self,
+        node_id: Union[str, uuid.UUID],
+        relationship_kinds: Optional[List[str]] = None,
+        distance: int = DEFAULT_DISTANCE,
+        include_paths: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get neighboring nodes together with their hop distance.
+
+        Args:
+            node_id: ID of the node to start from
+            relationship_kinds: Optional list of relationship kind names to follow
+            distance: Maximum number of hops
+            include_paths: Also return the relationship IDs leading to each node
+
+        Returns:
+            Mapping of neighbor ID to {"distance": int} (plus "path" if requested)
+        """
+        try:
+            node_uuid = uuid.UUID(node_id) if isinstance(node_id, str) else node_id
+            result = self.query_engine.traverse(
+                node_uuid,
+                distance,
+                self._convert_relationship_kind_filter(relationship_kinds),
+                include_paths=include_paths,
+            )
+
+            neighborhood: Dict[str, Dict[str, Any]] = {}
+            for neighbor_id, hops in result.distances.items():
+                entry: Dict[str, Any] = {"distance": hops}
+                if include_paths:
+                    entry["path"] = [str(rel_id) for rel_id in result.paths[neighbor_id]]
+                neighborhood[str(neighbor_id)] = entry
+            return neighborhood
+
+        except ValueError as exc:
+            raise ValidationError(f"Invalid UUID format: {node_id}") from exc
+        except Exception as e:
+            logger.error("Failed to traverse from node %s: %s", node_id, e)
+            raise SFMServiceError(
+                f"Failed to get node neighborhood: {str(e)}", "GET_NODE_NEIGHBORHOOD_FAILED"
+            ) from e
+
+    def _convert_relationship_kind_filter(
+        self, relationship_kinds: Optional[List[str]]
+    ) -> Optional[List[RelationshipKind]]:
+        """Convert relationship kind names to enum values, skipping unknown names."""
+        if not relationship_kinds:
+            return None
+        relationship_kind_enums = []
+        for kind_str in relationship_kinds:
+            try:
+                relationship_kind_enums.append(self._convert_to_relationship_kind(kind_str))
+            except ValidationError:
+                logger.warning("Unknown relationship kind: %s", kind_str)
+        return relationship_kind_enums
+
     # ═══ ENTITY LISTING ═══
 
     def _get_node_type_mapping(self) -> Dict[str, Type[Node]]:
@@ -1140,9 +1579,19 @@ class SFMService:
             ) from e
 
     def analyze_centrality(
-        self, centrality_type: str = "betweenness", limit: int = TOP_NODES_LIMIT
+        self,
+        centrality_type: str = "betweenness",
+        limit: int = TOP_NODES_LIMIT,
+        sample_size: Optional[int] = None,
     ) -> CentralityAnalysis:
-        """Perform centrality analysis on the network."""
+        """Perform centrality analysis on the network.
+
+        Args:
+            centrality_type: betweenness, closeness, degree or eigenvector
+            limit: Number of most central nodes to return
+            sample_size: Pivot count for approximate betweenness. None uses exact
+                betweenness unless the graph exceeds the configured threshold.
+        """
         try:
             engine = self.query_engine
             graph = self.get_graph()
@@ -1150,25 +1599,36 @@ class SFMService:
             # Calculate centrality for all nodes
             centrality_scores = {}
             most_central = []
+            estimate = None
 
             if len(graph) > 0:
+                # One whole-graph computation, shared with every other analysis
+                # running against the same graph version
+                scores = engine.get_all_centralities(
+                    [centrality_type], sample_size=sample_size
+                )[centrality_type]
                 for node in graph:
-                    score = engine.get_node_centrality(node.id, centrality_type)
-                    centrality_scores[str(node.id)] = score
+                    centrality_scores[str(node.id)] = scores.get(node.id, 0.0)
 
                 # Get most central nodes
                 central_nodes = engine.get_most_central_nodes(
-                    None, centrality_type, limit
+                    None, centrality_type, limit, sample_size=sample_size
                 )
                 most_central = [
                     (str(node_id), score) for node_id, score in central_nodes
                 ]
 
+                if centrality_type == "betweenness":
+                    estimate = engine.get_betweenness_estimate(sample_size)
+
             return CentralityAnalysis(
                 node_centrality=centrality_scores,
                 most_central_nodes=most_central,
                 analysis_type=centrality_type,
                 timestamp=datetime.now().isoformat(),
+                approximate=estimate is not None and not estimate.exact,
+                sample_size=estimate.sample_size if estimate else None,
+                estimated_error=estimate.estimated_error if estimate else None,
             )
 
         except Exception as e:
@@ -1242,11 +1702,503 @@ class SFMService:
                 "POLICY_IMPACT_ANALYSIS_FAILED",
             ) from e
 
+    def analyze_policy_impacts(
+        self,
+        policy_ids: Optional[Sequence[Union[str, uuid.UUID]]] = None,
+        impact_radius: int = 3,
+        min_shared: int = 1,
+    ) -> BatchPolicyImpactAnalysis:
+        """
+        Analyze the impact of many policies in one pass.
+
+        All policies are expanded together by a single multi-source traversal,
+        so this is the call to use for whole-model reports. Per-policy network
+        metrics hold the impact-area density only.
+
+        Args:
+            policy_ids: Policies to analyze (None = every policy in the graph)
+            impact_radius: Number of hops considered affected
+            min_shared: Smallest number of shared affected nodes reported as overlap
+
+        Returns:
+            Impacts in request order, pairwise overlaps (largest first) and the
+            requested IDs that were not found
+        """
+        if impact_radius < 1:
+            raise ValidationError(
+                "Impact radius must be at least 1", "impact_radius", impact_radius
+            )
+        validated_ids = (
+            None if policy_ids is None
+            else [self._validate_and_convert_uuid(policy_id) for policy_id in policy_ids]
+        )
+
+        try:
+            batch = self.query_engine.analyze_policy_impacts(
+                validated_ids, impact_radius=impact_radius, min_shared=min_shared
+            )
+            return BatchPolicyImpactAnalysis(
+                impacts=[
+                    self._build_policy_impact_analysis(policy_id, impact, impact_radius)
+                    for policy_id, impact in batch["impacts"].items()
+                ],
+                overlaps=[
+                    PolicyOverlap(
+                        policy_a=str(overlap["policy_a"]),
+                        policy_b=str(overlap["policy_b"]),
+                        shared_nodes=overlap["shared_nodes"],
+                        jaccard=overlap["jaccard"],
+                    )
+                    for overlap in batch["overlaps"]
+                ],
+                missing_policies=[str(policy_id) for policy_id in batch["missing"]],
+                impact_radius=impact_radius,
+                timestamp=datetime.now().isoformat(),
+            )
+        except Exception as e:
+            logger.error("Failed to analyze batch policy impact: %s", e)
+            raise SFMServiceError(
+                f"Failed to analyze policy impacts: {str(e)}",
+                "BATCH_POLICY_IMPACT_ANALYSIS_FAILED",
+            ) from e
+
+    def propagate_impact(
+        self,
+        seed_ids: Sequence[Union[str, uuid.UUID]],
+        top_k: int = 20,
+        damping: Optional[float] = None,
+        include_seeds: bool = False,
+    ) -> ImpactPropagationAnalysis:
+        """
+        Rank nodes by weighted influence from one or more seed nodes.
+
+        Influence is scored by random walk with restart (personalized PageRank)
+        over relationship weight scaled by certainty, so strong, certain
+        connections carry more impact than weak or speculative ones.
+
+        Args:
+            seed_ids: Nodes the impact starts from (e.g. policies)
+            top_k: Number of ranked nodes to return
+            damping: Probability of following a relationship rather than
+                restarting at the seeds (defaults to the service config)
+            include_seeds: Whether the seeds themselves appear in the ranking
+
+        Returns:
+            The top_k nodes by influence score, highest first
+        """
+        if not seed_ids:
+            raise ValidationError("At least one seed node is required", "seed_ids", seed_ids)
+        damping = self.config.impact_propagation_damping if damping is None else damping
+        if not 0.0 <= damping < 1.0:
+            raise ValidationError("Damping must be in [0, 1)", "damping", damping)
+        seeds = [self._validate_and_convert_uuid(seed_id) for seed_id in seed_ids]
+
+        try:
+            result = self.query_engine.propagate_impact(seeds, alpha=damping)
+        except Exception as e:
+            logger.error("Failed to propagate impact: %s", e)
+            raise SFMServiceError(
+                f"Failed to propagate impact: {str(e)}", "IMPACT_PROPAGATION_FAILED"
+            ) from e
+
+        missing = [seed for seed in seeds if seed not in result.seeds]
+        if missing:
+            raise NotFoundError("Node", str(missing[0]))
+
+        return ImpactPropagationAnalysis(
+            seed_ids=[str(seed) for seed in result.seeds],
+            ranked_nodes=[
+                (str(node_id), score)
+                for node_id, score in result.ranked(top_k, include_seeds=include_seeds)
+            ],
+            damping=damping,
+            iterations=result.iterations,
+            converged=result.converged,
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def _validate_draws(self, draws: int) -> None:
+        """Check a Monte Carlo draw count against the service limit."""
+        if not 1 <= draws <= self.config.uncertainty_max_draws:
+            raise ValidationError(
+                f"Draws must be between 1 and {self.config.uncertainty_max_draws}",
+                "draws", draws,
+            )
+
+    def _uncertainty_response(self, analysis: str, bands: UncertaintyBands,
+                              node_ids: List[uuid.UUID]) -> UncertaintyAnalysis:
+        """Convert percentile bands of the given nodes to a response."""
+        return UncertaintyAnalysis(
+            analysis=analysis,
+            draws=bands.draws,
+            percentiles=bands.percentiles,
+            bands={str(node_id): bands.band(node_id) for node_id in node_ids},
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def propagate_impact_uncertainty(
+        self,
+        seed_ids: Sequence[Union[str, uuid.UUID]],
+        draws: int = DEFAULT_DRAWS,
+        seed: Optional[int] = None,
+        top_k: int = 20,
+    ) -> UncertaintyAnalysis:
+        """
+        Percentile bands on weighted influence from one or more seed nodes.
+
+        Each draw keeps every relationship with probability equal to its
+        certainty and samples its weight around the recorded weight with its
+        variability, then ranks influence by random walk with restart.
+
+        Args:
+            seed_ids: Nodes the impact starts from (e.g. policies)
+            draws: Number of Monte Carlo draws
+            seed: Random seed for reproducible bands
+            top_k: Number of non-seed nodes, by mean score, to return bands for
+
+        Returns:
+            Mean, standard deviation and 5th/50th/95th percentile score per node
+        """
+        if not seed_ids:
+            raise ValidationError("At least one seed node is required", "seed_ids", seed_ids)
+        self._validate_draws(draws)
+        seeds = [self._validate_and_convert_uuid(seed_id) for seed_id in seed_ids]
+
+        try:
+            graph = self.get_graph()
+            missing = [node_id for node_id in seeds if graph.get_node_by_id(node_id) is None]
+            bands = None if missing else self.query_engine.propagate_impact_uncertainty(
+                seeds, draws=draws, seed=seed, max_workers=self.config.uncertainty_workers
+            )
+        except Exception as e:
+            logger.error("Failed to propagate impact uncertainty: %s", e)
+            raise SFMServiceError(
+                f"Failed to propagate impact uncertainty: {str(e)}", "IMPACT_UNCERTAINTY_FAILED"
+            ) from e
+        if bands is None:
+            raise NotFoundError("Node", str(missing[0]))
+
+        # Nodes never reached in any draw are left out, as in propagate_impact
+        ranked = sorted(
+            ((mean, node_id) for node_id, mean in zip(bands.node_ids, bands.mean.tolist())
+             if mean > 0 and node_id not in seeds),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        return self._uncertainty_response(
+            "impact_propagation", bands, [node_id for _, node_id in ranked[:top_k]]
+        )
+
+    def analyze_output_uncertainty(
+        self,
+        final_demand: Optional[Union[Mapping[str, float], Mapping[uuid.UUID, float]]] = None,
+        draws: int = DEFAULT_DRAWS,
+        seed: Optional[int] = None,
+        flow_variability: float = 0.0,
+    ) -> UncertaintyAnalysis:
+        """
+        Percentile bands on every process's gross output under flow uncertainty.
+
+        Each draw keeps every Flow with probability equal to its certainty
+        and scales its quantity by a factor drawn around 1, then solves the
+        Leontief input-output model.
+
+        Args:
+            final_demand: Process ID -> final demand (observed demand when omitted)
+            draws: Number of Monte Carlo draws
+            seed: Random seed for reproducible bands
+            flow_variability: Relative standard deviation of flow quantities
+
+        Returns:
+            Mean, standard deviation and 5th/50th/95th percentile gross output per process
+        """
+        self._validate_draws(draws)
+        if flow_variability < 0:
+            raise ValidationError(
+                "Flow variability must be non-negative", "flow_variability", flow_variability
+            )
+        demand = None if final_demand is None else {
+            self._validate_and_convert_uuid(sector_id): float(amount)
+            for sector_id, amount in final_demand.items()
+        }
+
+        try:
+            model = self.query_engine.uncertainty_analyzer.model
+            missing = [sector_id for sector_id in demand or {}
+                       if sector_id not in model.sector_ids]
+            bands = None if missing else self.query_engine.analyze_output_uncertainty(
+                demand, draws=draws, seed=seed, flow_variability=flow_variability,
+                max_workers=self.config.uncertainty_workers,
+            )
+        except Exception as e:
+            logger.error("Failed to analyze output uncertainty: %s", e)
+            raise SFMServiceError(
+                f"Failed to analyze output uncertainty: {str(e)}", "OUTPUT_UNCERTAINTY_FAILED"
+            ) from e
+        if bands is None:
+            raise NotFoundError("Process", str(missing[0]))
+
+        return self._uncertainty_response("input_output", bands, bands.node_ids)
+
+    def analyze_weight_sensitivity(
+        self,
+        seed_ids: Sequence[Union[str, uuid.UUID]],
+        target_ids: Optional[Sequence[Union[str, uuid.UUID]]] = None,
+        relationship_ids: Optional[Sequence[Union[str, uuid.UUID]]] = None,
+        method: str = "oat",
+        perturbation: float = DEFAULT_PERTURBATION,
+        samples: Optional[int] = None,
+        seed: Optional[int] = None,
+        top_k: int = 20,
+    ) -> WeightSensitivityAnalysis:
+        """
+        Rank relationships by how strongly their weights steer impact to the targets.
+
+        The indicator is the weighted influence (random walk with restart)
+        of the seeds on the targets; every perturbation is evaluated as a
+        low-rank update of one factorized propagation system.
+
+        Args:
+            seed_ids: Nodes the impact starts from (e.g. policies)
+            target_ids: Nodes whose influence is summed (every non-seed node when omitted)
+            relationship_ids: Relationships whose weights are perturbed (all when omitted)
+            method: "oat" (one at a time), "morris" (elementary effects) or "sobol"
+            perturbation: Relative weight change, in (0, 1)
+            samples: Morris trajectories or Sobol base samples
+            seed: Random seed for the Morris and Sobol designs
+            top_k: Number of relationships to rank
+
+        Returns:
+            Baseline indicator, ranked relationships and every index per ranked relationship
+        """
+        if not seed_ids:
+            raise ValidationError("At least one seed node is required", "seed_ids", seed_ids)
+        if method not in SENSITIVITY_METHODS:
+            raise ValidationError(
+                f"Method must be one of {', '.join(SENSITIVITY_METHODS)}", "method", method
+            )
+        if not 0.0 < perturbation < 1.0:
+            raise ValidationError(
+                "Perturbation must be between 0 and 1", "perturbation", perturbation
+            )
+        if samples is not None and samples < 2:
+            raise ValidationError("Samples must be at least 2", "samples", samples)
+        seeds = [self._validate_and_convert_uuid(seed_id) for seed_id in seed_ids]
+        targets = None if target_ids is None else [
+            self._validate_and_convert_uuid(node_id) for node_id in target_ids
+        ]
+        selected = None if relationship_ids is None else [
+            self._validate_and_convert_uuid(rel_id) for rel_id in relationship_ids
+        ]
+
+        try:
+            graph = self.get_graph()
+            missing = [("Node", node_id) for node_id in seeds + (targets or [])
+                       if graph.get_node_by_id(node_id) is None]
+            missing += [("Relationship", rel_id) for rel_id in selected or []
+                        if rel_id not in graph.relationships]
+            result = None if missing else self.query_engine.analyze_weight_sensitivity(
+                seeds, target_ids=targets, relationship_ids=selected, method=method,
+                perturbation=perturbation, samples=samples, seed=seed,
+            )
+        except Exception as e:
+            logger.error("Failed to analyze weight sensitivity: %s", e)
+            raise SFMServiceError(
+                f"Failed to analyze weight sensitivity: {str(e)}", "WEIGHT_SENSITIVITY_FAILED"
+            ) from e
+        if result is None:
+            raise NotFoundError(missing[0][0], str(missing[0][1]))
+
+        ranked = result.ranked(top_k)
+        return WeightSensitivityAnalysis(
+            method=result.method,
+            baseline=result.baseline,
+            ranking_index=result.ranking_index,
+            ranked_relationships=[(str(rel_id), value) for rel_id, value in ranked],
+            indices={str(rel_id): result.relationship_indices(rel_id) for rel_id, _ in ranked},
+            evaluations=result.evaluations,
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def project_temporal_dynamics(
+        self,
+        steps: int,
+        dt: float = DEFAULT_TIME_STEP,
+        start: Optional[float] = None,
+        entity_ids: Optional[Sequence[Union[str, uuid.UUID]]] = None,
+        seed: Optional[int] = None,
+    ) -> TemporalProjectionAnalysis:
+        """
+        Project the values of flows, indicators, change processes and relationships.
+
+        Every entity with temporal dynamics is advanced together, one
+        vectorized update per function type per step.
+
+        Args:
+            steps: Number of time steps to simulate
+            dt: Simulation time between steps
+            start: Simulation time of the first step
+            entity_ids: Entities to return trajectories for (all with dynamics when omitted)
+            seed: Random seed for RANDOM dynamics
+
+        Returns:
+            Step times and the value trajectory of each requested entity
+        """
+        if steps < 1:
+            raise ValidationError("Steps must be positive", "steps", steps)
+        if dt <= 0:
+            raise ValidationError("Time step must be positive", "dt", dt)
+        selected = None if entity_ids is None else [
+            self._validate_and_convert_uuid(entity_id) for entity_id in entity_ids
+        ]
+
+        try:
+            program = self.query_engine.dynamics_simulator.program
+            known = set(program.entity_ids)
+            missing = [entity_id for entity_id in selected or [] if entity_id not in known]
+            recorded = program.size if selected is None else len(selected)
+            projection = None
+            if not missing and steps * recorded <= self.config.dynamics_max_values:
+                projection = self.query_engine.project_temporal_dynamics(
+                    steps, dt=dt, start=start, entity_ids=selected, seed=seed
+                )
+        except Exception as e:
+            logger.error("Failed to project temporal dynamics: %s", e)
+            raise SFMServiceError(
+                f"Failed to project temporal dynamics: {str(e)}", "TEMPORAL_PROJECTION_FAILED"
+            ) from e
+        if missing:
+            raise NotFoundError("Temporal dynamics", str(missing[0]))
+        if projection is None:
+            raise ValidationError(
+                f"Projection of {recorded} entities over {steps} steps exceeds "
+                f"{self.config.dynamics_max_values} values; select fewer entities or steps",
+                "steps", steps,
+            )
+
+        function_types = dict(zip(program.entity_ids, program.function_types))
+        return TemporalProjectionAnalysis(
+            steps=steps,
+            times=projection.times.tolist(),
+            trajectories={
+                str(entity_id): projection.trajectory(entity_id).tolist()
+                for entity_id in projection.entity_ids
+            },
+            function_types={
+                str(entity_id): function_types[entity_id].name
+                for entity_id in projection.entity_ids
+            },
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def simulate_node_failures(
+        self,
+        failure_sets: Sequence[Sequence[Union[str, uuid.UUID]]],
+        failure_mode: str = "cascade",
+    ) -> FailureSimulationBatch:
+        """
+        Simulate many independent node-failure scenarios.
+
+        Every scenario is evaluated against the same unmodified graph, so
+        this is the call to use for resilience studies with thousands of
+        failure sets. Large batches run across worker processes.
+
+        Args:
+            failure_sets: Node IDs failing together, one list per scenario
+            failure_mode: "cascade" also removes nodes that lost most of their
+                connections; "complete" removes only the failed nodes
+
+        Returns:
+            Connectivity impact, isolated nodes and cascading failures per
+            scenario, in request order
+        """
+        if failure_mode not in FAILURE_MODES:
+            raise ValidationError(
+                f"Failure mode must be one of {', '.join(FAILURE_MODES)}",
+                "failure_mode", failure_mode,
+            )
+        validated_sets = [
+            [self._validate_and_convert_uuid(node_id) for node_id in failure_set]
+            for failure_set in failure_sets
+        ]
+
+        try:
+            results = self.query_engine.simulate_node_failures(
+                validated_sets, failure_mode,
+                max_workers=self.config.failure_simulation_workers,
+            )
+        except Exception as e:
+            logger.error("Failed to simulate node failures: %s", e)
+            raise SFMServiceError(
+                f"Failed to simulate node failures: {str(e)}", "FAILURE_SIMULATION_FAILED"
+            ) from e
+
+        return FailureSimulationBatch(
+            scenarios=[
+                FailureScenarioResult(
+                    failed_nodes=result["failed_nodes"],
+                    connectivity_impact=result["connectivity_impact"],
+                    isolated_nodes=result["isolated_nodes"],
+                    cascading_failures=result["cascading_failures"],
+                )
+                for result in results
+            ],
+            failure_mode=failure_mode,
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def get_robustness_curve(
+        self,
+        strategy: str = "degree",
+        trials: int = DEFAULT_RANDOM_TRIALS,
+        seed: Optional[int] = None,
+    ) -> RobustnessCurveAnalysis:
+        """
+        Measure how the network falls apart as nodes are removed.
+
+        Args:
+            strategy: "degree" or "betweenness" for targeted attacks on the most
+                connected or most central nodes first, "random" for failures
+            trials: Random removal orders averaged ("random" only)
+            seed: Seed for the random removal orders
+
+        Returns:
+            Largest-component fraction after every removal, the robustness
+            index (mean fraction) and the share of nodes removed before the
+            largest component halves
+        """
+        if strategy not in ATTACK_STRATEGIES:
+            raise ValidationError(
+                f"Strategy must be one of {', '.join(ATTACK_STRATEGIES)}", "strategy", strategy
+            )
+        if trials < 1:
+            raise ValidationError("Trials must be at least 1", "trials", trials)
+
+        try:
+            curve = self.query_engine.get_robustness_curve(strategy, trials, seed)
+        except Exception as e:
+            logger.error("Failed to compute robustness curve: %s", e)
+            raise SFMServiceError(
+                f"Failed to compute robustness curve: {str(e)}", "ROBUSTNESS_CURVE_FAILED"
+            ) from e
+
+        return RobustnessCurveAnalysis(
+            strategy=curve.strategy,
+            fractions=curve.fractions,
+            std=curve.std,
+            robustness=curve.robustness,
+            critical_fraction=curve.critical_fraction(),
+            removal_order=[str(node_id) for node_id in curve.removal_order],
+            trials=curve.trials,
+            timestamp=datetime.now().isoformat(),
+        )
+
     def find_shortest_path(
         self,
         source_id: Union[str, uuid.UUID],
         target_id: Union[str, uuid.UUID],
         relationship_kinds: Optional[List[str]] = None,
+        cost: Optional[str] = None,
     ) -> Optional[List[str]]:
         """
         Find the shortest path between two nodes.
@@ -1255,11 +2207,18 @@ class SFMService:
             source_id: ID of the source node
             target_id: ID of the target node
             relationship_kinds: Optional list of relationship kind names to filter by
+            cost: Optional edge cost ('weight' or 'certainty') for a weighted search
 
         Returns:
             List of node IDs representing the path (including source and target),
             or None if no path exists
         """
+        if cost is not None and cost not in PATH_COST_TYPES:
+            raise ValidationError(
+                f"Invalid path cost: {cost}. Must be one of {list(PATH_COST_TYPES)}",
+                "cost", cost
+            )
+
         try:
             if isinstance(source_id, str):
                 source_uuid = uuid.UUID(source_id)
@@ -1270,22 +2229,16 @@ class SFMService:
                 target_uuid = uuid.UUID(target_id)
             else:
                 target_uuid = target_id
+        except ValueError as exc:
+            raise ValidationError("Invalid UUID format in path finding") from exc
 
-            # Convert string relationship kinds to enum values if provided
-            relationship_kind_enums = None
-            if relationship_kinds:
-                relationship_kind_enums = []
-                for kind_str in relationship_kinds:
-                    try:
-                        kind_enum = self._convert_to_relationship_kind(kind_str)
-                        relationship_kind_enums.append(kind_enum)
-                    except ValidationError:
-                        logger.warning("Unknown relationship kind: %s", kind_str)
+        try:
+            relationship_kind_enums = self._convert_relationship_kind_filter(relationship_kinds)
 
             # Use the query engine to find the path
             engine = self.query_engine
             path_ids = engine.find_shortest_path(
-                source_uuid, target_uuid, relationship_kind_enums
+                source_uuid, target_uuid, relationship_kind_enums, cost=cost
             )
 
             if path_ids is None:
@@ -1295,7 +2248,8 @@ class SFMService:
             return [str(node_id) for node_id in path_ids]
 
         except ValueError as exc:
-            raise ValidationError("Invalid UUID format in path finding") from exc
+            # Raised for path costs the search cannot use, such as negative weights
+            raise ValidationError(str(exc), "cost", cost) from exc
         except Exception as e:
             logger.error(
                 "Failed to find path between %s and %s: %s", source_id, target_id, e
@@ -1304,6 +2258,398 @@ class SFMService:
                 f"Failed to find shortest path: {str(e)}", "FIND_PATH_FAILED"
             ) from e
 
+    def calculate_flow_efficiency_matrix(
+        self,
+        source_ids: Optional[Sequence[Union[str, uuid.UUID]]] = None,
+        target_ids: Optional[Sequence[Union[str, uuid.UUID]]] = None,
+        exact: bool = False,
+        landmark_strategy: str = "degree",
+    ) -> FlowEfficiencyMatrixAnalysis:
+        """
+        Flow efficiency (inverse path length) between every source and target.
+
+        Path lengths come from a landmark distance oracle: distances from and
+        to a few well-connected nodes are precomputed once per graph version,
+        and every pair is then estimated from them without a path search.
+
+        Args:
+            source_ids: Rows of the matrix (all nodes when omitted)
+            target_ids: Columns of the matrix (all nodes when omitted)
+            exact: Settle pairs the estimate cannot prove exact with a search
+            landmark_strategy: "degree" or "betweenness" landmark selection
+
+        Returns:
+            Efficiency per source and target; without `exact`, estimates may
+            understate efficiency but never overstate it
+        """
+        if landmark_strategy not in LANDMARK_STRATEGIES:
+            raise ValidationError(
+                f"Landmark strategy must be one of {', '.join(LANDMARK_STRATEGIES)}",
+                "landmark_strategy", landmark_strategy,
+            )
+        sources = None if source_ids is None else [
+            self._validate_and_convert_uuid(node_id) for node_id in source_ids
+        ]
+        targets = None if target_ids is None else [
+            self._validate_and_convert_uuid(node_id) for node_id in target_ids
+        ]
+        landmarks = self.config.distance_oracle_landmarks
+
+        try:
+            oracle = self.query_engine.distance_oracle(landmarks, landmark_strategy)
+            missing = [node_id for node_id in (sources or []) + (targets or [])
+                       if node_id not in oracle]
+            matrix = None if missing else self.query_engine.calculate_flow_efficiency_matrix(
+                sources, targets, exact, landmarks=landmarks, strategy=landmark_strategy
+            )
+        except Exception as e:
+            logger.error("Failed to calculate flow efficiency matrix: %s", e)
+            raise SFMServiceError(
+                f"Failed to calculate flow efficiency matrix: {str(e)}",
+                "FLOW_EFFICIENCY_MATRIX_FAILED",
+            ) from e
+
+        if missing:
+            raise NotFoundError("Node", str(missing[0]))
+
+        return FlowEfficiencyMatrixAnalysis(
+            source_ids=[str(node_id) for node_id in matrix.source_ids],
+            target_ids=[str(node_id) for node_id in matrix.target_ids],
+            efficiencies=matrix.efficiency.tolist(),
+            average_efficiency=matrix.average,
+            exact=exact,
+            landmarks=int(oracle.landmarks.size),
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def analyze_demand_shocks(
+        self, shocks: Sequence[Union[Mapping[str, float], Mapping[uuid.UUID, float]]]
+    ) -> DemandShockAnalysis:
+        """
+        Change in every process's gross output for final-demand shocks.
+
+        The Leontief input-output model is assembled from the graph's Flow
+        nodes, with Process nodes as sectors, and all shocks are answered by
+        one solve.
+
+        Args:
+            shocks: One mapping of Process ID to change in final demand per scenario
+
+        Returns:
+            Gross output change per process and in total, per scenario
+        """
+        if not shocks:
+            raise ValidationError("At least one shock is required", "shocks", shocks)
+        validated = [
+            {self._validate_and_convert_uuid(sector_id): float(amount)
+             for sector_id, amount in shock.items()}
+            for shock in shocks
+        ]
+
+        try:
+            model = self.query_engine.input_output_model
+            model.sync()
+            missing = [sector_id for shock in validated for sector_id in shock
+                       if sector_id not in model.sector_index]
+            changes = [] if missing else self.query_engine.analyze_demand_shocks(validated)
+        except Exception as e:
+            logger.error("Failed to analyze demand shocks: %s", e)
+            raise SFMServiceError(
+                f"Failed to analyze demand shocks: {str(e)}", "DEMAND_SHOCK_FAILED"
+            ) from e
+        if missing:
+            raise NotFoundError("Process", str(missing[0]))
+
+        return DemandShockAnalysis(
+            scenarios=[
+                {str(sector_id): change for sector_id, change in scenario.items()}
+                for scenario in changes
+            ],
+            total_output_changes=[sum(scenario.values()) for scenario in changes],
+            sectors=len(model.sector_ids),
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def get_sector_multipliers(self) -> SectorMultiplierAnalysis:
+        """
+        Input-output multipliers of every process.
+
+        Returns:
+            Per process, the output multiplier (economy-wide gross output per
+            unit of final demand for it) and the forward linkage (its output
+            when final demand for every process rises by one unit)
+        """
+        try:
+            multipliers = self.query_engine.get_sector_multipliers()
+        except Exception as e:
+            logger.error("Failed to compute sector multipliers: %s", e)
+            raise SFMServiceError(
+                f"Failed to compute sector multipliers: {str(e)}", "SECTOR_MULTIPLIERS_FAILED"
+            ) from e
+
+        return SectorMultiplierAnalysis(
+            multipliers={str(sector_id): values for sector_id, values in multipliers.items()},
+            sectors=len(multipliers),
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def _delivery_kind(self, relationship_kind: Optional[str]) -> Optional[RelationshipKind]:
+        """Relationship kind of a delivery-matrix query; None aggregates all kinds."""
+        if relationship_kind is None:
+            return None
+        try:
+            return RelationshipKind[relationship_kind.upper()]
+        except KeyError as e:
+            raise ValidationError(
+                f"Unknown relationship kind: {relationship_kind}",
+                "relationship_kind", relationship_kind,
+            ) from e
+
+    def _delivery_node_type(self, node_type: Optional[str], field: str) -> Optional[Type[Node]]:
+        """Node class selecting one side of a delivery-matrix block."""
+        if node_type is None:
+            return None
+        type_mapping = self._get_node_type_mapping()
+        if node_type not in type_mapping:
+            raise ValidationError(
+                f"Node type must be one of {', '.join(type_mapping)}", field, node_type
+            )
+        return type_mapping[node_type]
+
+    def get_delivery_matrix(
+        self,
+        row_type: Optional[str] = None,
+        column_type: Optional[str] = None,
+        relationship_kind: Optional[str] = None,
+        dense: bool = False,
+    ) -> DeliveryMatrixView:
+        """
+        Block of the social fabric matrix: what components of one type deliver to another.
+
+        Args:
+            row_type: Delivering node type, e.g. "Institution" (all nodes when omitted)
+            column_type: Receiving node type, e.g. "Actor" (all nodes when omitted)
+            relationship_kind: One relationship kind (all kinds aggregated when omitted)
+            dense: Also return the block as a dense matrix (small blocks only)
+
+        Returns:
+            Row and column component IDs with the summed relationship weight of
+            every non-empty cell
+        """
+        row_class = self._delivery_node_type(row_type, "row_type")
+        column_class = self._delivery_node_type(column_type, "column_type")
+        kind = self._delivery_kind(relationship_kind)
+
+        try:
+            matrix = self.query_engine.delivery_matrix
+            row_ids, column_ids, block = matrix.block(row_class, column_class, kind)
+            if dense:
+                row_ids, column_ids, dense_block = matrix.to_dense(row_class, column_class, kind)
+        except ValueError as e:
+            raise ValidationError(str(e), "dense", dense) from e
+        except Exception as e:
+            logger.error("Failed to build delivery matrix: %s", e)
+            raise SFMServiceError(
+                f"Failed to build delivery matrix: {str(e)}", "DELIVERY_MATRIX_FAILED"
+            ) from e
+
+        cells = block.tocoo()
+        return DeliveryMatrixView(
+            row_type=row_type,
+            column_type=column_type,
+            relationship_kind=kind.name if kind else None,
+            row_ids=[str(node_id) for node_id in row_ids],
+            column_ids=[str(node_id) for node_id in column_ids],
+            deliveries=[
+                {"source_id": str(row_ids[i]), "target_id": str(column_ids[j]), "weight": w}
+                for i, j, w in zip(cells.row.tolist(), cells.col.tolist(), cells.data.tolist())
+            ],
+            total_weight=float(cells.data.sum()),
+            timestamp=datetime.now().isoformat(),
+            dense=dense_block.tolist() if dense else None,
+        )
+
+    def get_component_deliveries(
+        self, node_id: Union[str, uuid.UUID], relationship_kind: Optional[str] = None
+    ) -> ComponentDeliveries:
+        """
+        What one component delivers to and receives from every other component.
+
+        Args:
+            node_id: ID of the component
+            relationship_kind: One relationship kind (all kinds aggregated when omitted)
+
+        Returns:
+            The component's delivery-matrix row and column as weights by counterpart
+        """
+        component_id = self._validate_and_convert_uuid(node_id)
+        kind = self._delivery_kind(relationship_kind)
+
+        try:
+            present = component_id in self.query_engine.delivery_matrix
+            deliveries = self.query_engine.get_component_deliveries(component_id, kind)
+        except Exception as e:
+            logger.error("Failed to read component deliveries: %s", e)
+            raise SFMServiceError(
+                f"Failed to read component deliveries: {str(e)}", "COMPONENT_DELIVERIES_FAILED"
+            ) from e
+        if not present:
+            raise NotFoundError("Node", str(component_id))
+
+        return ComponentDeliveries(
+            node_id=str(component_id),
+            relationship_kind=kind.name if kind else None,
+            delivers_to={str(k): v for k, v in deliveries["delivers_to"].items()},
+            receives_from={str(k): v for k, v in deliveries["receives_from"].items()},
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def analyze_ceremonial_balance(
+        self, group_by: str = "layer", top_k: Optional[int] = None
+    ) -> CeremonialBalanceAnalysis:
+        """
+        Balance of ceremonial versus instrumental relationships and behaviors.
+
+        Relationships count by the ceremonial tendency of their kind, scaled
+        by weight and certainty; behavioral nodes and flows add their own
+        scores. Masses are kept in sync with the graph, so repeated calls
+        cost only the aggregation.
+
+        Args:
+            group_by: "node", "community" or "layer" (Hayden's institution layers)
+            top_k: Number of groups to return, most ceremonial first (all when omitted)
+
+        Returns:
+            Graph-wide and per-group ceremonial and instrumental mass and ceremonial score
+        """
+        if group_by not in ("node", "community", "layer"):
+            raise ValidationError(
+                "Grouping must be one of node, community, layer", "group_by", group_by
+            )
+        if top_k is not None and top_k < 1:
+            raise ValidationError("top_k must be positive", "top_k", top_k)
+
+        try:
+            overall = self.query_engine.get_ceremonial_balance()
+            groups = self.query_engine.get_grouped_ceremonial_balance(group_by)
+        except Exception as e:
+            logger.error("Failed to analyze ceremonial balance: %s", e)
+            raise SFMServiceError(
+                f"Failed to analyze ceremonial balance: {str(e)}", "CEREMONIAL_BALANCE_FAILED"
+            ) from e
+
+        ranked = sorted(groups.items(), key=lambda item: item[1].score, reverse=True)[:top_k]
+        return CeremonialBalanceAnalysis(
+            group_by=group_by,
+            overall=overall.to_dict(),
+            groups={
+                group.name if isinstance(group, InstitutionLayer) else str(group): balance.to_dict()
+                for group, balance in ranked
+            },
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def can_reach(
+        self,
+        source_id: Union[str, uuid.UUID],
+        target_id: Union[str, uuid.UUID],
+        relationship_kinds: Optional[List[str]] = None,
+    ) -> ReachabilityResult:
+        """
+        Check whether any chain of relationships leads from source to target.
+
+        Args:
+            source_id: ID of the source node
+            target_id: ID of the target node
+            relationship_kinds: Optional list of relationship kind names to follow
+
+        Returns:
+            Whether the target is reachable; unknown nodes reach nothing
+        """
+        source_uuid = self._validate_and_convert_uuid(source_id)
+        target_uuid = self._validate_and_convert_uuid(target_id)
+        relationship_kind_enums = self._convert_relationship_kind_filter(relationship_kinds)
+
+        try:
+            reachable = self.query_engine.can_reach(
+                source_uuid, target_uuid, relationship_kind_enums
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to check reachability from %s to %s: %s", source_id, target_id, e
+            )
+            raise SFMServiceError(
+                f"Failed to check reachability: {str(e)}", "REACHABILITY_FAILED"
+            ) from e
+
+        return ReachabilityResult(
+            source_id=str(source_uuid),
+            target_id=str(target_uuid),
+            reachable=reachable,
+            relationship_kinds=relationship_kinds,
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def find_shortest_paths_bulk(
+        self,
+        pairs: List[Tuple[Union[str, uuid.UUID], Union[str, uuid.UUID]]],
+        relationship_kinds: Optional[List[str]] = None,
+        cost: Optional[str] = None,
+    ) -> List[PathResult]:
+        """
+        Find shortest paths for many source/target pairs in one call.
+
+        Pairs sharing a source are answered by a single search from that source.
+
+        Args:
+            pairs: (source_id, target_id) pairs
+            relationship_kinds: Optional list of relationship kind names to filter by
+            cost: Optional edge cost ('weight' or 'certainty') for a weighted search
+
+        Returns:
+            One PathResult per requested pair, in request order
+        """
+        if cost is not None and cost not in PATH_COST_TYPES:
+            raise ValidationError(
+                f"Invalid path cost: {cost}. Must be one of {list(PATH_COST_TYPES)}",
+                "cost", cost
+            )
+
+        try:
+            uuid_pairs = [
+                (
+                    uuid.UUID(source_id) if isinstance(source_id, str) else source_id,
+                    uuid.UUID(target_id) if isinstance(target_id, str) else target_id,
+                )
+                for source_id, target_id in pairs
+            ]
+        except ValueError as exc:
+            raise ValidationError("Invalid UUID format in path finding") from exc
+
+        try:
+            paths = self.query_engine.find_shortest_paths_bulk(
+                uuid_pairs, self._convert_relationship_kind_filter(relationship_kinds), cost=cost
+            )
+
+            results = []
+            for source_uuid, target_uuid in uuid_pairs:
+                path = paths.get((source_uuid, target_uuid))
+                results.append(PathResult(
+                    source_id=str(source_uuid),
+                    target_id=str(target_uuid),
+                    path=[str(node_id) for node_id in path] if path is not None else None,
+                    path_length=len(path) if path else 0,
+                ))
+            return results
+        except ValueError as exc:
+            # Raised for path costs the search cannot use, such as negative weights
+            raise ValidationError(str(exc), "cost", cost) from exc
+        except Exception as e:
+            logger.error("Failed to find %d bulk paths: %s", len(uuid_pairs), e)
+            raise SFMServiceError(
+                f"Failed to find shortest paths: {str(e)}", "FIND_PATHS_BULK_FAILED"
+            ) from e
+
     def find_shortest_path_legacy(self, source_id: str, target_id: str) -> list:
         """
         Find the shortest path between two nodes by their IDs.
@@ -1411,6 +2757,9 @@ class SFMService:
         """Rollback actor creation by deleting the actor."""
         try:
             self._actor_repo.delete(uuid.UUID(actor_id))
+            self._apply_graph_delta(
+                "rollback_create_actor", lambda graph: graph.remove_node(uuid.UUID(actor_id))
+            )
             logger.debug(f"Rolled back actor creation: {actor_id}")
         except Exception as e:
             logger.error(f"Failed to rollback actor creation {actor_id}: {e}")
@@ -1419,6 +2768,9 @@ class SFMService:
         """Rollback policy creation by deleting the policy."""
         try:
             self._policy_repo.delete(uuid.UUID(policy_id))
+            self._apply_graph_delta(
+                "rollback_create_policy", lambda graph: graph.remove_node(uuid.UUID(policy_id))
+            )
             logger.debug(f"Rolled back policy creation: {policy_id}")
         except Exception as e:
             logger.error(f"Failed to rollback policy creation {policy_id}: {e}")
@@ -1427,6 +2779,9 @@ class SFMService:
         """Rollback institution creation by deleting the institution."""
         try:
             self._institution_repo.delete(uuid.UUID(institution_id))
+            self._apply_graph_delta(
+                "rollback_create_institution", lambda graph: graph.remove_node(uuid.UUID(institution_id))
+            )
             logger.debug(f"Rolled back institution creation: {institution_id}")
         except Exception as e:
             logger.error(f"Failed to rollback institution creation {institution_id}: {e}")
@@ -1435,6 +2790,9 @@ class SFMService:
         """Rollback resource creation by deleting the resource."""
         try:
             self._resource_repo.delete(uuid.UUID(resource_id))
+            self._apply_graph_delta(
+                "rollback_create_resource", lambda graph: graph.remove_node(uuid.UUID(resource_id))
+            )
             logger.debug(f"Rolled back resource creation: {resource_id}")
         except Exception as e:
             logger.error(f"Failed to rollback resource creation {resource_id}: {e}")
@@ -1443,6 +2801,10 @@ class SFMService:
         """Rollback relationship creation by deleting the relationship."""
         try:
             self._relationship_repo.delete(uuid.UUID(relationship_id))
+            self._apply_graph_delta(
+                "rollback_create_relationship",
+                lambda graph: graph.remove_relationship(uuid.UUID(relationship_id)),
+            )
             logger.debug(f"Rolled back relationship creation: {relationship_id}")
         except Exception as e:
             logger.error(f"Failed to rollback relationship creation {relationship_id}: {e}")
@@ -1709,21 +3071,32 @@ class SFMService:
             for rel in graph.relationships.values():
                 nx_graph.add_edge(str(rel.source_id), str(rel.target_id))
             
-            # Find cycles
-            try:
-                cycles = list(nx.simple_cycles(nx_graph))
-                for cycle in cycles:
-                    # Only report cycles longer than 2 nodes as potential issues
-                    if len(cycle) > 2:
-                        violations.append({
-                            "type": "circular_dependency",
-                            "cycle": cycle,
-                            "length": len(cycle),
-                            "severity": "low"
-                        })
-            except nx.NetworkXNoCycle:
-                # No cycles found, which is good
-                pass
+            # Find cycles, bounded so dense feedback structures cannot stall validation.
+            # Only cycles longer than 2 nodes are reported as potential issues
+            search = BoundedCycleSearch(
+                nx_graph,
+                max_length=self.config.cycle_check_max_length,
+                max_cycles=self.config.cycle_check_max_cycles,
+                time_limit=self.config.cycle_check_time_limit,
+                min_length=3,
+            )
+            for cycle in search:
+                violations.append({
+                    "type": "circular_dependency",
+                    "cycle": cycle,
+                    "length": len(cycle),
+                    "severity": "low"
+                })
+
+            if search.truncated:
+                violations.append({
+                    "type": "circular_dependency_search_truncated",
+                    "message": (
+                        f"Cycle search stopped after {search.cycles_found} cycles "
+                        f"({search.truncation_reason} reached)"
+                    ),
+                    "severity": "low"
+                })
             
             return violations
             
@@ -1765,6 +3138,10 @@ class SFMService:
                 for rel_id in orphaned.keys():
                     try:
                         self._relationship_repo.delete(rel_id)
+                        self._apply_graph_delta(
+                            "repair_orphaned_relationships",
+                            partial(SFMGraph.remove_relationship, relationship_id=rel_id),
+                        )
                         removed_count += 1
                     except Exception as e:
                         logger.error(f"Failed to remove orphaned relationship {rel_id}: {e}")
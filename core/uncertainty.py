@@ -0,0 +1,509 @@
+"""
+Monte Carlo uncertainty propagation for SFM graphs.
+
+Relationships carry a `certainty` (how sure we are the relationship exists)
+and a `variability` (standard deviation of its weight), and nodes carry a
+`certainty` of their own. This module turns them into percentile bands on
+analysis results by sampling the graph many times. Draws are never built
+relationship by relationship: every draw samples all weights at once as rows
+of a (draws x relationships) NumPy array, and the analyses run on all draws
+of a chunk together.
+
+Sampling model:
+- A relationship is present in a draw with probability `certainty`; its
+  weight is Normal(weight, variability), clipped at zero
+- A node is present with probability `certainty`; relationships touching an
+  absent node drop out of the draw
+- Weights default to 1 as in ImpactPropagator, certainty scales presence
+  rather than weight
+- A Flow is present with probability `certainty`; its quantity (and fixed
+  transformation coefficient) is scaled by Normal(1, flow_variability)
+
+Features:
+- Random walk with restart (impact propagation) over all draws of a chunk in
+  one batched power iteration: one sparse product per step for every draw
+- Leontief output response per draw with one batched dense LU solve for
+  small economies, a sparse LU per draw above `batched_sector_limit` sectors
+- Fixed-size draw chunks seeded from one SeedSequence, so results depend on
+  the seed but not on the number of workers
+- Optional process-pool fan-out for very large draw counts, the arrays
+  shipped to each worker once through the pool initializer
+"""
+
+import logging
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
+
+from core.input_output import shipped_quantity
+from core.propagation import (
+    DEFAULT_DAMPING,
+    DEFAULT_PROPAGATION_MAX_ITER,
+    DEFAULT_PROPAGATION_TOL,
+    Seeds,
+)
+from core.sfm_models import SFMGraph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DRAWS = 1000
+DEFAULT_DRAW_CHUNK_SIZE = 256
+DEFAULT_PARALLEL_MIN_DRAWS = 4096  # Below this, process start-up outweighs the gain
+DEFAULT_PERCENTILES = (5.0, 50.0, 95.0)
+DEFAULT_BATCHED_SECTOR_LIMIT = 200  # Above this many sectors, solve draws one at a time
+
+
+def _clip_certainty(certainty: Optional[float]) -> float:
+    """Certainty as a probability; missing values count as certain."""
+    return min(max(certainty if certainty is not None else 1.0, 0.0), 1.0)
+
+
+def sample_quantities(
+    rng: np.random.Generator,
+    draws: int,
+    mean: np.ndarray,
+    std: np.ndarray,
+    certainty: np.ndarray,
+) -> np.ndarray:
+    """(draws x items) sample of uncertain, non-negative quantities.
+
+    Each item is Normal(mean, std) clipped at zero and absent (zero) in a
+    draw with probability 1 - certainty.
+    """
+    values = mean + std * rng.standard_normal((draws, mean.size))
+    np.maximum(values, 0.0, out=values)
+    values *= rng.random((draws, mean.size)) < certainty
+    return values
+
+
+def _incidence(indices: np.ndarray, size: int) -> sparse.csr_matrix:
+    """(size x len(indices)) matrix with a one at (indices[k], k)."""
+    return sparse.csr_matrix(
+        (np.ones(indices.size), (indices, np.arange(indices.size))),
+        shape=(size, indices.size),
+    )
+
+
+@dataclass
+class UncertaintyBands:
+    """Distribution of one analysis result over Monte Carlo draws.
+
+    `bands[k, i]` is the `percentiles[k]` percentile of the value of
+    `node_ids[i]` across draws.
+    """
+
+    node_ids: List[uuid.UUID]
+    percentiles: List[float]
+    bands: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+    draws: int
+
+    @classmethod
+    def from_samples(
+        cls, node_ids: List[uuid.UUID], samples: np.ndarray, percentiles: Sequence[float]
+    ) -> "UncertaintyBands":
+        """Summarize a (draws x nodes) sample."""
+        percentiles = [float(p) for p in percentiles]
+        if samples.shape[0] == 0 or samples.shape[1] == 0:
+            bands = np.zeros((len(percentiles), samples.shape[1]))
+        else:
+            bands = np.percentile(samples, percentiles, axis=0).reshape(len(percentiles), -1)
+        mean = samples.mean(axis=0) if samples.shape[0] else np.zeros(samples.shape[1])
+        std = samples.std(axis=0) if samples.shape[0] else np.zeros(samples.shape[1])
+        return cls(node_ids, percentiles, bands, mean, std, samples.shape[0])
+
+    def band(self, node_id: uuid.UUID) -> Dict[str, float]:
+        """Mean, standard deviation and percentiles of one node ("p5", "p50", ...)."""
+        i = self.node_ids.index(node_id)
+        summary = {"mean": float(self.mean[i]), "std": float(self.std[i])}
+        for k, percentile in enumerate(self.percentiles):
+            summary[f"p{percentile:g}"] = float(self.bands[k, i])
+        return summary
+
+    def summary(self) -> Dict[uuid.UUID, Dict[str, float]]:
+        """`band()` of every node."""
+        return {node_id: self.band(node_id) for node_id in self.node_ids}
+
+
+@dataclass(frozen=True)
+class UncertaintyModel:
+    """Immutable arrays of a graph's uncertain relationships and flows.
+
+    Node indices follow graph order (relationship endpoints outside the
+    graph are appended, as in ImpactPropagator); sector indices follow
+    `graph.processes`. Flow ends outside the economy are -1.
+    """
+
+    node_ids: List[uuid.UUID]
+    node_certainty: np.ndarray
+    edge_sources: np.ndarray
+    edge_targets: np.ndarray
+    edge_weights: np.ndarray
+    edge_std: np.ndarray
+    edge_certainty: np.ndarray
+    sector_ids: List[uuid.UUID]
+    flow_sources: np.ndarray
+    flow_targets: np.ndarray
+    flow_amounts: np.ndarray  # Shipped quantity
+    flow_coefficients: np.ndarray  # Fixed technical coefficient, NaN if none
+    flow_certainty: np.ndarray
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the relationship graph."""
+        return len(self.node_ids)
+
+    @classmethod
+    def from_graph(cls, graph: SFMGraph) -> "UncertaintyModel":
+        """Collect the arrays with one pass over nodes, relationships and flows."""
+        node_ids = [node.id for node in graph]
+        node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+        node_certainty = [_clip_certainty(node.certainty) for node in graph]
+
+        sources, targets, weights, std, certainty = [], [], [], [], []
+        for rel in graph.relationships.values():
+            for endpoint in (rel.source_id, rel.target_id):
+                if endpoint not in node_index:
+                    node_index[endpoint] = len(node_ids)
+                    node_ids.append(endpoint)
+                    node_certainty.append(1.0)
+            sources.append(node_index[rel.source_id])
+            targets.append(node_index[rel.target_id])
+            weights.append(max(rel.weight or 1.0, 0.0))
+            std.append(max(rel.variability or 0.0, 0.0))
+            certainty.append(_clip_certainty(rel.certainty))
+
+        sector_ids = list(graph.processes)
+        sector_index = {sector_id: i for i, sector_id in enumerate(sector_ids)}
+        flow_sources, flow_targets, amounts, coefficients, flow_certainty = [], [], [], [], []
+        for flow in list(graph.flows.values()) + list(graph.value_flows.values()):
+            flow_sources.append(sector_index.get(flow.source_process_id, -1))
+            flow_targets.append(sector_index.get(flow.target_process_id, -1))
+            amounts.append(shipped_quantity(flow))
+            coefficients.append(
+                np.nan if flow.transformation_coefficient is None
+                else flow.transformation_coefficient / (1.0 - (flow.loss_factor or 0.0))
+            )
+            flow_certainty.append(_clip_certainty(flow.certainty))
+
+        return cls(
+            node_ids=node_ids,
+            node_certainty=np.array(node_certainty, dtype=np.float64),
+            edge_sources=np.array(sources, dtype=np.int64),
+            edge_targets=np.array(targets, dtype=np.int64),
+            edge_weights=np.array(weights, dtype=np.float64),
+            edge_std=np.array(std, dtype=np.float64),
+            edge_certainty=np.array(certainty, dtype=np.float64),
+            sector_ids=sector_ids,
+            flow_sources=np.array(flow_sources, dtype=np.int64),
+            flow_targets=np.array(flow_targets, dtype=np.int64),
+            flow_amounts=np.array(amounts, dtype=np.float64),
+            flow_coefficients=np.array(coefficients, dtype=np.float64),
+            flow_certainty=np.array(flow_certainty, dtype=np.float64),
+        )
+
+    def sample_edge_weights(self, rng: np.random.Generator, draws: int) -> np.ndarray:
+        """(draws x relationships) weights, zero where a relationship or endpoint is absent."""
+        weights = sample_quantities(
+            rng, draws, self.edge_weights, self.edge_std, self.edge_certainty
+        )
+        if np.any(self.node_certainty < 1.0):
+            present = rng.random((draws, self.node_count)) < self.node_certainty
+            weights *= present[:, self.edge_sources] & present[:, self.edge_targets]
+        return weights
+
+
+# ─── KERNELS ───
+
+
+def propagate_draws(
+    model: UncertaintyModel,
+    draws: int,
+    seed: np.random.SeedSequence,
+    restart: np.ndarray,
+    columns: np.ndarray,
+    alpha: float = DEFAULT_DAMPING,
+    tol: float = DEFAULT_PROPAGATION_TOL,
+    max_iter: int = DEFAULT_PROPAGATION_MAX_ITER,
+) -> np.ndarray:
+    """Random walk with restart scores of `columns` nodes, one row per draw.
+
+    All draws iterate together: scores are a (nodes x draws) matrix and a
+    step is one pass over the (relationships x draws) transition shares.
+    """
+    rng = np.random.default_rng(seed)
+    n = model.node_count
+    weights = model.sample_edge_weights(rng, draws).T  # Relationships x draws
+    sources, targets = model.edge_sources, model.edge_targets
+    to_targets = _incidence(targets, n)
+
+    out_weight = _incidence(sources, n) @ weights
+    dangling = out_weight == 0
+    share = np.divide(weights, out_weight[sources], out=np.zeros_like(weights),
+                      where=weights > 0)
+
+    scores = np.repeat(restart[:, None], draws, axis=1)
+    for _ in range(max_iter):
+        # Walk mass stuck on dangling nodes restarts at the seeds
+        stuck = np.where(dangling, scores, 0.0).sum(axis=0)
+        updated = (alpha * (to_targets @ (share * scores[sources]))
+                   + (1.0 - alpha + alpha * stuck) * restart[:, None])
+        change = np.abs(updated - scores).sum(axis=0).max(initial=0.0)
+        scores = updated
+        if change < tol:
+            break
+    else:
+        logger.warning("Impact propagation did not converge for every draw after %d "
+                       "iterations", max_iter)
+    return scores[columns].T
+
+
+def output_draws(
+    model: UncertaintyModel,
+    draws: int,
+    seed: np.random.SeedSequence,
+    demand: Optional[np.ndarray],
+    columns: np.ndarray,
+    flow_variability: float = 0.0,
+    batched_sector_limit: int = DEFAULT_BATCHED_SECTOR_LIMIT,
+) -> np.ndarray:
+    """Gross output of `columns` sectors meeting final demand, one row per draw.
+
+    `demand` is a fixed final-demand vector (or shock); None uses each
+    draw's own observed final demand.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(model.sector_ids)
+    flow_count = model.flow_amounts.size
+    if n == 0:
+        return np.zeros((draws, columns.size))
+    factor = sample_quantities(rng, draws, np.ones(flow_count),
+                               np.full(flow_count, flow_variability), model.flow_certainty)
+    amounts = factor * model.flow_amounts
+
+    from_sector = model.flow_sources >= 0
+    to_sector = model.flow_targets >= 0
+    gross = (_incidence(model.flow_sources[from_sector], n) @ amounts[:, from_sector].T).T
+    if demand is None:
+        final = from_sector & ~to_sector
+        rhs = (_incidence(model.flow_sources[final], n) @ amounts[:, final].T).T
+    else:
+        rhs = np.broadcast_to(demand, (draws, n))
+
+    # Technical coefficients of every intermediate delivery, per draw
+    intermediate = np.flatnonzero(from_sector & to_sector)
+    rows, cols = model.flow_sources[intermediate], model.flow_targets[intermediate]
+    fixed = model.flow_coefficients[intermediate]
+    is_fixed = ~np.isnan(fixed)
+    buyer_output = gross[:, cols]
+    coefficients = np.where(
+        is_fixed,
+        factor[:, intermediate] * np.where(is_fixed, fixed, 0.0),
+        np.divide(amounts[:, intermediate], buyer_output,
+                  out=np.zeros_like(buyer_output), where=buyer_output > 0),
+    )
+
+    if n <= batched_sector_limit:
+        system = np.broadcast_to(np.identity(n), (draws, n, n)).copy()
+        np.subtract.at(system, (np.arange(draws)[:, None], rows[None, :], cols[None, :]),
+                       coefficients)
+        try:
+            output = np.linalg.solve(system, rhs[..., None])[..., 0]
+        except np.linalg.LinAlgError as e:
+            raise ValueError("I - A is singular in at least one draw") from e
+    else:
+        identity = sparse.identity(n, format="csc")
+        output = np.empty((draws, n))
+        for draw in range(draws):
+            system = identity - sparse.csc_matrix(
+                (coefficients[draw], (rows, cols)), shape=(n, n)
+            )
+            output[draw] = sparse_linalg.splu(system).solve(np.asarray(rhs[draw]))
+    return output[:, columns]
+
+
+_KERNELS: Dict[str, Callable[..., np.ndarray]] = {
+    "propagation": propagate_draws, "input_output": output_draws
+}
+
+# Worker-process state, populated once per worker by the pool initializer
+_WORKER_MODEL: Optional[UncertaintyModel] = None
+
+
+def _init_worker(model: UncertaintyModel) -> None:
+    """Pool initializer: keep the shipped arrays for every chunk of the run."""
+    global _WORKER_MODEL  # pylint: disable=global-statement
+    _WORKER_MODEL = model
+
+
+def _worker_task(analysis: str, draws: int, seed: np.random.SeedSequence,
+                 options: Dict[str, Any]) -> np.ndarray:
+    """Run one chunk of draws inside a worker process."""
+    assert _WORKER_MODEL is not None
+    return _KERNELS[analysis](_WORKER_MODEL, draws, seed, **options)
+
+
+class UncertaintyAnalyzer:
+    """Monte Carlo percentile bands for impact propagation and input-output output.
+
+    The sampled arrays follow the graph version. Draws are split into
+    `chunk_size` chunks; with more than one worker (`max_workers` per call,
+    None for one per CPU) and at least `parallel_min_draws` draws the chunks
+    run in a process pool.
+    """
+
+    def __init__(
+        self,
+        graph: SFMGraph,
+        chunk_size: int = DEFAULT_DRAW_CHUNK_SIZE,
+        parallel_min_draws: int = DEFAULT_PARALLEL_MIN_DRAWS,
+        batched_sector_limit: int = DEFAULT_BATCHED_SECTOR_LIMIT,
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.graph = graph
+        self.chunk_size = chunk_size
+        self.parallel_min_draws = parallel_min_draws
+        self.batched_sector_limit = batched_sector_limit
+        self._model: Optional[UncertaintyModel] = None
+        self._built_version: Optional[int] = None
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the graph changed since the arrays were collected."""
+        return self._built_version != self.graph.graph_version
+
+    @property
+    def model(self) -> UncertaintyModel:
+        """Arrays of the current graph, recollected when the graph changes."""
+        if self._model is None or self.is_stale:
+            self._model = UncertaintyModel.from_graph(self.graph)
+            self._built_version = self.graph.graph_version
+        return self._model
+
+    # ─── ANALYSES ───
+
+    def propagate_impact(
+        self,
+        seeds: Seeds,
+        draws: int = DEFAULT_DRAWS,
+        seed: Optional[int] = None,
+        alpha: float = DEFAULT_DAMPING,
+        node_ids: Optional[Sequence[uuid.UUID]] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        max_workers: Optional[int] = 1,
+    ) -> UncertaintyBands:
+        """Percentile bands of random walk with restart scores from `seeds`.
+
+        Seeds are node IDs (equal restart weight) or a mapping of node ID to
+        restart weight; unknown seeds are ignored. Bands cover `node_ids`
+        (every node by default).
+        """
+        if not 0.0 <= alpha < 1.0:
+            raise ValueError(f"alpha must be in [0, 1), got {alpha}")
+        model = self.model
+        index = {node_id: i for i, node_id in enumerate(model.node_ids)}
+        restart = np.zeros(model.node_count)
+        weights = seeds if isinstance(seeds, Mapping) else {node_id: 1.0 for node_id in seeds}
+        for node_id, weight in weights.items():
+            if weight < 0:
+                raise ValueError("Seed weights must be non-negative")
+            if node_id in index:
+                restart[index[node_id]] += weight
+        if restart.sum() > 0:
+            restart /= restart.sum()
+
+        reported, columns = self._columns(model.node_ids, index, node_ids)
+        if restart.sum() == 0:
+            samples = np.zeros((self._check_draws(draws), columns.size))
+        else:
+            samples = self._run("propagation", draws, seed, {
+                "restart": restart, "columns": columns, "alpha": alpha,
+            }, max_workers)
+        return UncertaintyBands.from_samples(reported, samples, percentiles)
+
+    def output_response(
+        self,
+        final_demand: Optional[Mapping[uuid.UUID, float]] = None,
+        draws: int = DEFAULT_DRAWS,
+        seed: Optional[int] = None,
+        flow_variability: float = 0.0,
+        sector_ids: Optional[Sequence[uuid.UUID]] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        max_workers: Optional[int] = 1,
+    ) -> UncertaintyBands:
+        """Percentile bands of the gross output each process needs for `final_demand`.
+
+        `final_demand` maps Process IDs to final demand (a shock gives the
+        change in output); by default each draw's observed final demand is
+        used. `flow_variability` is the relative standard deviation of flow
+        quantities.
+        """
+        if flow_variability < 0:
+            raise ValueError(f"flow_variability must be non-negative, got {flow_variability}")
+        model = self.model
+        index = {sector_id: i for i, sector_id in enumerate(model.sector_ids)}
+        demand = None
+        if final_demand is not None:
+            demand = np.zeros(len(model.sector_ids))
+            for sector_id, amount in final_demand.items():
+                if sector_id in index:
+                    demand[index[sector_id]] += amount
+
+        reported, columns = self._columns(model.sector_ids, index, sector_ids)
+        samples = self._run("input_output", draws, seed, {
+            "demand": demand, "columns": columns, "flow_variability": flow_variability,
+            "batched_sector_limit": self.batched_sector_limit,
+        }, max_workers)
+        return UncertaintyBands.from_samples(reported, samples, percentiles)
+
+    # ─── EXECUTION ───
+
+    @staticmethod
+    def _check_draws(draws: int) -> int:
+        """Validate a draw count."""
+        if draws < 1:
+            raise ValueError(f"draws must be positive, got {draws}")
+        return draws
+
+    @staticmethod
+    def _columns(
+        all_ids: List[uuid.UUID], index: Dict[uuid.UUID, int],
+        requested: Optional[Sequence[uuid.UUID]],
+    ) -> Tuple[List[uuid.UUID], np.ndarray]:
+        """Reported IDs and their column indices; unknown IDs are skipped."""
+        if requested is None:
+            return list(all_ids), np.arange(len(all_ids), dtype=np.int64)
+        reported = [node_id for node_id in requested if node_id in index]
+        return reported, np.array([index[node_id] for node_id in reported], dtype=np.int64)
+
+    def _run(self, analysis: str, draws: int, seed: Optional[int],
+             options: Dict[str, Any], max_workers: Optional[int]) -> np.ndarray:
+        """Run `analysis` over every chunk of draws and stack the rows in draw order."""
+        draws = self._check_draws(draws)
+        max_workers = max_workers or os.cpu_count() or 1
+        model = self.model
+        sizes = [min(self.chunk_size, draws - start) for start in range(0, draws, self.chunk_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+        if (max_workers <= 1 or len(sizes) <= 1
+                or draws < self.parallel_min_draws):
+            chunks = [_KERNELS[analysis](model, size, chunk_seed, **options)
+                      for size, chunk_seed in zip(sizes, seeds)]
+        else:
+            workers = min(max_workers, len(sizes))
+            logger.debug("Sampling %d %s draws with %d workers", draws, analysis, workers)
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(model,)
+            ) as pool:
+                futures = [pool.submit(_worker_task, analysis, size, chunk_seed, options)
+                           for size, chunk_seed in zip(sizes, seeds)]
+                chunks = [future.result() for future in futures]
+        return np.vstack(chunks)
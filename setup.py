@@ -8,7 +8,7 @@ setup(
     author_email="your.email@example.com",
     packages=find_packages(),
     install_requires=[
-        "networkx",
+        "networkx>=3.1",
         # Add other dependencies here
     ],
     classifiers=[
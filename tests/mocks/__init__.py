@@ -7,7 +7,7 @@ for consistent mocking across all test modules.
 
 from .query_mocks import MockQueryEngineFactory, MockNetworkXFunctions
 from .dao_mocks import MockRepositoryFactory, MockStorageBackend
-from .shared_fixtures import create_mock_graph, create_sample_nodes
+from .shared_fixtures import create_mock_graph, create_random_graph, create_sample_nodes
 
 __all__ = [
     'MockQueryEngineFactory',
@@ -15,5 +15,6 @@ __all__ = [
     'MockRepositoryFactory',
     'MockStorageBackend',
     'create_mock_graph',
+    'create_random_graph',
     'create_sample_nodes'
 ]
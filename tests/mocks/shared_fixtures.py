@@ -12,8 +12,9 @@ Provides common test data, mock graph creation, and utility functions
 used across multiple test modules.
 """
 
+import random
 import uuid
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Type
 from datetime import datetime
 
 from core.sfm_models import (
@@ -40,6 +41,43 @@ def create_mock_graph() -> SFMGraph:
     return graph
 
 
+def create_random_graph(
+    node_count: int,
+    edge_count: int,
+    seed: int,
+    node_types: Sequence[Type[Node]] = (Actor, Institution, Policy),
+    kinds: Sequence[RelationshipKind] = (
+        RelationshipKind.AFFECTS, RelationshipKind.MONITORS, RelationshipKind.PAYS
+    ),
+    weights: Optional[Sequence[float]] = None,
+    certainties: Optional[Sequence[Optional[float]]] = None,
+) -> SFMGraph:
+    """Create a seeded random graph with parallel relationships and self-loops.
+
+    Node types cycle through `node_types`. Each relationship joins two nodes
+    drawn with replacement and picks its kind from `kinds`, its weight from
+    `weights` and its certainty from `certainties` (model defaults when None).
+    """
+    rng = random.Random(seed)
+    graph = SFMGraph()
+    nodes = []
+    for i in range(node_count):
+        node_type = node_types[i % len(node_types)]
+        nodes.append(graph.add_node(node_type(label=f"{node_type.__name__} {i}")))
+    for _ in range(edge_count):
+        fields: Dict[str, Any] = {
+            "source_id": rng.choice(nodes).id,
+            "target_id": rng.choice(nodes).id,
+            "kind": rng.choice(kinds),
+        }
+        if weights is not None:
+            fields["weight"] = rng.choice(weights)
+        if certainties is not None:
+            fields["certainty"] = rng.choice(certainties)
+        graph.add_relationship(Relationship(**fields))
+    return graph
+
+
 def create_sample_nodes() -> List[Node]:
     """Create a set of sample nodes for testing."""
     nodes = []
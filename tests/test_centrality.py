@@ -0,0 +1,98 @@
+"""
+Tests for the version-keyed centrality store.
+"""
+
+import unittest
+import uuid
+
+from core.centrality import (
+    CentralityStore,
+    SUPPORTED_CENTRALITY_TYPES,
+    betweenness_error_bound,
+)
+
+
+class TestCentralityStore(unittest.TestCase):
+    """Test memoization behaviour of CentralityStore."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.store = CentralityStore()
+        self.node_id = uuid.uuid4()
+        self.calls = 0
+
+    def _compute(self):
+        self.calls += 1
+        return {self.node_id: float(self.calls)}
+
+    def test_computes_once_per_version(self):
+        """Test repeated lookups for the same version reuse the first result."""
+        first = self.store.get_or_compute(1, "betweenness", self._compute)
+        second = self.store.get_or_compute(1, "betweenness", self._compute)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.calls, 1)
+        stats = self.store.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_new_version_drops_old_results(self):
+        """Test a newer graph version forces recomputation."""
+        self.store.get_or_compute(1, "betweenness", self._compute)
+        self.store.get_or_compute(1, "closeness", self._compute)
+        result = self.store.get_or_compute(2, "betweenness", self._compute)
+
+        self.assertEqual(result[self.node_id], 3.0)
+        self.assertEqual(self.store.get_stats()["entries"], 1)
+        self.assertEqual(self.store.get_stats()["invalidations"], 1)
+
+    def test_parameters_are_part_of_the_key(self):
+        """Test different parameters are stored separately."""
+        self.store.get_or_compute(1, "betweenness", self._compute, {"k": 10})
+        self.store.get_or_compute(1, "betweenness", self._compute, {"k": 20})
+        self.store.get_or_compute(1, "betweenness", self._compute, {"k": 10})
+
+        self.assertEqual(self.calls, 2)
+
+    def test_invalidate(self):
+        """Test explicit invalidation clears all results."""
+        self.store.get_or_compute(1, "degree", self._compute)
+        self.store.invalidate()
+        self.store.get_or_compute(1, "degree", self._compute)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_supported_types(self):
+        """Test the supported centrality types are exposed."""
+        self.assertIn("betweenness", SUPPORTED_CENTRALITY_TYPES)
+        self.assertIn("eigenvector", SUPPORTED_CENTRALITY_TYPES)
+
+
+
+class TestBetweennessErrorBound(unittest.TestCase):
+    """Test the sampled betweenness error estimate."""
+
+    def test_exact_when_all_nodes_sampled(self):
+        """Test no error is reported when every node is a pivot."""
+        self.assertEqual(betweenness_error_bound(100, 100), 0.0)
+        self.assertEqual(betweenness_error_bound(100, 500), 0.0)
+
+    def test_error_shrinks_with_sample_size(self):
+        """Test the bound decreases as more pivots are sampled."""
+        small = betweenness_error_bound(20000, 100)
+        large = betweenness_error_bound(20000, 1600)
+
+        self.assertGreater(small, large)
+        self.assertAlmostEqual(small / large, 4.0, places=6)
+        self.assertLess(large, 0.05)
+
+    def test_higher_confidence_widens_bound(self):
+        """Test a stricter confidence level gives a larger bound."""
+        self.assertGreater(
+            betweenness_error_bound(1000, 100, confidence=0.99),
+            betweenness_error_bound(1000, 100, confidence=0.9),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
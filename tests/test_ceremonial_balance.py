@@ -0,0 +1,200 @@
+"""
+Tests for ceremonial/instrumental balance scoring.
+"""
+
+import random
+import unittest
+
+import numpy as np
+
+from core.sfm_enums import InstitutionLayer, RelationshipKind
+from core.sfm_models import (
+    Actor,
+    CeremonialBehavior,
+    Flow,
+    Institution,
+    InstrumentalBehavior,
+    Relationship,
+    SFMGraph,
+)
+from core.ceremonial_balance import (
+    CEREMONIAL_TENDENCY,
+    KIND_CODES,
+    BalanceScore,
+    CeremonialBalance,
+    node_tendency,
+    relationship_mass,
+)
+
+# Kinds Institution -> Institution relationships may use
+PEER_KINDS = (RelationshipKind.LEGITIMIZES, RelationshipKind.GOVERNS, RelationshipKind.ADVISES,
+              RelationshipKind.FUNDS, RelationshipKind.AFFECTS)
+
+
+class TestScoringRules(unittest.TestCase):
+    """Test the per-kind lookup and the relationship and node evidence rules."""
+
+    def test_tendency_lookup(self):
+        """Test the lookup array agrees with RelationshipKind.ceremonial_tendency."""
+        for kind in RelationshipKind:
+            self.assertEqual(CEREMONIAL_TENDENCY[KIND_CODES[kind]], kind.ceremonial_tendency)
+
+    def test_relationship_mass(self):
+        """Test unset weights count once and certainty scales the mass."""
+        self.assertEqual(relationship_mass(0.0, 1.0), 1.0)
+        self.assertEqual(relationship_mass(-2.0, 0.5), 1.0)
+        self.assertEqual(relationship_mass(3.0, None), 3.0)
+
+    def test_node_tendency(self):
+        """Test behavioral nodes and flows report their own tendency."""
+        ceremonial = CeremonialBehavior(label="Ritual", rigidity_level=0.8,
+                                        tradition_strength=0.6)
+        instrumental = InstrumentalBehavior(label="Repair", efficiency_measure=0.9)
+        flow = Flow(label="Tribute", ceremonial_component=3.0, instrumental_component=1.0)
+
+        self.assertAlmostEqual(node_tendency(ceremonial), 0.7)
+        self.assertAlmostEqual(node_tendency(instrumental), 0.1)
+        self.assertAlmostEqual(node_tendency(flow), 0.75)
+        self.assertTrue(np.isnan(node_tendency(Actor(label="Plain"))))
+        self.assertTrue(np.isnan(node_tendency(CeremonialBehavior(label="Unscored"))))
+
+    def test_balance_score(self):
+        """Test the ceremonial share, neutral without evidence."""
+        self.assertEqual(BalanceScore(3.0, 1.0).score, 0.75)
+        self.assertEqual(BalanceScore(0.0, 0.0).score, 0.5)
+        self.assertEqual(BalanceScore(1.0, 1.0).to_dict(),
+                         {"ceremonial": 1.0, "instrumental": 1.0, "score": 0.5})
+
+
+class TestCeremonialBalance(unittest.TestCase):
+    """Test aggregation and incremental refresh against full rebuilds."""
+
+    def setUp(self):
+        """Set up institutions across layers with random peer relationships."""
+        self.graph = SFMGraph()
+        layers = list(InstitutionLayer)
+        self.institutions = [Institution(label=f"Institution {i}", layer=layers[i % 3])
+                             for i in range(30)]
+        for node in self.institutions:
+            self.graph.add_node(node)
+        self.rng = random.Random(5)
+        for _ in range(120):
+            self._add_random_relationship()
+        self.balance = CeremonialBalance(self.graph)
+
+    def _add_random_relationship(self) -> Relationship:
+        """Add a relationship of a random peer kind between two institutions."""
+        source, target = self.rng.sample(self.institutions, 2)
+        rel = Relationship(source.id, target.id, self.rng.choice(PEER_KINDS),
+                           weight=self.rng.uniform(0.5, 2.0), certainty=self.rng.uniform(0.5, 1.0))
+        self.graph.add_relationship(rel)
+        return rel
+
+    def _assert_matches_rebuild(self):
+        """Assert incremental masses equal a fresh build."""
+        fresh = CeremonialBalance(self.graph)
+        self.assertAlmostEqual(self.balance.graph_balance().score, fresh.graph_balance().score)
+        self.assertFalse(self.balance.is_stale)
+        expected = fresh.node_scores()
+        actual = self.balance.node_scores()
+        self.assertEqual(set(actual), set(expected))
+        for node_id, score in expected.items():
+            self.assertAlmostEqual(actual[node_id], score)
+
+    def test_graph_balance_counts_each_relationship_once(self):
+        """Test the graph score is the mass-weighted mean tendency of all relationships."""
+        rels = list(self.graph.relationships.values())
+        mass = np.array([relationship_mass(rel.weight, rel.certainty) for rel in rels])
+        tendency = np.array([rel.kind.ceremonial_tendency for rel in rels])
+
+        balance = self.balance.graph_balance()
+
+        self.assertAlmostEqual(balance.score, (mass * tendency).sum() / mass.sum())
+        self.assertAlmostEqual(balance.total, mass.sum())
+
+    def test_node_and_layer_balance(self):
+        """Test node balances sum incident relationships and layers sum their members."""
+        node = self.institutions[0]
+        incident = [rel for rel in self.graph.relationships.values()
+                    if node.id in (rel.source_id, rel.target_id)]
+        ceremonial = sum(relationship_mass(rel.weight, rel.certainty)
+                         * rel.kind.ceremonial_tendency for rel in incident)
+
+        self.assertAlmostEqual(self.balance.node_balance(node.id).ceremonial, ceremonial)
+        layers = self.balance.layer_balance()
+        self.assertEqual(set(layers), set(list(InstitutionLayer)[:3]))
+        nodes = self.balance.node_balances()
+        members = [inst.id for inst in self.institutions if inst.layer == node.layer]
+        self.assertAlmostEqual(layers[node.layer].total,
+                               sum(nodes[member].total for member in members if member in nodes))
+
+    def test_group_balance(self):
+        """Test arbitrary labels, e.g. communities, aggregate their members."""
+        labels = {inst.id: i % 2 for i, inst in enumerate(self.institutions)}
+        groups = self.balance.group_balance(labels)
+        nodes = self.balance.node_balances()
+
+        self.assertEqual(set(groups), {0, 1})
+        self.assertAlmostEqual(
+            groups[0].ceremonial,
+            sum(nodes[node_id].ceremonial for node_id, label in labels.items()
+                if label == 0 and node_id in nodes),
+        )
+
+    def test_incremental_refresh(self):
+        """Test added and removed relationships and nodes update masses in place."""
+        self.balance.graph_balance()
+        for rel in list(self.graph.relationships.values())[:20]:
+            self.graph.remove_relationship(rel.id)
+        for _ in range(20):
+            self._add_random_relationship()
+        self.graph.remove_node(self.institutions[3].id)
+        behavior = CeremonialBehavior(label="Ritual", rigidity_level=0.9)
+        self.graph.add_node(behavior)
+        self.graph.add_relationship(Relationship(behavior.id, self.institutions[4].id,
+                                                 RelationshipKind.LEGITIMIZES))
+
+        self._assert_matches_rebuild()
+        self.assertIsNone(self.balance.node_balance(self.institutions[3].id))
+        self.assertAlmostEqual(self.balance.node_balance(behavior.id).ceremonial, 0.9 + 0.85)
+
+    def test_missed_mutation_rebuilds(self):
+        """Test direct writes to the relationships dict trigger a full rebuild."""
+        self.balance.graph_balance()
+        source, target = self.institutions[:2]
+        rel = Relationship(source.id, target.id, RelationshipKind.GOVERNS, weight=4.0)
+        self.graph.relationships[rel.id] = rel
+
+        self.assertTrue(self.balance.is_stale)
+        self._assert_matches_rebuild()
+
+    def test_relationships_to_unloaded_nodes(self):
+        """Test endpoints evicted from memory or never loaded still get a slot."""
+        outsider = Institution(label="Outsider")
+        dangling = Relationship(self.institutions[0].id, outsider.id, RelationshipKind.GOVERNS)
+        self.graph.add_relationship(dangling)
+        self.graph.remove_node_from_memory(self.institutions[1].id)
+
+        fresh = CeremonialBalance(self.graph)
+        self.assertAlmostEqual(fresh.node_balance(outsider.id).ceremonial, 0.75)
+        self.assertIn(self.institutions[1].id, fresh.node_scores())
+        self.balance.graph_balance()
+        self.graph.add_relationship(Relationship(outsider.id, self.institutions[2].id,
+                                                 RelationshipKind.ADVISES))
+        self._assert_matches_rebuild()
+
+    def test_node_evidence_weight(self):
+        """Test own scores can be weighted or ignored."""
+        behavior = InstrumentalBehavior(label="Repair", adaptability_score=1.0)
+        self.graph.add_node(behavior)
+
+        self.assertEqual(CeremonialBalance(self.graph, node_evidence_weight=2.0)
+                         .node_balance(behavior.id).instrumental, 2.0)
+        self.assertIsNone(CeremonialBalance(self.graph, node_evidence_weight=0.0)
+                          .node_scores().get(behavior.id))
+        with self.assertRaises(ValueError):
+            CeremonialBalance(self.graph, node_evidence_weight=-1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests for incremental community detection.
+"""
+
+import unittest
+
+import networkx as nx
+
+from core.communities import CommunityTracker, undirected_weights
+
+
+def _two_cliques() -> nx.MultiDiGraph:
+    """Two 5-cliques joined by a single edge."""
+    graph = nx.MultiDiGraph()
+    for offset in (0, 5):
+        for i in range(offset, offset + 5):
+            for j in range(i + 1, offset + 5):
+                graph.add_edge(i, j, weight=1.0)
+    graph.add_edge(4, 5, weight=1.0)
+    return graph
+
+
+class TestCommunityTracker(unittest.TestCase):
+    """Test caching, warm-started updates and full recomputation."""
+
+    def setUp(self):
+        """Set up a tracker with a computed baseline partition."""
+        self.graph = _two_cliques()
+        # Small graph: let updates touch any share of it without a full run
+        self.tracker = CommunityTracker(seed=7, full_recompute_fraction=1.0)
+        self.labels = dict(self.tracker.partition(self.graph, 1))
+
+    def _apply(self, version, nodes, change):
+        """Mutate the graph and report the change like an engine does."""
+        change()
+        self.tracker.record_change(version, nodes)
+        return self.tracker.partition(self.graph, version)
+
+    def test_baseline_and_cache(self):
+        """Test the first call runs Louvain and repeated calls reuse it."""
+        self.assertEqual(self.tracker.last_update, "full")
+        self.assertEqual(len(set(self.labels.values())), 2)
+        self.assertEqual(len({self.labels[i] for i in range(5)}), 1)
+
+        cached = self.tracker.partition(self.graph, 1)
+
+        self.assertEqual(self.tracker.last_update, "cached")
+        self.assertEqual(dict(cached), self.labels)
+        with self.assertRaises(TypeError):
+            cached[0] = -1  # type: ignore[index]
+
+    def test_new_node_joins_neighbor_community(self):
+        """Test a node attached to one clique is moved into it, labels kept."""
+        def attach():
+            for neighbor in (6, 7, 8):
+                self.graph.add_edge(10, neighbor, weight=1.0)
+
+        labels = self._apply(2, [10, 6, 7, 8], attach)
+
+        self.assertEqual(self.tracker.last_update, "incremental")
+        self.assertEqual(labels[10], self.labels[6])
+        self.assertEqual({node: labels[node] for node in range(10)}, self.labels)
+
+    def test_disconnected_community_is_split(self):
+        """Test removing the edges holding a community together splits it."""
+        def cut():
+            for i in range(1, 5):
+                self.graph.remove_edges_from([(0, i), (i, 0)])
+
+        labels = self._apply(2, [0, 1, 2, 3, 4], cut)
+
+        self.assertNotEqual(labels[0], labels[1])
+        self.assertEqual(labels[1], self.labels[1])
+        self.assertEqual(labels[7], self.labels[7])
+
+    def test_incremental_matches_modularity_of_fresh_run(self):
+        """Test warm-started updates keep the quality of a full run."""
+        graph = nx.MultiDiGraph(nx.planted_partition_graph(4, 15, 0.5, 0.02, seed=3))
+        tracker = CommunityTracker(seed=3, full_recompute_fraction=1.0)
+        tracker.partition(graph, 1)
+        for version, (u, v) in enumerate([(0, 1), (20, 21), (40, 59)], start=2):
+            graph.add_edge(u, v, weight=1.0)
+            tracker.record_change(version, [u, v])
+        labels = tracker.partition(graph, 4)
+
+        communities = {}
+        for node, label in labels.items():
+            communities.setdefault(label, set()).add(node)
+        undirected = graph.to_undirected()
+        fresh = nx.algorithms.community.louvain_communities(undirected, seed=3)
+
+        self.assertEqual(tracker.last_update, "incremental")
+        self.assertGreaterEqual(
+            nx.algorithms.community.modularity(undirected, communities.values()),
+            nx.algorithms.community.modularity(undirected, fresh) - 0.02,
+        )
+
+    def test_full_recompute_when_changes_missed_or_large(self):
+        """Test gaps in the recorded versions and large changes fall back to Louvain."""
+        self.graph.add_edge(0, 9, weight=1.0)
+        self.tracker.record_change(3, [0, 9])  # Version 2 was never reported
+        self.tracker.partition(self.graph, 3)
+        self.assertEqual(self.tracker.last_update, "full")
+
+        self.tracker.full_recompute_fraction = 0.3
+        self._apply(4, [1, 8], lambda: self.graph.add_edge(1, 8, weight=1.0))
+        self.assertEqual(self.tracker.last_update, "full")
+
+    def test_undirected_weights(self):
+        """Test both directions and parallel edges add up."""
+        graph = nx.MultiDiGraph([(0, 1, {"weight": 2.0}), (1, 0, {"weight": 1.0}),
+                                 (0, 1, {"weight": 0.5})])
+        weights = undirected_weights(graph, [0, 1]).toarray()
+
+        self.assertEqual(weights.tolist(), [[0.0, 3.5], [3.5, 0.0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
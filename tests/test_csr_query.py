@@ -0,0 +1,263 @@
+"""
+Tests for the CSR/NumPy query engine backend.
+"""
+
+import inspect
+import unittest
+import uuid
+
+import networkx as nx
+
+from core.sfm_models import Actor, Institution, Policy, Resource, Relationship, SFMGraph
+from core.sfm_enums import RelationshipKind
+from core.sfm_query import NetworkXSFMQueryEngine, SFMQueryEngine
+from core.csr_query import CSRSFMQueryEngine, RELATIONSHIP_KIND_CODES
+from tests.mocks import create_random_graph
+
+
+def _random_graph(node_count: int, edge_count: int) -> SFMGraph:
+    """Random graph of four node types with mixed kinds and weights."""
+    return create_random_graph(
+        node_count, edge_count, seed=11,
+        node_types=(Actor, Institution, Resource, Policy),
+        kinds=(RelationshipKind.MONITORS, RelationshipKind.PAYS, RelationshipKind.AFFECTS),
+        weights=(0.0, 0.5, 2.0),
+    )
+
+
+class TestCSRSFMQueryEngine(unittest.TestCase):
+    """Compare the CSR engine against the NetworkX reference engine."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.graph = _random_graph(60, 220)
+        self.engine = CSRSFMQueryEngine(self.graph)
+        self.reference = NetworkXSFMQueryEngine(self.graph)
+        self.node_ids = [node.id for node in self.graph]
+
+    def test_memory_is_13_bytes_per_edge(self):
+        """Test edges are stored as int32 target, float64 weight and uint8 kind."""
+        usage = self.engine.get_memory_usage()
+
+        self.assertEqual(usage["edges"], len(self.graph.relationships))
+        self.assertEqual(usage["bytes_per_edge"], 13)
+        self.assertLess(max(RELATIONSHIP_KIND_CODES.values()), 255)
+
+    def test_neighbors_match_networkx(self):
+        """Test direct, multi-hop and kind-filtered neighbors."""
+        for node_id in self.node_ids[:15]:
+            for distance in (1, 2, 3):
+                self.assertCountEqual(
+                    self.engine.get_node_neighbors(node_id, distance=distance),
+                    self.reference.get_node_neighbors(node_id, distance=distance),
+                )
+            kinds = [RelationshipKind.MONITORS]
+            self.assertCountEqual(
+                self.engine.get_node_neighbors(node_id, kinds, distance=2),
+                self.reference.get_node_neighbors(node_id, kinds, distance=2),
+            )
+
+    def test_traverse_matches_networkx(self):
+        """Test bounded traversal distances."""
+        kinds = [RelationshipKind.MONITORS, RelationshipKind.PAYS]
+        for node_id in self.node_ids[:10]:
+            self.assertEqual(
+                self.engine.traverse(node_id, 3, kinds).distances,
+                {
+                    key: value for key, value in sorted(
+                        self.reference.traverse(node_id, 3, kinds).distances.items(),
+                        key=lambda item: (item[1], self.engine.node_index[item[0]]),
+                    )
+                },
+            )
+
+    def test_shortest_paths_match_networkx(self):
+        """Test shortest path lengths and path validity."""
+        for source_id in self.node_ids[:10]:
+            for target_id in self.node_ids[-10:]:
+                path = self.engine.find_shortest_path(source_id, target_id)
+                expected = self.reference.find_shortest_path(source_id, target_id)
+                self.assertEqual(path is None, expected is None)
+                if path is None:
+                    continue
+                self.assertEqual(len(path), len(expected))
+                self.assertEqual((path[0], path[-1]), (source_id, target_id))
+                for u, v in zip(path, path[1:]):
+                    self.assertIn(v, self.engine.get_node_neighbors(u))
+
+    def test_bulk_paths_match_networkx(self):
+        """Test bulk path lengths against the NetworkX engine."""
+        pairs = [(s, t) for s in self.node_ids[:5] for t in self.node_ids[-10:]]
+        kinds = [RelationshipKind.MONITORS, RelationshipKind.PAYS]
+        paths = self.engine.find_shortest_paths_bulk(pairs, kinds)
+        expected = self.reference.find_shortest_paths_bulk(pairs, kinds)
+
+        for pair in pairs:
+            self.assertEqual(
+                len(paths[pair]) if paths[pair] else None,
+                len(expected[pair]) if expected[pair] else None,
+            )
+
+    def test_reachability_matches_networkx(self):
+        """Test reachability with and without kind filters on both engines."""
+        for kinds in (None, [RelationshipKind.AFFECTS],
+                      [RelationshipKind.PAYS, RelationshipKind.MONITORS]):
+            for source_id in self.node_ids[:15]:
+                for target_id in self.node_ids:
+                    self.assertEqual(
+                        self.engine.can_reach(source_id, target_id, kinds),
+                        self.reference.can_reach(source_id, target_id, kinds),
+                    )
+        # Filtered builds must leave the CSR arrays intact
+        self.test_neighbors_match_networkx()
+        self.assertIs(self.engine.reachability_index(), self.engine.reachability_index())
+        self.assertEqual(self.engine._centrality_store.get_stats()["entries"], 0)
+
+    def test_flow_efficiency_matrix_matches_networkx(self):
+        """Test landmark efficiency estimates and exact matrices on both engines."""
+        for strategy in ("degree", "betweenness"):
+            for exact in (False, True):
+                matrix = self.engine.calculate_flow_efficiency_matrix(
+                    exact=exact, landmarks=4, strategy=strategy
+                )
+                expected = self.reference.calculate_flow_efficiency_matrix(
+                    exact=exact, landmarks=4, strategy=strategy
+                )
+                self.assertEqual(matrix.source_ids, expected.source_ids)
+                self.assertEqual(matrix.efficiency.tolist(), expected.efficiency.tolist())
+        oracle = self.engine.distance_oracle(landmarks=4)
+        self.assertIs(self.engine.distance_oracle(landmarks=4), oracle)
+        # Only the betweenness scores behind the landmark choice are centrality results
+        self.assertEqual(self.engine._centrality_store.get_stats()["entries"], 1)
+
+    def test_flow_efficiency_matches_networkx(self):
+        """Test single-pair efficiency agrees with the NetworkX engine and exact matrices."""
+        matrix = self.engine.calculate_flow_efficiency_matrix(exact=True)
+        for i, source_id in enumerate(self.node_ids[:10]):
+            for target_id in self.node_ids + [uuid.uuid4()]:
+                efficiency = self.engine.calculate_flow_efficiency(source_id, target_id)
+                self.assertEqual(
+                    efficiency, self.reference.calculate_flow_efficiency(source_id, target_id)
+                )
+                if target_id in self.engine.node_index:
+                    j = matrix.target_ids.index(target_id)
+                    row = matrix.source_ids.index(source_id)
+                    self.assertAlmostEqual(efficiency, matrix.efficiency[row, j])
+
+    def test_weighted_paths_match_networkx(self):
+        """Test weighted path search gives the same path as the NetworkX engine."""
+        source_id, target_id = self.node_ids[0], self.node_ids[-1]
+        for cost in ("weight", "certainty"):
+            self.assertEqual(
+                self.engine.find_shortest_path(source_id, target_id, cost=cost),
+                self.reference.find_shortest_path(source_id, target_id, cost=cost),
+            )
+
+    def test_centralities_match_networkx(self):
+        """Test degree, eigenvector, closeness and betweenness scores."""
+        scores = self.engine.get_all_centralities()
+        expected = self.reference.get_all_centralities(["betweenness", "closeness", "degree"])
+        # Eigenvector centrality is undefined for multigraphs in NetworkX; the CSR
+        # engine collapses parallel edges, which is what the simple digraph does
+        expected["eigenvector"] = nx.eigenvector_centrality(
+            nx.DiGraph(self.reference.nx_graph), max_iter=1000
+        )
+
+        for centrality_type in ("betweenness", "closeness", "degree", "eigenvector"):
+            for node_id in self.node_ids:
+                self.assertAlmostEqual(
+                    scores[centrality_type][node_id],
+                    expected[centrality_type][node_id],
+                    places=6,
+                    msg=centrality_type,
+                )
+
+    def test_pagerank_is_a_distribution(self):
+        """Test weighted PageRank sums to one and is memoized."""
+        pagerank = self.engine.get_pagerank()
+
+        self.assertAlmostEqual(sum(pagerank.values()), 1.0, places=6)
+        self.assertIs(self.engine.get_pagerank(), pagerank)
+
+    def test_structural_metrics_match_networkx(self):
+        """Test density, relationship strength and policy impact."""
+        self.assertAlmostEqual(
+            self.engine.get_network_density(), self.reference.get_network_density()
+        )
+        for rel in list(self.graph.relationships.values())[:20]:
+            self.assertAlmostEqual(
+                self.engine.get_relationship_strength(rel.source_id, rel.target_id),
+                self.reference.get_relationship_strength(rel.source_id, rel.target_id),
+            )
+
+        policy_id = self.node_ids[3]
+        impact = self.engine.analyze_policy_impact(policy_id, impact_radius=2)
+        expected = self.reference.analyze_policy_impact(policy_id, impact_radius=2)
+        self.assertEqual(impact["total_affected_nodes"], expected["total_affected_nodes"])
+        self.assertCountEqual(impact["affected_actors"], expected["affected_actors"])
+        for metric in ("density", "centrality"):
+            self.assertAlmostEqual(
+                impact["network_metrics"][metric], expected["network_metrics"][metric]
+            )
+
+    def test_flow_inefficiencies_match_networkx(self):
+        """Test redundant paths and degree imbalances."""
+        report = self.engine.identify_flow_inefficiencies(top_k=25)
+        expected = self.reference.identify_flow_inefficiencies(top_k=25)
+
+        self.assertEqual(
+            [entry["path_count"] for entry in report["redundant_paths"]],
+            [entry["path_count"] for entry in expected["redundant_paths"]],
+        )
+        self.assertCountEqual(report["flow_imbalances"], expected["flow_imbalances"])
+
+    def test_batch_policy_impact_matches_networkx(self):
+        """Test the batch policy analysis on both engines."""
+        batch = self.engine.analyze_policy_impacts(impact_radius=2)
+        expected = self.reference.analyze_policy_impacts(impact_radius=2)
+
+        self.assertEqual(list(batch["impacts"]), list(self.graph.policies))
+        for policy_id, impact in batch["impacts"].items():
+            single = self.reference.analyze_policy_impact(policy_id, impact_radius=2)
+            self.assertEqual(impact["total_affected_nodes"], single["total_affected_nodes"])
+            self.assertCountEqual(impact["affected_resources"], single["affected_resources"])
+            self.assertAlmostEqual(impact["network_metrics"]["density"],
+                                   single["network_metrics"]["density"])
+        self.assertEqual(batch["overlaps"], expected["overlaps"])
+
+    def test_rebuilds_after_graph_mutation(self):
+        """Test the arrays follow the graph version."""
+        source_id, target_id = self.node_ids[0], self.node_ids[1]
+        self.graph.add_relationship(
+            Relationship(source_id=source_id, target_id=target_id, kind=RelationshipKind.ENACTS)
+        )
+
+        self.assertTrue(self.engine.is_stale)
+        self.assertIn(target_id, self.engine.get_node_neighbors(source_id))
+        self.assertFalse(self.engine.is_stale)
+
+    def test_delegated_analysis(self):
+        """Test analyses without an array form use the NetworkX engine."""
+        graph = _random_graph(6, 8)
+        engine = CSRSFMQueryEngine(graph)
+
+        self.assertEqual(
+            engine.find_cycles(max_length=4),
+            NetworkXSFMQueryEngine(graph).find_cycles(max_length=4),
+        )
+        self.assertIsInstance(engine.networkx_engine, NetworkXSFMQueryEngine)
+
+
+    def test_signatures_match_networkx(self):
+        """Test every query method takes the same parameters and defaults as NetworkX."""
+        for name in sorted(SFMQueryEngine.__abstractmethods__):
+            with self.subTest(method=name):
+                csr = inspect.signature(getattr(CSRSFMQueryEngine, name)).parameters
+                reference = inspect.signature(getattr(NetworkXSFMQueryEngine, name)).parameters
+                self.assertEqual(
+                    [(p.name, p.default) for p in csr.values()],
+                    [(p.name, p.default) for p in reference.values()],
+                )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests for bounded cycle enumeration.
+"""
+
+import itertools
+import unittest
+from unittest.mock import patch
+
+import networkx as nx
+
+from core.cycles import BoundedCycleSearch, CycleList, cyclic_nodes
+
+
+class TestCyclicNodes(unittest.TestCase):
+    """Test the strongly connected component pre-filter."""
+
+    def test_only_nodes_on_cycles_are_kept(self):
+        """Test acyclic nodes are dropped and self-loops are kept."""
+        graph = nx.DiGraph([(1, 2), (2, 3), (3, 1), (3, 4), (5, 5), (6, 7)])
+
+        self.assertEqual(cyclic_nodes(graph), {1, 2, 3, 5})
+
+    def test_acyclic_graph(self):
+        """Test a DAG has no cyclic nodes."""
+        self.assertEqual(cyclic_nodes(nx.DiGraph([(1, 2), (2, 3), (1, 3)])), set())
+
+
+class TestBoundedCycleSearch(unittest.TestCase):
+    """Test length, count and time caps."""
+
+    def setUp(self):
+        """Set up a complete digraph, which has exponentially many cycles."""
+        self.dense = nx.complete_graph(30, create_using=nx.DiGraph)
+
+    def test_length_bound_applied_during_search(self):
+        """Test only short cycles are enumerated on a dense graph."""
+        search = BoundedCycleSearch(self.dense, max_length=3, max_cycles=None, time_limit=None)
+        cycles = list(search)
+
+        # 2-cycles: C(30, 2); 3-cycles: 2 * C(30, 3)
+        self.assertEqual(len(cycles), 435 + 2 * 4060)
+        self.assertTrue(all(len(cycle) <= 3 for cycle in cycles))
+        self.assertFalse(search.truncated)
+
+    def test_min_length(self):
+        """Test shorter cycles are skipped."""
+        cycles = list(BoundedCycleSearch(self.dense, max_length=3, max_cycles=None,
+                                         time_limit=None, min_length=3))
+
+        self.assertEqual(len(cycles), 2 * 4060)
+
+    def test_max_cycles_cap(self):
+        """Test enumeration stops at the cycle cap."""
+        search = BoundedCycleSearch(self.dense, max_length=10, max_cycles=25)
+        cycles = list(search)
+
+        self.assertEqual(len(cycles), 25)
+        self.assertTrue(search.truncated)
+        self.assertEqual(search.truncation_reason, "max_cycles")
+
+    def test_time_limit_cap(self):
+        """Test enumeration stops once the time limit has passed."""
+        # Start, then two expansions (each closing a 2-cycle) before the deadline
+        with patch("core.cycles.time.monotonic", side_effect=[0.0, 0.5, 0.5, 2.0]):
+            search = BoundedCycleSearch(self.dense, max_length=10, max_cycles=None,
+                                        time_limit=1.0)
+            cycles = list(search)
+
+        self.assertEqual(cycles, [[0, 1]])
+        self.assertEqual(search.truncation_reason, "time_limit")
+
+    def test_time_limit_checked_between_cycles(self):
+        """Test the deadline stops a search that has not found a cycle yet."""
+        ring = nx.cycle_graph(50, create_using=nx.DiGraph)
+        clock = itertools.chain([0.0], itertools.repeat(0.5, 10), itertools.repeat(2.0))
+        with patch("core.cycles.time.monotonic", side_effect=clock):
+            search = BoundedCycleSearch(ring, max_length=None, max_cycles=None,
+                                        time_limit=1.0)
+            cycles = list(search)
+
+        self.assertEqual(cycles, [])
+        self.assertTrue(search.truncated)
+        self.assertEqual(search.truncation_reason, "time_limit")
+
+    def test_matches_networkx_simple_cycles(self):
+        """Test each bounded simple cycle is found exactly once."""
+        graph = nx.gnp_random_graph(14, 0.25, seed=7, directed=True)
+        graph.add_edge(3, 3)
+
+        def canonical(cycle):
+            start = cycle.index(min(cycle))
+            return tuple(cycle[start:] + cycle[:start])
+
+        for max_length in (None, 2, 4):
+            expected = sorted(map(canonical, nx.simple_cycles(graph, length_bound=max_length)))
+            found = sorted(map(canonical, BoundedCycleSearch(
+                graph, max_length=max_length, max_cycles=None, time_limit=None
+            )))
+            self.assertEqual(found, expected)
+
+    def test_collect_keeps_truncation(self):
+        """Test collected cycles carry the status of the search that produced them."""
+        cycles = BoundedCycleSearch(self.dense, max_length=10, max_cycles=5).collect()
+        complete = BoundedCycleSearch(self.dense, max_length=2, max_cycles=None).collect()
+
+        self.assertIsInstance(cycles, CycleList)
+        self.assertEqual(len(cycles), 5)
+        self.assertTrue(cycles.truncated)
+        self.assertEqual(cycles.truncation_reason, "max_cycles")
+        self.assertEqual(len(complete), 435)
+        self.assertFalse(complete.truncated)
+        self.assertIsNone(complete.truncation_reason)
+
+    def test_is_lazy(self):
+        """Test cycles are produced one at a time."""
+        search = iter(BoundedCycleSearch(self.dense, max_length=30, max_cycles=None,
+                                         time_limit=None))
+
+        self.assertIsInstance(next(search), list)
+
+    def test_invalid_length(self):
+        """Test a non-positive length bound is rejected."""
+        with self.assertRaises(ValueError):
+            BoundedCycleSearch(self.dense, max_length=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+"""
+Tests for the social fabric delivery-matrix view.
+"""
+
+import random
+import unittest
+import uuid
+
+import numpy as np
+
+from core.sfm_enums import RelationshipKind
+from core.sfm_models import Actor, Institution, Policy, Relationship, SFMGraph
+from core.delivery_matrix import DeliveryMatrix
+
+KINDS = (RelationshipKind.AFFECTS, RelationshipKind.FUNDS, RelationshipKind.REGULATES)
+
+
+def _scan(graph: SFMGraph, kind=None):
+    """Summed weight per (source, target) from a scan over every relationship."""
+    cells = {}
+    for rel in graph.relationships.values():
+        if kind is None or rel.kind == kind:
+            key = (rel.source_id, rel.target_id)
+            cells[key] = cells.get(key, 0.0) + (rel.weight or 0.0)
+    return cells
+
+
+class TestDeliveryMatrix(unittest.TestCase):
+    """Test delivery-matrix queries on a small institutional network."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.graph = SFMGraph()
+        self.actor = Actor(label="Farmer")
+        self.institution = Institution(label="Cooperative")
+        self.policy = Policy(label="Subsidy")
+        for node in (self.actor, self.institution, self.policy):
+            self.graph.add_node(node)
+        self.graph.add_relationship(Relationship(
+            self.institution.id, self.actor.id, RelationshipKind.FUNDS, weight=2.0))
+        self.graph.add_relationship(Relationship(
+            self.institution.id, self.actor.id, RelationshipKind.FUNDS, weight=1.5))
+        self.graph.add_relationship(Relationship(
+            self.policy.id, self.actor.id, RelationshipKind.REGULATES, weight=0.5))
+        self.graph.add_relationship(Relationship(
+            self.actor.id, self.institution.id, RelationshipKind.AFFECTS, weight=1.0))
+        self.matrix = DeliveryMatrix(self.graph)
+
+    def test_cells_sum_parallel_relationships(self):
+        """Test cells add up relationships per kind and across kinds."""
+        self.assertEqual(self.matrix.cell(self.institution.id, self.actor.id), 3.5)
+        self.assertEqual(
+            self.matrix.cell(self.institution.id, self.actor.id, RelationshipKind.FUNDS), 3.5)
+        self.assertEqual(
+            self.matrix.cell(self.institution.id, self.actor.id, RelationshipKind.AFFECTS), 0.0)
+        self.assertEqual(self.matrix.cell(uuid.uuid4(), self.actor.id), 0.0)
+        self.assertCountEqual(self.matrix.kinds(), KINDS)
+
+    def test_row_and_column(self):
+        """Test rows hold deliveries and columns receipts."""
+        self.assertEqual(self.matrix.row(self.institution.id), {self.actor.id: 3.5})
+        self.assertEqual(self.matrix.column(self.actor.id),
+                         {self.institution.id: 3.5, self.policy.id: 0.5})
+        self.assertEqual(self.matrix.column(self.actor.id, RelationshipKind.REGULATES),
+                         {self.policy.id: 0.5})
+        self.assertEqual(self.matrix.row(uuid.uuid4()), {})
+
+    def test_block_selects_by_node_class(self):
+        """Test blocks select components with isinstance (Policy is an Institution)."""
+        row_ids, column_ids, block = self.matrix.block(Institution, Actor)
+
+        self.assertCountEqual(row_ids, [self.institution.id, self.policy.id])
+        self.assertEqual(column_ids, [self.actor.id])
+        self.assertEqual(block.shape, (2, 1))
+        self.assertAlmostEqual(block.sum(), 4.0)
+
+    def test_to_dense(self):
+        """Test dense export and its size limit."""
+        row_ids, column_ids, dense = self.matrix.to_dense(kind=RelationshipKind.FUNDS)
+
+        self.assertIsInstance(dense, np.ndarray)
+        self.assertEqual(dense[row_ids.index(self.institution.id),
+                               column_ids.index(self.actor.id)], 3.5)
+        self.assertEqual(dense.sum(), 3.5)
+        with self.assertRaises(ValueError):
+            self.matrix.to_dense(max_components=2)
+
+    def test_zero_weight_relationships_are_deliveries(self):
+        """Test a relationship of weight 0 still shows up in rows and columns."""
+        self.graph.add_relationship(Relationship(
+            self.actor.id, self.policy.id, RelationshipKind.AFFECTS, weight=0.0))
+
+        self.assertEqual(self.matrix.row(self.actor.id),
+                         {self.institution.id: 1.0, self.policy.id: 0.0})
+
+    def test_mutations_update_incrementally(self):
+        """Test added and removed relationships and nodes update the cells in place."""
+        self.matrix.row(self.actor.id)
+        version = self.matrix._synced_version
+        newcomer = Actor(label="Trader")
+        self.graph.add_node(newcomer)
+        rel = Relationship(self.institution.id, newcomer.id, RelationshipKind.FUNDS, weight=4.0)
+        self.graph.add_relationship(rel)
+
+        self.assertEqual(self.matrix._synced_version, version + 2)
+        self.assertEqual(self.matrix.row(self.institution.id),
+                         {self.actor.id: 3.5, newcomer.id: 4.0})
+        self.assertEqual(len(self.matrix.block(Institution, Actor)[1]), 2)
+
+        self.graph.remove_node(newcomer.id)
+        self.assertFalse(self.matrix.is_stale)
+        self.assertNotIn(newcomer.id, self.matrix)
+        self.assertEqual(self.matrix.row(self.institution.id), {self.actor.id: 3.5})
+        self.assertEqual(self.matrix.block(Institution, Actor)[1], [self.actor.id])
+
+    def test_row_and_column_queries_skip_matrices(self):
+        """Test slices come from the cell indexes, not from a rebuilt matrix."""
+        self.matrix.matrix()
+        live = self.matrix._live_indices()
+        self.graph.add_relationship(Relationship(
+            self.policy.id, self.institution.id, RelationshipKind.REGULATES, weight=3.0))
+
+        self.assertEqual(self.matrix.row(self.policy.id),
+                         {self.actor.id: 0.5, self.institution.id: 3.0})
+        self.assertEqual(self.matrix.column(self.institution.id),
+                         {self.actor.id: 1.0, self.policy.id: 3.0})
+        self.assertNotIn(None, self.matrix._rows)
+        # Relationship changes keep the live component indices
+        self.assertIs(self.matrix._live_indices(), live)
+        self.graph.remove_node(self.policy.id)
+        self.assertEqual(self.matrix._live_indices().tolist(),
+                         sorted([self.matrix.component_index[self.actor.id],
+                                 self.matrix.component_index[self.institution.id]]))
+
+    def test_missed_mutation_rebuilds(self):
+        """Test direct writes to the relationships dict trigger a full rebuild."""
+        self.matrix.row(self.actor.id)
+        rel = Relationship(self.actor.id, self.policy.id, RelationshipKind.AFFECTS, weight=2.0)
+        self.graph.relationships[rel.id] = rel
+
+        self.assertEqual(self.matrix.cell(self.actor.id, self.policy.id), 2.0)
+        self.graph.clear()
+        self.assertEqual(self.matrix.size, 0)
+
+    def test_random_mutations_match_scan(self):
+        """Test the view matches a relationship scan after random edits."""
+        rng = random.Random(7)
+        nodes = [Actor(label=f"Actor {i}") for i in range(15)]
+        for node in nodes:
+            self.graph.add_node(node)
+        self.matrix.matrix()
+        for _ in range(200):
+            if self.graph.relationships and rng.random() < 0.3:
+                self.graph.remove_relationship(rng.choice(list(self.graph.relationships)))
+            else:
+                source, target = rng.sample(nodes, 2)
+                self.graph.add_relationship(Relationship(
+                    source.id, target.id, rng.choice(KINDS), weight=rng.randint(1, 5)))
+        self.graph.remove_node(nodes[0].id)
+
+        for kind in (None,) + KINDS:
+            expected = _scan(self.graph, kind)
+            matrix = self.matrix.matrix(kind).tocoo()
+            actual = {
+                (self.matrix.component_ids[i], self.matrix.component_ids[j]): w
+                for i, j, w in zip(matrix.row.tolist(), matrix.col.tolist(), matrix.data.tolist())
+            }
+            self.assertEqual(set(actual), set(expected))
+            for key, weight in expected.items():
+                self.assertAlmostEqual(actual[key], weight)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Tests for the landmark distance oracle.
+"""
+
+import unittest
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+from core.distance_oracle import (
+    EfficiencyMatrix, LandmarkDistanceOracle, bidirectional_hop_distance, select_landmarks
+)
+
+
+def _adjacency(graph: nx.DiGraph) -> sparse.csr_matrix:
+    """Adjacency matrix in node order."""
+    return sparse.csr_matrix(nx.to_scipy_sparse_array(graph, nodelist=list(graph), format="csr"))
+
+
+class TestLandmarkDistanceOracle(unittest.TestCase):
+    """Compare oracle distances with breadth-first search in NetworkX."""
+
+    def test_bounds_contain_true_distance(self):
+        """Test bounds, estimates and exact distances on random directed graphs."""
+        for seed in range(5):
+            graph = nx.gnm_random_graph(40, 60 + 15 * seed, seed=seed, directed=True)
+            nodes = list(graph)
+            for landmarks in (0, 1, 4):
+                oracle = LandmarkDistanceOracle.build(_adjacency(graph), nodes, landmarks)
+                estimates = oracle.distance_matrix()
+                exact = oracle.distance_matrix(exact=True)
+
+                for source in nodes:
+                    lengths = nx.single_source_shortest_path_length(graph, source)
+                    for target in nodes:
+                        true = lengths.get(target, np.inf)
+                        lower, upper = oracle.bounds(source, target)
+                        self.assertLessEqual(lower, true)
+                        self.assertGreaterEqual(upper, true)
+                        self.assertGreaterEqual(estimates[source, target], true)
+                        self.assertEqual(exact[source, target], true)
+                        self.assertEqual(oracle.distance(source, target, exact=True), true)
+
+    def test_landmark_pairs_are_exact(self):
+        """Test bounds meet for pairs starting or ending at a landmark."""
+        graph = nx.DiGraph([(0, 1), (1, 2), (2, 3), (4, 2)])
+        oracle = LandmarkDistanceOracle(_adjacency(graph), list(graph), landmarks=[2])
+
+        self.assertEqual(oracle.bounds(0, 2), (2.0, 2.0))
+        self.assertEqual(oracle.bounds(2, 3), (1.0, 1.0))
+        # Through the landmark: the estimate is right, but not proven exact
+        self.assertEqual(oracle.bounds(0, 3), (1.0, 3.0))
+        self.assertEqual(oracle.distance(4, 3), 2.0)
+        self.assertEqual(oracle.bounds(3, 0), (np.inf, np.inf))
+
+    def test_unknown_nodes_are_unreachable(self):
+        """Test unknown node IDs have infinite distance and zero efficiency."""
+        graph = nx.DiGraph([("a", "b")])
+        oracle = LandmarkDistanceOracle.build(_adjacency(graph), list(graph), landmarks=1)
+
+        self.assertEqual(oracle.distance("a", "missing"), np.inf)
+        matrix = oracle.efficiency_matrix(["a", "missing"], ["a", "b"])
+        self.assertEqual(matrix.efficiency.tolist(), [[0.0, 1.0], [0.0, 0.0]])
+        self.assertNotIn("missing", oracle)
+
+    def test_select_landmarks(self):
+        """Test degree and score-based landmark selection."""
+        graph = nx.DiGraph([(0, 1), (2, 1), (1, 3), (3, 4)])
+        adjacency = _adjacency(graph)
+
+        self.assertEqual(select_landmarks(adjacency, 2).tolist(), [1, 3])
+        self.assertEqual(
+            select_landmarks(adjacency, 1, "betweenness", [0.0, 0.1, 0.0, 0.9, 0.0]).tolist(), [3]
+        )
+        with self.assertRaises(ValueError):
+            select_landmarks(adjacency, 1, "betweenness")
+        with self.assertRaises(ValueError):
+            select_landmarks(adjacency, 1, "closeness")
+
+
+class TestBidirectionalHopDistance(unittest.TestCase):
+    """Compare single-pair distances with breadth-first search in NetworkX."""
+
+    def test_matches_networkx(self):
+        """Test reachable, unreachable and self pairs on random directed graphs."""
+        for seed in range(3):
+            graph = nx.gnm_random_graph(40, 70, seed=seed, directed=True)
+            adjacency = _adjacency(graph)
+            reverse = adjacency.T.tocsr()
+            for source in graph:
+                lengths = nx.single_source_shortest_path_length(graph, source)
+                for target in graph:
+                    self.assertEqual(
+                        bidirectional_hop_distance(adjacency, reverse, source, target),
+                        lengths.get(target, np.inf),
+                    )
+
+
+class TestEfficiencyMatrix(unittest.TestCase):
+    """Test efficiency matrices and their average."""
+
+    def test_efficiency_is_inverse_distance(self):
+        """Test efficiency against 1 / shortest path length."""
+        graph = nx.gnm_random_graph(30, 70, seed=3, directed=True)
+        oracle = LandmarkDistanceOracle.build(_adjacency(graph), list(graph), landmarks=3)
+
+        matrix = oracle.efficiency_matrix(exact=True)
+
+        lengths = dict(nx.all_pairs_shortest_path_length(graph))
+        for source in graph:
+            for target in graph:
+                length = lengths[source].get(target)
+                expected = 1.0 / length if length else 0.0
+                self.assertAlmostEqual(matrix.efficiency[source, target], expected)
+
+    def test_average_skips_self_pairs(self):
+        """Test the average covers pairs of distinct nodes only."""
+        matrix = EfficiencyMatrix(["a", "b"], ["a", "b"], np.array([[0.0, 1.0], [0.5, 0.0]]),
+                                  exact=True)
+        self.assertAlmostEqual(matrix.average, 0.75)
+        self.assertEqual(EfficiencyMatrix(["a"], ["a"], np.zeros((1, 1)), True).average, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests for batch node-failure simulation.
+"""
+
+import random
+import unittest
+import uuid
+
+import networkx as nx
+
+from core.failure_simulation import FailureModel, FailureSimulator, simulate_failure
+from core.sfm_query import NetworkXSFMQueryEngine
+from tests.mocks import create_random_graph
+
+
+class TestFailureSimulator(unittest.TestCase):
+    """Compare batch simulation with the single-scenario NetworkX simulation."""
+
+    def test_matches_single_scenario_simulation(self):
+        """Test every scenario agrees with simulate_node_failure_impact."""
+        for seed in range(4):
+            graph = create_random_graph(50, 60 + 25 * seed, seed)
+            engine = NetworkXSFMQueryEngine(graph)
+            node_ids = [node.id for node in graph]
+            rng = random.Random(seed)
+            failure_sets = [rng.sample(node_ids, rng.randint(0, 6)) for _ in range(25)]
+            model = FailureModel.from_networkx(engine.nx_graph)
+
+            for failure_mode in ("cascade", "complete"):
+                results = FailureSimulator(max_workers=1).run(model, failure_sets, failure_mode)
+                for failure_set, result in zip(failure_sets, results):
+                    self.assertEqual(
+                        result, engine.simulate_node_failure_impact(failure_set, failure_mode)
+                    )
+
+    def test_process_pool_gives_same_results(self):
+        """Test results do not depend on the number of workers."""
+        graph = create_random_graph(40, 80, 11)
+        model = FailureModel.from_networkx(NetworkXSFMQueryEngine(graph).nx_graph)
+        node_ids = [node.id for node in graph]
+        rng = random.Random(5)
+        failure_sets = [rng.sample(node_ids, 3) for _ in range(20)]
+
+        serial = FailureSimulator(max_workers=1).run(model, failure_sets)
+        parallel = FailureSimulator(
+            max_workers=2, chunk_size=4, parallel_min_scenarios=1
+        ).run(model, failure_sets)
+
+        self.assertEqual(parallel, serial)
+
+    def test_cascade_visits_nodes_once_in_graph_order(self):
+        """Test a cascade reaches later nodes but never revisits earlier ones."""
+        edges = [(1, 2), (1, 3), (1, 4), (0, 1), (0, 2), (0, 3)]
+        for graph, expected in (
+            (nx.MultiDiGraph(edges), [1, 0]),  # Node 0 visited after node 1 fails
+            (nx.MultiDiGraph(edges[3:] + edges[:3]), [1]),  # Node 0 visited first
+        ):
+            model = FailureModel.from_networkx(graph)
+            failed = [model.node_ids.index(node) for node in (2, 3, 4)]
+            result = simulate_failure(model, failed)
+
+            self.assertEqual([model.node_ids[i] for i in result["cascading_failures"]],
+                             expected)
+            self.assertEqual([model.node_ids[i] for i in result["isolated_nodes"]], [1])
+            self.assertEqual(result["connectivity_impact"]["new_components"], 1)
+            self.assertEqual(result["connectivity_impact"]["largest_component_size_change"],
+                             -3)
+
+    def test_unknown_nodes_and_modes(self):
+        """Test unknown node IDs are ignored and unknown modes are rejected."""
+        graph = create_random_graph(10, 15, 2)
+        model = FailureModel.from_networkx(NetworkXSFMQueryEngine(graph).nx_graph)
+        missing = uuid.uuid4()
+
+        result = FailureSimulator(max_workers=1).run(model, [[missing]])[0]
+
+        self.assertEqual(result["failed_nodes"], [str(missing)])
+        self.assertEqual(result["connectivity_impact"]["component_increase"], 0)
+        with self.assertRaises(ValueError):
+            FailureSimulator(max_workers=1).run(model, [[missing]], "partial")
+
+
+    def test_empty_graph(self):
+        """Test the model builds for a graph without nodes."""
+        model = FailureModel.from_networkx(nx.MultiDiGraph())
+
+        self.assertEqual(model.node_count, 0)
+        self.assertEqual(model.largest_component_size, 0)
+        result = FailureSimulator(max_workers=1).run(model, [[uuid.uuid4()]])[0]
+        self.assertEqual(result["connectivity_impact"]["component_increase"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
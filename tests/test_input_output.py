@@ -0,0 +1,123 @@
+"""
+Tests for the Leontief input-output model.
+"""
+
+import unittest
+import uuid
+
+import numpy as np
+
+from core.sfm_models import Flow, Process, SFMGraph, ValueFlow
+from core.input_output import InputOutputModel, shipped_quantity
+
+
+def _flow(source, target, quantity, **fields) -> Flow:
+    """Flow between two processes; None marks the outside of the economy."""
+    return Flow(
+        label="Flow",
+        quantity=quantity,
+        source_process_id=source.id if source is not None else None,
+        target_process_id=target.id if target is not None else None,
+        **fields,
+    )
+
+
+class TestInputOutputModel(unittest.TestCase):
+    """Test coefficient assembly and Leontief solves on a three-sector economy."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.graph = SFMGraph()
+        self.sectors = [Process(label=f"Sector {i}") for i in range(3)]
+        for sector in self.sectors:
+            self.graph.add_node(sector)
+        a, b, c = self.sectors
+        for flow in (
+            _flow(a, b, 20.0), _flow(b, c, 30.0), _flow(c, a, 10.0),
+            _flow(a, None, 80.0), _flow(b, None, 70.0), _flow(c, None, 90.0, loss_factor=0.1),
+            _flow(None, a, 50.0),
+        ):
+            self.graph.add_node(flow)
+        self.model = InputOutputModel(self.graph)
+
+    def test_coefficients(self):
+        """Test gross output, final demand and technical coefficients."""
+        self.model.sync()
+
+        self.assertEqual(self.model.gross_output.tolist(), [100.0, 100.0, 110.0])
+        self.assertEqual(self.model.final_demand.tolist(), [80.0, 70.0, 100.0])
+        self.assertEqual(self.model.primary_inputs.tolist(), [50.0, 0.0, 0.0])
+        np.testing.assert_allclose(
+            self.model.technical_coefficients.toarray(),
+            [[0.0, 0.2, 0.0], [0.0, 0.0, 30 / 110], [0.1, 0.0, 0.0]],
+        )
+
+    def test_observed_demand_reproduces_output(self):
+        """Test x = L f gives back the observed gross output."""
+        output = self.model.total_output()
+
+        np.testing.assert_allclose([output[s.id] for s in self.sectors], [100.0, 100.0, 110.0])
+
+    def test_multipliers_match_leontief_inverse(self):
+        """Test multipliers are the column and row sums of the Leontief inverse."""
+        inverse = self.model.leontief_inverse()
+        multipliers = self.model.multipliers()
+
+        for i, sector in enumerate(self.sectors):
+            self.assertAlmostEqual(multipliers[sector.id]["output_multiplier"],
+                                   inverse[:, i].sum())
+            self.assertAlmostEqual(multipliers[sector.id]["forward_linkage"], inverse[i].sum())
+
+    def test_demand_shocks_in_one_solve(self):
+        """Test several shocks against the Leontief inverse; unknown sectors are ignored."""
+        inverse = self.model.leontief_inverse()
+        a, b, _ = self.sectors
+
+        changes = self.model.demand_shocks([{a.id: 1.0}, {b.id: 2.0, uuid.uuid4(): 5.0}])
+
+        np.testing.assert_allclose([changes[0][s.id] for s in self.sectors], inverse[:, 0])
+        np.testing.assert_allclose([changes[1][s.id] for s in self.sectors], 2 * inverse[:, 1])
+
+    def test_sparse_solver_matches_dense(self):
+        """Test the iterative solver used above the dense limit."""
+        sparse_model = InputOutputModel(self.graph, dense_limit=1)
+        a, _, c = self.sectors
+
+        expected = self.model.demand_shocks([{a.id: 3.0, c.id: -1.0}])[0]
+        changes = sparse_model.demand_shocks([{a.id: 3.0, c.id: -1.0}])[0]
+
+        for sector in self.sectors:
+            self.assertAlmostEqual(changes[sector.id], expected[sector.id], places=6)
+        with self.assertRaises(ValueError):
+            sparse_model.leontief_inverse()
+
+    def test_transformation_coefficient_and_value_flows(self):
+        """Test stated coefficients and ValueFlow deliveries."""
+        a, b, c = self.sectors
+        self.graph.add_node(_flow(b, a, 5.0, transformation_coefficient=0.05, loss_factor=0.5))
+        self.graph.add_node(ValueFlow(label="Value", quantity=11.0,
+                                      source_process_id=c.id, target_process_id=b.id))
+
+        self.assertTrue(self.model.is_stale)
+        self.model.sync()
+
+        coefficients = self.model.technical_coefficients.toarray()
+        self.assertAlmostEqual(coefficients[1, 0], 0.1)
+        self.assertAlmostEqual(coefficients[2, 1], 11.0 / 110.0)
+
+    def test_invalid_loss_factor(self):
+        """Test a flow that loses everything is rejected."""
+        with self.assertRaises(ValueError):
+            shipped_quantity(Flow(label="Leak", quantity=1.0, loss_factor=1.0))
+
+    def test_empty_graph(self):
+        """Test a graph without processes."""
+        model = InputOutputModel(SFMGraph())
+
+        self.assertEqual(model.sector_count, 0)
+        self.assertEqual(model.multipliers(), {})
+        self.assertEqual(model.demand_shocks([{}]), [{}])
+
+
+if __name__ == "__main__":
+    unittest.main()
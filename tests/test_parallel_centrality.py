@@ -0,0 +1,90 @@
+"""
+Tests for process-pool parallel centrality computation.
+"""
+
+import random
+import unittest
+import uuid
+
+import networkx as nx
+
+from core.parallel_centrality import CompactGraph, ParallelCentralityExecutor
+
+
+def _random_multidigraph(node_count: int = 80, edge_count: int = 300, seed: int = 7):
+    """Build a random MultiDiGraph with UUID nodes, parallel edges and self-loops."""
+    rng = random.Random(seed)
+    graph = nx.MultiDiGraph()
+    node_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(node_count)]
+    graph.add_nodes_from(node_ids)
+    for _ in range(edge_count):
+        graph.add_edge(rng.choice(node_ids), rng.choice(node_ids), key=uuid.uuid4())
+    return graph
+
+
+class TestCompactGraph(unittest.TestCase):
+    """Test the CSR representation shipped to workers."""
+
+    def test_from_networkx_collapses_parallel_edges(self):
+        """Test parallel edges become one adjacency entry in NetworkX order."""
+        a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from([a, b, c])
+        graph.add_edge(a, b, key=1)
+        graph.add_edge(a, b, key=2)
+        graph.add_edge(a, c, key=3)
+
+        compact = CompactGraph.from_networkx(graph)
+
+        self.assertEqual(compact.node_ids, [a, b, c])
+        self.assertEqual(list(compact.indptr), [0, 2, 2, 2])
+        self.assertEqual(list(compact.indices), [1, 2])
+
+
+class TestParallelCentralityExecutor(unittest.TestCase):
+    """Test parallel results against the serial path and NetworkX."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.graph = _random_multidigraph()
+        self.compact = CompactGraph.from_networkx(self.graph)
+
+    def test_single_chunk_matches_networkx_exactly(self):
+        """Test the in-process kernels reproduce NetworkX bit for bit."""
+        executor = ParallelCentralityExecutor(max_workers=1, chunk_size=10_000)
+        results = executor.compute(self.compact)
+
+        self.assertEqual(results["betweenness"], nx.betweenness_centrality(self.graph))
+        self.assertEqual(results["closeness"], nx.closeness_centrality(self.graph))
+
+    def test_parallel_matches_serial_exactly(self):
+        """Test the result does not depend on the number of workers or chunks."""
+        serial = ParallelCentralityExecutor(max_workers=1, chunk_size=16).compute(self.compact)
+        parallel = ParallelCentralityExecutor(max_workers=3, chunk_size=16).compute(self.compact)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(parallel["betweenness"], nx.betweenness_centrality(self.graph))
+        self.assertEqual(parallel["closeness"], nx.closeness_centrality(self.graph))
+
+    def test_rejects_unsupported_measure(self):
+        """Test only betweenness and closeness can be parallelized."""
+        with self.assertRaises(ValueError):
+            ParallelCentralityExecutor(max_workers=1).compute(self.compact, ["eigenvector"])
+        with self.assertRaises(ValueError):
+            ParallelCentralityExecutor(max_workers=1, chunk_size=0)
+
+    def test_tiny_graphs(self):
+        """Test graphs too small to normalize produce zero scores."""
+        graph = nx.MultiDiGraph()
+        a, b = uuid.uuid4(), uuid.uuid4()
+        graph.add_edge(a, b, key=1)
+        results = ParallelCentralityExecutor(max_workers=1).compute(
+            CompactGraph.from_networkx(graph)
+        )
+
+        self.assertEqual(results["betweenness"], {a: 0.0, b: 0.0})
+        self.assertEqual(results["closeness"], nx.closeness_centrality(graph))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
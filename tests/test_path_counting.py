@@ -0,0 +1,101 @@
+"""
+Tests for sparse matrix path counting.
+"""
+
+import random
+import unittest
+
+import networkx as nx
+
+from core.path_counting import (
+    adjacency_matrix,
+    distinct_degrees,
+    flow_inefficiency_report,
+    top_path_counts,
+)
+
+
+def _random_multigraph(seed: int, node_count: int = 15, edge_count: int = 45) -> nx.MultiDiGraph:
+    """Random multigraph with parallel edges and self-loops."""
+    rng = random.Random(seed)
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from(range(node_count))
+    for _ in range(edge_count):
+        graph.add_edge(rng.randrange(node_count), rng.randrange(node_count))
+    return graph
+
+
+class TestTopPathCounts(unittest.TestCase):
+    """Compare matrix-power counts against explicit path enumeration."""
+
+    def test_counts_match_simple_path_enumeration(self):
+        """Test counts equal all_simple_paths for every pair and length up to 3."""
+        for seed in range(3):
+            graph = _random_multigraph(seed)
+            nodes = list(graph)
+            adjacency = adjacency_matrix(graph, nodes)
+            for max_length in (1, 2, 3):
+                expected = {}
+                for source in nodes:
+                    for target in nodes:
+                        if source != target:
+                            count = len(list(nx.all_simple_paths(
+                                graph, source, target, cutoff=max_length
+                            )))
+                            if count:
+                                expected[(source, target)] = count
+
+                counts = top_path_counts(adjacency, max_length=max_length,
+                                         top_k=len(nodes) ** 2, min_count=1, block_size=4)
+
+                self.assertEqual(
+                    {(nodes[s], nodes[t]): count for count, s, t in counts}, expected
+                )
+
+    def test_top_k_are_the_largest(self):
+        """Test only the k highest counts are kept, sorted descending."""
+        graph = _random_multigraph(7)
+        adjacency = adjacency_matrix(graph, list(graph))
+        everything = top_path_counts(adjacency, top_k=1000)
+        top = top_path_counts(adjacency, top_k=5)
+
+        self.assertEqual(len(top), 5)
+        self.assertEqual([c for c, _, _ in top], sorted((c for c, _, _ in everything),
+                                                        reverse=True)[:5])
+        self.assertTrue(all(count >= 2 for count, _, _ in everything))
+
+    def test_invalid_length(self):
+        """Test a non-positive length bound is rejected."""
+        with self.assertRaises(ValueError):
+            top_path_counts(adjacency_matrix(nx.MultiDiGraph([(0, 1)]), [0, 1]), max_length=0)
+
+
+class TestDegreeImbalance(unittest.TestCase):
+    """Test degree arrays and the imbalance report."""
+
+    def test_distinct_degrees_match_neighbor_lists(self):
+        """Test counts equal distinct predecessors and successors."""
+        graph = _random_multigraph(3)
+        nodes = list(graph)
+        in_degrees, out_degrees = distinct_degrees(adjacency_matrix(graph, nodes))
+
+        self.assertEqual(list(in_degrees), [len(set(graph.predecessors(n))) for n in nodes])
+        self.assertEqual(list(out_degrees), [len(set(graph.successors(n))) for n in nodes])
+
+    def test_imbalanced_nodes_reported(self):
+        """Test a hub with many inputs and one output is flagged."""
+        graph = nx.MultiDiGraph([(1, 0), (2, 0), (3, 0), (4, 0), (0, 5), (1, 2)])
+        nodes = list(graph)
+        report = flow_inefficiency_report(adjacency_matrix(graph, nodes), nodes)
+
+        self.assertEqual(report["flow_imbalances"], [
+            {"node": "0", "in_degree": 4, "out_degree": 1, "imbalance_ratio": 0.75}
+        ])
+        self.assertEqual(report["redundant_paths"], [
+            {"source": "1", "target": "0", "path_count": 2},
+            {"source": "1", "target": "5", "path_count": 2},
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for percolation robustness curves.
+"""
+
+import unittest
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+from core.percolation import (
+    RobustnessCurve,
+    largest_component_curve,
+    removal_order,
+    robustness_curve,
+)
+
+
+def _undirected(graph: nx.Graph) -> sparse.csr_matrix:
+    """Symmetric boolean adjacency matrix in node order."""
+    adjacency = nx.to_scipy_sparse_array(graph, nodelist=list(graph), weight=None,
+                                         format="csr")
+    return sparse.csr_matrix(adjacency + adjacency.T, dtype=bool)
+
+
+def _recomputed_curve(graph: nx.Graph, order) -> list:
+    """Largest component size after each removal, recounted from scratch."""
+    graph = nx.Graph(graph)
+    nodes = list(graph)
+    sizes = [len(max(nx.connected_components(graph), key=len))]
+    for index in order:
+        graph.remove_node(nodes[index])
+        sizes.append(max((len(c) for c in nx.connected_components(graph)), default=0))
+    return sizes
+
+
+class TestLargestComponentCurve(unittest.TestCase):
+    """Compare Newman-Ziff curves with recounting after every removal."""
+
+    def test_matches_recomputation(self):
+        """Test random graphs under random removal orders."""
+        for seed in range(4):
+            graph = nx.gnm_random_graph(40, 50 + 10 * seed, seed=seed)
+            graph.add_edge(0, 0)
+            order = np.random.default_rng(seed).permutation(40)
+
+            curve = largest_component_curve(_undirected(graph), order)
+
+            self.assertEqual(curve.tolist(), _recomputed_curve(graph, order))
+
+    def test_partial_order_rejected(self):
+        """Test the order must cover every node."""
+        with self.assertRaises(ValueError):
+            largest_component_curve(_undirected(nx.path_graph(3)), [0, 1])
+
+
+class TestRobustnessCurve(unittest.TestCase):
+    """Test attack strategies and curve summaries."""
+
+    def setUp(self):
+        """Set up a star with a tail: the hub is the obvious target."""
+        self.graph = nx.star_graph(5)
+        self.graph.add_edges_from([(5, 6), (6, 7)])
+        self.node_ids = [f"n{node}" for node in self.graph]
+        self.undirected = _undirected(self.graph)
+
+    def test_degree_attack_removes_hub_first(self):
+        """Test targeted removal by degree."""
+        curve = robustness_curve(self.undirected, self.node_ids, "degree")
+
+        self.assertEqual(curve.removal_order[:2], ["n0", "n5"])
+        self.assertEqual(curve.fractions[0], 1.0)
+        self.assertAlmostEqual(curve.fractions[1], 3 / 8)
+        self.assertEqual(curve.fractions[-1], 0.0)
+        self.assertAlmostEqual(curve.critical_fraction(), 1 / 8)
+
+    def test_betweenness_attack_uses_scores(self):
+        """Test targeted removal follows the given centrality scores."""
+        scores = {f"n{node}": value
+                  for node, value in nx.betweenness_centrality(self.graph).items()}
+        curve = robustness_curve(self.undirected, self.node_ids, "betweenness", scores=scores)
+
+        self.assertEqual(curve.removal_order[0], "n0")
+        with self.assertRaises(ValueError):
+            robustness_curve(self.undirected, self.node_ids, "betweenness")
+
+    def test_random_failures_average_trials(self):
+        """Test random curves are seeded averages that beat the targeted attack."""
+        first = robustness_curve(self.undirected, self.node_ids, "random", trials=50, seed=4)
+        second = robustness_curve(self.undirected, self.node_ids, "random", trials=50, seed=4)
+        targeted = robustness_curve(self.undirected, self.node_ids, "degree")
+
+        self.assertEqual(first.fractions, second.fractions)
+        self.assertEqual(first.trials, 50)
+        self.assertEqual(first.removal_order, [])
+        self.assertGreater(first.robustness, targeted.robustness)
+        self.assertTrue(all(std >= 0 for std in first.std))
+
+    def test_summaries(self):
+        """Test the robustness index and degenerate inputs."""
+        curve = RobustnessCurve("degree", fractions=[1.0, 0.5, 0.0])
+
+        self.assertAlmostEqual(curve.robustness, 0.25)
+        self.assertAlmostEqual(curve.critical_fraction(), 0.5)
+        self.assertEqual(robustness_curve(sparse.csr_matrix((0, 0)), [], "degree").fractions,
+                         [0.0])
+        with self.assertRaises(ValueError):
+            removal_order(self.undirected, "closeness")
+        with self.assertRaises(ValueError):
+            robustness_curve(self.undirected, self.node_ids, "random", trials=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
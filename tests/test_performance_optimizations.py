@@ -159,6 +159,125 @@ class TestPerformanceOptimizations(unittest.TestCase):
         updated_rels = self.graph.get_node_relationships(node_id)
         self.assertEqual(len(updated_rels), 2)
 
+    def test_adjacency_index_directional_lookups(self):
+        """Test outgoing/incoming lookups are served from the adjacency index."""
+        hub = self.nodes[0]
+        out_rel = Relationship(source_id=hub.id, target_id=self.nodes[1].id, kind="AFFECTS")
+        in_rel = Relationship(source_id=self.nodes[2].id, target_id=hub.id, kind="AFFECTS")
+        loop_rel = Relationship(source_id=hub.id, target_id=hub.id, kind="AFFECTS")
+        for rel in (out_rel, in_rel, loop_rel):
+            self.graph.add_relationship(rel)
+
+        self.assertCountEqual(self.graph.get_out_relationships(hub.id), [out_rel, loop_rel])
+        self.assertCountEqual(self.graph.get_in_relationships(hub.id), [in_rel, loop_rel])
+        # Self-loops are reported once in the combined view
+        self.assertCountEqual(
+            self.graph.get_node_relationships(hub.id), [out_rel, in_rel, loop_rel]
+        )
+        self.assertEqual(self.graph.get_out_relationships(self.nodes[3].id), [])
+
+    def test_adding_relationship_keeps_unrelated_cache_entries(self):
+        """Test add_relationship only invalidates the endpoints it touches."""
+        self.graph.add_relationship(Relationship(
+            source_id=self.nodes[0].id, target_id=self.nodes[1].id, kind="AFFECTS"
+        ))
+        self.graph.get_node_relationships(self.nodes[0].id)
+
+        self.graph.add_relationship(Relationship(
+            source_id=self.nodes[5].id, target_id=self.nodes[6].id, kind="AFFECTS"
+        ))
+
+        self.assertIn(self.nodes[0].id, self.graph._relationship_cache)
+        self.assertEqual(len(self.graph.get_node_relationships(self.nodes[5].id)), 1)
+
+    def test_replacing_relationship_reindexes_endpoints(self):
+        """Test re-adding a relationship id with new endpoints moves its index entries."""
+        rel = Relationship(source_id=self.nodes[0].id, target_id=self.nodes[1].id, kind="AFFECTS")
+        self.graph.add_relationship(rel)
+        moved = Relationship(
+            id=rel.id, source_id=self.nodes[0].id, target_id=self.nodes[2].id, kind="AFFECTS"
+        )
+        self.graph.add_relationship(moved)
+
+        self.assertEqual(self.graph.get_in_relationships(self.nodes[1].id), [])
+        self.assertEqual(self.graph.get_in_relationships(self.nodes[2].id), [moved])
+        self.assertEqual(len(self.graph.get_node_relationships(self.nodes[0].id)), 1)
+
+    def test_adjacency_index_resyncs_after_direct_writes(self):
+        """Test relationships written straight into the dict are still indexed."""
+        rel = Relationship(source_id=self.nodes[0].id, target_id=self.nodes[1].id, kind="AFFECTS")
+        self.graph.relationships[rel.id] = rel
+
+        self.assertEqual(self.graph.get_out_relationships(self.nodes[0].id), [rel])
+        self.assertEqual(self.graph.get_node_relationships(self.nodes[1].id), [rel])
+
+    def test_adjacency_index_resyncs_after_same_size_direct_writes(self):
+        """Test a direct delete plus a direct add (same count) still resyncs."""
+        old = Relationship(source_id=self.nodes[0].id, target_id=self.nodes[1].id, kind="AFFECTS")
+        self.graph.add_relationship(old)
+        self.graph.get_node_relationships(self.nodes[0].id)
+        version = self.graph.graph_version
+
+        new = Relationship(source_id=self.nodes[0].id, target_id=self.nodes[2].id, kind="AFFECTS")
+        del self.graph.relationships[old.id]
+        self.graph.relationships[new.id] = new
+
+        self.assertEqual(self.graph.get_out_relationships(self.nodes[0].id), [new])
+        self.assertEqual(self.graph.get_in_relationships(self.nodes[1].id), [])
+        self.assertEqual(self.graph.get_node_relationships(self.nodes[0].id), [new])
+        self.assertGreater(self.graph.graph_version, version)
+
+    def test_clear_resets_adjacency_index(self):
+        """Test clear() empties the adjacency indexes."""
+        self.graph.add_relationship(Relationship(
+            source_id=self.nodes[0].id, target_id=self.nodes[1].id, kind="AFFECTS"
+        ))
+        self.graph.clear()
+
+        self.assertEqual(self.graph._out_index, {})
+        self.assertEqual(self.graph._in_index, {})
+        self.assertEqual(self.graph.get_node_relationships(self.nodes[0].id), [])
+
+    def test_graph_version_and_mutation_listeners(self):
+        """Test every structural change bumps the version and notifies listeners."""
+        events = []
+        listener = lambda event, version, **context: events.append((event, version))
+        self.graph.add_mutation_listener(listener)
+        start = self.graph.graph_version
+
+        rel = Relationship(source_id=self.nodes[0].id, target_id=self.nodes[1].id, kind="AFFECTS")
+        self.graph.add_relationship(rel)
+        self.graph.remove_relationship(rel.id)
+        self.assertFalse(self.graph.remove_relationship(rel.id))
+
+        self.assertEqual(
+            events,
+            [("relationship_added", start + 1), ("relationship_removed", start + 2)],
+        )
+        self.assertEqual(self.graph.graph_version, start + 2)
+
+        self.graph.remove_mutation_listener(listener)
+        self.graph.add_node(Actor(label="Unobserved"))
+        self.assertEqual(len(events), 2)
+        self.assertEqual(self.graph.graph_version, start + 3)
+
+    def test_remove_node_drops_incident_relationships(self):
+        """Test remove_node removes the node and all relationships touching it."""
+        hub = self.nodes[0]
+        for other in self.nodes[1:4]:
+            self.graph.add_relationship(
+                Relationship(source_id=hub.id, target_id=other.id, kind="AFFECTS")
+            )
+        self.graph.add_relationship(
+            Relationship(source_id=self.nodes[4].id, target_id=hub.id, kind="AFFECTS")
+        )
+
+        self.assertTrue(self.graph.remove_node(hub.id))
+        self.assertIsNone(self.graph.get_node_by_id(hub.id))
+        self.assertEqual(len(self.graph.relationships), 0)
+        self.assertEqual(self.graph.get_in_relationships(self.nodes[1].id), [])
+        self.assertFalse(self.graph.remove_node(hub.id))
+
     def test_lazy_loading_functionality(self):
         """Test lazy loading mechanism for nodes."""
         # Create a separate graph for lazy loading test
@@ -0,0 +1,111 @@
+"""
+Tests for batch policy impact analysis.
+"""
+
+import random
+import unittest
+import uuid
+
+import networkx as nx
+
+from core.path_counting import adjacency_matrix
+from core.policy_batch import batch_policy_impact, bounded_reach
+from core.sfm_models import Actor, Institution, Policy, Resource
+
+
+class TestBoundedReach(unittest.TestCase):
+    """Compare the multi-source BFS against NetworkX ego graphs."""
+
+    def test_matches_ego_graphs(self):
+        """Test every row equals the ego graph of its source."""
+        rng = random.Random(1)
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(range(40))
+        for _ in range(90):
+            graph.add_edge(rng.randrange(40), rng.randrange(40))
+        nodes = list(graph)
+        adjacency = adjacency_matrix(graph, nodes)
+
+        for radius in (1, 3):
+            reached = bounded_reach(adjacency, list(range(40)), radius, block_size=7)
+            for source in range(40):
+                self.assertEqual(
+                    set(reached[source].indices),
+                    set(nx.ego_graph(graph, nodes[source], radius=radius)),
+                )
+
+    def test_no_sources(self):
+        """Test an empty request gives an empty matrix."""
+        adjacency = adjacency_matrix(nx.MultiDiGraph([(0, 1)]), [0, 1])
+
+        self.assertEqual(bounded_reach(adjacency, [], 2).shape, (0, 2))
+
+
+class TestBatchPolicyImpact(unittest.TestCase):
+    """Test per-policy categorization and overlaps."""
+
+    def setUp(self):
+        """Set up two policies sharing part of their impact area."""
+        self.policies = [Policy(label="P1"), Policy(label="P2")]
+        self.actor = Actor(label="Actor")
+        self.institution = Institution(label="Institution")
+        self.resource = Resource(label="Resource")
+        self.nodes = self.policies + [self.actor, self.institution, self.resource]
+        self.node_ids = [node.id for node in self.nodes]
+
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(self.node_ids)
+        graph.add_edge(self.policies[0].id, self.actor.id)
+        graph.add_edge(self.policies[0].id, self.actor.id)
+        graph.add_edge(self.actor.id, self.institution.id)
+        graph.add_edge(self.policies[1].id, self.institution.id)
+        graph.add_edge(self.institution.id, self.resource.id)
+        self.graph = graph
+        self.adjacency = adjacency_matrix(graph, self.node_ids)
+
+    def test_impacts_by_type(self):
+        """Test affected nodes are split by type within the radius."""
+        result = batch_policy_impact(
+            self.adjacency, self.node_ids, self.nodes, [p.id for p in self.policies], 2
+        )
+        first = result["impacts"][self.policies[0].id]
+
+        self.assertEqual(first["total_affected_nodes"], 2)
+        self.assertEqual(first["affected_actors"], [self.actor.id])
+        self.assertEqual(first["affected_institutions"], [self.institution.id])
+        self.assertEqual(first["affected_resources"], [])
+        ego = nx.ego_graph(self.graph, self.policies[0].id, radius=2)
+        self.assertAlmostEqual(first["network_metrics"]["density"], nx.density(ego))
+
+    def test_overlap_is_set_intersection(self):
+        """Test overlaps count shared affected nodes and report Jaccard similarity."""
+        result = batch_policy_impact(
+            self.adjacency, self.node_ids, self.nodes, [p.id for p in self.policies], 2
+        )
+
+        self.assertEqual(result["overlaps"], [{
+            "policy_a": self.policies[0].id,
+            "policy_b": self.policies[1].id,
+            "shared_nodes": 1,
+            "jaccard": 1 / 3,
+        }])
+        self.assertEqual(
+            batch_policy_impact(self.adjacency, self.node_ids, self.nodes,
+                                [p.id for p in self.policies], 2, min_shared=2)["overlaps"],
+            [],
+        )
+
+    def test_missing_and_duplicate_policies(self):
+        """Test unknown IDs are reported and duplicates analyzed once."""
+        unknown = uuid.uuid4()
+        result = batch_policy_impact(
+            self.adjacency, self.node_ids, self.nodes,
+            [self.policies[1].id, unknown, self.policies[1].id], 1,
+        )
+
+        self.assertEqual(list(result["impacts"]), [self.policies[1].id])
+        self.assertEqual(result["missing"], [unknown])
+
+
+if __name__ == "__main__":
+    unittest.main()
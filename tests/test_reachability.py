@@ -0,0 +1,75 @@
+"""
+Tests for the SCC-condensation reachability index.
+"""
+
+import unittest
+
+import networkx as nx
+from scipy import sparse
+
+from core.reachability import ReachabilityIndex
+
+
+class TestReachabilityIndex(unittest.TestCase):
+    """Compare index answers with NetworkX descendants."""
+
+    def test_matches_descendants(self):
+        """Test every pair of random directed graphs with cycles."""
+        for seed in range(6):
+            graph = nx.gnm_random_graph(40, 45 + 10 * seed, seed=seed, directed=True)
+            index = ReachabilityIndex.from_edges(graph.edges(), list(graph))
+
+            for source in graph:
+                reachable = nx.descendants(graph, source) | {source}
+                for target in graph:
+                    self.assertEqual(index.can_reach(source, target), target in reachable,
+                                     f"seed {seed}: {source} -> {target}")
+
+    def test_single_label_matches_descendants(self):
+        """Test answers do not depend on the number of interval labels."""
+        graph = nx.gnm_random_graph(30, 60, seed=11, directed=True)
+        index = ReachabilityIndex.from_edges(graph.edges(), list(graph), labels=1)
+
+        for source in graph:
+            reachable = nx.descendants(graph, source) | {source}
+            for target in graph:
+                self.assertEqual(index.can_reach(source, target), target in reachable)
+
+    def test_cycles_condense(self):
+        """Test nodes on a cycle share a component and reach each other."""
+        edges = [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")]
+        index = ReachabilityIndex.from_edges(edges, ["a", "b", "c", "d"])
+
+        self.assertEqual(index.component_count, 2)
+        self.assertTrue(index.can_reach("b", "a"))
+        self.assertTrue(index.can_reach("a", "d"))
+        self.assertFalse(index.can_reach("d", "a"))
+
+    def test_unknown_nodes_and_self_reach(self):
+        """Test isolated nodes reach only themselves and unknown nodes nothing."""
+        index = ReachabilityIndex.from_edges([("a", "b")], ["a", "b", "c"])
+
+        self.assertTrue(index.can_reach("c", "c"))
+        self.assertFalse(index.can_reach("c", "a"))
+        self.assertFalse(index.can_reach("a", "missing"))
+        self.assertIn("a", index)
+        self.assertNotIn("missing", index)
+
+    def test_adjacency_input_and_empty_graph(self):
+        """Test building from a matrix, including a graph without nodes."""
+        adjacency = sparse.csr_matrix(([1, 1], ([0, 1], [1, 2])), shape=(3, 3))
+        index = ReachabilityIndex(adjacency, ["x", "y", "z"])
+        self.assertTrue(index.can_reach("x", "z"))
+        self.assertFalse(index.can_reach("z", "x"))
+
+        empty = ReachabilityIndex.from_edges([], [])
+        self.assertEqual(empty.component_count, 0)
+
+    def test_labels_must_be_positive(self):
+        """Test an index needs at least one interval label."""
+        with self.assertRaises(ValueError):
+            ReachabilityIndex(sparse.csr_matrix((1, 1)), ["a"], labels=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+"""
+Tests for copy-on-write scenario overlays.
+"""
+
+import unittest
+
+from core.scenario_overlay import (
+    ScenarioOverlay,
+    clustering_affected_nodes,
+    local_clustering,
+)
+from core.sfm_models import Policy, Relationship, SFMGraph
+from core.sfm_enums import RelationshipKind
+from core.sfm_query import NetworkXSFMQueryEngine
+from core.csr_query import CSRSFMQueryEngine
+from tests.mocks import create_random_graph
+
+
+class TestScenarioOverlay(unittest.TestCase):
+    """Test overlay reads and writes against the base graph."""
+
+    def setUp(self):
+        """Set up a base graph and an overlay with every kind of change."""
+        self.graph = create_random_graph(40, 120, seed=3)
+        self.nodes = list(self.graph)
+        self.relationships = list(self.graph.relationships.values())
+        self.base_version = self.graph.graph_version
+        self.renamed_label = self.nodes[2].label
+
+        self.overlay = ScenarioOverlay(self.graph, "variant")
+        self.removed_node = self.nodes[3]
+        self.overlay.remove_node(self.removed_node.id)
+        self.removed_rel = next(
+            rel for rel in self.relationships
+            if self.removed_node.id not in (rel.source_id, rel.target_id)
+        )
+        self.overlay.remove_relationship(self.removed_rel.id)
+        self.moved_rel = next(
+            rel for rel in self.relationships[10:]
+            if self.removed_node.id not in (rel.source_id, rel.target_id)
+            and rel.id != self.removed_rel.id
+        )
+        self.overlay.update_relationship(self.moved_rel.id, target_id=self.nodes[9].id)
+        self.new_policy = self.overlay.add_node(Policy(label="New Policy"))
+        self.overlay.add_relationship(Relationship(
+            source_id=self.new_policy.id, target_id=self.nodes[1].id,
+            kind=RelationshipKind.AFFECTS,
+        ))
+        self.overlay.update_node(self.nodes[2].id, label="Renamed")
+
+    def test_base_graph_untouched(self):
+        """Test overlay writes never reach the base graph."""
+        self.assertEqual(self.graph.graph_version, self.base_version)
+        self.assertIsNotNone(self.graph.get_node_by_id(self.removed_node.id))
+        self.assertEqual(self.graph.get_node_by_id(self.nodes[2].id).label,
+                         self.renamed_label)
+        self.assertNotEqual(self.graph.relationships[self.moved_rel.id].target_id,
+                            self.nodes[9].id)
+
+    def test_reads_resolve_through_delta(self):
+        """Test nodes, relationships and adjacency reflect the changes."""
+        self.assertNotIn(self.removed_node.id, self.overlay)
+        self.assertIn(self.new_policy.id, self.overlay)
+        self.assertEqual(self.overlay.get_node_by_id(self.nodes[2].id).label, "Renamed")
+        self.assertIsNone(self.overlay.get_relationship(self.removed_rel.id))
+        self.assertIn(
+            self.moved_rel.id,
+            [rel.id for rel in self.overlay.get_in_relationships(self.nodes[9].id)],
+        )
+        self.assertEqual(self.overlay.get_out_relationships(self.removed_node.id), [])
+
+    def test_counts_match_materialized_graph(self):
+        """Test delta-computed counts and iteration match a materialized copy."""
+        materialized = self.overlay.materialize()
+
+        self.assertEqual(len(self.overlay), len(materialized))
+        self.assertEqual(self.overlay.relationship_count, len(materialized.relationships))
+        self.assertEqual({node.id for node in self.overlay},
+                         {node.id for node in materialized})
+        self.assertEqual({rel.id for rel in self.overlay.iter_relationships()},
+                         set(materialized.relationships))
+        for node in self.nodes:
+            if node.id != self.removed_node.id:
+                self.assertEqual(
+                    {rel.id for rel in self.overlay.get_out_relationships(node.id)},
+                    {rel.id for rel in materialized.get_out_relationships(node.id)},
+                )
+
+    def test_delta_summary(self):
+        """Test added, modified and removed entities are told apart."""
+        summary = self.overlay.get_delta_summary()
+        incident = {
+            rel.id for rel in self.relationships
+            if self.removed_node.id in (rel.source_id, rel.target_id)
+        }
+
+        self.assertEqual(summary["nodes_added"], 1)
+        self.assertEqual(summary["nodes_modified"], 1)
+        self.assertEqual(summary["nodes_removed"], 1)
+        self.assertEqual(summary["relationships_added"], 1)
+        self.assertEqual(summary["relationships_modified"], 1)
+        self.assertEqual(summary["relationships_removed"], len(incident) + 1)
+        self.assertFalse(self.overlay.is_empty)
+        self.assertTrue(ScenarioOverlay(self.graph).is_empty)
+
+    def test_local_clustering_matches_materialized_graph(self):
+        """Test local clustering recomputation for the affected nodes."""
+        engine = NetworkXSFMQueryEngine(self.overlay.materialize())
+        expected = engine._baseline_clustering()[0]  # pylint: disable=protected-access
+
+        for node_id in clustering_affected_nodes(self.overlay):
+            self.assertAlmostEqual(local_clustering(self.overlay, node_id), expected[node_id])
+        # pylint: disable-next=protected-access
+        self.assertIs(engine._baseline_clustering()[0], expected)
+        # pylint: disable-next=protected-access
+        self.assertEqual(engine._centrality_store.get_stats()["entries"], 0)
+
+    def test_invalid_updates(self):
+        """Test updating or removing missing entities."""
+        with self.assertRaises(KeyError):
+            self.overlay.update_node(self.removed_node.id, label="Gone")
+        self.assertFalse(self.overlay.remove_relationship(self.removed_rel.id))
+        self.assertFalse(self.overlay.remove_node(self.removed_node.id))
+
+
+class TestOverlayComparison(unittest.TestCase):
+    """Compare delta-based metrics with full rebuilds of materialized scenarios."""
+
+    def setUp(self):
+        """Set up a baseline and two variants."""
+        self.graph = create_random_graph(40, 120, seed=8)
+        self.engine = NetworkXSFMQueryEngine(self.graph)
+        nodes = list(self.graph)
+        relationships = list(self.graph.relationships.values())
+
+        self.first = ScenarioOverlay(self.graph, "first")
+        self.first.remove_node(nodes[5].id)
+        self.first.add_relationship(Relationship(
+            source_id=nodes[0].id, target_id=nodes[7].id, kind=RelationshipKind.AFFECTS
+        ))
+        self.second = ScenarioOverlay(self.graph)
+        self.second.remove_node(nodes[5].id)
+        self.second.remove_relationship(relationships[0].id)
+        self.second.add_node(Policy(label="Extra Policy"))
+
+    def test_matches_full_scenario_comparison(self):
+        """Test overlay comparison agrees with compare_policy_scenarios."""
+        overlays = [self.first, self.second]
+        comparison = self.engine.compare_scenario_overlays(overlays, include_centrality=True)
+        expected = self.engine.compare_policy_scenarios(
+            [self.graph] + [overlay.materialize() for overlay in overlays]
+        )
+
+        self.assertEqual(comparison["scenario_names"], ["baseline", "first", "scenario_2"])
+        self.assertEqual(comparison["basic_metrics"]["node_counts"],
+                         expected["basic_metrics"]["node_counts"])
+        self.assertEqual(comparison["basic_metrics"]["relationship_counts"],
+                         expected["basic_metrics"]["relationship_counts"])
+        for actual, reference in zip(comparison["basic_metrics"]["density_scores"],
+                                     expected["basic_metrics"]["density_scores"]):
+            self.assertAlmostEqual(actual, reference)
+        for actual, reference in zip(
+            comparison["structural_comparison"]["clustering_differences"],
+            expected["structural_comparison"]["clustering_differences"],
+        ):
+            self.assertAlmostEqual(actual["clustering_coefficient"],
+                                   reference["clustering_coefficient"])
+        for actual, reference in zip(
+            comparison["structural_comparison"]["centrality_differences"],
+            expected["structural_comparison"]["centrality_differences"],
+        ):
+            self.assertAlmostEqual(actual["avg_centrality_difference"],
+                                   reference["avg_centrality_difference"])
+        for actual_row, reference_row in zip(comparison["similarity_matrix"],
+                                             expected["similarity_matrix"]):
+            for actual, reference in zip(actual_row, reference_row):
+                self.assertAlmostEqual(actual, reference)
+        self.assertEqual(comparison["policy_impact_analysis"]["policy_nodes_per_scenario"],
+                         expected["policy_impact_analysis"]["policy_nodes_per_scenario"])
+
+    def test_centrality_is_opt_in(self):
+        """Test the default comparison does not rebuild any scenario."""
+        comparison = self.engine.compare_scenario_overlays([self.first])
+
+        self.assertEqual(comparison["structural_comparison"]["centrality_differences"], [])
+        self.assertEqual(comparison["key_differences"][0]["nodes_removed"], 1)
+
+    def test_detect_overlay_changes(self):
+        """Test structural change detection agrees with the full comparison."""
+        changes = self.engine.detect_overlay_changes(self.second, include_centrality=True)
+        expected = self.engine.detect_structural_changes(self.graph, self.second.materialize())
+
+        self.assertEqual(changes["node_count_change"], expected["node_count_change"])
+        self.assertEqual(changes["edge_count_change"], expected["edge_count_change"])
+        self.assertAlmostEqual(changes["density_change"], expected["density_change"])
+        self.assertEqual(set(changes["centrality_shifts"]), set(expected["centrality_shifts"]))
+
+    def test_csr_engine_and_foreign_base(self):
+        """Test the CSR engine delegates and overlays of other graphs are rejected."""
+        self.assertEqual(
+            CSRSFMQueryEngine(self.graph).detect_overlay_changes(self.first)["delta"],
+            self.first.get_delta_summary(),
+        )
+        with self.assertRaises(ValueError):
+            self.engine.compare_scenario_overlays([ScenarioOverlay(SFMGraph())])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+"""
+Tests for batched sensitivity analysis over relationship weights.
+"""
+
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from core.sfm_enums import RelationshipKind
+from core.sfm_models import Actor, Relationship, SFMGraph
+from core.propagation import ImpactPropagator
+from core.sensitivity import (
+    WeightSensitivityModel,
+    morris_screening,
+    one_at_a_time,
+    sobol_indices,
+)
+
+
+class TestWeightSensitivityModel(unittest.TestCase):
+    """Test low-rank evaluations against repropagating the edited graph."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.graph = SFMGraph()
+        self.nodes = [Actor(label=f"Actor {i}") for i in range(25)]
+        for node in self.nodes:
+            self.graph.add_node(node)
+        rng = random.Random(7)
+        self.relationships = []
+        for _ in range(70):
+            source, target = rng.sample(self.nodes, 2)
+            rel = Relationship(source.id, target.id, RelationshipKind.AFFECTS,
+                               weight=rng.uniform(0.5, 2.0), certainty=rng.uniform(0.5, 1.0))
+            self.graph.add_relationship(rel)
+            self.relationships.append(rel)
+        self.seeds = [self.nodes[0].id, self.nodes[1].id]
+        self.targets = [node.id for node in self.nodes[10:20]]
+        self.propagator = ImpactPropagator(self.graph)
+
+    def _repropagate(self, multipliers):
+        """Indicator after scaling relationship weights in the graph itself."""
+        original = {rel.id: rel.weight for rel in self.relationships}
+        for rel_id, multiplier in multipliers.items():
+            self.graph.relationships[rel_id].weight = original[rel_id] * multiplier
+        result = ImpactPropagator(self.graph, tol=1e-14, max_iter=5000).propagate(
+            self.seeds, warm_start=False)
+        for rel_id, weight in original.items():
+            self.graph.relationships[rel_id].weight = weight
+        return sum(result.scores.get(node_id, 0.0) for node_id in self.targets)
+
+    def test_baseline_matches_propagator(self):
+        """Test the factorized baseline equals a fresh propagation."""
+        model = WeightSensitivityModel(self.propagator, self.seeds, self.targets)
+
+        self.assertAlmostEqual(model.baseline, self._repropagate({}), places=10)
+
+    def test_one_at_a_time_matches_repropagation(self):
+        """Test every single-weight update matches editing that weight."""
+        selected = [rel.id for rel in self.relationships[:12]]
+        model = WeightSensitivityModel(self.propagator, self.seeds, self.targets, selected)
+        multipliers = np.linspace(0.3, 2.5, len(selected))
+        values = model.evaluate_one_at_a_time(multipliers)
+
+        for rel_id, multiplier, value in zip(selected, multipliers, values):
+            self.assertAlmostEqual(value, self._repropagate({rel_id: multiplier}), places=10)
+
+    def test_joint_update_matches_repropagation(self):
+        """Test the Woodbury update handles many weights changing at once."""
+        selected = [rel.id for rel in self.relationships[::3]]
+        model = WeightSensitivityModel(self.propagator, self.seeds, self.targets, selected)
+        points = np.random.default_rng(0).uniform(0.2, 3.0, size=(4, len(selected)))
+        values = model.evaluate(points)
+
+        for point, value in zip(points, values):
+            expected = self._repropagate(dict(zip(selected, point)))
+            self.assertAlmostEqual(value, expected, places=10)
+
+    def test_zero_multiplier_removes_relationship(self):
+        """Test scaling a weight to zero is the same as removing the relationship."""
+        rel = self.relationships[5]
+        model = WeightSensitivityModel(self.propagator, self.seeds, self.targets, [rel.id])
+        joint, single = model.evaluate([[0.0]])[0], model.evaluate_one_at_a_time([0.0])[0]
+        self.graph.remove_relationship(rel.id)
+        result = ImpactPropagator(self.graph, tol=1e-14, max_iter=5000).propagate(
+            self.seeds, warm_start=False)
+        expected = sum(result.scores.get(node_id, 0.0) for node_id in self.targets)
+
+        self.assertAlmostEqual(joint, expected, places=10)
+        self.assertAlmostEqual(single, expected, places=10)
+
+    def test_invalid_arguments(self):
+        """Test unknown relationships, absent seeds and oversized designs are rejected."""
+        with self.assertRaises(ValueError):
+            WeightSensitivityModel(self.propagator, self.seeds, relationship_ids=["missing"])
+        with self.assertRaises(ValueError):
+            WeightSensitivityModel(self.propagator, [Actor(label="Outsider").id])
+        model = WeightSensitivityModel(self.propagator, self.seeds, max_design_sources=2)
+        with self.assertRaises(ValueError):
+            model.evaluate(np.ones((1, len(self.relationships))))
+        with self.assertRaises(ValueError):
+            model.evaluate_one_at_a_time(-np.ones(len(self.relationships)))
+
+    def test_small_memory_budget_matches(self):
+        """Test chunks sized from a tiny memory budget give the same values."""
+        selected = [rel.id for rel in self.relationships[::2]]
+        model = WeightSensitivityModel(self.propagator, self.seeds, self.targets, selected)
+        small = WeightSensitivityModel(self.propagator, self.seeds, self.targets, selected,
+                                       memory_budget=1)
+        points = np.random.default_rng(1).uniform(0.2, 3.0, size=(5, len(selected)))
+
+        self.assertEqual(small.points_per_chunk, 1)
+        np.testing.assert_allclose(small.evaluate(points), model.evaluate(points), atol=1e-12)
+        self.assertAlmostEqual(small.evaluate(points[:1])[0],
+                               self._repropagate(dict(zip(selected, points[0]))), places=10)
+        np.testing.assert_allclose(sobol_indices(small, samples=8, seed=2).indices["total"],
+                                   sobol_indices(model, samples=8, seed=2).indices["total"])
+        np.testing.assert_allclose(
+            morris_screening(small, trajectories=3, seed=2).indices["mu_star"],
+            morris_screening(model, trajectories=3, seed=2).indices["mu_star"])
+
+    def test_design_guard_precedes_sampling(self):
+        """Test oversized joint designs are refused before any point is generated."""
+        model = WeightSensitivityModel(self.propagator, self.seeds, max_design_sources=2)
+        for design in (morris_screening, sobol_indices):
+            with mock.patch.object(np.random, "default_rng") as rng:
+                with self.assertRaises(ValueError):
+                    design(model)
+            rng.assert_not_called()
+
+
+class TestSensitivityDesigns(unittest.TestCase):
+    """Test the designs rank the relationship that carries the influence."""
+
+    def setUp(self):
+        """Set up a seed with one route to the target and one route away from it."""
+        self.graph = SFMGraph()
+        self.seed, self.hub, self.target, self.sink = (
+            Actor(label=label) for label in ("Seed", "Hub", "Target", "Sink"))
+        for node in (self.seed, self.hub, self.target, self.sink):
+            self.graph.add_node(node)
+        self.main = Relationship(self.seed.id, self.hub.id, RelationshipKind.AFFECTS, weight=1.0)
+        self.link = Relationship(self.hub.id, self.target.id, RelationshipKind.AFFECTS,
+                                 weight=1.0)
+        self.leak = Relationship(self.hub.id, self.sink.id, RelationshipKind.AFFECTS, weight=1.0)
+        self.side = Relationship(self.sink.id, self.seed.id, RelationshipKind.AFFECTS,
+                                 weight=1.0)
+        for rel in (self.main, self.link, self.leak, self.side):
+            self.graph.add_relationship(rel)
+        self.model = WeightSensitivityModel(ImpactPropagator(self.graph), [self.seed.id],
+                                            [self.target.id])
+
+    def test_one_at_a_time(self):
+        """Test sensitivities have the expected signs and elasticities are relative."""
+        result = one_at_a_time(self.model, perturbation=0.1)
+
+        self.assertEqual(result.evaluations, 4)
+        self.assertGreater(result.relationship_indices(self.link.id)["sensitivity"], 0.0)
+        self.assertLess(result.relationship_indices(self.leak.id)["sensitivity"], 0.0)
+        self.assertAlmostEqual(result.relationship_indices(self.main.id)["sensitivity"], 0.0)
+        np.testing.assert_allclose(result.indices["elasticity"] * result.baseline,
+                                   result.indices["sensitivity"])
+        self.assertIn(result.ranked(1)[0][0], {self.link.id, self.leak.id})
+
+    def test_morris_screening(self):
+        """Test elementary effects single out the competing relationships."""
+        result = morris_screening(self.model, perturbation=0.5, trajectories=8, seed=1)
+
+        self.assertEqual(result.evaluations, 8 * 5)
+        self.assertAlmostEqual(result.relationship_indices(self.main.id)["mu_star"], 0.0)
+        self.assertNotIn(result.ranked(2)[0][0], {self.main.id, self.side.id})
+        self.assertGreater(result.relationship_indices(self.link.id)["mu"], 0.0)
+
+    def test_sobol_indices(self):
+        """Test total effects are reproducible and near zero for inert weights."""
+        first = sobol_indices(self.model, perturbation=0.5, samples=512, seed=4)
+        second = sobol_indices(self.model, perturbation=0.5, samples=512, seed=4)
+
+        np.testing.assert_allclose(first.indices["total"], second.indices["total"])
+        self.assertEqual(first.evaluations, 512 * 6)
+        self.assertAlmostEqual(first.relationship_indices(self.main.id)["total"], 0.0)
+        self.assertGreater(first.relationship_indices(self.link.id)["total"], 0.2)
+        self.assertEqual({rel_id for rel_id, _ in first.ranked(2)},
+                         {self.link.id, self.leak.id})
+
+    def test_invalid_designs(self):
+        """Test perturbations and sample counts are validated."""
+        with self.assertRaises(ValueError):
+            one_at_a_time(self.model, perturbation=0.0)
+        with self.assertRaises(ValueError):
+            morris_screening(self.model, levels=1)
+        with self.assertRaises(ValueError):
+            sobol_indices(self.model, samples=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,7 +34,24 @@ from core.sfm_service import (
     RelationshipResponse,
     GraphStatistics,
     CentralityAnalysis,
+    PathResult,
     PolicyImpactAnalysis,
+    PolicyOverlap,
+    BatchPolicyImpactAnalysis,
+    FailureScenarioResult,
+    FailureSimulationBatch,
+    RobustnessCurveAnalysis,
+    ReachabilityResult,
+    FlowEfficiencyMatrixAnalysis,
+    DemandShockAnalysis,
+    SectorMultiplierAnalysis,
+    DeliveryMatrixView,
+    ComponentDeliveries,
+    CeremonialBalanceAnalysis,
+    UncertaintyAnalysis,
+    WeightSensitivityAnalysis,
+    TemporalProjectionAnalysis,
+    ImpactPropagationAnalysis,
 )
 from core.sfm_models import Actor, Institution, Policy, Resource, Relationship
 from core.sfm_enums import ResourceType
@@ -166,7 +183,9 @@ class TestSFMAPIStatistics(unittest.TestCase):
         self.assertIn("most_central_nodes", data)
         self.assertEqual(len(data["most_central_nodes"]), 2)
         
-        self.mock_service.analyze_centrality.assert_called_once_with("betweenness", 10)
+        self.mock_service.analyze_centrality.assert_called_once_with(
+            "betweenness", 10, sample_size=None
+        )
 
     def test_analyze_policy_impact(self):
         """Test policy impact analysis endpoint."""
@@ -219,8 +238,356 @@ class TestSFMAPIStatistics(unittest.TestCase):
         self.assertEqual(data["path_length"], 3)
         self.assertIn("timestamp", data)
         
-        self.mock_service.find_shortest_path.assert_called_once_with(source_id, target_id, None)
+        self.mock_service.find_shortest_path.assert_called_once_with(
+            source_id, target_id, None, cost=None
+        )
+
+    def test_find_shortest_paths_bulk(self):
+        """Test bulk shortest path endpoint."""
+        source_id = str(uuid.uuid4())
+        targets = [str(uuid.uuid4()) for _ in range(2)]
+        self.mock_service.find_shortest_paths_bulk.return_value = [
+            PathResult(source_id, targets[0], [source_id, targets[0]], 2),
+            PathResult(source_id, targets[1], None, 0),
+        ]
 
+        response = self.client.post("/analytics/shortest-paths", json={
+            "pairs": [{"source_id": source_id, "target_id": target} for target in targets],
+            "relationship_kinds": ["GOVERNS"],
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["path_count"], 2)
+        self.assertEqual(data["distinct_sources"], 1)
+        self.assertEqual(data["paths"][0]["path"], [source_id, targets[0]])
+        self.assertIsNone(data["paths"][1]["path"])
+        self.mock_service.find_shortest_paths_bulk.assert_called_once_with(
+            [(source_id, targets[0]), (source_id, targets[1])], ["GOVERNS"], cost=None
+        )
+
+
+    def test_analyze_policy_impacts(self):
+        """Test batch policy impact endpoint."""
+        policy_ids = [str(uuid.uuid4()) for _ in range(2)]
+        self.mock_service.analyze_policy_impacts.return_value = BatchPolicyImpactAnalysis(
+            impacts=[
+                PolicyImpactAnalysis(policy_id, 1, [], [], [], {"density": 0.5}, 2)
+                for policy_id in policy_ids
+            ],
+            overlaps=[PolicyOverlap(policy_ids[0], policy_ids[1], 1, 1.0)],
+            missing_policies=[],
+            impact_radius=2,
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.post("/analytics/policy-impact/batch", json={
+            "policy_ids": policy_ids, "impact_radius": 2,
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(len(data["impacts"]), 2)
+        self.assertEqual(data["overlaps"][0]["shared_nodes"], 1)
+        self.mock_service.analyze_policy_impacts.assert_called_once_with(
+            policy_ids, 2, min_shared=1
+        )
+
+    def test_propagate_impact(self):
+        """Test weighted impact propagation endpoint."""
+        seed_id, node_id = str(uuid.uuid4()), str(uuid.uuid4())
+        self.mock_service.propagate_impact.return_value = ImpactPropagationAnalysis(
+            seed_ids=[seed_id],
+            ranked_nodes=[(node_id, 0.4)],
+            damping=0.85,
+            iterations=12,
+            converged=True,
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.get(
+            "/analytics/impact-propagation", params={"seed_ids": [seed_id], "top_k": 5}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["ranked_nodes"], [[node_id, 0.4]])
+        self.mock_service.propagate_impact.assert_called_once_with(
+            [seed_id], 5, damping=None, include_seeds=False
+        )
+
+    def test_simulate_node_failures(self):
+        """Test batch failure simulation endpoint."""
+        node_id = str(uuid.uuid4())
+        self.mock_service.simulate_node_failures.return_value = FailureSimulationBatch(
+            scenarios=[FailureScenarioResult(
+                failed_nodes=[node_id],
+                connectivity_impact={"component_increase": 1},
+                isolated_nodes=[],
+                cascading_failures=[],
+            )],
+            failure_mode="complete",
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.post("/analytics/failure-simulation/batch", json={
+            "failure_sets": [[node_id]], "failure_mode": "complete",
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["scenarios"][0]["connectivity_impact"]["component_increase"], 1)
+        self.mock_service.simulate_node_failures.assert_called_once_with(
+            [[node_id]], "complete"
+        )
+
+    def test_get_robustness_curve(self):
+        """Test robustness curve endpoint."""
+        self.mock_service.get_robustness_curve.return_value = RobustnessCurveAnalysis(
+            strategy="random",
+            fractions=[1.0, 0.5, 0.0],
+            std=[0.0, 0.1, 0.0],
+            robustness=0.25,
+            critical_fraction=0.5,
+            removal_order=[],
+            trials=5,
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.get(
+            "/analytics/robustness-curve", params={"strategy": "random", "trials": 5}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["fractions"], [1.0, 0.5, 0.0])
+        self.mock_service.get_robustness_curve.assert_called_once_with("random", 5, None)
+
+    def test_analyze_demand_shocks(self):
+        """Test input-output demand shock endpoint."""
+        sector_id = str(uuid.uuid4())
+        self.mock_service.analyze_demand_shocks.return_value = DemandShockAnalysis(
+            scenarios=[{sector_id: 12.5}],
+            total_output_changes=[12.5],
+            sectors=1,
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.post(
+            "/analytics/input-output/demand-shocks", json={"shocks": [{sector_id: 10.0}]}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["total_output_changes"], [12.5])
+        self.mock_service.analyze_demand_shocks.assert_called_once_with([{sector_id: 10.0}])
+
+    def test_get_sector_multipliers(self):
+        """Test input-output multiplier endpoint."""
+        sector_id = str(uuid.uuid4())
+        self.mock_service.get_sector_multipliers.return_value = SectorMultiplierAnalysis(
+            multipliers={sector_id: {"output_multiplier": 1.5, "forward_linkage": 1.2}},
+            sectors=1,
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.get("/analytics/input-output/multipliers")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["multipliers"][sector_id]["output_multiplier"], 1.5)
+
+    def test_propagate_impact_uncertainty(self):
+        """Test Monte Carlo impact propagation endpoint."""
+        seed_id, node_id = str(uuid.uuid4()), str(uuid.uuid4())
+        self.mock_service.propagate_impact_uncertainty.return_value = UncertaintyAnalysis(
+            analysis="impact_propagation",
+            draws=500,
+            percentiles=[5.0, 50.0, 95.0],
+            bands={node_id: {"mean": 0.2, "std": 0.05, "p5": 0.1, "p50": 0.2, "p95": 0.3}},
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.post(
+            "/analytics/uncertainty/impact",
+            json={"seed_ids": [seed_id], "draws": 500, "seed": 7},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["bands"][node_id]["p95"], 0.3)
+        self.mock_service.propagate_impact_uncertainty.assert_called_once_with(
+            [seed_id], 500, 7, 20
+        )
+
+    def test_analyze_output_uncertainty(self):
+        """Test Monte Carlo input-output endpoint."""
+        sector_id = str(uuid.uuid4())
+        self.mock_service.analyze_output_uncertainty.return_value = UncertaintyAnalysis(
+            analysis="input_output",
+            draws=1000,
+            percentiles=[5.0, 50.0, 95.0],
+            bands={sector_id: {"mean": 12.0, "std": 1.0, "p5": 10.4, "p50": 12.0,
+                               "p95": 13.6}},
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.post(
+            "/analytics/uncertainty/input-output", json={"flow_variability": 0.1}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["analysis"], "input_output")
+        self.mock_service.analyze_output_uncertainty.assert_called_once_with(
+            None, 1000, None, 0.1
+        )
+
+    def test_analyze_weight_sensitivity(self):
+        """Test relationship weight sensitivity endpoint."""
+        seed_id, rel_id = str(uuid.uuid4()), str(uuid.uuid4())
+        self.mock_service.analyze_weight_sensitivity.return_value = WeightSensitivityAnalysis(
+            method="sobol",
+            baseline=0.4,
+            ranking_index="total",
+            ranked_relationships=[(rel_id, 0.7)],
+            indices={rel_id: {"first_order": 0.6, "total": 0.7}},
+            evaluations=768,
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.post(
+            "/analytics/sensitivity/weights",
+            json={"seed_ids": [seed_id], "method": "sobol", "seed": 3},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["ranked_relationships"], [[rel_id, 0.7]])
+        self.mock_service.analyze_weight_sensitivity.assert_called_once_with(
+            [seed_id], None, None, "sobol", 0.1, None, 3, 20
+        )
+
+    def test_project_temporal_dynamics(self):
+        """Test temporal dynamics projection endpoint."""
+        entity_id = str(uuid.uuid4())
+        self.mock_service.project_temporal_dynamics.return_value = TemporalProjectionAnalysis(
+            steps=2,
+            times=[0.0, 0.5],
+            trajectories={entity_id: [1.0, 1.5]},
+            function_types={entity_id: "LINEAR"},
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.post(
+            "/analytics/temporal-dynamics/projection",
+            json={"steps": 2, "dt": 0.5, "entity_ids": [entity_id]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["trajectories"][entity_id], [1.0, 1.5])
+        self.mock_service.project_temporal_dynamics.assert_called_once_with(
+            2, 0.5, None, [entity_id], None
+        )
+
+    def test_analyze_ceremonial_balance(self):
+        """Test ceremonial/instrumental balance endpoint."""
+        balance = {"ceremonial": 3.0, "instrumental": 1.0, "score": 0.75}
+        self.mock_service.analyze_ceremonial_balance.return_value = CeremonialBalanceAnalysis(
+            group_by="community",
+            overall=balance,
+            groups={"0": balance},
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.get("/analytics/ceremonial-balance?group_by=community&top_k=5")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["groups"]["0"]["score"], 0.75)
+        self.mock_service.analyze_ceremonial_balance.assert_called_once_with("community", 5)
+
+    def test_get_delivery_matrix(self):
+        """Test delivery-matrix block endpoint."""
+        source_id, target_id = str(uuid.uuid4()), str(uuid.uuid4())
+        self.mock_service.get_delivery_matrix.return_value = DeliveryMatrixView(
+            row_type="Institution",
+            column_type="Actor",
+            relationship_kind="FUNDS",
+            row_ids=[source_id],
+            column_ids=[target_id],
+            deliveries=[{"source_id": source_id, "target_id": target_id, "weight": 3.0}],
+            total_weight=3.0,
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.get(
+            "/analytics/delivery-matrix",
+            params={"row_type": "Institution", "column_type": "Actor",
+                    "relationship_kind": "FUNDS"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["total_weight"], 3.0)
+        self.mock_service.get_delivery_matrix.assert_called_once_with(
+            "Institution", "Actor", "FUNDS", False
+        )
+
+    def test_get_component_deliveries(self):
+        """Test component delivery-matrix row and column endpoint."""
+        node_id, other_id = str(uuid.uuid4()), str(uuid.uuid4())
+        self.mock_service.get_component_deliveries.return_value = ComponentDeliveries(
+            node_id=node_id,
+            relationship_kind=None,
+            delivers_to={other_id: 1.5},
+            receives_from={},
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.get(f"/analytics/delivery-matrix/nodes/{node_id}")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["delivers_to"], {other_id: 1.5})
+        self.mock_service.get_component_deliveries.assert_called_once_with(node_id, None)
+
+    def test_calculate_flow_efficiency_matrix(self):
+        """Test flow efficiency matrix endpoint."""
+        source_id, target_id = str(uuid.uuid4()), str(uuid.uuid4())
+        self.mock_service.calculate_flow_efficiency_matrix.return_value = (
+            FlowEfficiencyMatrixAnalysis(
+                source_ids=[source_id],
+                target_ids=[target_id],
+                efficiencies=[[0.5]],
+                average_efficiency=0.5,
+                exact=True,
+                landmarks=16,
+                timestamp="2024-01-01T00:00:00",
+            )
+        )
+
+        response = self.client.post(
+            "/analytics/flow-efficiency/matrix",
+            json={"source_ids": [source_id], "target_ids": [target_id], "exact": True},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["efficiencies"], [[0.5]])
+        self.mock_service.calculate_flow_efficiency_matrix.assert_called_once_with(
+            [source_id], [target_id], True, "degree"
+        )
+
+    def test_check_reachability(self):
+        """Test reachability endpoint."""
+        source_id, target_id = str(uuid.uuid4()), str(uuid.uuid4())
+        self.mock_service.can_reach.return_value = ReachabilityResult(
+            source_id=source_id,
+            target_id=target_id,
+            reachable=True,
+            relationship_kinds=["GOVERNS"],
+            timestamp="2024-01-01T00:00:00",
+        )
+
+        response = self.client.get(
+            "/analytics/reachability",
+            params={"source_id": source_id, "target_id": target_id,
+                    "relationship_kinds": ["GOVERNS"]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["reachable"])
+        self.mock_service.can_reach.assert_called_once_with(source_id, target_id, ["GOVERNS"])
 
 class TestSFMAPIActors(unittest.TestCase):
     """Test suite for actor CRUD endpoints."""
@@ -356,6 +723,27 @@ class TestSFMAPIActors(unittest.TestCase):
         
         self.mock_service.get_node_neighbors.assert_called_once_with(actor_id, None, 2)
 
+    def test_get_actor_neighbors_with_paths(self):
+        """Test getting actor neighbors with distances and relationship paths."""
+        actor_id = str(uuid.uuid4())
+        neighbor_id = str(uuid.uuid4())
+        rel_id = str(uuid.uuid4())
+        self.mock_service.get_node_neighborhood.return_value = {
+            neighbor_id: {"distance": 1, "path": [rel_id]}
+        }
+
+        response = self.client.get(f"/actors/{actor_id}/neighbors?include_paths=true")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["neighbors"], [neighbor_id])
+        self.assertEqual(data["distances"], {neighbor_id: 1})
+        self.assertEqual(data["paths"], {neighbor_id: [rel_id]})
+        self.mock_service.get_node_neighborhood.assert_called_once_with(
+            actor_id, None, 1, include_paths=True
+        )
+        self.mock_service.get_node_neighbors.assert_not_called()
+
 
 class TestSFMAPIInstitutions(unittest.TestCase):
     """Test suite for institution CRUD endpoints."""
@@ -17,11 +17,14 @@ from core.sfm_models import (
     Resource,
     Policy,
     Flow,
+    Process,
     Relationship,
     Node,
-    
+    Indicator,
+    TemporalDynamics,
 )
-from core.sfm_enums import ResourceType, FlowNature,RelationshipKind
+from core.sfm_enums import ResourceType, FlowNature,RelationshipKind, TemporalFunctionType, InstitutionLayer
+from core.meta_entities import TimeSlice
 from core.sfm_query import (
     SFMQueryEngine,
     NetworkXSFMQueryEngine,
@@ -420,6 +423,37 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         # Should handle the filtering and path length checks
         self.assertIsInstance(neighbors, list)
 
+    def test_traverse_distances_and_paths(self):
+        """Test bounded traversal follows only allowed kinds up to max_depth."""
+        graph = SFMGraph()
+        a, b, c, d = (Actor(label=label) for label in "ABCD")
+        for actor in (a, b, c, d):
+            graph.add_node(actor)
+        ab = Relationship(a.id, b.id, RelationshipKind.GOVERNS)
+        bc = Relationship(b.id, c.id, RelationshipKind.GOVERNS)
+        cd = Relationship(c.id, d.id, RelationshipKind.GOVERNS)
+        ad = Relationship(a.id, d.id, RelationshipKind.AFFECTS)
+        for rel in (ab, bc, cd, ad):
+            graph.add_relationship(rel)
+        engine = NetworkXSFMQueryEngine(graph)
+
+        result = engine.traverse(a.id, 2, [RelationshipKind.GOVERNS], include_paths=True)
+
+        self.assertEqual(result.distances, {b.id: 1, c.id: 2})
+        self.assertEqual(result.paths, {b.id: [ab.id], c.id: [ab.id, bc.id]})
+        self.assertEqual(engine.traverse(a.id, 3).distances, {b.id: 1, d.id: 1, c.id: 2})
+        self.assertEqual(engine.traverse(uuid.uuid4(), 2).node_ids, [])
+
+    @patch("networkx.shortest_path_length")
+    def test_filtered_multihop_neighbors_use_traversal(self, mock_path_length):
+        """Test kind-filtered multi-hop neighbors expand from the seed only."""
+        neighbors = self.query_engine.get_node_neighbors(
+            self.actor1.id, relationship_kinds=[RelationshipKind.GOVERNS], distance=2
+        )
+
+        self.assertIn(self.actor2.id, neighbors)
+        mock_path_length.assert_not_called()
+
     def test_get_node_neighbors_negative_distance(self):
         """Test handling of negative distance parameter."""
         neighbors = self.query_engine.get_node_neighbors(self.actor1.id, distance=-1)
@@ -479,6 +513,93 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         self.assertIsNone(path)
         mock_shortest_path.assert_called_once()
 
+    def test_filtered_view_built_once_per_graph_version(self):
+        """Test kind-filtered views are reused until the graph changes."""
+        kinds = [RelationshipKind.GOVERNS]
+        view = self.query_engine.get_filtered_view(kinds)
+
+        self.query_engine.find_shortest_path(self.actor1.id, self.actor2.id, kinds)
+        self.assertIs(self.query_engine.get_filtered_view(kinds), view)
+
+        self.graph.add_relationship(
+            Relationship(self.actor2.id, self.institution.id, RelationshipKind.GOVERNS)
+        )
+        updated = self.query_engine.get_filtered_view(kinds)
+        self.assertIsNot(updated, view)
+        self.assertTrue(updated.has_edge(self.actor2.id, self.institution.id))
+
+    def test_weighted_shortest_path(self):
+        """Test weight and certainty costs with Dijkstra and A*."""
+        graph = SFMGraph()
+        a, b, c = (Actor(label=label) for label in "ABC")
+        for actor in (a, b, c):
+            graph.add_node(actor)
+        graph.add_relationship(Relationship(a.id, b.id, RelationshipKind.GOVERNS,
+                                            weight=1.0, certainty=0.5))
+        graph.add_relationship(Relationship(b.id, c.id, RelationshipKind.GOVERNS,
+                                            weight=1.0, certainty=0.5))
+        graph.add_relationship(Relationship(a.id, c.id, RelationshipKind.GOVERNS,
+                                            weight=5.0, certainty=0.9))
+        engine = NetworkXSFMQueryEngine(graph)
+
+        self.assertEqual(engine.find_shortest_path(a.id, c.id), [a.id, c.id])
+        self.assertEqual(engine.find_shortest_path(a.id, c.id, cost="weight"), [a.id, b.id, c.id])
+        self.assertEqual(engine.find_shortest_path(a.id, c.id, cost="certainty"), [a.id, c.id])
+        self.assertEqual(
+            engine.find_shortest_path(a.id, c.id, cost="weight", heuristic=lambda u, v: 0.0),
+            [a.id, b.id, c.id],
+        )
+        with self.assertRaises(ValueError):
+            engine.find_shortest_path(a.id, c.id, cost="distance")
+
+    def test_weighted_shortest_path_rejects_negative_weights(self):
+        """Test weight-cost searches raise a clear error on negative weights."""
+        graph = SFMGraph()
+        a, b, c = (Actor(label=label) for label in "ABC")
+        for actor in (a, b, c):
+            graph.add_node(actor)
+        graph.add_relationship(Relationship(a.id, b.id, RelationshipKind.GOVERNS, weight=-3.0))
+        graph.add_relationship(Relationship(b.id, c.id, RelationshipKind.GOVERNS, weight=-3.0))
+        graph.add_relationship(Relationship(a.id, c.id, RelationshipKind.GOVERNS, weight=1.0))
+        engine = NetworkXSFMQueryEngine(graph)
+
+        with self.assertRaisesRegex(ValueError, "negative weight"):
+            engine.find_shortest_path(a.id, c.id, cost="weight")
+        with self.assertRaisesRegex(ValueError, "negative weight"):
+            engine.find_shortest_paths_bulk([(a.id, c.id)], cost="weight")
+        # Unweighted and certainty searches do not use the weights
+        self.assertEqual(engine.find_shortest_path(a.id, c.id), [a.id, c.id])
+        self.assertEqual(
+            engine.find_shortest_paths_bulk([(a.id, c.id)], cost="certainty"),
+            {(a.id, c.id): [a.id, c.id]},
+        )
+
+    def test_find_shortest_paths_bulk(self):
+        """Test bulk paths agree with per-pair searches and search each source once."""
+        node_ids = list(self.query_engine.nx_graph.nodes())
+        pairs = [(source, target) for source in node_ids[:3] for target in node_ids]
+        pairs.append((uuid.uuid4(), node_ids[0]))
+
+        with patch.object(self.query_engine, "_bfs_paths",
+                          wraps=self.query_engine._bfs_paths) as mock_bfs:
+            results = self.query_engine.find_shortest_paths_bulk(pairs)
+
+        self.assertEqual(mock_bfs.call_count, 3)
+        for source, target in pairs:
+            expected = self.query_engine.find_shortest_path(source, target)
+            path = results[(source, target)]
+            self.assertEqual(path is None, expected is None)
+            if path is not None:
+                self.assertEqual(len(path), len(expected))
+                self.assertEqual((path[0], path[-1]), (source, target))
+
+        weighted = self.query_engine.find_shortest_paths_bulk(pairs, cost="weight")
+        for source, target in pairs:
+            self.assertEqual(
+                weighted[(source, target)] is None,
+                results[(source, target)] is None,
+            )
+
     def test_get_relationship_strength(self):
         """Test calculating relationship strength."""
         # Test existing relationship
@@ -493,7 +614,7 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         )
         self.assertEqual(no_strength, 0.0)
 
-    @patch("networkx.simple_cycles")
+    @patch("core.cycles.BoundedCycleSearch._simple_cycles")
     def test_find_cycles(self, mock_cycles):
         """Test finding cycles in the graph using centralized mocks."""
         mock_cycles.return_value = [
@@ -507,7 +628,7 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         self.assertIn(self.actor1.id, cycles[0])
         mock_cycles.assert_called_once()
 
-    @patch("networkx.simple_cycles")
+    @patch("networkx.strongly_connected_components")
     def test_find_cycles_network_error(self, mock_cycles):
         """Test finding cycles with NetworkX error."""
         mock_cycles.side_effect = nx.NetworkXError("Graph error")
@@ -517,6 +638,31 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         self.assertEqual(cycles, [])
         mock_cycles.assert_called_once()
 
+    def test_iter_cycles_is_bounded(self):
+        """Test lazy cycle enumeration honours the length and count caps."""
+        graph = SFMGraph()
+        actors = [Actor(label=f"Actor {i}") for i in range(8)]
+        for actor in actors:
+            graph.add_node(actor)
+        for source in actors:
+            for target in actors:
+                if source is not target:
+                    graph.add_relationship(Relationship(source.id, target.id,
+                                                        RelationshipKind.GOVERNS))
+        engine = NetworkXSFMQueryEngine(graph)
+
+        search = engine.iter_cycles(max_length=3, max_cycles=10)
+        cycles = list(search)
+
+        self.assertEqual(len(cycles), 10)
+        self.assertTrue(search.truncated)
+        self.assertTrue(all(len(cycle) <= 3 for cycle in cycles))
+        self.assertEqual(len(engine.find_cycles(max_length=2, max_cycles=None)), 28)
+        truncated = engine.find_cycles(max_length=3, max_cycles=10)
+        self.assertTrue(truncated.truncated)
+        self.assertEqual(truncated.truncation_reason, "max_cycles")
+        self.assertFalse(engine.find_cycles(max_length=2, max_cycles=None).truncated)
+
     def test_trace_resource_flows(self):
         """Test tracing resource flows."""
         flow_analysis = self.query_engine.trace_resource_flows(ResourceType.NATURAL)
@@ -616,52 +762,48 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
 
     def test_calculate_flow_efficiency(self):
         """Test calculating flow efficiency."""
-        # Mock the shortest path finding
-        with patch.object(self.query_engine, "find_shortest_path") as mock_path:
-            mock_path.return_value = [self.actor1.id, self.actor2.id]
+        with patch("networkx.bidirectional_shortest_path") as mock_search:
+            mock_search.return_value = [self.actor1.id, self.actor2.id]
 
             efficiency = self.query_engine.calculate_flow_efficiency(
                 self.actor1.id, self.actor2.id
             )
 
-            # Path length is 2 nodes, so 1 edge, efficiency should be 1.0
+            # One hop, so efficiency should be 1.0
             self.assertEqual(efficiency, 1.0)
+            mock_search.assert_called_once_with(
+                self.query_engine.nx_graph, self.actor1.id, self.actor2.id
+            )
 
     def test_calculate_flow_efficiency_no_path(self):
         """Test calculating flow efficiency when no path exists."""
-        with patch.object(self.query_engine, "find_shortest_path") as mock_path:
-            mock_path.return_value = None
-            
-            efficiency = self.query_engine.calculate_flow_efficiency(
-                self.actor1.id, uuid.uuid4()
-            )
-            
-            # No path should return 0.0 efficiency
-            self.assertEqual(efficiency, 0.0)
+        efficiency = self.query_engine.calculate_flow_efficiency(
+            self.actor1.id, uuid.uuid4()
+        )
+
+        # No path should return 0.0 efficiency
+        self.assertEqual(efficiency, 0.0)
 
     def test_calculate_flow_efficiency_zero_division(self):
         """Test calculating flow efficiency with zero division error."""
-        with patch.object(self.query_engine, "find_shortest_path") as mock_path:
-            mock_path.return_value = [self.actor1.id]  # Single node path
-            
-            efficiency = self.query_engine.calculate_flow_efficiency(
-                self.actor1.id, self.actor1.id
-            )
-            
-            # Zero length path should return 0.0 efficiency
-            self.assertEqual(efficiency, 0.0)
+        efficiency = self.query_engine.calculate_flow_efficiency(
+            self.actor1.id, self.actor1.id
+        )
 
-    def test_calculate_flow_efficiency_network_error(self):
-        """Test calculating flow efficiency with NetworkX error."""
-        with patch.object(self.query_engine, "find_shortest_path") as mock_path:
-            mock_path.side_effect = nx.NetworkXError("Graph error")
-            
+        # Zero length path should return 0.0 efficiency
+        self.assertEqual(efficiency, 0.0)
+
+    def test_calculate_flow_efficiency_skips_path_search(self):
+        """Test a single pair needs neither a path search nor a distance oracle."""
+        with patch.object(self.query_engine, "find_shortest_path") as mock_path, \
+                patch.object(self.query_engine, "distance_oracle") as mock_oracle:
             efficiency = self.query_engine.calculate_flow_efficiency(
                 self.actor1.id, self.actor2.id
             )
-            
-            # Network error should return 0.0 efficiency
-            self.assertEqual(efficiency, 0.0)
+
+            self.assertEqual(efficiency, 1.0)
+            mock_path.assert_not_called()
+            mock_oracle.assert_not_called()
 
     @patch("networkx.ego_graph")
     @patch("networkx.density")
@@ -743,18 +885,57 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         self.assertIn(resource.id, impact["affected_resources"])
         self.assertIn(institution.id, impact["affected_institutions"])
 
-    def test_identify_policy_targets(self):
-        """Test identifying policy targets using centralized mocks."""
-        with patch.object(self.query_engine, "get_node_neighbors") as mock_neighbors:
-            mock_neighbors.side_effect = [
-                [self.actor1.id],  # Direct targets
-                [self.actor1.id, self.actor2.id],  # 2-hop targets
-            ]
+    def test_analyze_policy_impacts_matches_single_analysis(self):
+        """Test the batch analysis agrees with per-policy analysis."""
+        other_policy = Policy(label="Second Policy", authority="Government")
+        self.graph.add_node(other_policy)
+        self.graph.add_relationship(Relationship(
+            source_id=other_policy.id, target_id=self.actor1.id, kind=RelationshipKind.AFFECTS
+        ))
+        self.graph.add_relationship(Relationship(
+            source_id=self.policy.id, target_id=self.actor1.id, kind=RelationshipKind.AFFECTS
+        ))
+
+        batch = self.query_engine.analyze_policy_impacts([self.policy.id, other_policy.id])
+
+        for policy_id in (self.policy.id, other_policy.id):
+            single = self.query_engine.analyze_policy_impact(policy_id)
+            impact = batch["impacts"][policy_id]
+            self.assertEqual(impact["total_affected_nodes"], single["total_affected_nodes"])
+            self.assertCountEqual(impact["affected_actors"], single["affected_actors"])
+        self.assertEqual(len(batch["overlaps"]), 1)
+        self.assertEqual(batch["missing"], [])
+
+    def test_propagate_impact(self):
+        """Test weighted propagation ranks reachable nodes and reuses its matrix."""
+        self.graph.add_relationship(Relationship(
+            source_id=self.policy.id, target_id=self.actor1.id,
+            kind=RelationshipKind.AFFECTS, weight=1.0,
+        ))
+
+        result = self.query_engine.propagate_impact([self.policy.id])
+        ranking = result.ranked()
+
+        self.assertIn(self.actor1.id, dict(ranking))
+        self.assertNotIn(self.policy.id, dict(ranking))
+        self.assertEqual([score for _, score in ranking],
+                         sorted((score for _, score in ranking), reverse=True))
+        self.assertIs(self.query_engine.impact_propagator, self.query_engine.impact_propagator)
+        batch = self.query_engine.propagate_impact_batch([[self.policy.id], [self.actor1.id]])
+        self.assertEqual(len(batch), 2)
 
+    def test_identify_policy_targets(self):
+        """Test policy targets come from one 2-hop traversal, excluding the policy."""
+        with patch.object(self.query_engine, "traverse",
+                          wraps=self.query_engine.traverse) as mock_traverse:
             targets = self.query_engine.identify_policy_targets(self.policy.id)
 
-            self.assertIsInstance(targets, list)
-            self.assertIn(self.actor1.id, targets)
+        mock_traverse.assert_called_once_with(self.policy.id, 2)
+        self.assertIsInstance(targets, list)
+        self.assertNotIn(self.policy.id, targets)
+        self.assertCountEqual(
+            targets, self.query_engine.get_node_neighbors(self.policy.id, distance=2)
+        )
 
     def test_compare_policy_scenarios(self):
         """Test comparing policy scenarios."""
@@ -808,6 +989,30 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         communities_unknown = self.query_engine.identify_communities("unknown_algorithm")
         self.assertIsInstance(communities_unknown, dict)
 
+    def test_louvain_communities_follow_graph_versions(self):
+        """Test Louvain results are cached per version and track mutations."""
+        communities = self.query_engine.identify_communities()
+        tracker = self.query_engine._community_tracker  # pylint: disable=protected-access
+
+        self.assertEqual(self.query_engine.identify_communities(), communities)
+        self.assertEqual(tracker.last_update, "cached")
+        for label, members in communities.items():
+            for node_id in members:
+                self.assertEqual(self.query_engine.get_community_assignment(node_id), str(label))
+
+        newcomer = Actor(label="Newcomer")
+        self.graph.add_node(newcomer)
+        self.graph.add_relationship(Relationship(
+            source_id=newcomer.id, target_id=self.actor1.id, kind=RelationshipKind.AFFECTS
+        ))
+        updated = self.query_engine.identify_communities()
+
+        self.assertIn(tracker.last_update, ("incremental", "full"))
+        self.assertCountEqual([node for members in updated.values() for node in members],
+                              list(self.query_engine.nx_graph.nodes()))
+        self.assertIsNotNone(self.query_engine.get_community_assignment(newcomer.id))
+        self.assertIsNone(self.query_engine.get_community_assignment(uuid.uuid4()))
+
     @patch("networkx.betweenness_centrality")
     def test_get_structural_holes(self, mock_centrality):
         """Test identifying structural holes using centralized mocks."""
@@ -959,6 +1164,229 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         self.assertIn("connectivity_impact", impact)
         self.assertIn("failure_mode", impact)
 
+    def test_simulate_node_failures_matches_single_scenarios(self):
+        """Test batch failure simulation agrees with one scenario at a time."""
+        nodes = [node.id for node in self.graph]
+        failure_sets = [nodes[:1], nodes[1:3], [], [uuid.uuid4()]]
+
+        results = self.query_engine.simulate_node_failures(failure_sets)
+
+        self.assertEqual(len(results), len(failure_sets))
+        for failure_set, result in zip(failure_sets, results):
+            self.assertEqual(result, self.query_engine.simulate_node_failure_impact(failure_set))
+
+    def test_failure_model_cached_per_version(self):
+        """Test the failure model is kept outside the centrality store, once per version."""
+        model = self.query_engine._failure_model()
+
+        self.assertIs(self.query_engine._failure_model(), model)
+        self.assertEqual(self.query_engine._centrality_store.get_stats()["entries"], 0)
+        self.graph.add_node(Actor(label="Newcomer"))
+        self.assertIsNot(self.query_engine._failure_model(), model)
+
+    def test_get_robustness_curve(self):
+        """Test robustness curves cover every removal for each strategy."""
+        node_count = len(self.graph)
+
+        for strategy in ("degree", "betweenness"):
+            curve = self.query_engine.get_robustness_curve(strategy)
+            self.assertEqual(len(curve.fractions), node_count + 1)
+            self.assertCountEqual(curve.removal_order, [node.id for node in self.graph])
+            self.assertEqual(curve.fractions[-1], 0.0)
+        random_curve = self.query_engine.get_robustness_curve("random", trials=3, seed=1)
+        self.assertEqual(random_curve.trials, 3)
+        with self.assertRaises(ValueError):
+            self.query_engine.get_robustness_curve("closeness")
+
+    def test_input_output_analysis(self):
+        """Test demand shocks and multipliers over Process and Flow nodes."""
+        upstream, downstream = Process(label="Mining"), Process(label="Smelting")
+        self.graph.add_node(upstream)
+        self.graph.add_node(downstream)
+        for source, target, quantity in ((upstream, downstream, 40.0), (upstream, None, 60.0),
+                                         (downstream, None, 80.0)):
+            self.graph.add_node(Flow(
+                label="Ore", quantity=quantity, source_process_id=source.id,
+                target_process_id=target.id if target is not None else None,
+            ))
+
+        changes = self.query_engine.analyze_demand_shocks([{downstream.id: 10.0}])
+        multipliers = self.query_engine.get_sector_multipliers()
+
+        self.assertAlmostEqual(changes[0][downstream.id], 10.0)
+        self.assertAlmostEqual(changes[0][upstream.id], 5.0)  # 40 ore per 80 units smelted
+        self.assertAlmostEqual(multipliers[downstream.id]["output_multiplier"], 1.5)
+        self.assertAlmostEqual(multipliers[upstream.id]["forward_linkage"], 1.5)
+
+    def test_uncertainty_bands(self):
+        """Test Monte Carlo bands for impact propagation and input-output output."""
+        source, target = Actor(label="Source"), Actor(label="Target")
+        self.graph.add_node(source)
+        self.graph.add_node(target)
+        self.graph.add_relationship(Relationship(
+            source.id, target.id, RelationshipKind.AFFECTS, weight=1.0, certainty=0.5))
+        sector = Process(label="Plant")
+        self.graph.add_node(sector)
+        self.graph.add_node(Flow(label="Goods", quantity=20.0, source_process_id=sector.id))
+
+        impact = self.query_engine.propagate_impact_uncertainty([source.id], draws=400, seed=0)
+        output = self.query_engine.analyze_output_uncertainty(
+            draws=50, seed=0, flow_variability=0.1)
+
+        target_band = impact.band(target.id)
+        self.assertEqual(impact.draws, 400)
+        self.assertEqual(target_band["p5"], 0.0)  # Relationship absent in some draws
+        self.assertGreater(target_band["p95"], 0.0)
+        self.assertEqual(output.node_ids, [sector.id])
+        self.assertAlmostEqual(output.band(sector.id)["mean"], 20.0, delta=1.0)
+
+    def test_weight_sensitivity(self):
+        """Test relationship weights are ranked by their pull on the targets."""
+        source, near, far = Actor(label="Source"), Actor(label="Near"), Actor(label="Far")
+        for node in (source, near, far):
+            self.graph.add_node(node)
+        to_near = Relationship(source.id, near.id, RelationshipKind.AFFECTS, weight=1.0)
+        to_far = Relationship(source.id, far.id, RelationshipKind.AFFECTS, weight=1.0)
+        self.graph.add_relationship(to_near)
+        self.graph.add_relationship(to_far)
+
+        selected = [to_near.id, to_far.id]
+        oat = self.query_engine.analyze_weight_sensitivity(
+            [source.id], target_ids=[far.id], relationship_ids=selected)
+        sobol = self.query_engine.analyze_weight_sensitivity(
+            [source.id], target_ids=[far.id], relationship_ids=selected, method="sobol",
+            samples=64, seed=0)
+
+        self.assertEqual({rel_id for rel_id, _ in oat.ranked()}, set(selected))
+        self.assertGreater(oat.relationship_indices(to_far.id)["sensitivity"], 0.0)
+        self.assertLess(oat.relationship_indices(to_near.id)["sensitivity"], 0.0)
+        self.assertEqual(sobol.method, "sobol")
+        self.assertEqual(sobol.evaluations, 64 * 4)
+        with self.assertRaises(ValueError):
+            self.query_engine.analyze_weight_sensitivity([source.id], method="fast")
+
+    def test_temporal_dynamics_projection(self):
+        """Test indicator and relationship dynamics advance together."""
+        indicator = Indicator(label="Employment", current_value=100.0,
+                              temporal_dynamics=TemporalDynamics(
+                                  start_time=TimeSlice("2025"), end_time=TimeSlice("2027"),
+                                  function_type=TemporalFunctionType.LINEAR,
+                                  parameters={"rate": 5.0}))
+        source, target = Actor(label="Lender"), Actor(label="Borrower")
+        for node in (indicator, source, target):
+            self.graph.add_node(node)
+        rel = Relationship(source.id, target.id, RelationshipKind.FUNDS, weight=2.0,
+                           temporal_dynamics=TemporalDynamics(
+                               start_time=TimeSlice("2025"),
+                               function_type=TemporalFunctionType.EXPONENTIAL,
+                               parameters={"rate": 0.0}))
+        self.graph.add_relationship(rel)
+
+        projection = self.query_engine.project_temporal_dynamics(4)
+        streamed = [state.time for state in self.query_engine.stream_temporal_dynamics(2)]
+
+        self.assertEqual(projection.times.tolist(), [2025.0, 2026.0, 2027.0, 2028.0])
+        self.assertEqual(projection.trajectory(indicator.id).tolist(),
+                         [100.0, 105.0, 110.0, 110.0])
+        self.assertEqual(projection.final_values()[rel.id], 2.0)
+        self.assertEqual(streamed, [2025.0, 2026.0])
+
+    def test_component_deliveries(self):
+        """Test delivery-matrix rows and columns follow graph mutations."""
+        source, target = Actor(label="Lender"), Actor(label="Borrower")
+        self.graph.add_node(source)
+        self.graph.add_node(target)
+        self.graph.add_relationship(Relationship(
+            source.id, target.id, RelationshipKind.FUNDS, weight=2.5))
+
+        deliveries = self.query_engine.get_component_deliveries(source.id)
+        self.assertEqual(deliveries["delivers_to"], {target.id: 2.5})
+        self.assertEqual(deliveries["receives_from"], {})
+        self.assertEqual(
+            self.query_engine.get_component_deliveries(target.id, RelationshipKind.FUNDS),
+            {"delivers_to": {}, "receives_from": {source.id: 2.5}},
+        )
+
+        self.graph.remove_node(target.id)
+        self.assertEqual(self.query_engine.get_component_deliveries(source.id)["delivers_to"], {})
+
+    def test_ceremonial_balance(self):
+        """Test graph, node, layer and community balance follow graph mutations."""
+        ministry = Institution(label="Ministry", layer=InstitutionLayer.FORMAL_RULE)
+        workshop = Institution(label="Workshop", layer=InstitutionLayer.ORGANIZATION)
+        for node in (ministry, workshop):
+            self.graph.add_node(node)
+        self.graph.add_relationship(Relationship(
+            ministry.id, workshop.id, RelationshipKind.LEGITIMIZES, weight=1.0))
+
+        overall = self.query_engine.get_ceremonial_balance()
+        layers = self.query_engine.get_grouped_ceremonial_balance("layer")
+        nodes = self.query_engine.get_grouped_ceremonial_balance("node")
+        communities = self.query_engine.get_grouped_ceremonial_balance("community")
+
+        self.assertGreater(overall.total, 0.0)
+        self.assertAlmostEqual(layers[InstitutionLayer.FORMAL_RULE].score, 0.85)
+        self.assertAlmostEqual(nodes[workshop.id].score, 0.85)
+        self.assertTrue(communities)
+        self.graph.add_relationship(Relationship(
+            ministry.id, workshop.id, RelationshipKind.ADVISES, weight=1.0))
+        self.assertAlmostEqual(
+            self.query_engine.get_grouped_ceremonial_balance("node")[workshop.id].score,
+            (0.85 + 0.45) / 2)
+        with self.assertRaises(ValueError):
+            self.query_engine.get_grouped_ceremonial_balance("sector")
+
+    def test_flow_efficiency_matrix_matches_single_pairs(self):
+        """Test exact efficiency matrices agree with calculate_flow_efficiency."""
+        nodes = list(self.query_engine.nx_graph.nodes())
+
+        matrix = self.query_engine.calculate_flow_efficiency_matrix(exact=True)
+        estimate = self.query_engine.calculate_flow_efficiency_matrix(nodes[:3], nodes)
+
+        self.assertEqual(matrix.source_ids, nodes)
+        for i, source in enumerate(nodes):
+            for j, target in enumerate(nodes):
+                self.assertAlmostEqual(matrix.efficiency[i, j],
+                                       self.query_engine.calculate_flow_efficiency(source, target))
+        self.assertTrue((estimate.efficiency <= matrix.efficiency[:3] + 1e-12).all())
+        self.assertIs(self.query_engine.distance_oracle(), self.query_engine.distance_oracle())
+        self.assertEqual(self.query_engine._centrality_store.get_stats()["entries"], 0)
+        self.assertEqual(self.query_engine.estimate_distance(self.actor1.id, self.actor1.id), 0)
+        self.assertEqual(self.query_engine.estimate_distance(self.actor1.id, uuid.uuid4()),
+                         float("inf"))
+
+    def test_can_reach_matches_path_search(self):
+        """Test reachability answers agree with NetworkX path search, with and without a filter."""
+        kinds = [RelationshipKind.GOVERNS]
+        nx_graph = self.query_engine.nx_graph
+        nodes = list(nx_graph.nodes())
+        filtered = nx.MultiDiGraph(self.query_engine.get_filtered_view(kinds))
+        filtered.add_nodes_from(nodes)
+
+        for source in nodes:
+            for target in nodes:
+                self.assertEqual(self.query_engine.can_reach(source, target),
+                                 nx.has_path(nx_graph, source, target))
+                self.assertEqual(self.query_engine.can_reach(source, target, kinds),
+                                 nx.has_path(filtered, source, target))
+        self.assertFalse(self.query_engine.can_reach(nodes[0], uuid.uuid4()))
+
+    def test_can_reach_follows_graph_changes(self):
+        """Test the reachability index is rebuilt after a mutation."""
+        newcomer = Actor(label="Newcomer")
+        self.graph.add_node(newcomer)
+        source = self.actor1.id
+        self.assertFalse(self.query_engine.can_reach(source, newcomer.id))
+        index = self.query_engine.reachability_index()
+        self.assertIs(self.query_engine.reachability_index(), index)
+        self.assertEqual(self.query_engine._centrality_store.get_stats()["entries"], 0)
+
+        self.graph.add_relationship(
+            Relationship(source_id=source, target_id=newcomer.id, kind=RelationshipKind.AFFECTS)
+        )
+
+        self.assertTrue(self.query_engine.can_reach(source, newcomer.id))
+
     def test_analyze_flow_patterns(self):
         """Test flow pattern analysis."""
         patterns = self.query_engine.analyze_flow_patterns(FlowNature.TRANSFER)
@@ -977,6 +1405,137 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         self.assertIn("flow_imbalances", inefficiencies)
         self.assertIn("optimization_opportunities", inefficiencies)
 
+    def test_redundant_paths_match_path_enumeration(self):
+        """Test redundant path counts agree with explicit simple path enumeration."""
+        nx_graph = self.query_engine.nx_graph
+        expected = sorted(
+            (
+                len(list(nx.all_simple_paths(nx_graph, s, t, cutoff=3))),
+                str(s), str(t),
+            )
+            for s in nx_graph for t in nx_graph if s != t
+        )
+        expected = [entry for entry in expected if entry[0] > 1]
+
+        redundant = self.query_engine.identify_flow_inefficiencies(top_k=1000)["redundant_paths"]
+
+        self.assertEqual(
+            sorted((entry["path_count"], entry["source"], entry["target"])
+                   for entry in redundant),
+            expected,
+        )
+
+    @patch("networkx.betweenness_centrality")
+    def test_centrality_computed_once_per_graph_version(self, mock_centrality):
+        """Test analyses share one betweenness computation until the graph changes."""
+        mock_centrality.return_value = {self.actor1.id: 0.8, self.actor2.id: 0.2}
+
+        self.query_engine.get_node_centrality(self.actor1.id, "betweenness")
+        self.query_engine.get_most_central_nodes(centrality_type="betweenness")
+        self.query_engine.get_structural_holes()
+        self.query_engine.identify_bottlenecks(FlowNature.TRANSFER)
+        mock_centrality.assert_called_once()
+
+        self.graph.add_node(Actor(label="New Actor"))
+        self.query_engine.get_node_centrality(self.actor1.id, "betweenness")
+        self.assertEqual(mock_centrality.call_count, 2)
+
+    def test_get_all_centralities(self):
+        """Test the batch centrality API returns whole-graph scores per type."""
+        results = self.query_engine.get_all_centralities(["betweenness", "degree"])
+
+        self.assertEqual(set(results), {"betweenness", "degree"})
+        self.assertEqual(len(results["degree"]), self.query_engine.nx_graph.number_of_nodes())
+        self.assertEqual(
+            results["degree"][self.actor1.id],
+            self.query_engine.get_node_centrality(self.actor1.id, "degree"),
+        )
+        with self.assertRaises(ValueError):
+            self.query_engine.get_all_centralities(["invalid"])
+
+    @patch("networkx.betweenness_centrality")
+    def test_betweenness_sampling_switches_on_above_threshold(self, mock_centrality):
+        """Test large graphs use k-pivot sampling and report the error estimate."""
+        mock_centrality.return_value = {self.actor1.id: 0.5}
+        self.query_engine.approximation_threshold = 5
+        self.query_engine.betweenness_sample_size = 3
+
+        estimate = self.query_engine.get_betweenness_estimate()
+
+        self.assertFalse(estimate.exact)
+        self.assertEqual(estimate.sample_size, 3)
+        self.assertGreater(estimate.estimated_error, 0.0)
+        _, kwargs = mock_centrality.call_args
+        self.assertEqual(kwargs["k"], 3)
+        self.assertEqual(kwargs["seed"], self.query_engine.sampling_seed)
+
+    def test_betweenness_sample_size_per_call(self):
+        """Test an explicit sample size overrides the automatic choice."""
+        exact = self.query_engine.get_betweenness_estimate()
+        sampled = self.query_engine.get_betweenness_estimate(sample_size=4)
+        oversized = self.query_engine.get_betweenness_estimate(sample_size=1000)
+
+        self.assertTrue(exact.exact)
+        self.assertEqual(exact.estimated_error, 0.0)
+        self.assertFalse(sampled.exact)
+        self.assertEqual(sampled.sample_size, 4)
+        self.assertEqual(set(sampled.scores), set(exact.scores))
+        self.assertIs(oversized, exact)
+        self.assertIn("betweenness_sampling",
+                      self.query_engine.assess_network_vulnerabilities(sample_size=4))
+        with self.assertRaises(ValueError):
+            self.query_engine.get_betweenness_estimate(sample_size=0)
+
+    def test_parallel_centrality_matches_serial(self):
+        """Test the process-pool path agrees with the NetworkX computation."""
+        parallel_engine = NetworkXSFMQueryEngine(
+            self.graph, centrality_workers=2, parallel_min_nodes=1
+        )
+        parallel_engine.centrality_executor.chunk_size = 3
+
+        serial = self.query_engine.get_all_centralities(["betweenness", "closeness"])
+        parallel = parallel_engine.get_all_centralities(["betweenness", "closeness"])
+
+        self.assertEqual(parallel["closeness"], serial["closeness"])
+        self.assertEqual(parallel["betweenness"], serial["betweenness"])
+
+    def test_mirror_applies_graph_mutations_incrementally(self):
+        """Test graph mutations are applied to the NetworkX mirror as deltas."""
+        nx_graph = self.query_engine.nx_graph
+        new_actor = Actor(label="Late Actor")
+        self.graph.add_node(new_actor)
+        rel = Relationship(
+            source_id=new_actor.id, target_id=self.actor1.id, kind=RelationshipKind.AFFECTS
+        )
+        self.graph.add_relationship(rel)
+
+        # Same mirror object, updated in place and in sync with the graph
+        self.assertIs(self.query_engine.nx_graph, nx_graph)
+        self.assertFalse(self.query_engine.is_stale)
+        self.assertTrue(nx_graph.has_edge(new_actor.id, self.actor1.id, key=rel.id))
+
+        self.graph.remove_relationship(rel.id)
+        self.assertFalse(nx_graph.has_edge(new_actor.id, self.actor1.id, key=rel.id))
+
+        self.graph.remove_node(self.actor1.id)
+        self.assertNotIn(self.actor1.id, nx_graph)
+        self.assertEqual(nx_graph.number_of_edges(), len(self.graph.relationships))
+        self.assertFalse(self.query_engine.is_stale)
+
+    def test_mirror_resyncs_after_missed_mutations(self):
+        """Test direct writes mark the mirror stale and sync() rebuilds it."""
+        rel = Relationship(
+            source_id=self.actor2.id, target_id=self.resource.id, kind=RelationshipKind.USES
+        )
+        self.graph.relationships[rel.id] = rel
+
+        self.assertTrue(self.query_engine.is_stale)
+        self.query_engine.sync()
+        self.assertFalse(self.query_engine.is_stale)
+        self.assertTrue(
+            self.query_engine.nx_graph.has_edge(self.actor2.id, self.resource.id, key=rel.id)
+        )
+
 
 class TestSFMQueryFactory(unittest.TestCase):
     """Test suite for SFMQueryFactory."""
@@ -998,6 +1557,15 @@ class TestSFMQueryFactory(unittest.TestCase):
 
         self.assertIsInstance(engine, NetworkXSFMQueryEngine)
 
+    def test_create_csr_query_engine(self):
+        """Test creation of the CSR query engine."""
+        from core.csr_query import CSRSFMQueryEngine
+
+        engine = SFMQueryFactory.create_query_engine(self.graph, "csr")
+
+        self.assertIsInstance(engine, CSRSFMQueryEngine)
+        self.assertEqual(engine.graph, self.graph)
+
     def test_create_query_engine_unsupported_backend(self):
         """Test error handling for unsupported backend."""
         with self.assertRaises(ValueError):
@@ -46,8 +46,13 @@ from core.sfm_models import (
     Policy,
     Resource,
     Relationship,
+    Process,
+    Flow,
+    Indicator,
+    TemporalDynamics,
 )
-from core.sfm_enums import ResourceType,RelationshipKind
+from core.sfm_enums import ResourceType,RelationshipKind, TemporalFunctionType, InstitutionLayer
+from core.meta_entities import TimeSlice
 from db.sfm_dao import SFMRepositoryFactory
 
 # Import centralized mock infrastructure
@@ -680,6 +685,41 @@ class TestSFMServiceIntegration(unittest.TestCase):
         self.assertEqual(retrieved_actor.label, "Integration Test Actor")
         self.assertEqual(retrieved_actor.sector, "government")
 
+    def test_query_engine_updated_incrementally_after_creates(self):
+        """Test creates are applied to the loaded graph without rebuilding the engine."""
+        actor1 = self.service.create_actor(CreateActorRequest(name="Actor 1"))
+        engine = self.service.query_engine
+        graph = self.service.get_graph()
+
+        actor2 = self.service.create_actor(CreateActorRequest(name="Actor 2"))
+        self.service.create_relationship(CreateRelationshipRequest(
+            source_id=actor1.id, target_id=actor2.id, kind="GOVERNS"
+        ))
+
+        self.assertIs(self.service.get_graph(), graph)
+        self.assertIs(self.service.query_engine, engine)
+        self.assertTrue(engine.nx_graph.has_edge(uuid.UUID(actor1.id), uuid.UUID(actor2.id)))
+        self.assertEqual(self.service.get_statistics().total_relationships, 1)
+
+    def test_analyze_centrality_reports_sampling(self):
+        """Test sampled betweenness is flagged with its sample size and error."""
+        actors = [self.service.create_actor(CreateActorRequest(name=f"Actor {i}"))
+                  for i in range(6)]
+        for source, target in zip(actors, actors[1:]):
+            self.service.create_relationship(CreateRelationshipRequest(
+                source_id=source.id, target_id=target.id, kind="GOVERNS"
+            ))
+
+        exact = self.service.analyze_centrality("betweenness")
+        sampled = self.service.analyze_centrality("betweenness", sample_size=3)
+
+        self.assertFalse(exact.approximate)
+        self.assertEqual(exact.estimated_error, 0.0)
+        self.assertTrue(sampled.approximate)
+        self.assertEqual(sampled.sample_size, 3)
+        self.assertGreater(sampled.estimated_error, 0.0)
+        self.assertEqual(len(sampled.node_centrality), 6)
+
     def test_end_to_end_relationship_creation(self):
         """Test complete relationship creation workflow."""
         # Create two actors
@@ -789,6 +829,318 @@ class TestSFMServiceIntegration(unittest.TestCase):
         self.assertEqual(impact.policy_id, policy.id)
         self.assertGreaterEqual(impact.total_affected_nodes, 0)
 
+    def test_batch_policy_impact_integration(self):
+        """Test batch policy impact matches single-policy analysis and reports overlap."""
+        policies = [
+            self.service.create_policy(CreatePolicyRequest(name=f"Policy {i}", authority="EPA"))
+            for i in range(2)
+        ]
+        shared = self.service.create_actor(CreateActorRequest(name="Shared Actor"))
+        only_first = self.service.create_actor(CreateActorRequest(name="First Only"))
+        for policy in policies:
+            self.service.create_relationship(CreateRelationshipRequest(
+                source_id=policy.id, target_id=shared.id, kind="AFFECTS"
+            ))
+        self.service.create_relationship(CreateRelationshipRequest(
+            source_id=policies[0].id, target_id=only_first.id, kind="AFFECTS"
+        ))
+
+        batch = self.service.analyze_policy_impacts(impact_radius=2)
+
+        self.assertEqual([impact.policy_id for impact in batch.impacts],
+                         [policy.id for policy in policies])
+        for impact in batch.impacts:
+            single = self.service.analyze_policy_impact(impact.policy_id, impact_radius=2)
+            self.assertEqual(impact.total_affected_nodes, single.total_affected_nodes)
+            self.assertCountEqual(impact.affected_actors, single.affected_actors)
+            self.assertAlmostEqual(impact.network_metrics["density"],
+                                   single.network_metrics["density"])
+        self.assertEqual(len(batch.overlaps), 1)
+        self.assertEqual(batch.overlaps[0].shared_nodes, 1)
+        self.assertAlmostEqual(batch.overlaps[0].jaccard, 0.5)
+
+        missing = str(uuid.uuid4())
+        batch = self.service.analyze_policy_impacts([policies[1].id, missing])
+        self.assertEqual(len(batch.impacts), 1)
+        self.assertEqual(batch.missing_policies, [missing])
+        with self.assertRaises(ValidationError):
+            self.service.analyze_policy_impacts(["not-a-uuid"])
+
+    def test_propagate_impact_integration(self):
+        """Test weighted impact ranking from a policy."""
+        policy = self.service.create_policy(
+            CreatePolicyRequest(name="Test Policy", authority="EPA")
+        )
+        strong = self.service.create_actor(CreateActorRequest(name="Strong"))
+        weak = self.service.create_actor(CreateActorRequest(name="Weak"))
+        for actor, weight in ((strong, 3.0), (weak, 1.0)):
+            self.service.create_relationship(CreateRelationshipRequest(
+                source_id=policy.id, target_id=actor.id, kind="AFFECTS", weight=weight
+            ))
+
+        analysis = self.service.propagate_impact([policy.id], top_k=5)
+
+        self.assertEqual(analysis.seed_ids, [policy.id])
+        self.assertEqual([node_id for node_id, _ in analysis.ranked_nodes],
+                         [strong.id, weak.id])
+        self.assertTrue(analysis.converged)
+        self.assertEqual(analysis.damping, self.service.config.impact_propagation_damping)
+        with self.assertRaises(NotFoundError):
+            self.service.propagate_impact([str(uuid.uuid4())])
+        with self.assertRaises(ValidationError):
+            self.service.propagate_impact([])
+        with self.assertRaises(ValidationError):
+            self.service.propagate_impact([policy.id], damping=1.5)
+
+    def test_simulate_node_failures_integration(self):
+        """Test batch failure simulation through the service."""
+        hub = self.service.create_institution(CreateInstitutionRequest(name="Hub"))
+        actors = [
+            self.service.create_actor(CreateActorRequest(name=f"Actor {i}")) for i in range(3)
+        ]
+        for actor in actors:
+            self.service.create_relationship(CreateRelationshipRequest(
+                source_id=actor.id, target_id=hub.id, kind="MEMBER_OF"
+            ))
+
+        batch = self.service.simulate_node_failures([[hub.id], [actors[0].id]])
+
+        self.assertEqual(batch.failure_mode, "cascade")
+        self.assertEqual(len(batch.scenarios), 2)
+        self.assertEqual(batch.scenarios[0].failed_nodes, [hub.id])
+        self.assertEqual(batch.scenarios[0].connectivity_impact["component_increase"], 2)
+        self.assertCountEqual(batch.scenarios[0].cascading_failures,
+                              [actor.id for actor in actors])
+        self.assertEqual(batch.scenarios[1].connectivity_impact["component_increase"], 0)
+        with self.assertRaises(ValidationError):
+            self.service.simulate_node_failures([[hub.id]], failure_mode="partial")
+        with self.assertRaises(ValidationError):
+            self.service.simulate_node_failures([["not-a-uuid"]])
+
+    def test_get_robustness_curve_integration(self):
+        """Test robustness curves through the service."""
+        hub = self.service.create_institution(CreateInstitutionRequest(name="Hub"))
+        for i in range(3):
+            actor = self.service.create_actor(CreateActorRequest(name=f"Actor {i}"))
+            self.service.create_relationship(CreateRelationshipRequest(
+                source_id=actor.id, target_id=hub.id, kind="MEMBER_OF"
+            ))
+
+        analysis = self.service.get_robustness_curve("degree")
+
+        self.assertEqual(analysis.removal_order[0], hub.id)
+        self.assertEqual(analysis.fractions[:2], [1.0, 0.25])
+        self.assertAlmostEqual(analysis.critical_fraction, 0.25)
+        with self.assertRaises(ValidationError):
+            self.service.get_robustness_curve("closeness")
+        with self.assertRaises(ValidationError):
+            self.service.get_robustness_curve("random", trials=0)
+
+    def test_input_output_integration(self):
+        """Test demand shocks and multipliers through the service."""
+        graph = self.service.get_graph()
+        farm, mill = Process(label="Farm"), Process(label="Mill")
+        graph.add_node(farm)
+        graph.add_node(mill)
+        graph.add_node(Flow(label="Grain", quantity=50.0,
+                            source_process_id=farm.id, target_process_id=mill.id))
+        graph.add_node(Flow(label="Grain", quantity=50.0, source_process_id=farm.id))
+        graph.add_node(Flow(label="Flour", quantity=100.0, source_process_id=mill.id))
+
+        analysis = self.service.analyze_demand_shocks([{str(mill.id): 10.0}, {farm.id: 1.0}])
+        multipliers = self.service.get_sector_multipliers()
+
+        self.assertEqual(analysis.sectors, 2)
+        self.assertAlmostEqual(analysis.scenarios[0][str(farm.id)], 5.0)
+        self.assertEqual(analysis.total_output_changes, [15.0, 1.0])
+        self.assertAlmostEqual(multipliers.multipliers[str(mill.id)]["output_multiplier"], 1.5)
+        with self.assertRaises(NotFoundError):
+            self.service.analyze_demand_shocks([{str(uuid.uuid4()): 1.0}])
+        with self.assertRaises(ValidationError):
+            self.service.analyze_demand_shocks([])
+
+    def test_uncertainty_integration(self):
+        """Test Monte Carlo uncertainty bands through the service."""
+        actor = self.service.create_actor(CreateActorRequest(name="Member"))
+        institution = self.service.create_institution(CreateInstitutionRequest(name="Union"))
+        graph = self.service.get_graph()
+        graph.add_relationship(Relationship(
+            uuid.UUID(institution.id), uuid.UUID(actor.id), RelationshipKind.FUNDS,
+            weight=1.0, certainty=0.5))
+        plant = Process(label="Plant")
+        graph.add_node(plant)
+        graph.add_node(Flow(label="Goods", quantity=10.0, source_process_id=plant.id))
+
+        impact = self.service.propagate_impact_uncertainty([institution.id], draws=200, seed=1)
+        output = self.service.analyze_output_uncertainty({str(plant.id): 5.0}, draws=10, seed=1)
+
+        self.assertEqual(impact.analysis, "impact_propagation")
+        self.assertEqual(list(impact.bands), [actor.id])
+        self.assertEqual(impact.percentiles, [5.0, 50.0, 95.0])
+        self.assertAlmostEqual(output.bands[str(plant.id)]["p50"], 5.0)
+        with self.assertRaises(NotFoundError):
+            self.service.propagate_impact_uncertainty([str(uuid.uuid4())])
+        with self.assertRaises(NotFoundError):
+            self.service.analyze_output_uncertainty({str(uuid.uuid4()): 1.0})
+        with self.assertRaises(ValidationError):
+            self.service.propagate_impact_uncertainty([institution.id], draws=0)
+        with self.assertRaises(ValidationError):
+            self.service.analyze_output_uncertainty(flow_variability=-0.1)
+
+    def test_weight_sensitivity_integration(self):
+        """Test relationship weight sensitivity through the service."""
+        actor = self.service.create_actor(CreateActorRequest(name="Member"))
+        other = self.service.create_actor(CreateActorRequest(name="Employer"))
+        institution = self.service.create_institution(CreateInstitutionRequest(name="Union"))
+        graph = self.service.get_graph()
+        funds = Relationship(uuid.UUID(institution.id), uuid.UUID(actor.id),
+                             RelationshipKind.FUNDS, weight=2.0)
+        affects = Relationship(uuid.UUID(institution.id), uuid.UUID(other.id),
+                               RelationshipKind.AFFECTS, weight=1.0)
+        graph.add_relationship(funds)
+        graph.add_relationship(affects)
+
+        analysis = self.service.analyze_weight_sensitivity(
+            [institution.id], target_ids=[actor.id], top_k=1)
+        morris = self.service.analyze_weight_sensitivity(
+            [institution.id], target_ids=[actor.id], relationship_ids=[str(funds.id)],
+            method="morris", samples=4, seed=2)
+
+        self.assertEqual(analysis.method, "oat")
+        self.assertEqual(analysis.ranking_index, "sensitivity")
+        self.assertEqual(len(analysis.ranked_relationships), 1)
+        self.assertIn(analysis.ranked_relationships[0][0], {str(funds.id), str(affects.id)})
+        self.assertEqual(set(analysis.indices[analysis.ranked_relationships[0][0]]),
+                         {"sensitivity", "elasticity"})
+        self.assertAlmostEqual(analysis.baseline, 0.85 * (2.0 / 3.0) / 1.85)
+        self.assertEqual(list(morris.indices), [str(funds.id)])
+        self.assertGreater(morris.indices[str(funds.id)]["mu_star"], 0.0)
+        with self.assertRaises(NotFoundError):
+            self.service.analyze_weight_sensitivity([str(uuid.uuid4())])
+        with self.assertRaises(NotFoundError):
+            self.service.analyze_weight_sensitivity(
+                [institution.id], relationship_ids=[str(uuid.uuid4())])
+        with self.assertRaises(ValidationError):
+            self.service.analyze_weight_sensitivity([institution.id], method="fast")
+        with self.assertRaises(ValidationError):
+            self.service.analyze_weight_sensitivity([institution.id], perturbation=1.5)
+
+    def test_temporal_projection_integration(self):
+        """Test temporal dynamics projections through the service."""
+        graph = self.service.get_graph()
+        indicator = Indicator(label="Adoption", current_value=1.0,
+                              temporal_dynamics=TemporalDynamics(
+                                  start_time=TimeSlice("0"),
+                                  function_type=TemporalFunctionType.STEP,
+                                  parameters={"magnitude": 2.0, "interval": 1.0}))
+        graph.add_node(indicator)
+
+        projection = self.service.project_temporal_dynamics(3, dt=1.0)
+
+        self.assertEqual(projection.times, [0.0, 1.0, 2.0])
+        self.assertEqual(projection.trajectories[str(indicator.id)], [3.0, 5.0, 7.0])
+        self.assertEqual(projection.function_types[str(indicator.id)], "STEP")
+        with self.assertRaises(NotFoundError):
+            self.service.project_temporal_dynamics(3, entity_ids=[str(uuid.uuid4())])
+        with self.assertRaises(ValidationError):
+            self.service.project_temporal_dynamics(0)
+        with self.assertRaises(ValidationError):
+            self.service.project_temporal_dynamics(3, dt=-1.0)
+        self.service.config.dynamics_max_values = 2
+        with self.assertRaises(ValidationError):
+            self.service.project_temporal_dynamics(3)
+
+    def test_ceremonial_balance_integration(self):
+        """Test ceremonial/instrumental balance through the service."""
+        graph = self.service.get_graph()
+        ministry = Institution(label="Ministry", layer=InstitutionLayer.FORMAL_RULE)
+        workshop = Institution(label="Workshop", layer=InstitutionLayer.ORGANIZATION)
+        for node in (ministry, workshop):
+            graph.add_node(node)
+        graph.add_relationship(Relationship(
+            ministry.id, workshop.id, RelationshipKind.GOVERNS, weight=2.0))
+
+        by_layer = self.service.analyze_ceremonial_balance()
+        by_node = self.service.analyze_ceremonial_balance("node", top_k=1)
+
+        self.assertEqual(by_layer.group_by, "layer")
+        self.assertAlmostEqual(by_layer.overall["score"], 0.75)
+        self.assertAlmostEqual(by_layer.groups["FORMAL_RULE"]["ceremonial"], 1.5)
+        self.assertEqual(len(by_node.groups), 1)
+        with self.assertRaises(ValidationError):
+            self.service.analyze_ceremonial_balance("sector")
+        with self.assertRaises(ValidationError):
+            self.service.analyze_ceremonial_balance("node", top_k=0)
+
+    def test_delivery_matrix_integration(self):
+        """Test delivery-matrix blocks and component rows through the service."""
+        actor = self.service.create_actor(CreateActorRequest(name="Member"))
+        institution = self.service.create_institution(CreateInstitutionRequest(name="Union"))
+        graph = self.service.get_graph()
+        graph.add_relationship(Relationship(
+            uuid.UUID(institution.id), uuid.UUID(actor.id), RelationshipKind.FUNDS, weight=3.0))
+
+        view = self.service.get_delivery_matrix("Institution", "Actor", "funds", dense=True)
+        deliveries = self.service.get_component_deliveries(actor.id)
+
+        self.assertEqual(view.relationship_kind, "FUNDS")
+        self.assertEqual(view.row_ids, [institution.id])
+        self.assertEqual(view.deliveries,
+                         [{"source_id": institution.id, "target_id": actor.id, "weight": 3.0}])
+        self.assertEqual(view.dense, [[3.0]])
+        self.assertEqual(deliveries.receives_from, {institution.id: 3.0})
+        with self.assertRaises(ValidationError):
+            self.service.get_delivery_matrix(row_type="Galaxy")
+        with self.assertRaises(ValidationError):
+            self.service.get_delivery_matrix(relationship_kind="NOT_A_KIND")
+        with self.assertRaises(NotFoundError):
+            self.service.get_component_deliveries(str(uuid.uuid4()))
+
+    def test_flow_efficiency_matrix_integration(self):
+        """Test flow efficiency matrices through the service."""
+        actor = self.service.create_actor(CreateActorRequest(name="Member"))
+        institution = self.service.create_institution(CreateInstitutionRequest(name="Union"))
+        policy = self.service.create_policy(CreatePolicyRequest(name="Rule"))
+        for source, target, kind in ((actor, institution, "MEMBER_OF"),
+                                     (institution, policy, "IMPLEMENTS")):
+            self.service.create_relationship(CreateRelationshipRequest(
+                source_id=source.id, target_id=target.id, kind=kind
+            ))
+
+        analysis = self.service.calculate_flow_efficiency_matrix(
+            [actor.id], [institution.id, policy.id, actor.id], exact=True
+        )
+
+        self.assertEqual(analysis.source_ids, [actor.id])
+        self.assertEqual(analysis.efficiencies, [[1.0, 0.5, 0.0]])
+        self.assertAlmostEqual(analysis.average_efficiency, 0.75)
+        self.assertEqual(len(self.service.calculate_flow_efficiency_matrix().efficiencies), 3)
+        with patch.object(self.service.query_engine, "calculate_flow_efficiency_matrix") as matrix:
+            with self.assertRaises(NotFoundError):
+                self.service.calculate_flow_efficiency_matrix([str(uuid.uuid4())])
+        matrix.assert_not_called()
+        with self.assertRaises(ValidationError):
+            self.service.calculate_flow_efficiency_matrix(landmark_strategy="random")
+
+    def test_can_reach_integration(self):
+        """Test reachability queries through the service."""
+        actor = self.service.create_actor(CreateActorRequest(name="Member"))
+        institution = self.service.create_institution(CreateInstitutionRequest(name="Union"))
+        self.service.create_relationship(CreateRelationshipRequest(
+            source_id=actor.id, target_id=institution.id, kind="MEMBER_OF"
+        ))
+
+        result = self.service.can_reach(actor.id, institution.id)
+
+        self.assertTrue(result.reachable)
+        self.assertEqual((result.source_id, result.target_id), (actor.id, institution.id))
+        self.assertFalse(self.service.can_reach(institution.id, actor.id).reachable)
+        self.assertFalse(
+            self.service.can_reach(actor.id, institution.id, ["GOVERNS"]).reachable
+        )
+        with self.assertRaises(ValidationError):
+            self.service.can_reach("not-a-uuid", institution.id)
+
     def test_shortest_path_integration(self):
         """Test shortest path finding with real data."""
         # Create a path: Actor A -> Institution -> Actor B
@@ -817,6 +1169,48 @@ class TestSFMServiceIntegration(unittest.TestCase):
         self.assertEqual(path[0], actor_a.id)
         self.assertEqual(path[2], actor_b.id)
 
+        weighted = self.service.find_shortest_path(actor_a.id, actor_b.id, cost="certainty")
+        self.assertEqual(weighted, path)
+        with self.assertRaises(ValidationError):
+            self.service.find_shortest_path(actor_a.id, actor_b.id, cost="distance")
+
+    def test_find_shortest_paths_bulk_integration(self):
+        """Test bulk path finding returns one result per pair in request order."""
+        actors = [
+            self.service.create_actor(CreateActorRequest(name=f"Actor {i}")) for i in range(3)
+        ]
+        for source, target in zip(actors, actors[1:]):
+            self.service.create_relationship(CreateRelationshipRequest(
+                source_id=source.id, target_id=target.id, kind="GOVERNS"
+            ))
+
+        results = self.service.find_shortest_paths_bulk([
+            (actors[0].id, actors[2].id),
+            (actors[0].id, actors[1].id),
+            (actors[2].id, actors[0].id),
+        ])
+
+        self.assertEqual([r.path_length for r in results], [3, 2, 0])
+        self.assertEqual(results[0].path, [actor.id for actor in actors])
+        self.assertIsNone(results[2].path)
+        with self.assertRaises(ValidationError):
+            self.service.find_shortest_paths_bulk([("not-a-uuid", actors[0].id)])
+
+    def test_weighted_path_with_negative_weights(self):
+        """Test negative weights are reported as a cost error, not a UUID error."""
+        actor_a = self.service.create_actor(CreateActorRequest(name="Actor A"))
+        actor_b = self.service.create_actor(CreateActorRequest(name="Actor B"))
+        self.service.create_relationship(CreateRelationshipRequest(
+            source_id=actor_a.id, target_id=actor_b.id, kind="GOVERNS", weight=-3.0
+        ))
+
+        with self.assertRaisesRegex(ValidationError, "negative weight") as single:
+            self.service.find_shortest_path(actor_a.id, actor_b.id, cost="weight")
+        self.assertEqual(single.exception.details["field"], "cost")
+        with self.assertRaisesRegex(ValidationError, "negative weight") as bulk:
+            self.service.find_shortest_paths_bulk([(actor_a.id, actor_b.id)], cost="weight")
+        self.assertEqual(bulk.exception.details["field"], "cost")
+
     def test_get_node_neighbors_integration(self):
         """Test getting node neighbors with real data."""
         # Create central node with multiple neighbors
@@ -843,6 +1237,25 @@ class TestSFMServiceIntegration(unittest.TestCase):
         for neighbor in neighbors:
             self.assertIn(neighbor.id, neighbor_ids)
 
+    def test_get_node_neighborhood_integration(self):
+        """Test neighbors are returned with hop distances and relationship paths."""
+        a = self.service.create_actor(CreateActorRequest(name="A"))
+        b = self.service.create_actor(CreateActorRequest(name="B"))
+        c = self.service.create_actor(CreateActorRequest(name="C"))
+        ab = self.service.create_relationship(CreateRelationshipRequest(
+            source_id=a.id, target_id=b.id, kind="GOVERNS"
+        ))
+        bc = self.service.create_relationship(CreateRelationshipRequest(
+            source_id=b.id, target_id=c.id, kind="GOVERNS"
+        ))
+
+        neighborhood = self.service.get_node_neighborhood(
+            a.id, ["GOVERNS"], distance=2, include_paths=True
+        )
+
+        self.assertEqual(neighborhood[b.id], {"distance": 1, "path": [ab.id]})
+        self.assertEqual(neighborhood[c.id], {"distance": 2, "path": [ab.id, bc.id]})
+
     def test_list_nodes_and_relationships_integration(self):
         """Test listing operations with real data."""
         # Create mixed entities
@@ -1223,6 +1636,31 @@ class TestSFMServiceAdvanced(unittest.TestCase):
         self.assertIsInstance(health, ServiceHealth)
         self.assertEqual(health.status, ServiceStatus.HEALTHY)
 
+    def test_circular_dependency_check_is_bounded(self):
+        """Test the circular dependency check reports cycles under its caps."""
+        actors = [
+            self.service.create_actor(CreateActorRequest(name=f"Loop Actor {i}"))
+            for i in range(4)
+        ]
+        for source in actors:
+            for target in actors:
+                if source is not target:
+                    self.service.create_relationship(CreateRelationshipRequest(
+                        source_id=source.id, target_id=target.id, kind="GOVERNS"
+                    ))
+
+        violations = self.service._check_circular_dependencies()
+        cycles = [v for v in violations if v["type"] == "circular_dependency"]
+        # Complete digraph on 4 nodes: 8 cycles of length 3 and 6 of length 4
+        self.assertEqual(len(cycles), 14)
+
+        self.service.config.cycle_check_max_cycles = 5
+        violations = self.service._check_circular_dependencies()
+        self.assertEqual(
+            len([v for v in violations if v["type"] == "circular_dependency"]), 5
+        )
+        self.assertEqual(violations[-1]["type"], "circular_dependency_search_truncated")
+
     def test_bulk_operations(self):
         """Test bulk creation and operations."""
         # Create multiple entities in bulk
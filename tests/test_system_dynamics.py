@@ -0,0 +1,186 @@
+"""
+Tests for the time-stepped temporal dynamics simulator.
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+from core.meta_entities import TimeSlice
+from core.metadata_models import TemporalDynamics
+from core.sfm_enums import RelationshipKind, TemporalFunctionType
+from core.sfm_models import (
+    Actor,
+    ChangeProcess,
+    Flow,
+    Indicator,
+    Relationship,
+    SFMGraph,
+)
+from core.system_dynamics import DynamicsProgram, SystemDynamicsSimulator, slice_time
+
+
+def _dynamics(function_type, start="0", end=None, **parameters) -> TemporalDynamics:
+    """Temporal dynamics with numeric time-slice labels."""
+    return TemporalDynamics(
+        start_time=TimeSlice(start),
+        end_time=TimeSlice(end) if end is not None else None,
+        function_type=function_type,
+        parameters=parameters,
+    )
+
+
+class TestDynamicsProgram(unittest.TestCase):
+    """Test compilation of a graph's temporal dynamics into arrays."""
+
+    def test_collects_every_entity_type(self):
+        """Test flows, indicators, change processes and relationships are compiled."""
+        graph = SFMGraph()
+        flow = Flow(label="Grain", quantity=5.0,
+                    temporal_dynamics=_dynamics(TemporalFunctionType.LINEAR, rate=1.0))
+        indicator = Indicator(label="Literacy", current_value=0.6,
+                              temporal_dynamics=_dynamics(TemporalFunctionType.STEP))
+        change = ChangeProcess(label="Reform", temporal_dynamics=_dynamics(
+            TemporalFunctionType.LOGISTIC, initial=0.1, capacity=1.0, rate=0.5))
+        static = Indicator(label="Static", current_value=1.0)
+        source, target = Actor(label="Lender"), Actor(label="Borrower")
+        for node in (flow, indicator, change, static, source, target):
+            graph.add_node(node)
+        rel = Relationship(source.id, target.id, RelationshipKind.FUNDS, weight=3.0,
+                           temporal_dynamics=_dynamics(TemporalFunctionType.EXPONENTIAL))
+        graph.add_relationship(rel)
+
+        program = DynamicsProgram.from_graph(graph)
+        initial = dict(zip(program.entity_ids, program.initial.tolist()))
+
+        self.assertEqual(program.size, 4)
+        self.assertEqual(initial, {flow.id: 5.0, indicator.id: 0.6, change.id: 0.1, rel.id: 3.0})
+        self.assertEqual(set(program.groups), {
+            TemporalFunctionType.LINEAR, TemporalFunctionType.STEP,
+            TemporalFunctionType.LOGISTIC, TemporalFunctionType.EXPONENTIAL,
+        })
+        self.assertIn("Relationship", program.entity_types)
+
+    def test_time_slices(self):
+        """Test time-slice labels resolve through the index or as numbers."""
+        self.assertEqual(slice_time(TimeSlice("Q3"), {"Q3": 2.5}), 2.5)
+        self.assertEqual(slice_time(TimeSlice("2030")), 2030.0)
+        self.assertIsNone(slice_time(TimeSlice("Baseline")))
+        self.assertIsNone(slice_time(None))
+
+    def test_invalid_dynamics(self):
+        """Test windows that end before they start and bad parameters are rejected."""
+        graph = SFMGraph()
+        graph.add_node(Indicator(label="Backwards", current_value=1.0,
+                                 temporal_dynamics=_dynamics(TemporalFunctionType.LINEAR,
+                                                             start="5", end="2")))
+        with self.assertRaises(ValueError):
+            DynamicsProgram.from_graph(graph)
+
+        graph = SFMGraph()
+        graph.add_node(Indicator(label="Flat", current_value=1.0, temporal_dynamics=_dynamics(
+            TemporalFunctionType.CYCLICAL, period=0.0)))
+        with self.assertRaises(ValueError):
+            DynamicsProgram.from_graph(graph)
+
+
+class TestSystemDynamicsSimulator(unittest.TestCase):
+    """Test vectorized steps against the closed-form value model."""
+
+    def setUp(self):
+        """Set up one indicator per function type."""
+        self.graph = SFMGraph()
+        self.indicators = {}
+        for function_type, parameters in (
+            (TemporalFunctionType.LINEAR, {"rate": 2.0}),
+            (TemporalFunctionType.EXPONENTIAL, {"rate": 0.1}),
+            (TemporalFunctionType.LOGISTIC, {"rate": 1.0, "capacity": 10.0}),
+            (TemporalFunctionType.CYCLICAL, {"amplitude": 1.0, "period": 4.0}),
+            (TemporalFunctionType.STEP, {"magnitude": 3.0, "interval": 2.0, "delay": 1.0}),
+            (TemporalFunctionType.RANDOM, {"drift": 1.0, "volatility": 0.0}),
+        ):
+            indicator = Indicator(label=function_type.name, current_value=1.0,
+                                  temporal_dynamics=_dynamics(function_type, **parameters))
+            self.graph.add_node(indicator)
+            self.indicators[function_type] = indicator.id
+        self.simulator = SystemDynamicsSimulator(self.graph)
+
+    def test_closed_forms(self):
+        """Test every function type follows its formula step by step."""
+        projection = self.simulator.project(6, dt=0.5)
+        t = np.arange(6) * 0.5
+
+        def trajectory(function_type):
+            return projection.trajectory(self.indicators[function_type])
+
+        np.testing.assert_allclose(projection.times, t)
+        np.testing.assert_allclose(trajectory(TemporalFunctionType.LINEAR), 1.0 + 2.0 * t)
+        np.testing.assert_allclose(trajectory(TemporalFunctionType.EXPONENTIAL),
+                                   np.exp(0.1 * t))
+        np.testing.assert_allclose(trajectory(TemporalFunctionType.LOGISTIC),
+                                   10.0 / (1.0 + 9.0 * np.exp(-t)))
+        np.testing.assert_allclose(trajectory(TemporalFunctionType.CYCLICAL),
+                                   1.0 + np.sin(2.0 * np.pi * t / 4.0), atol=1e-12)
+        np.testing.assert_allclose(trajectory(TemporalFunctionType.STEP),
+                                   [1.0, 1.0, 4.0, 4.0, 4.0, 4.0])
+        np.testing.assert_allclose(trajectory(TemporalFunctionType.RANDOM), 1.0 + t)
+
+    def test_window_and_bounds(self):
+        """Test values hold outside the window and are clipped to their bounds."""
+        held = Indicator(label="Held", current_value=0.0, temporal_dynamics=_dynamics(
+            TemporalFunctionType.LINEAR, start="2", end="4", rate=1.0))
+        capped = Indicator(label="Capped", current_value=0.0, temporal_dynamics=_dynamics(
+            TemporalFunctionType.LINEAR, rate=1.0, maximum=2.5))
+        self.graph.add_node(held)
+        self.graph.add_node(capped)
+
+        projection = self.simulator.project(7, entity_ids=[held.id, capped.id])
+
+        self.assertEqual(projection.trajectory(held.id).tolist(),
+                         [0.0, 0.0, 0.0, 1.0, 2.0, 2.0, 2.0])
+        self.assertEqual(projection.final_values()[capped.id], 2.5)
+
+    def test_random_walk_is_seeded(self):
+        """Test stochastic dynamics are reproducible and spread with volatility."""
+        walker = Indicator(label="Walker", current_value=0.0, temporal_dynamics=_dynamics(
+            TemporalFunctionType.RANDOM, volatility=1.0))
+        self.graph.add_node(walker)
+
+        first = self.simulator.project(50, seed=3, entity_ids=[walker.id])
+        second = self.simulator.project(50, seed=3, entity_ids=[walker.id])
+
+        np.testing.assert_allclose(first.values, second.values)
+        self.assertGreater(np.abs(np.diff(first.trajectory(walker.id))).max(), 0.0)
+
+    def test_stream_reuses_one_buffer(self):
+        """Test streamed steps cover all entities without accumulating arrays."""
+        states = []
+        for state in self.simulator.stream(3):
+            states.append((state.step, state.time, id(state.values)))
+            self.assertEqual(state.values.shape, (self.simulator.program.size,))
+
+        self.assertEqual([step for step, _, _ in states], [0, 1, 2])
+        self.assertEqual(len({buffer for _, _, buffer in states}), 1)
+
+    def test_recompiles_after_graph_changes(self):
+        """Test entities added after the first run are simulated."""
+        self.assertEqual(self.simulator.program.size, 6)
+        late = Flow(label="Late", quantity=1.0,
+                    temporal_dynamics=_dynamics(TemporalFunctionType.LINEAR))
+        self.graph.add_node(late)
+
+        self.assertTrue(self.simulator.is_stale)
+        self.assertEqual(self.simulator.program.size, 7)
+
+    def test_invalid_arguments(self):
+        """Test step counts, time steps and unknown entities are validated."""
+        with self.assertRaises(ValueError):
+            next(self.simulator.stream(1, dt=0.0))
+        with self.assertRaises(ValueError):
+            self.simulator.project(2, entity_ids=[Actor(label="Static").id])
+        self.assertTrue(math.isinf(self.simulator.program.end.max()))
+
+
+if __name__ == "__main__":
+    unittest.main()
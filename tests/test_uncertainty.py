@@ -0,0 +1,170 @@
+"""
+Tests for Monte Carlo uncertainty propagation.
+"""
+
+import random
+import unittest
+
+import numpy as np
+
+from core.sfm_enums import RelationshipKind
+from core.sfm_models import Actor, Flow, Process, Relationship, SFMGraph
+from core.input_output import InputOutputModel
+from core.propagation import ImpactPropagator
+from core.uncertainty import UncertaintyAnalyzer, UncertaintyBands, sample_quantities
+
+
+class TestSampling(unittest.TestCase):
+    """Test the vectorized sampler and band summaries."""
+
+    def test_sample_quantities(self):
+        """Test certainty drops items and variability spreads them, clipped at zero."""
+        rng = np.random.default_rng(0)
+        values = sample_quantities(rng, 20000, np.array([2.0, 2.0, 1.0]),
+                                   np.array([0.0, 0.5, 5.0]), np.array([0.25, 1.0, 1.0]))
+
+        self.assertEqual(values.shape, (20000, 3))
+        self.assertAlmostEqual((values[:, 0] > 0).mean(), 0.25, delta=0.02)
+        self.assertAlmostEqual(values[:, 1].mean(), 2.0, delta=0.02)
+        self.assertAlmostEqual(values[:, 1].std(), 0.5, delta=0.02)
+        self.assertGreaterEqual(values.min(), 0.0)
+
+    def test_bands_from_samples(self):
+        """Test percentiles, mean and per-node summaries."""
+        samples = np.column_stack([np.arange(101.0), np.full(101, 3.0)])
+        bands = UncertaintyBands.from_samples(["a", "b"], samples, (5, 50, 95))
+
+        self.assertEqual(bands.draws, 101)
+        self.assertEqual(bands.band("a"), {"mean": 50.0, "std": samples[:, 0].std(),
+                                           "p5": 5.0, "p50": 50.0, "p95": 95.0})
+        self.assertEqual(bands.summary()["b"]["p95"], 3.0)
+
+
+class TestImpactUncertainty(unittest.TestCase):
+    """Test Monte Carlo impact propagation against the deterministic propagator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.graph = SFMGraph()
+        self.nodes = [Actor(label=f"Actor {i}") for i in range(30)]
+        for node in self.nodes:
+            self.graph.add_node(node)
+        rng = random.Random(3)
+        for _ in range(90):
+            source, target = rng.sample(self.nodes, 2)
+            self.graph.add_relationship(Relationship(
+                source.id, target.id, RelationshipKind.AFFECTS, weight=rng.uniform(0.5, 2.0)))
+        self.analyzer = UncertaintyAnalyzer(self.graph, chunk_size=64)
+        self.seeds = [self.nodes[0].id]
+
+    def test_certain_graph_matches_propagator(self):
+        """Test draws of a certain graph all equal the deterministic scores."""
+        bands = self.analyzer.propagate_impact(self.seeds, draws=10, seed=1)
+        expected = ImpactPropagator(self.graph).propagate(self.seeds, warm_start=False)
+
+        for i, node_id in enumerate(bands.node_ids):
+            self.assertAlmostEqual(bands.mean[i], expected.scores[node_id], places=6)
+        self.assertLess(bands.std.max(), 1e-12)
+
+    def test_uncertain_relationships_widen_bands(self):
+        """Test certainty and variability produce non-degenerate bands."""
+        for rel in self.graph.relationships.values():
+            rel.certainty, rel.variability = 0.7, 0.5
+        bands = self.analyzer.propagate_impact(self.seeds, draws=300, seed=2)
+
+        self.assertEqual(bands.draws, 300)
+        self.assertTrue(np.all(bands.bands[0] <= bands.bands[1]))
+        self.assertTrue(np.all(bands.bands[1] <= bands.bands[2]))
+        self.assertGreater(bands.std.max(), 0.0)
+        self.assertAlmostEqual(bands.mean.sum(), 1.0, places=6)
+
+    def test_seeded_draws_are_reproducible_across_chunks(self):
+        """Test the same seed gives the same bands; a node subset is reported in order."""
+        for rel in self.graph.relationships.values():
+            rel.certainty = 0.5
+        first = self.analyzer.propagate_impact(self.seeds, draws=200, seed=5)
+        second = self.analyzer.propagate_impact(self.seeds, draws=200, seed=5)
+        subset = [self.nodes[3].id, self.nodes[1].id]
+        partial = self.analyzer.propagate_impact(self.seeds, draws=200, seed=5, node_ids=subset)
+
+        np.testing.assert_allclose(first.bands, second.bands)
+        self.assertEqual(partial.node_ids, subset)
+        self.assertEqual(partial.band(subset[0]), first.band(subset[0]))
+
+    def test_absent_nodes_drop_their_relationships(self):
+        """Test a seed that is never present cannot pass on any influence."""
+        self.nodes[0].certainty = 0.0
+        bands = UncertaintyAnalyzer(self.graph).propagate_impact(self.seeds, draws=20, seed=0)
+
+        self.assertAlmostEqual(bands.band(self.nodes[0].id)["mean"], 1.0)
+
+    def test_invalid_arguments(self):
+        """Test draw counts and damping are validated."""
+        with self.assertRaises(ValueError):
+            self.analyzer.propagate_impact(self.seeds, draws=0)
+        with self.assertRaises(ValueError):
+            self.analyzer.propagate_impact(self.seeds, alpha=1.0)
+
+
+class TestOutputUncertainty(unittest.TestCase):
+    """Test Monte Carlo input-output solves against the Leontief model."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.graph = SFMGraph()
+        self.sectors = [Process(label=f"Sector {i}") for i in range(6)]
+        for sector in self.sectors:
+            self.graph.add_node(sector)
+        rng = random.Random(11)
+        for _ in range(15):
+            source, target = rng.sample(self.sectors, 2)
+            self.graph.add_node(Flow(label="Input", quantity=rng.uniform(1.0, 10.0),
+                                     source_process_id=source.id, target_process_id=target.id))
+        for sector in self.sectors:
+            self.graph.add_node(Flow(label="Sales", quantity=50.0, source_process_id=sector.id))
+        self.model = InputOutputModel(self.graph)
+
+    def _assert_matches_model(self, bands, expected):
+        """Assert every draw reproduced the expected gross output."""
+        for i, sector_id in enumerate(bands.node_ids):
+            self.assertAlmostEqual(bands.mean[i], expected[sector_id], places=8)
+        self.assertLess(bands.std.max(), 1e-9)
+
+    def test_certain_flows_match_model(self):
+        """Test batched and per-draw sparse solves both reproduce the Leontief solution."""
+        shock = {self.sectors[0].id: 10.0}
+        batched = UncertaintyAnalyzer(self.graph)
+        sparse_path = UncertaintyAnalyzer(self.graph, batched_sector_limit=2)
+
+        self._assert_matches_model(batched.output_response(draws=5, seed=0),
+                                   self.model.total_output())
+        self._assert_matches_model(sparse_path.output_response(shock, draws=5, seed=0),
+                                   self.model.total_output(shock))
+
+    def test_flow_variability_widens_bands(self):
+        """Test variable flow quantities give non-degenerate output bands."""
+        bands = UncertaintyAnalyzer(self.graph).output_response(
+            draws=500, seed=1, flow_variability=0.2, sector_ids=[self.sectors[2].id]
+        )
+        expected = self.model.total_output()[self.sectors[2].id]
+        band = bands.band(self.sectors[2].id)
+
+        self.assertGreater(band["std"], 0.0)
+        self.assertLess(band["p5"], expected)
+        self.assertGreater(band["p95"], expected)
+        with self.assertRaises(ValueError):
+            UncertaintyAnalyzer(self.graph).output_response(flow_variability=-1.0)
+
+    def test_process_pool_matches_in_process(self):
+        """Test fanning chunks out to workers does not change the bands."""
+        analyzer = UncertaintyAnalyzer(self.graph, chunk_size=50, parallel_min_draws=1)
+        in_process = analyzer.output_response(draws=200, seed=4, flow_variability=0.1)
+        pooled = analyzer.output_response(draws=200, seed=4, flow_variability=0.1,
+                                          max_workers=2)
+
+        np.testing.assert_allclose(pooled.bands, in_process.bands)
+        np.testing.assert_allclose(pooled.mean, in_process.mean)
+
+
+if __name__ == "__main__":
+    unittest.main()